@@ -8,7 +8,10 @@
 for a protein structure."""
 
 import sys
-from mmLib import FileIO
+
+import numpy
+
+from mmLib import FileIO, AtomTable
 
 
 def main(path):
@@ -16,30 +19,25 @@ def main(path):
     print("Loading ",path)
     struct = FileIO.LoadStructure(file = path)
 
-    ## list of anisotropic values
-    anisou_list = []
-
-    ## iterate over all atoms in the structure
-    for res in struct.iter_amino_acids():
-        for atm in res.iter_atoms():
-            anisou = atm.calc_anisotropy()	
-            anisou_list.append(anisou)
-
-    ## this function counts the number of anisotropic values in
-    ## anisou_list in the range amin to amax
-    def count(amin, amax):
-        c = 0
-        for x in anisou_list:
-            if x >= amin and x < amax: c += 1 
-        return c
+    ## a table of the atoms of the amino acid residues, in the default
+    ## alt_loc, so the anisotropy comes from one batched eigen
+    ## decomposition
+    table = AtomTable.AtomTable(
+        (atm for res in struct.iter_amino_acids() for atm in res.iter_atoms()),
+        bind = False)
+    anisou_list = table.calc_anisotropy()
 
+    ## count the number of anisotropic values in each range
     bin_size = 0.05
-    amax = bin_size
-    while amax <= 1.001:
-        amin = amax - bin_size
-        print("Ansotropy Range (%f,%f): %d atoms " % (
-            amin, amax, count(amin, amax)))
-        amax += bin_size
+    num_bins = int(round(1.0 / bin_size))
+    counts, edges = numpy.histogram(
+        anisou_list, bins = num_bins, range = (0.0, num_bins * bin_size))
+    for amin, amax, c in zip(edges[:-1], edges[1:], counts):
+        print("Ansotropy Range (%f,%f): %d atoms " % (amin, amax, c))
+
+    ## mean anisotropy of each chain
+    for chain, mean in zip(table.chain_list, table.calc_chain_means(anisou_list)):
+        print("Chain %s: mean anisotropy %.3f" % (chain.chain_id, mean))
 
 
 try:
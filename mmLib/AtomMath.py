@@ -6,7 +6,6 @@
 """
 import math
 import numpy
-from numpy.linalg import linalg
 
 from . import Constants
 
@@ -91,7 +90,7 @@ def rmatrix(alpha, beta, gamma):
          [cosB*sinG, cosA*cosG+sinA*sinB*sinG, cosA*sinB*sinG-cosG*sinA ],
          [-sinB,     cosB*sinA,                cosA*cosB ]], float)
 
-    assert numpy.allclose(linalg.determinant(R), 1.0)
+    assert numpy.allclose(numpy.linalg.det(R), 1.0)
     return R
 
 def rmatrixu(u, theta):
@@ -111,10 +110,10 @@ def rmatrixu(u, theta):
          [-y*sa+(1.0-ca)*x*z,     x*sa+(1.0-ca)*y*z,      1.0+(1.0-ca)*(z*z-1.0)]], float)
 
     try:
-        assert numpy.allclose(linalg.determinant(R), 1.0)
+        assert numpy.allclose(numpy.linalg.det(R), 1.0)
     except AssertionError:
         print("rmatrixu(%s, %f) determinant(R)=%f" % (
-            u, theta, linalg.determinant(R)))
+            u, theta, numpy.linalg.det(R)))
         raise
     
     return R
@@ -155,9 +154,9 @@ def rmatrixz(vec):
     R = numpy.dot(Rxz2z, Rxz)
 
     try:
-        assert numpy.allclose(linalg.determinant(R), 1.0)
+        assert numpy.allclose(numpy.linalg.det(R), 1.0)
     except AssertionError:
-        print("rmatrixz(%s) determinant(R)=%f" % (vec, linalg.determinant(R)))
+        print("rmatrixz(%s) determinant(R)=%f" % (vec, numpy.linalg.det(R)))
         raise
 
     return R
@@ -241,13 +240,13 @@ def rmatrixquaternion(q):
                [r10, r11, r12],
                [r20, r21, r22]], float)
     
-    assert numpy.allclose(linalg.determinant(R), 1.0)
+    assert numpy.allclose(numpy.linalg.det(R), 1.0)
     return R
 
 def quaternionrmatrix(R):
     """Return a quaternion calculated from the argument rotation matrix R.
     """
-    assert numpy.allclose(linalg.determinant(R), 1.0)
+    assert numpy.allclose(numpy.linalg.det(R), 1.0)
 
     t = numpy.trace(R) + 1.0
 
@@ -294,6 +293,14 @@ def calc_distance(a1, a2):
         return None
     return length(a1.position - a2.position)
 
+def calc_distance_array(xyz1, xyz2):
+    """Calculates the distances between each pair of positions in the
+    (...,3) arrays xyz1 and xyz2 at once.  Either argument may be a single
+    position.
+    """
+    d = numpy.asarray(xyz1, float) - numpy.asarray(xyz2, float)
+    return numpy.sqrt(numpy.sum(d * d, axis = -1))
+
 def calc_angle(a1, a2, a3):
     """Return the angle between the three argument atoms.
     """
@@ -307,6 +314,20 @@ def calc_angle(a1, a2, a3):
 
     return math.acos(numpy.dot(a21, a23))
 
+def calc_angle_array(xyz1, xyz2, xyz3):
+    """Calculates calc_angle() for each set of three positions in the
+    (...,3) arrays xyz1, xyz2, xyz3 at once, returning the angles at xyz2
+    in radians.
+    """
+    xyz2 = numpy.asarray(xyz2, float)
+    a21 = numpy.asarray(xyz1, float) - xyz2
+    a23 = numpy.asarray(xyz3, float) - xyz2
+
+    with numpy.errstate(invalid = "ignore", divide = "ignore"):
+        cos_angle = numpy.sum(a21 * a23, axis = -1) / numpy.sqrt(
+            numpy.sum(a21 * a21, axis = -1) * numpy.sum(a23 * a23, axis = -1))
+    return numpy.arccos(numpy.clip(cos_angle, -1.0, 1.0))
+
 def calc_torsion_angle_old(a1, a2, a3, a4):
     """Calculates the torsion angle between the four argument atoms.
     Note: This "old" subroutine doesn't appear to do what it claims. Please
@@ -390,6 +411,59 @@ def calc_torsion_angle(a1, a2, a3, a4, sqrt=math.sqrt, acos=math.acos):
     else:
         return angle
 
+def calc_torsion_angle_array(xyz1, xyz2, xyz3, xyz4):
+    """Calculates calc_torsion_angle() for each set of four positions in
+    the (...,3) arrays xyz1, xyz2, xyz3, xyz4 at once, returning the
+    angles in degrees.  Angles with a NaN (missing) position, or with
+    collinear atoms, are NaN.
+    """
+    xyz2 = numpy.asarray(xyz2, float)
+    xyz3 = numpy.asarray(xyz3, float)
+
+    v12 = numpy.asarray(xyz1, float) - xyz2
+    v32 = xyz3 - xyz2
+    v43 = numpy.asarray(xyz4, float) - xyz3
+
+    vn13 = numpy.cross(v12, v32)
+    vn24 = numpy.cross(v43, v32)
+
+    with numpy.errstate(invalid = "ignore", divide = "ignore"):
+        cos_angle = numpy.sum(vn13 * vn24, axis = -1) / numpy.sqrt(
+            numpy.sum(vn13 * vn13, axis = -1) * numpy.sum(vn24 * vn24, axis = -1))
+
+    angle = numpy.arccos(numpy.clip(cos_angle, -1.0, 1.0)) * Constants.RAD2DEG
+    negative = numpy.sum(vn13 * numpy.cross(vn24, v32), axis = -1) < 0.0
+    angle = numpy.where(negative, -angle, angle)
+
+    ## the same special cases as calc_torsion_angle()
+    angle = numpy.where(cos_angle >= 1.0, 0.0, angle)
+    angle = numpy.where(cos_angle <= -1.0, -180.0, angle)
+    return angle
+
+def calc_index_distance_array(xyz, index_pairs):
+    """Returns the distances between the rows of the (n,3) position array
+    xyz given by the (m,2) integer array index_pairs.
+    """
+    index_pairs = numpy.asarray(index_pairs, int).reshape((-1, 2))
+    return calc_distance_array(xyz[index_pairs[:,0]], xyz[index_pairs[:,1]])
+
+def calc_index_angle_array(xyz, index_triples):
+    """Returns the angles, in radians, between the rows of the (n,3)
+    position array xyz given by the (m,3) integer array index_triples.
+    """
+    index_triples = numpy.asarray(index_triples, int).reshape((-1, 3))
+    return calc_angle_array(
+        xyz[index_triples[:,0]], xyz[index_triples[:,1]], xyz[index_triples[:,2]])
+
+def calc_index_torsion_angle_array(xyz, index_quads):
+    """Returns the torsion angles, in degrees, between the rows of the
+    (n,3) position array xyz given by the (m,4) integer array index_quads.
+    """
+    index_quads = numpy.asarray(index_quads, int).reshape((-1, 4))
+    return calc_torsion_angle_array(
+        xyz[index_quads[:,0]], xyz[index_quads[:,1]],
+        xyz[index_quads[:,2]], xyz[index_quads[:,3]])
+
 
 ##
 ## Atomic ADPs
@@ -399,16 +473,45 @@ def calc_CCuij(U, V):
     and V.
     """
     ## FIXME: Check for non-positive Uij's, 2009-08-19
-    invU = linalg.inverse(U)
-    invV = linalg.inverse(V)
+    invU = numpy.linalg.inv(U)
+    invV = numpy.linalg.inv(V)
     #invU = internal_inv3x3(U)
     #invV = internal_inv3x3(V)
     
-    det_invU = linalg.determinant(invU)
-    det_invV = linalg.determinant(invV)
+    det_invU = numpy.linalg.det(invU)
+    det_invV = numpy.linalg.det(invV)
 
     return ( math.sqrt(math.sqrt(det_invU * det_invV)) /
-             math.sqrt((1.0/8.0) * linalg.determinant(invU + invV)) )
+             math.sqrt((1.0/8.0) * numpy.linalg.det(invU + invV)) )
+
+def calc_positive_definite_array(U):
+    """Returns a boolean (n) array which is True for the tensors of the
+    (n,3,3) stack U of symmetric tensors whose eigenvalues are all
+    positive.
+    """
+    U = numpy.asarray(U, float)
+    use = numpy.all(numpy.isfinite(U.reshape((len(U), 9))), axis = 1)
+    positive = numpy.zeros(len(U), bool)
+    positive[use] = numpy.linalg.eigvalsh(U[use])[:,0] > 0.0
+    return positive
+
+def calc_CCuij_array(U, V):
+    """Calculates calc_CCuij() for each pair of the (n,3,3) stacks of
+    anisotropic ADP tensors U and V, returning a (n) array.  This uses the
+    equivalent form sqrt(8) (|U||V|)^(1/4) / |U+V|^(1/2), which needs no
+    inverses; pairs which are not positive definite give NaN.
+    """
+    detU  = numpy.linalg.det(U)
+    detV  = numpy.linalg.det(V)
+    detUV = numpy.linalg.det(numpy.asarray(U) + numpy.asarray(V))
+
+    with numpy.errstate(invalid = "ignore", divide = "ignore"):
+        cc = math.sqrt(8.0) * numpy.sqrt(numpy.sqrt(detU * detV)) / numpy.sqrt(detUV)
+
+    ## a positive determinant is not enough: two negative eigenvalues
+    ## give one too
+    positive = calc_positive_definite_array(U) & calc_positive_definite_array(V)
+    return numpy.where(positive, cc, numpy.nan)
 
 def calc_Suij(U, V):
     """Calculate the similarity of anisotropic ADP tensors U and V.
@@ -423,32 +526,102 @@ def calc_Suij(U, V):
     return ( calc_CCuij(U, (eqU/eqV)*V) /
              (calc_CCuij(U, isoU) * calc_CCuij(V, isoV)) )
 
+def calc_Suij_array(U, V):
+    """Calculates calc_Suij() for each pair of the (n,3,3) stacks of
+    anisotropic ADP tensors U and V, returning a (n) array, NaN where
+    calc_CCuij_array() is.
+    """
+    U = numpy.asarray(U, float)
+    V = numpy.asarray(V, float)
+
+    eqU = numpy.trace(U, axis1 = 1, axis2 = 2) / 3.0
+    eqV = numpy.trace(V, axis1 = 1, axis2 = 2) / 3.0
+
+    isoU = eqU[:, numpy.newaxis, numpy.newaxis] * numpy.identity(3, float)
+    isoV = eqV[:, numpy.newaxis, numpy.newaxis] * numpy.identity(3, float)
+
+    with numpy.errstate(invalid = "ignore", divide = "ignore"):
+        scale = (eqU / eqV)[:, numpy.newaxis, numpy.newaxis]
+        return ( calc_CCuij_array(U, scale * V) /
+                 (calc_CCuij_array(U, isoU) * calc_CCuij_array(V, isoV)) )
+
 def calc_DP2uij(U, V):
     """Calculate the square of the volumetric difference in the probability
     density function of anisotropic ADP tensors U and V.
     """
-    invU = linalg.inverse(U)
-    invV = linalg.inverse(V)
+    invU = numpy.linalg.inv(U)
+    invV = numpy.linalg.inv(V)
 
-    det_invU = linalg.determinant(invU)
-    det_invV = linalg.determinant(invV)
+    det_invU = numpy.linalg.det(invU)
+    det_invV = numpy.linalg.det(invV)
 
     Pu2 = math.sqrt( det_invU / (64.0 * Constants.PI3) )
     Pv2 = math.sqrt( det_invV / (64.0 * Constants.PI3) )
     Puv = math.sqrt(
-        (det_invU * det_invV) / (8.0*Constants.PI3 * linalg.determinant(invU + invV)))
+        (det_invU * det_invV) / (8.0*Constants.PI3 * numpy.linalg.det(invU + invV)))
 
     dP2 = Pu2 + Pv2 - (2.0 * Puv)
     
     return dP2
 
+def calc_DP2uij_array(U, V):
+    """Calculates calc_DP2uij() for each pair of the (n,3,3) stacks of
+    anisotropic ADP tensors U and V, returning a (n) array.  Uses
+    |U^-1| = 1/|U| and |U^-1 + V^-1| = |U+V| / (|U||V|), so no inverses are
+    needed; pairs which are not positive definite give NaN.
+    """
+    detU  = numpy.linalg.det(U)
+    detV  = numpy.linalg.det(V)
+    detUV = numpy.linalg.det(numpy.asarray(U) + numpy.asarray(V))
+
+    with numpy.errstate(invalid = "ignore", divide = "ignore"):
+        Pu2 = numpy.sqrt( 1.0 / (64.0 * Constants.PI3 * detU) )
+        Pv2 = numpy.sqrt( 1.0 / (64.0 * Constants.PI3 * detV) )
+        Puv = numpy.sqrt( 1.0 / (8.0 * Constants.PI3 * detUV) )
+
+    positive = calc_positive_definite_array(U) & calc_positive_definite_array(V)
+    return numpy.where(positive, Pu2 + Pv2 - (2.0 * Puv), numpy.nan)
+
 def calc_anisotropy(U):
     """Calculates the anisotropy of a atomic ADP tensor U.  Anisotropy is
     defined as the smallest eigenvalue of U divided by the largest eigenvalue
     of U.
     """
-    evals = linalg.eigenvalues(U)
-    return min(evals) / max(evals)
+    evals = numpy.linalg.eigvalsh(U)
+    return evals[0] / evals[2]
+
+def calc_eigenvalues_array(U):
+    """Returns the (n,3) ascending eigenvalues of each tensor of the (n,3,3)
+    stack of symmetric ADP tensors U, from one batched eigh.
+    """
+    U = numpy.asarray(U, float).reshape((-1, 3, 3))
+    return numpy.linalg.eigvalsh(U)
+
+def calc_anisotropy_array(U):
+    """Calculates calc_anisotropy() for each tensor of the (n,3,3) stack of
+    ADP tensors U, returning a (n) array.
+    """
+    evals = calc_eigenvalues_array(U)
+    with numpy.errstate(invalid = "ignore", divide = "ignore"):
+        return evals[:,0] / evals[:,2]
+
+def calc_anisotropy3_array(U):
+    """Returns the (n,3) array of the eigenvalue ratios (e1/e2, e1/e3,
+    e2/e3) of each tensor of the (n,3,3) stack of ADP tensors U, with the
+    eigenvalues e1 <= e2 <= e3 and each ratio taken as smaller/larger,
+    like Atom.calc_anisotropy3().
+    """
+    evals = calc_eigenvalues_array(U)
+    e1 = evals[:,0]
+    e2 = evals[:,1]
+    e3 = evals[:,2]
+
+    ratios = numpy.empty((len(evals), 3), float)
+    with numpy.errstate(invalid = "ignore", divide = "ignore"):
+        ratios[:,0] = numpy.minimum(e1, e2) / numpy.maximum(e1, e2)
+        ratios[:,1] = numpy.minimum(e1, e3) / numpy.maximum(e1, e3)
+        ratios[:,2] = numpy.minimum(e2, e3) / numpy.maximum(e2, e3)
+    return ratios
 
 def diff_trace_UV(U, V):
     """Calculates the trace difference of anisotropic ADP tensors U and V.
@@ -473,88 +646,75 @@ def calc_rosenfeld(a, b, d, U, V):
 ##
 ## Calculations on groups of atoms
 ##
+def calc_atom_position_array(atom_iter):
+    """Returns the positions of the Atom instances of atom_iter as a (n,3)
+    array, skipping atoms without a position.
+    """
+    xyz = [atm.position for atm in atom_iter if atm.position is not None]
+    return numpy.array(xyz, float).reshape((-1, 3))
+
+def calc_centroid_array(xyz, mask = None):
+    """Returns the centroid of the (n,3) position array xyz, or of the
+    positions selected by the boolean or index array mask.
+    """
+    xyz = numpy.asarray(xyz, float)
+    if mask is not None:
+        xyz = xyz[mask]
+    return numpy.sum(xyz, axis = 0) / len(xyz)
+
 def calc_atom_centroid(atom_iter):
     """Calculates the centroid of all contained Atom instances and
     returns a Vector to the centroid.
     """
-    num      = 0
-    centroid = numpy.zeros(3, float)
-    for atm in atom_iter:
-        if atm.position != None:
-            centroid += atm.position
-            num += 1
-    
-    return centroid / num
+    return calc_centroid_array(calc_atom_position_array(atom_iter))
 
 def calc_atom_mean_temp_factor(atom_iter):
     """Calculates the average temperature factor of all contained
     Atom instances and returns the average temperature factor.
     """
-    num_tf = 0
-    adv_tf = 0.0
-
-    for atm in atom_iter:
-        if atm.temp_factor != None:
-            adv_tf += atm.temp_factor
-            num_tf += 1
-
-    return adv_tf / num_tf
-
-
-def calc_inertia_tensor(atom_iter, origin):
-    """Calculate a moment-of-inertia tensor at the given origin assuming all
-    atoms have the same mass.
+    temp_factor = numpy.array(
+        [atm.temp_factor for atm in atom_iter if atm.temp_factor is not None], float)
+    return float(numpy.sum(temp_factor)) / len(temp_factor)
+
+def calc_inertia_matrix_array(xyz, origin, mask = None):
+    """Returns the (3,3) moment-of-inertia matrix of the (n,3) position
+    array xyz, or of the positions selected by mask, at the given origin
+    assuming all atoms have the same mass.
     """
-    I = numpy.zeros((3,3), float)
-    
-    for atm in atom_iter:
-        x = atm.position - origin
-
-        I[0,0] += x[1]**2 + x[2]**2
-        I[1,1] += x[0]**2 + x[2]**2
-        I[2,2] += x[0]**2 + x[1]**2
-
-        I[0,1] += - x[0]*x[1]
-        I[1,0] += - x[0]*x[1]
-
-        I[0,2] += - x[0]*x[2]
-        I[2,0] += - x[0]*x[2]
-
-        I[1,2] += - x[1]*x[2]
-        I[2,1] += - x[1]*x[2]
-
-    evals, evecs = linalg.eigenvectors(I)
+    x = numpy.asarray(xyz, float)
+    if mask is not None:
+        x = x[mask]
+    x = x - origin
+
+    ## I = sum(|x|^2 E - x x^T)
+    xx = numpy.dot(x.T, x)
+    return numpy.trace(xx) * numpy.identity(3, float) - xx
+
+def calc_inertia_tensor_array(xyz, origin, mask = None):
+    """Calculates calc_inertia_tensor() from the (n,3) position array xyz,
+    or from the positions selected by the boolean or index array mask.
+    """
+    evals, evecs = numpy.linalg.eigh(calc_inertia_matrix_array(xyz, origin, mask))
 
     ## order the tensor such that the largest
     ## principal component is along the z-axis, and
-    ## the second largest is along the y-axis
-    if evals[0] >= evals[1] and evals[0] >= evals[2]:
-        if evals[1] >= evals[2]:
-            R = numpy.array((evecs[2], evecs[1], evecs[0]), float)
-        else:
-            R = numpy.array((evecs[1], evecs[2], evecs[0]), float)
-
-    elif evals[1] >= evals[0] and evals[1] >= evals[2]:
-        if evals[0] >= evals[2]:
-            R = numpy.array((evecs[2], evecs[0], evecs[1]), float)
-        else:
-            R = numpy.array((evecs[0], evecs[2], evecs[1]), float)
-
-    elif evals[2] >= evals[0] and evals[2] >= evals[1]:
-        if evals[0] >= evals[1]:
-            R = numpy.array((evecs[1], evecs[0], evecs[2]), float)
-        else:
-            R = numpy.array((evecs[0], evecs[1], evecs[2]), float)
+    ## the second largest is along the y-axis; eigh returns the
+    ## eigenvalues in ascending order
+    R = evecs.T.copy()
 
     ## make sure the tensor is right-handed
-    if numpy.allclose(linalg.determinant(R), -1.0):
-        I = numpy.identity(3, float)
-        I[0,0] = -1.0
-        R = numpy.dot(I, R)
+    if numpy.linalg.det(R) < 0.0:
+        R[0] = -R[0]
 
-    assert numpy.allclose(linalg.determinant(R), 1.0)
+    assert numpy.allclose(numpy.linalg.det(R), 1.0)
     return R
 
+def calc_inertia_tensor(atom_iter, origin):
+    """Calculate a moment-of-inertia tensor at the given origin assuming all
+    atoms have the same mass.
+    """
+    return calc_inertia_tensor_array(calc_atom_position_array(atom_iter), origin)
+
 
 ### <TESTING>
 def test_module():
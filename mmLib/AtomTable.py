@@ -0,0 +1,534 @@
+## Copyright 2002-2010 by PyMMLib Development Group (see AUTHORS file)
+## This code is part of the PyMMLib distribution and governed by
+## its license.  Please see the LICENSE file that should have been
+## included as part of this package.
+"""Columnar (structure of arrays) storage for Atom data.
+"""
+import numpy
+
+from . import AtomMath
+from . import BondGraph
+from . import Constants
+from . import GeometryDict
+from . import Library
+
+
+class AtomTable(object):
+    """Packs the data of a sequence of Atom objects into contiguous NumPy
+    arrays so whole-structure math can be done with vectorized operations.
+    Row i of every column describes AtomTable.atom_list[i].
+
+    Once built, the Atom objects are bound to the table: their position,
+    sig_position, occupancy, temp_factor, U and sig_U attributes are read
+    from and written to the table rows, so changes made through either the
+    Atom objects or the arrays are seen by both.  Building a new table
+    for an Atom moves its binding to the new table.
+
+    Numeric columns (undefined values are stored as NaN, with a matching
+    has_* boolean column for the array valued attributes):
+
+    position(n,3), has_position(n), sig_position(n,3), has_sig_position(n)
+    occupancy(n), temp_factor(n)
+    U(n,3,3), has_U(n), sig_U(n,3,3), has_sig_U(n)
+
+    Label columns are integer codes into the matching *_names lists:
+
+    element_code/element_names, name_code/name_names,
+    res_name_code/res_name_names, alt_loc_code/alt_loc_names
+
+    Hierarchy columns are indexes into the matching *_list lists, or -1
+    if the Atom is not part of a Structure:
+
+    model_index/model_list, chain_index/chain_list,
+    fragment_index/fragment_list
+
+    The label and hierarchy columns are a snapshot taken when the table is
+    built; build a new table after adding or removing Atoms, or after
+    renaming them.  A table built with bind=False is a snapshot of all
+    columns, and leaves the Atom objects unchanged.
+    """
+    def __init__(self, atom_iter, bind = True):
+        self.atom_list = list(atom_iter)
+        num_atoms = len(self.atom_list)
+
+        self.position = numpy.zeros((num_atoms, 3), float)
+        self.has_position = numpy.zeros(num_atoms, bool)
+        self.sig_position = numpy.zeros((num_atoms, 3), float)
+        self.has_sig_position = numpy.zeros(num_atoms, bool)
+        self.occupancy = numpy.zeros(num_atoms, float)
+        self.temp_factor = numpy.zeros(num_atoms, float)
+        self.U = numpy.zeros((num_atoms, 3, 3), float)
+        self.has_U = numpy.zeros(num_atoms, bool)
+        self.sig_U = numpy.zeros((num_atoms, 3, 3), float)
+        self.has_sig_U = numpy.zeros(num_atoms, bool)
+
+        self.element_names = []
+        self.name_names = []
+        self.res_name_names = []
+        self.alt_loc_names = []
+        self.element_code = numpy.zeros(num_atoms, int)
+        self.name_code = numpy.zeros(num_atoms, int)
+        self.res_name_code = numpy.zeros(num_atoms, int)
+        self.alt_loc_code = numpy.zeros(num_atoms, int)
+
+        self.model_list = []
+        self.chain_list = []
+        self.fragment_list = []
+        self.model_index = numpy.zeros(num_atoms, int)
+        self.chain_index = numpy.zeros(num_atoms, int)
+        self.fragment_index = numpy.zeros(num_atoms, int)
+
+        ## collect the values with plain Python lists, then convert each
+        ## column to an array in one step
+        position = []
+        sig_position = []
+        occupancy = []
+        temp_factor = []
+        U_index = []
+        U_list = []
+        sig_U_index = []
+        sig_U_list = []
+
+        element_code = []
+        name_code = []
+        res_name_code = []
+        alt_loc_code = []
+        model_index = []
+        chain_index = []
+        fragment_index = []
+
+        element_dict = {}
+        name_dict = {}
+        res_name_dict = {}
+        alt_loc_dict = {}
+        model_dict = {}
+        chain_dict = {}
+        fragment_dict = {}
+
+        nan = numpy.nan
+        nan3 = (nan, nan, nan)
+
+        for i, atm in enumerate(self.atom_list):
+            pos = atm.position
+            position.append(nan3 if pos is None else pos)
+            pos = atm.sig_position
+            sig_position.append(nan3 if pos is None else pos)
+
+            occ = atm.occupancy
+            occupancy.append(nan if occ is None else occ)
+            tf = atm.temp_factor
+            temp_factor.append(nan if tf is None else tf)
+
+            if atm.U is not None:
+                U_index.append(i)
+                U_list.append(atm.U)
+            if atm.sig_U is not None:
+                sig_U_index.append(i)
+                sig_U_list.append(atm.sig_U)
+
+            element_code.append(
+                calc_code(element_dict, self.element_names, atm.element))
+            name_code.append(
+                calc_code(name_dict, self.name_names, atm.name))
+            res_name_code.append(
+                calc_code(res_name_dict, self.res_name_names, atm.res_name))
+            alt_loc_code.append(
+                calc_code(alt_loc_dict, self.alt_loc_names, atm.alt_loc))
+
+            frag = atm.fragment
+            chain = None
+            model = None
+            if frag is not None:
+                chain = frag.chain
+                if chain is not None:
+                    model = chain.model
+            fragment_index.append(
+                calc_index(fragment_dict, self.fragment_list, frag))
+            chain_index.append(
+                calc_index(chain_dict, self.chain_list, chain))
+            model_index.append(
+                calc_index(model_dict, self.model_list, model))
+
+        if num_atoms > 0:
+            self.position[:] = position
+            self.sig_position[:] = sig_position
+            self.occupancy[:] = occupancy
+            self.temp_factor[:] = temp_factor
+            self.element_code[:] = element_code
+            self.name_code[:] = name_code
+            self.res_name_code[:] = res_name_code
+            self.alt_loc_code[:] = alt_loc_code
+            self.model_index[:] = model_index
+            self.chain_index[:] = chain_index
+            self.fragment_index[:] = fragment_index
+
+        self.has_position[:] = ~numpy.isnan(self.position[:, 0])
+        self.has_sig_position[:] = ~numpy.isnan(self.sig_position[:, 0])
+
+        self.U[:] = numpy.nan
+        self.sig_U[:] = numpy.nan
+        if len(U_index) > 0:
+            self.U[U_index] = U_list
+            self.has_U[U_index] = True
+        if len(sig_U_index) > 0:
+            self.sig_U[sig_U_index] = sig_U_list
+            self.has_sig_U[sig_U_index] = True
+
+        ## bind the Atoms to their rows; this drops the per-Atom arrays
+        if bind:
+            for i, atm in enumerate(self.atom_list):
+                atm.bind_atom_table(self, i)
+
+    def __len__(self):
+        return len(self.atom_list)
+
+    def __getitem__(self, index):
+        """Returns the Atom object stored in row index.
+        """
+        return self.atom_list[index]
+
+    def __iter__(self):
+        return iter(self.atom_list)
+
+    def __contains__(self, atom):
+        return getattr(atom, "atom_table", None) is self
+
+    def index(self, atom):
+        """Returns the row index of the argument Atom.  Raises ValueError
+        if the Atom is not bound to this table.
+        """
+        if getattr(atom, "atom_table", None) is not self:
+            raise ValueError("AtomTable.index(x): x not in AtomTable")
+        return atom.atom_table_index
+
+    def calc_atom_indices(self, atom_iter):
+        """Returns a integer array of the row indexes of the Atoms in
+        atom_iter.
+        """
+        return numpy.array([self.index(atm) for atm in atom_iter], int)
+
+    def iter_atoms(self):
+        """Iterates over all Atom objects in row order.
+        """
+        return iter(self.atom_list)
+
+    def count_atoms(self):
+        """Returns the number of rows in the table.
+        """
+        return len(self.atom_list)
+
+    def detach(self):
+        """Copies the row values back into the Atom objects which are
+        still bound to this table and unbinds them.  The table arrays are
+        left unchanged.
+        """
+        for atm in self.atom_list:
+            if atm.atom_table is self:
+                atm.unbind_atom_table()
+
+    def calc_U_array(self):
+        """Returns a (n,3,3) array of the U tensor of each row, or for rows
+        without one the isotropic U calculated from the temperature factor,
+        as Atom.get_U() does.  Rows with neither are NaN.
+        """
+        U = numpy.where(
+            self.has_U[:, numpy.newaxis, numpy.newaxis],
+            self.U,
+            (self.temp_factor * Constants.B2U)[:, numpy.newaxis, numpy.newaxis] *
+            numpy.identity(3, float))
+        return U
+
+    def calc_anisotropy(self):
+        """Returns a float array of the Atom.calc_anisotropy() anisotropy of
+        each row: the smallest over the largest eigenvalue of U, from one
+        batched eigen decomposition, and 1.0 for rows without U.
+        """
+        anisotropy = numpy.ones(len(self.atom_list), float)
+        if numpy.any(self.has_U):
+            anisotropy[self.has_U] = AtomMath.calc_anisotropy_array(self.U[self.has_U])
+        return anisotropy
+
+    def calc_anisotropy3(self):
+        """Returns a (n,3) array of the Atom.calc_anisotropy3() eigenvalue
+        ratios of each row, (1.0, 1.0, 1.0) for rows without U.
+        """
+        anisotropy3 = numpy.ones((len(self.atom_list), 3), float)
+        if numpy.any(self.has_U):
+            anisotropy3[self.has_U] = AtomMath.calc_anisotropy3_array(self.U[self.has_U])
+        return anisotropy3
+
+    def calc_chain_means(self, values):
+        """Returns the mean of the per-row array values over the rows of
+        each chain, in the order of chain_list; see calc_group_means().
+        """
+        return calc_group_means(values, self.chain_index, len(self.chain_list))
+
+    def calc_fragment_means(self, values):
+        """Returns the mean of the per-row array values over the rows of
+        each fragment (residue), in the order of fragment_list; see
+        calc_group_means().
+        """
+        return calc_group_means(values, self.fragment_index, len(self.fragment_list))
+
+    def calc_covalent_radii(self):
+        """Returns a float array of the covalent radius of each row's
+        element, looked up once per element.  Rows with an unknown
+        element are NaN.
+        """
+        radii = numpy.zeros(len(self.element_names), float)
+        for code, element in enumerate(self.element_names):
+            edesc = None
+            if isinstance(element, str):
+                edesc = Library.library_get_element_desc(element)
+            if edesc is None:
+                radii[code] = numpy.nan
+            else:
+                radii[code] = edesc.covalent_radius
+        return radii[self.element_code]
+
+    def calc_alt_loc_compatible(self, index1, index2):
+        """Returns a boolean mask of the row pairs (index1[k], index2[k])
+        which can be bonded: rows with the same alt_loc, or where either
+        row has a blank alt_loc.
+        """
+        blank = numpy.array(
+            [alt_loc == "" for alt_loc in self.alt_loc_names], bool)
+        code1 = self.alt_loc_code[index1]
+        code2 = self.alt_loc_code[index2]
+        if len(blank) == 0:
+            return numpy.zeros(len(code1), bool)
+        return (code1 == code2) | blank[code1] | blank[code2]
+
+    def calc_covalent_bonds(self, max_distance = 2.5, tolerance = 0.54):
+        """Returns the (index1, index2, dist) edge list arrays of the row
+        pairs with positions closer than max_distance, and no farther
+        apart than the sum of their covalent radii + tolerance, and
+        compatible alt_locs.  index1 < index2 for every pair.
+        """
+        rows = numpy.nonzero(self.has_position)[0]
+        cell_list = GeometryDict.XYZCellList(self.position[rows], max_distance)
+        index1, index2, dist = cell_list.calc_contact_pairs(max_distance)
+        index1 = rows[index1]
+        index2 = rows[index2]
+
+        radii = self.calc_covalent_radii()
+        mask = dist <= radii[index1] + radii[index2] + tolerance
+        mask &= self.calc_alt_loc_compatible(index1, index2)
+        return index1[mask], index2[mask], dist[mask]
+
+    def create_bonds(self,
+                     index1,
+                     index2,
+                     bond_type         = None,
+                     standard_res_bond = False):
+        """Creates a Bond between the Atoms of each row pair (index1[k],
+        index2[k]) which are not bonded already.  Returns the number of
+        bonds created.
+        """
+        atom_list = self.atom_list
+
+        ## the existing bonds of the Atoms, as pairs of Atom ids
+        bonded = set()
+        for i in numpy.unique(numpy.concatenate((index1, index2))).tolist():
+            for bond in atom_list[i].bond_list:
+                bonded.add((id(bond.atom1), id(bond.atom2)))
+                bonded.add((id(bond.atom2), id(bond.atom1)))
+
+        num_bonds = 0
+        for i, j in zip(index1.tolist(), index2.tolist()):
+            atm1 = atom_list[i]
+            atm2 = atom_list[j]
+            key = (id(atm1), id(atm2))
+            if key in bonded or atm1 is atm2:
+                continue
+
+            atm1.create_bond(
+                atom              = atm2,
+                bond_type         = bond_type,
+                standard_res_bond = standard_res_bond)
+
+            bonded.add(key)
+            bonded.add((id(atm2), id(atm1)))
+            num_bonds += 1
+
+        return num_bonds
+
+    def calc_bond_graph(self):
+        """Returns a BondGraph.BondGraph of the Bond objects between the
+        Atoms of the table, with the table row indexes as atom indexes.
+        Bonds to Atoms outside the table are left out.
+        """
+        bond_type_dict = {}
+        bond_type_names = []
+        index1 = []
+        index2 = []
+        bond_type_code = []
+        standard_res_bond = []
+
+        visited = set()
+        for i, atm in enumerate(self.atom_list):
+            for bond in atm.bond_list:
+                if id(bond) in visited:
+                    continue
+                visited.add(id(bond))
+
+                partner = bond.get_partner(atm)
+                if getattr(partner, "atom_table", None) is self:
+                    j = partner.atom_table_index
+                else:
+                    j = self.find_atom_index(partner)
+                if j is None:
+                    continue
+
+                index1.append(i)
+                index2.append(j)
+                bond_type_code.append(
+                    calc_code(bond_type_dict, bond_type_names, bond.bond_type))
+                standard_res_bond.append(bool(bond.standard_res_bond))
+
+        bond_graph = BondGraph.BondGraph(
+            len(self.atom_list),
+            numpy.array(index1, int),
+            numpy.array(index2, int),
+            bond_type_code    = numpy.array(bond_type_code, int),
+            bond_type_names   = bond_type_names,
+            standard_res_bond = numpy.array(standard_res_bond, bool))
+        bond_graph.atom_table = self
+        return bond_graph
+
+    def find_atom_index(self, atom):
+        """Returns the row index of the argument Atom, or None if it is not
+        in the table.  Unlike index(), this works for tables built with
+        bind=False.
+        """
+        try:
+            atom_index_dict = self.atom_index_dict
+        except AttributeError:
+            atom_index_dict = self.atom_index_dict = dict(
+                (id(atm), i) for i, atm in enumerate(self.atom_list))
+        return atom_index_dict.get(id(atom))
+
+    def get_position(self, i):
+        if self.has_position[i]:
+            return self.position[i]
+        return None
+
+    def set_position(self, i, position):
+        if position is None:
+            self.position[i] = numpy.nan
+            self.has_position[i] = False
+        else:
+            self.position[i] = position
+            self.has_position[i] = True
+
+    def get_sig_position(self, i):
+        if self.has_sig_position[i]:
+            return self.sig_position[i]
+        return None
+
+    def set_sig_position(self, i, sig_position):
+        if sig_position is None:
+            self.sig_position[i] = numpy.nan
+            self.has_sig_position[i] = False
+        else:
+            self.sig_position[i] = sig_position
+            self.has_sig_position[i] = True
+
+    def get_occupancy(self, i):
+        occ = self.occupancy[i]
+        if occ != occ:
+            return None
+        return float(occ)
+
+    def set_occupancy(self, i, occupancy):
+        if occupancy is None:
+            self.occupancy[i] = numpy.nan
+        else:
+            self.occupancy[i] = occupancy
+
+    def get_temp_factor(self, i):
+        tf = self.temp_factor[i]
+        if tf != tf:
+            return None
+        return float(tf)
+
+    def set_temp_factor(self, i, temp_factor):
+        if temp_factor is None:
+            self.temp_factor[i] = numpy.nan
+        else:
+            self.temp_factor[i] = temp_factor
+
+    def get_U(self, i):
+        if self.has_U[i]:
+            return self.U[i]
+        return None
+
+    def set_U(self, i, U):
+        if U is None:
+            self.U[i] = numpy.nan
+            self.has_U[i] = False
+        else:
+            self.U[i] = U
+            self.has_U[i] = True
+
+    def get_sig_U(self, i):
+        if self.has_sig_U[i]:
+            return self.sig_U[i]
+        return None
+
+    def set_sig_U(self, i, sig_U):
+        if sig_U is None:
+            self.sig_U[i] = numpy.nan
+            self.has_sig_U[i] = False
+        else:
+            self.sig_U[i] = sig_U
+            self.has_sig_U[i] = True
+
+
+def calc_code(code_dict, name_list, name):
+    """Returns the integer code of name, adding it to code_dict and
+    name_list if it has not been seen before.
+    """
+    try:
+        return code_dict[name]
+    except KeyError:
+        code = code_dict[name] = len(name_list)
+        name_list.append(name)
+        return code
+
+
+def calc_index(index_dict, obj_list, obj):
+    """Like calc_code, but for container objects, which are hashed by
+    identity.  Returns -1 for None.
+    """
+    if obj is None:
+        return -1
+    key = id(obj)
+    try:
+        return index_dict[key]
+    except KeyError:
+        index = index_dict[key] = len(obj_list)
+        obj_list.append(obj)
+        return index
+
+
+def calc_group_means(values, group_index, num_groups):
+    """Returns the mean of values (an array with one entry, or one row of
+    entries, per table row) over the rows of each of num_groups groups,
+    where group_index holds each row's group, or -1 for none.  NaN values
+    are left out of the means; groups without values are NaN.
+    """
+    values = numpy.asarray(values, float)
+    group_index = numpy.asarray(group_index, int)
+
+    use = (group_index >= 0) & ~numpy.isnan(values.reshape((len(values), -1))).any(axis = 1)
+    flat = values[use].reshape((numpy.sum(use), -1))
+    index = group_index[use]
+
+    sums = numpy.zeros((num_groups, flat.shape[1]), float)
+    numpy.add.at(sums, index, flat)
+    counts = numpy.bincount(index, minlength = num_groups).astype(float)
+
+    with numpy.errstate(invalid = "ignore", divide = "ignore"):
+        means = sums / counts[:, numpy.newaxis]
+    return means.reshape((num_groups,) + values.shape[1:])
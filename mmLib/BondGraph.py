@@ -0,0 +1,322 @@
+## Copyright 2002-2010 by PyMMLib Development Group (see AUTHORS file)
+## This code is part of the PyMMLib distribution and governed by
+## its license.  Please see the LICENSE file that should have been
+## included as part of this package.
+"""Compact (CSR) bond graph over integer atom indexes.
+"""
+import numpy
+
+
+class BondGraph(object):
+    """Stores bonds as a edge list of atom index pairs, and indexes the
+    edges in compressed sparse row (CSR) form so the bonded neighbors of
+    any atom are a contiguous slice of one array.  A BondGraph built by
+    AtomTable.calc_bond_graph() uses the row indexes of that table, and
+    keeps the table in BondGraph.atom_table.
+
+    Edge arrays, one entry per bond:
+
+    index1(m), index2(m)   atom indexes of the bond, index1 < index2
+    bond_type_code(m)      code into bond_type_names (which may hold None)
+    standard_res_bond(m)   standard_res_bond flag of the bond
+
+    CSR arrays: the neighbors of atom i are
+    neighbors[indptr[i]:indptr[i+1]], in increasing order, and
+    neighbor_edge[indptr[i]:indptr[i+1]] are the matching edge indexes.
+    """
+    def __init__(self,
+                 num_atoms,
+                 index1,
+                 index2,
+                 bond_type_code    = None,
+                 bond_type_names   = None,
+                 standard_res_bond = None):
+
+        self.atom_table = None
+        self.num_atoms = num_atoms
+
+        index1 = numpy.asarray(index1, int)
+        index2 = numpy.asarray(index2, int)
+        num_bonds = len(index1)
+
+        if bond_type_code is None:
+            bond_type_code = numpy.zeros(num_bonds, int)
+            bond_type_names = [None]
+        if standard_res_bond is None:
+            standard_res_bond = numpy.zeros(num_bonds, bool)
+
+        ## store each edge with index1 < index2, sorted
+        lo = numpy.minimum(index1, index2)
+        hi = numpy.maximum(index1, index2)
+        order = numpy.lexsort((hi, lo))
+        self.index1 = lo[order]
+        self.index2 = hi[order]
+        self.bond_type_code = numpy.asarray(bond_type_code, int)[order]
+        self.bond_type_names = list(bond_type_names)
+        self.standard_res_bond = numpy.asarray(standard_res_bond, bool)[order]
+
+        ## CSR index of both directions of every edge
+        edge = numpy.arange(num_bonds)
+        source = numpy.concatenate((self.index1, self.index2))
+        target = numpy.concatenate((self.index2, self.index1))
+        edge = numpy.concatenate((edge, edge))
+        order = numpy.lexsort((target, source))
+
+        self.neighbors = target[order]
+        self.neighbor_edge = edge[order]
+        self.indptr = numpy.zeros(num_atoms + 1, int)
+        numpy.cumsum(numpy.bincount(source, minlength = num_atoms),
+                     out = self.indptr[1:])
+
+    def __len__(self):
+        return len(self.index1)
+
+    def count_atoms(self):
+        """Returns the number of atoms (graph vertices).
+        """
+        return self.num_atoms
+
+    def count_bonds(self):
+        """Returns the number of bonds (graph edges).
+        """
+        return len(self.index1)
+
+    def calc_degree(self):
+        """Returns a integer array of the number of bonds of each atom.
+        """
+        return numpy.diff(self.indptr)
+
+    def get_neighbors(self, i):
+        """Returns the sorted array of the atom indexes bonded to atom i.
+        """
+        return self.neighbors[self.indptr[i]:self.indptr[i + 1]]
+
+    def get_neighbor_edges(self, i):
+        """Returns the array of the edge indexes of the bonds of atom i,
+        in the order of get_neighbors(i).
+        """
+        return self.neighbor_edge[self.indptr[i]:self.indptr[i + 1]]
+
+    def get_edge(self, i, j):
+        """Returns the edge index of the bond between atoms i and j, or -1
+        if they are not bonded.
+        """
+        start = self.indptr[i]
+        end = self.indptr[i + 1]
+        k = start + numpy.searchsorted(self.neighbors[start:end], j)
+        if k < end and self.neighbors[k] == j:
+            return int(self.neighbor_edge[k])
+        return -1
+
+    def is_bonded(self, i, j):
+        """Returns True if atoms i and j are bonded.
+        """
+        return self.get_edge(i, j) != -1
+
+    def get_bond_type(self, edge):
+        """Returns the bond_type of the edge.
+        """
+        return self.bond_type_names[self.bond_type_code[edge]]
+
+    def iter_edges(self):
+        """Iterates over all edges as (index1, index2, bond_type,
+        standard_res_bond) 4-tuples.
+        """
+        names = self.bond_type_names
+        for i, j, code, std in zip(self.index1.tolist(),
+                                   self.index2.tolist(),
+                                   self.bond_type_code.tolist(),
+                                   self.standard_res_bond.tolist()):
+            yield i, j, names[code], std
+
+    def calc_connected_components(self):
+        """Returns a integer array labeling the connected component of
+        each atom.  Components are numbered 0, 1, ... in the order of
+        their lowest atom index.
+        """
+        labels = numpy.arange(self.num_atoms)
+        index1 = self.index1
+        index2 = self.index2
+
+        ## hook the larger label of each edge onto the smaller one, then
+        ## compress the label trees until all edges agree
+        while True:
+            label1 = labels[index1]
+            label2 = labels[index2]
+            differ = label1 != label2
+            if not numpy.any(differ):
+                break
+            lo = numpy.minimum(label1[differ], label2[differ])
+            hi = numpy.maximum(label1[differ], label2[differ])
+            numpy.minimum.at(labels, hi, lo)
+            while True:
+                parent = labels[labels]
+                if numpy.array_equal(parent, labels):
+                    break
+                labels = parent
+
+        roots, component = numpy.unique(labels, return_inverse = True)
+        return component
+
+    def count_connected_components(self):
+        """Returns the number of connected components.
+        """
+        if self.num_atoms == 0:
+            return 0
+        return int(self.calc_connected_components().max()) + 1
+
+    def calc_ring_bonds(self):
+        """Returns a boolean mask of the edges which are part of a ring;
+        these are the edges which are not bridges of the graph.
+        """
+        in_ring = numpy.ones(len(self.index1), bool)
+        num_atoms = self.num_atoms
+        indptr = self.indptr.tolist()
+        neighbors = self.neighbors.tolist()
+        neighbor_edge = self.neighbor_edge.tolist()
+
+        ## iterative depth first search computing the lowest discovery
+        ## order reachable from each subtree; a tree edge whose child
+        ## cannot reach above itself is a bridge
+        order = [-1] * num_atoms
+        low = [0] * num_atoms
+        counter = 0
+
+        for root in range(num_atoms):
+            if order[root] != -1:
+                continue
+            order[root] = low[root] = counter
+            counter += 1
+            stack = [(root, -1, indptr[root])]
+
+            while stack:
+                atom, parent_edge, k = stack[-1]
+                if k < indptr[atom + 1]:
+                    stack[-1] = (atom, parent_edge, k + 1)
+                    edge = neighbor_edge[k]
+                    if edge == parent_edge:
+                        continue
+                    nbr = neighbors[k]
+                    if order[nbr] == -1:
+                        order[nbr] = low[nbr] = counter
+                        counter += 1
+                        stack.append((nbr, edge, indptr[nbr]))
+                    elif order[nbr] < low[atom]:
+                        low[atom] = order[nbr]
+                else:
+                    stack.pop()
+                    if stack:
+                        parent = stack[-1][0]
+                        if low[atom] < low[parent]:
+                            low[parent] = low[atom]
+                        if low[atom] > order[parent]:
+                            in_ring[parent_edge] = False
+
+        return in_ring
+
+    def calc_ring_atoms(self):
+        """Returns a boolean mask of the atoms which are part of a ring.
+        """
+        mask = numpy.zeros(self.num_atoms, bool)
+        ring_bonds = self.calc_ring_bonds()
+        mask[self.index1[ring_bonds]] = True
+        mask[self.index2[ring_bonds]] = True
+        return mask
+
+    def count_rings(self):
+        """Returns the number of independent rings (the cycle rank of the
+        graph: bonds - atoms + connected components).
+        """
+        return self.count_bonds() - self.num_atoms + \
+               self.count_connected_components()
+
+    def calc_path_lengths(self, source):
+        """Returns a integer array of the number of bonds on the shortest
+        path from atom source to each atom, or -1 for atoms which cannot
+        be reached.
+        """
+        return self.calc_breadth_first_search(source)[0]
+
+    def calc_shortest_path(self, source, target):
+        """Returns the list of atom indexes along a shortest bonded path
+        from source to target, both included, or None if target cannot be
+        reached.
+        """
+        dist, parent = self.calc_breadth_first_search(source, target)
+        if dist[target] == -1:
+            return None
+        path = [target]
+        while path[-1] != source:
+            path.append(int(parent[path[-1]]))
+        path.reverse()
+        return path
+
+    def calc_breadth_first_search(self, source, target = None):
+        """Returns the (dist, parent) arrays of a breadth first search from
+        atom source, expanding a whole frontier of atoms at a time.  The
+        search stops early once target is reached.
+        """
+        dist = numpy.empty(self.num_atoms, int)
+        dist[:] = -1
+        parent = numpy.empty(self.num_atoms, int)
+        parent[:] = -1
+
+        dist[source] = 0
+        frontier = numpy.array([source], int)
+        level = 0
+
+        while len(frontier) > 0:
+            if target is not None and dist[target] != -1:
+                break
+
+            starts = self.indptr[frontier]
+            counts = self.indptr[frontier + 1] - starts
+            first = numpy.cumsum(counts) - counts
+            k = numpy.repeat(starts - first, counts) + numpy.arange(counts.sum())
+            nbrs = self.neighbors[k]
+            from_atoms = numpy.repeat(frontier, counts)
+
+            new = dist[nbrs] == -1
+            nbrs = nbrs[new]
+            from_atoms = from_atoms[new]
+            nbrs, first_index = numpy.unique(nbrs, return_index = True)
+
+            level += 1
+            dist[nbrs] = level
+            parent[nbrs] = from_atoms[first_index]
+            frontier = nbrs
+
+        return dist, parent
+
+    def save_file(self, fil):
+        """Saves the graph to fil, a file name or file object, in NumPy
+        .npz format.  Read it back with load_bond_graph().
+        """
+        names = self.bond_type_names
+        numpy.savez(
+            fil,
+            num_atoms         = numpy.array(self.num_atoms),
+            index1            = self.index1,
+            index2            = self.index2,
+            bond_type_code    = self.bond_type_code,
+            bond_type_names   = numpy.array(
+                [name or "" for name in names], str).reshape(len(names)),
+            bond_type_is_none = numpy.array(
+                [name is None for name in names], bool),
+            standard_res_bond = self.standard_res_bond)
+
+
+def load_bond_graph(fil):
+    """Returns the BondGraph saved in fil by BondGraph.save_file().
+    """
+    data = numpy.load(fil)
+    names = [None if is_none else str(name)
+             for name, is_none in zip(data["bond_type_names"].tolist(),
+                                      data["bond_type_is_none"].tolist())]
+    return BondGraph(
+        int(data["num_atoms"]),
+        data["index1"],
+        data["index2"],
+        bond_type_code    = data["bond_type_code"],
+        bond_type_names   = names,
+        standard_res_bond = data["standard_res_bond"])
@@ -5,6 +5,8 @@
 ##
 ## DESCRIPTION: CIF Parser for CIF 1.1 format
 
+import re
+
 from .mmCIF import mmCIFSyntaxError
 class CIFSyntaxError(mmCIFSyntaxError):
     pass
@@ -21,6 +23,12 @@ L_GLOBAL = "<global>"
 L_TAG = "<tag>"
 L_VALUE = "<value>"
 
+## the characters of string.whitespace
+WHITESPACE = " \t\n\r\x0b\x0c"
+
+## number of characters read from the file at a time by the Lexer
+LEXER_CHUNK_SIZE = 65536
+
 #
 # Parser classes
 #
@@ -141,6 +149,231 @@ class Table:
 #
 class Lexer:
     """Lexical analyzer for reading a CIF 1.1 file.
+
+    The file is read in blocks of LEXER_CHUNK_SIZE characters, and each
+    token is found with regular expression and str.find() calls on the
+    buffered text.  The Token stream, including the token line numbers,
+    is the same as the one of the character at a time CharLexer.
+    """
+    re_whitespace = re.compile("[%s]*" % WHITESPACE)
+
+    ## fast path for the common plain value: optional whitespace, a
+    ## value without any of the characters which start other tokens or
+    ## a underscore, and the whitespace character ending it
+    re_plain_value = re.compile(
+        "[%s]*([^%s#'\"\\[;_?.][^%s_]*)[%s]" % (
+        WHITESPACE, WHITESPACE, WHITESPACE, WHITESPACE))
+    re_token = re.compile("[^%s]*" % WHITESPACE)
+    re_quote_end = {
+        "'": re.compile("'[%s]" % WHITESPACE),
+        '"': re.compile('"[%s]' % WHITESPACE)}
+
+    def __init__(self, f, filename):
+        self.f = f
+        self.filename = filename
+        self.pushed_token = None
+        self.line = 1
+
+        ## buffered text, the file offset of buf[0], and the index
+        ## of the next character to scan
+        self.buf = ""
+        self.buf_offset = 0
+        self.pos = 0
+        self.at_eof = False
+
+        ## number of newlines in buf[:line_pos]
+        self.line_pos = 0
+
+        ## number of times the end of the file has been read; each read
+        ## counts as one character for the line numbers
+        self.eof_reads = 0
+
+    def next_token(self):
+        # Return any tokens from previous "push_back" calls
+        if self.pushed_token is not None:
+            t = self.pushed_token
+            self.pushed_token = None
+            return t
+
+        m = self.re_plain_value.match(self.buf, self.pos)
+        if m is not None:
+            last = m.end(1)
+            self.pos = last + 1
+            if last - 1 > self.line_pos:
+                self.line += self.buf.count('\n', self.line_pos, last - 1)
+                self.line_pos = last - 1
+            return Token(L_VALUE, m.group(1), self.line)
+
+        while True:
+            buf = self.buf
+            pos = self.re_whitespace.match(buf, self.pos).end()
+            self.pos = pos
+
+            if pos == len(buf):
+                if self.fill():
+                    continue
+                return self.eof_token()
+
+            c = buf[pos]
+            #
+            # Check for comments
+            #
+            if c == '#':
+                end = buf.find('\n', pos)
+                if end == -1:
+                    if self.fill():
+                        continue
+                    return self.eof_token()
+                # Start over with the next line
+                self.pos = end + 1
+                continue
+            #
+            # Check for quoted strings
+            #
+            if c == "'" or c == '"':
+                m = self.re_quote_end[c].search(buf, pos + 1)
+                if m is None:
+                    if self.fill():
+                        continue
+                    self.set_eof_line()
+                    raise CIFSyntaxError(self.line, "<eof> in quoted string")
+                end = m.start()
+                return self.token(L_VALUE, buf[pos + 1:end], end + 1)
+            #
+            # Check for (illegal) bracket string
+            #
+            if c == '[':
+                self.set_line(pos)
+                raise CIFSyntaxError(self.line,
+                        "bracket strings not permitted in CIF")
+            #
+            # Check for text field
+            #
+            if c == ';' and pos > 0 and buf[pos - 1] == '\n':
+                end = buf.find('\n;', pos + 1)
+                if end == -1:
+                    if self.fill():
+                        continue
+                    self.set_eof_line()
+                    raise CIFSyntaxError(self.line, "<eof> in text field")
+                return self.token(L_VALUE, buf[pos + 1:end], end + 1)
+            #
+            # Check for tags
+            #
+            if c == '_':
+                end = self.re_token.match(buf, pos + 1).end()
+                if end == len(buf):
+                    if self.fill():
+                        continue
+                    self.set_eof_line()
+                    raise CIFSyntaxError(self.line, "<eof> in tag")
+                return self.token(L_TAG, buf[pos + 1:end], end)
+            #
+            # Check for simple values
+            #
+            if c == '?':
+                return self.token(L_VALUE, c, pos)
+            if c == '.':
+                if pos + 1 == len(buf) and self.fill():
+                    continue
+                if pos + 1 == len(buf) or buf[pos + 1] in WHITESPACE:
+                    return self.token(L_VALUE, c, pos)
+            #
+            # Get a value with no embedded whitespace
+            #
+            end = self.re_token.match(buf, pos).end()
+            if end == len(buf):
+                if self.fill():
+                    continue
+                data = buf[pos:]
+                self.pos = end
+                self.set_eof_line()
+            else:
+                data = buf[pos:end]
+                self.pos = end + 1
+                self.set_line(end)
+
+            ## all the reserved words contain a underscore
+            if '_' not in data:
+                return Token(L_VALUE, data, self.line)
+
+            lc = data.lower()
+
+            if lc.startswith("data_"):
+                return Token(L_DATA, data[5:], self.line)
+            elif lc.startswith("loop_"):
+                return Token(L_LOOP, data[5:], self.line)
+            elif lc.startswith("save_"):
+                return Token(L_SAVE, data[5:], self.line)
+            elif lc.startswith("stop_"):
+                return Token(L_STOP, data[5:], self.line)
+            elif lc.startswith("global_"):
+                return Token(L_GLOBAL, data[5:], self.line)
+            else:
+                return Token(L_VALUE, data, self.line)
+
+    def fill(self):
+        """Reads the next block of the file into the buffer.  Returns False
+        at the end of the file.
+        """
+        if self.at_eof:
+            return False
+
+        chunk = self.f.read(LEXER_CHUNK_SIZE)
+        if not chunk:
+            self.at_eof = True
+            return False
+
+        ## drop the scanned text, but keep the character before
+        ## self.pos, which marks the start of text fields
+        cut = min(self.pos - 1, self.line_pos)
+        if cut > 0:
+            self.buf = self.buf[cut:] + chunk
+            self.buf_offset += cut
+            self.pos -= cut
+            self.line_pos -= cut
+        else:
+            self.buf = self.buf + chunk
+        return True
+
+    def set_line(self, last):
+        """Sets self.line for a token which ends with the character at
+        buf[last].  Like CharLexer, the newline just before that character
+        is not counted yet.
+        """
+        end = last - 1
+        if end > self.line_pos:
+            self.line += self.buf.count('\n', self.line_pos, end)
+            self.line_pos = end
+
+    def set_eof_line(self):
+        """Sets self.line for a read of the end of the file.
+        """
+        self.set_line(len(self.buf) + self.eof_reads)
+        self.eof_reads += 1
+
+    def eof_token(self):
+        self.pos = len(self.buf)
+        self.set_eof_line()
+        return Token(L_EOF, None, self.line)
+
+    def token(self, type, value, last):
+        self.pos = last + 1
+        self.set_line(last)
+        return Token(type, value, self.line)
+
+    def push_back(self, token):
+        assert(self.pushed_token is None)
+        self.pushed_token = token
+
+    def msg(self, s):
+        return formatMessage(self.filename, self.line, s)
+
+
+class CharLexer:
+    """Reference lexical analyzer for reading a CIF 1.1 file one character
+    at a time.  Lexer produces the same Token stream much faster; this
+    class is kept to test and benchmark it against.
     """
 
     def __init__(self, f, filename):
@@ -10,6 +10,12 @@ import random
 import math
 import itertools
 
+import numpy
+
+## maximum number of cells probed at once by XYZCellList queries; bounds
+## the size of the temporary candidate arrays
+CELL_PROBE_BLOCK = 65536
+
 
 class XYZDict(object):
     """Hash all objects according to their position, allowing spacial
@@ -110,29 +116,285 @@ class XYZDict(object):
     def iter_contact_distance(self, distance):
         """Iterates all items within a given contact distance.
         """
-        visited = {}
+        geom_list = list(self.iter_all())
+        if len(geom_list) == 0:
+            return
 
-        for geom_tuple1 in self.iter_all():
-            visited[geom_tuple1[1]] = True
+        cell_list = XYZCellList(
+            [geom_tuple[0] for geom_tuple in geom_list],
+            max(self.resolution, distance))
 
-            for geom_tuple2 in self.iter_cube_intersection(
-                geom_tuple1[0], distance):
+        index1, index2, dist = cell_list.calc_contact_pairs(distance)
 
-                if geom_tuple2[1] in visited:
-                    continue
+        for i, j, d in zip(index1.tolist(), index2.tolist(), dist.tolist()):
+            yield geom_list[i], geom_list[j], d
 
-                p1 = geom_tuple1[0]
-                p2 = geom_tuple2[0]
 
-                d = math.sqrt((p1[0]-p2[0])**2 + \
-                              (p1[1]-p2[1])**2 + \
-                              (p1[2]-p2[2])**2)
+class XYZCellList(object):
+    """Cell list spatial index over a fixed array of positions, answering
+    neighbor queries for many points at once with NumPy.  The positions
+    are sorted into cubic cells with edges of length resolution; a query
+    of radius r probes the cube of cells within ceil(r / resolution)
+    cells of each query point.  All queries return index arrays into
+    the positions array.
+    """
+    def __init__(self, positions, resolution = 2.0):
+        assert resolution > 0.0
 
-                if d>distance:
-                    continue
+        self.positions = numpy.asarray(positions, float).reshape(-1, 3)
+        self.resolution = float(resolution)
+
+        num_positions = len(self.positions)
+        if num_positions > 0:
+            self.origin = self.positions.min(axis = 0)
+        else:
+            self.origin = numpy.zeros(3, float)
+
+        cell_xyz = self.calc_cell_xyz(self.positions)
+        if num_positions > 0:
+            self.shape = cell_xyz.max(axis = 0) + 1
+        else:
+            self.shape = numpy.ones(3, int)
+
+        ## sort the positions by cell; the occupied cells are kept in
+        ## sorted arrays so sparse grids use no memory for empty cells
+        cell_id = self.calc_cell_id(cell_xyz)
+        self.order = numpy.argsort(cell_id, kind = "stable")
+        self.sorted_positions = self.positions[self.order]
+        self.sorted_cell_xyz = cell_xyz[self.order]
+        self.sorted_cell_id = cell_id[self.order]
+
+        self.cell_id, self.cell_start, self.cell_count = numpy.unique(
+            self.sorted_cell_id, return_index = True, return_counts = True)
+        self.cell_xyz = self.sorted_cell_xyz[self.cell_start]
+
+    def __len__(self):
+        return len(self.positions)
+
+    def calc_cell_xyz(self, positions):
+        """Returns the integer (n,3) cell coordinates of positions.
+        """
+        return numpy.floor(
+            (positions - self.origin) / self.resolution).astype(int)
+
+    def calc_cell_id(self, cell_xyz):
+        """Returns the linear cell ids of the (n,3) cell coordinates, which
+        must be inside the grid.
+        """
+        return (cell_xyz[:, 0] * self.shape[1] + cell_xyz[:, 1]) * \
+               self.shape[2] + cell_xyz[:, 2]
+
+    def calc_cell_offsets(self, reach, half = False):
+        """Returns the (m,3) cell offsets of the cube of cells within reach
+        cells.  If half is True, only the zero offset and the offsets
+        which are lexicographically positive are returned, so each pair
+        of cells is probed once.
+        """
+        r = numpy.arange(-reach, reach + 1)
+        offsets = numpy.array(
+            numpy.meshgrid(r, r, r, indexing = "ij")).reshape(3, -1).T
+        if half:
+            offsets = offsets[calc_offset_key(offsets, reach) >= 0]
+        return offsets
+
+    def count_cell_probes(self, reach):
+        """Returns the number of cells probed for each query point.  Once
+        the cube of cells within reach is larger than the number of
+        occupied cells, the occupied cells are scanned instead.
+        """
+        return min((2 * reach + 1) ** 3, max(len(self.cell_id), 1))
+
+    def calc_candidate_cells(self, query_cell_xyz, reach, half = False):
+        """Returns the (query_index, cell_index) arrays of the occupied
+        cells within reach cells of query_cell_xyz[query_index].  The
+        second array indexes self.cell_id.
+        """
+        if (2 * reach + 1) ** 3 > len(self.cell_id):
+            delta = self.cell_xyz[None, :, :] - query_cell_xyz[:, None, :]
+            mask = numpy.all(numpy.abs(delta) <= reach, axis = 2)
+            if half:
+                mask &= calc_offset_key(delta, reach) >= 0
+            return numpy.nonzero(mask)
+
+        offsets = self.calc_cell_offsets(reach, half)
+        cells = (query_cell_xyz[:, None, :] + offsets[None, :, :]).reshape(-1, 3)
+        query_index = numpy.repeat(
+            numpy.arange(len(query_cell_xyz)), len(offsets))
+
+        inside = numpy.all((cells >= 0) & (cells < self.shape), axis = 1)
+        cells = cells[inside]
+        query_index = query_index[inside]
+
+        cell_id = self.calc_cell_id(cells)
+        cell_index = numpy.searchsorted(self.cell_id, cell_id)
+        cell_index[cell_index == len(self.cell_id)] = 0
+        found = self.cell_id[cell_index] == cell_id
+        return query_index[found], cell_index[found]
+
+    def calc_candidate_pairs(self, query_cell_xyz, reach, half = False):
+        """Returns the (query_index, sorted_index) arrays of all positions
+        in the cells within reach cells of query_cell_xyz[query_index].
+        The second array indexes self.sorted_positions.
+        """
+        query_index, cell_index = self.calc_candidate_cells(
+            query_cell_xyz, reach, half)
+
+        starts = self.cell_start[cell_index]
+        counts = self.cell_count[cell_index]
+        total = counts.sum()
+
+        ## expand each cell into the range of its sorted positions
+        first = numpy.cumsum(counts) - counts
+        sorted_index = numpy.repeat(starts - first, counts) + numpy.arange(total)
+        query_index = numpy.repeat(query_index, counts)
+        return query_index, sorted_index
+
+    def iter_query_blocks(self, num_queries, reach):
+        """Iterates (start, end) ranges of query points, sized so each
+        block probes about CELL_PROBE_BLOCK cells.
+        """
+        block = max(1, CELL_PROBE_BLOCK // self.count_cell_probes(reach))
+        for start in range(0, num_queries, block):
+            yield start, min(start + block, num_queries)
+
+    def calc_contact_pairs(self, distance):
+        """Returns the (index1, index2, dist) arrays of all pairs of
+        positions within distance of each other, with index1 < index2,
+        sorted by index1 and then index2.
+        """
+        reach = int(math.ceil(distance / self.resolution))
+
+        pair_list = []
+        for start, end in self.iter_query_blocks(len(self), reach):
+            qi, si = self.calc_candidate_pairs(
+                self.sorted_cell_xyz[start:end], reach, half = True)
+            qi += start
+
+            ## positions in the same cell are paired once
+            mask = (self.sorted_cell_id[qi] != self.sorted_cell_id[si]) | (si > qi)
+            qi = qi[mask]
+            si = si[mask]
+
+            delta = self.sorted_positions[qi] - self.sorted_positions[si]
+            dist = numpy.sqrt(numpy.sum(delta * delta, axis = 1))
+            mask = dist <= distance
+            pair_list.append((qi[mask], si[mask], dist[mask]))
+
+        index1, index2, dist = concatenate_pairs(pair_list)
+        index1 = self.order[index1]
+        index2 = self.order[index2]
+
+        swap = index1 > index2
+        index1[swap], index2[swap] = index2[swap], index1[swap]
+        return sort_pairs(index1, index2, dist)
+
+    def calc_radius_neighbors(self, centers, radius):
+        """Returns the (center_index, index, dist) arrays of all positions
+        within radius of each of the (m,3) centers, sorted by
+        center_index and then index.
+        """
+        centers = numpy.asarray(centers, float).reshape(-1, 3)
+        reach = int(math.ceil(radius / self.resolution))
+        center_cell_xyz = self.calc_cell_xyz(centers)
+
+        pair_list = []
+        for start, end in self.iter_query_blocks(len(centers), reach):
+            qi, si = self.calc_candidate_pairs(
+                center_cell_xyz[start:end], reach)
+            qi += start
+
+            delta = centers[qi] - self.sorted_positions[si]
+            dist = numpy.sqrt(numpy.sum(delta * delta, axis = 1))
+            mask = dist <= radius
+            pair_list.append((qi[mask], si[mask], dist[mask]))
+
+        center_index, index, dist = concatenate_pairs(pair_list)
+        return sort_pairs(center_index, self.order[index], dist)
+
+    def calc_k_nearest(self, centers, k):
+        """Returns the (index, dist) (m,k) arrays of the k positions nearest
+        to each of the (m,3) centers, nearest first.  If there are fewer
+        than k positions, the missing entries have index -1 and distance
+        inf.  A center which is one of the positions finds itself at
+        distance 0.
+        """
+        centers = numpy.asarray(centers, float).reshape(-1, 3)
+        num_centers = len(centers)
+
+        knn_index = numpy.empty((num_centers, k), int)
+        knn_index[:] = -1
+        knn_dist = numpy.empty((num_centers, k), float)
+        knn_dist[:] = numpy.inf
+
+        if len(self) == 0 or k < 1:
+            return knn_index, knn_dist
+
+        ## search radius starts at the distance to the grid box and is
+        ## doubled for the centers with fewer than k positions in it; all
+        ## positions are inside the search radius once it reaches the
+        ## distance to the farthest corner of the box
+        lower = self.origin
+        upper = self.origin + self.shape * self.resolution
+        gap = numpy.maximum(numpy.maximum(lower - centers, centers - upper), 0.0)
+        radius = numpy.sqrt(numpy.sum(gap * gap, axis = 1)) + self.resolution
+        far = numpy.maximum(numpy.abs(centers - lower), numpy.abs(centers - upper))
+        max_radius = numpy.sqrt(numpy.sum(far * far, axis = 1))
+
+        pending = numpy.arange(num_centers)
+        while len(pending) > 0:
+            ## centers with similar radii are searched together
+            level = numpy.ceil(numpy.log2(radius[pending] / self.resolution))
+            done_list = []
+            for lvl in numpy.unique(level):
+                group = pending[level == lvl]
+                group_radius = self.resolution * 2.0 ** lvl
+                ci, index, dist = self.calc_radius_neighbors(
+                    centers[group], group_radius)
+
+                order = numpy.lexsort((dist, ci))
+                ci = ci[order]
+                index = index[order]
+                dist = dist[order]
+
+                counts = numpy.bincount(ci, minlength = len(group))
+                first = numpy.cumsum(counts) - counts
+                rank = numpy.arange(len(ci)) - first[ci]
+
+                done = (counts >= k) | (group_radius >= max_radius[group])
+                keep = (rank < k) & done[ci]
+                knn_index[group[ci[keep]], rank[keep]] = index[keep]
+                knn_dist[group[ci[keep]], rank[keep]] = dist[keep]
+
+                radius[group] = 2.0 * group_radius
+                done_list.append(group[done])
+
+            pending = numpy.setdiff1d(pending, numpy.concatenate(done_list))
+
+        return knn_index, knn_dist
+
+
+def calc_offset_key(offsets, reach):
+    """Returns a integer key of the cell offsets within reach cells which
+    has the sign of the first non-zero offset component.
+    """
+    base = 2 * reach + 1
+    return (offsets[..., 0] * base + offsets[..., 1]) * base + offsets[..., 2]
+
+
+def concatenate_pairs(pair_list):
+    """Concatenates a list of (index1, index2, dist) array 3-tuples.
+    """
+    if len(pair_list) == 0:
+        return numpy.zeros(0, int), numpy.zeros(0, int), numpy.zeros(0, float)
+    return tuple(numpy.concatenate(arrays) for arrays in zip(*pair_list))
+
+
+def sort_pairs(index1, index2, dist):
+    """Sorts the (index1, index2, dist) arrays by index1 and then index2.
+    """
+    order = numpy.lexsort((index2, index1))
+    return index1[order], index2[order], dist[order]
 
-                yield geom_tuple1, geom_tuple2, d
-                
 
 ### <testing>
 def test_module():
@@ -5,7 +5,9 @@
 """Monomer and element library data classes.  The Library classes are used
 for the identification and construction of biopolymers and ligands.
 """
+import json
 import os
+import pathlib
 import sys
 import types
 
@@ -22,8 +24,12 @@ ELEMENT_DATA_PATH       = os.path.join(MMLIB_PATH, "Data", "elements.cif")
 MMLIB_MONOMER_DATA_PATH = os.path.join(MMLIB_PATH, "Data", "monomers.cif")
 RCSB_MONOMER_DATA_FILE  = os.path.join(MMLIB_PATH, "Data", "Monomers.zip") 
 RCSB_MONOMER_DATA_PATH  = os.path.join(MMLIB_PATH, "Data", "Monomers")
+LIBRARY_INDEX_PATH      = os.path.join(MMLIB_PATH, "Data", "Library.db")
 
-if not os.path.exists(RCSB_MONOMER_DATA_PATH) and (not os.path.exists(RCSB_MONOMER_DATA_FILE) or os.path.getsize(RCSB_MONOMER_DATA_FILE) < 1000):
+## bump when the layout of the records in the library index changes
+LIBRARY_INDEX_VERSION   = "1"
+
+if not os.path.exists(LIBRARY_INDEX_PATH) and not os.path.exists(RCSB_MONOMER_DATA_PATH) and (not os.path.exists(RCSB_MONOMER_DATA_FILE) or os.path.getsize(RCSB_MONOMER_DATA_FILE) < 1000):
     print(
         'ERROR: Monomer Library does not exist!\nLooked for zip file ({}) or folder ({}).\nPlease use the mmlib-build-library tool to download the library from PDBe!'.format(
             RCSB_MONOMER_DATA_FILE, RCSB_MONOMER_DATA_PATH))
@@ -34,15 +40,17 @@ if not os.path.exists(RCSB_MONOMER_DATA_PATH) and (not os.path.exists(RCSB_MONOM
 ELEMENT_CACHE          = {}
 MONOMER_RES_NAME_CACHE = {}
 
-ELEMENT_CIF_FILE = mmCIF.mmCIFFile()
-ELEMENT_CIF_FILE.load_file(open(ELEMENT_DATA_PATH, "r"))
-
-MMLIB_MONOMERS_CIF = mmCIF.mmCIFFile()
-MMLIB_MONOMERS_CIF.load_file(open(MMLIB_MONOMER_DATA_PATH, "r"))
+## elements.cif and monomers.cif are parsed on first use by
+## library_get_element_cif_file() and library_get_mmlib_monomers_cif()
+ELEMENT_CIF_FILE_CACHE = None
+MMLIB_MONOMERS_CIF_CACHE = None
 
 RCSB_USE_ZIP = None
 RCSB_ZIP = None
 
+LIBRARY_INDEX = None
+LIBRARY_INDEX_PID = None
+
 ###############################################################################
 ## Constants
 ##
@@ -257,28 +265,124 @@ class MonomerDesc(object):
 ## Library API
 ##
 
-def library_construct_element_desc(symbol):
-    """Constructs the ElementDesc object for the given element symbol.
+def library_get_element_cif_file():
+    """Returns the mmCIFFile of mmLib/Data/elements.cif, loading it the
+    first time it is needed.
     """
-    cif_data = ELEMENT_CIF_FILE.get_data(symbol)
-    if cif_data is None:
-        ConsoleOutput.warning("element description not found for %s" % (symbol))
+    global ELEMENT_CIF_FILE_CACHE
+    if ELEMENT_CIF_FILE_CACHE is None:
+        cif_file = mmCIF.mmCIFFile()
+        cif_file.load_file(open(ELEMENT_DATA_PATH, "r"))
+        ELEMENT_CIF_FILE_CACHE = cif_file
+    return ELEMENT_CIF_FILE_CACHE
+
+
+def library_get_mmlib_monomers_cif():
+    """Returns the mmCIFFile of the supplemental monomer library
+    mmLib/Data/monomers.cif, loading it the first time it is needed.
+    """
+    global MMLIB_MONOMERS_CIF_CACHE
+    if MMLIB_MONOMERS_CIF_CACHE is None:
+        cif_file = mmCIF.mmCIFFile()
+        cif_file.load_file(open(MMLIB_MONOMER_DATA_PATH, "r"))
+        MMLIB_MONOMERS_CIF_CACHE = cif_file
+    return MMLIB_MONOMERS_CIF_CACHE
+
+
+def __getattr__(name):
+    """Loads the ELEMENT_CIF_FILE and MMLIB_MONOMERS_CIF module attributes
+    on first access.
+    """
+    if name == "ELEMENT_CIF_FILE":
+        return library_get_element_cif_file()
+    if name == "MMLIB_MONOMERS_CIF":
+        return library_get_mmlib_monomers_cif()
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def library_open_index():
+    """Returns the read-only sqlite3 connection to the precompiled library
+    index mmLib/Data/Library.db written by build_library.build_library_index(),
+    or None if there is no usable index.  The connection is opened once per
+    process, so forked worker processes do not share it.
+    """
+    global LIBRARY_INDEX
+    global LIBRARY_INDEX_PID
+
+    pid = os.getpid()
+    if LIBRARY_INDEX_PID == pid:
+        return LIBRARY_INDEX
+
+    LIBRARY_INDEX = None
+    LIBRARY_INDEX_PID = pid
+
+    if not os.path.isfile(LIBRARY_INDEX_PATH):
         return None
 
-    ## create element description
-    element_desc = ElementDesc()
+    import sqlite3
+    uri = pathlib.Path(LIBRARY_INDEX_PATH).resolve().as_uri() + "?mode=ro"
+    try:
+        index = sqlite3.connect(uri, uri = True, check_same_thread = False)
+        row = index.execute(
+            "SELECT value FROM info WHERE name = 'version'").fetchone()
+    except sqlite3.Error as err:
+        ConsoleOutput.warning("unable to read library index %s: %s" % (
+            LIBRARY_INDEX_PATH, err))
+        return None
 
-    element_desc.cif_data = cif_data
+    if row is None or row[0] != LIBRARY_INDEX_VERSION:
+        ConsoleOutput.warning(
+            "library index %s is out of date, rebuild it with "\
+            "mmlib-build-library --index-only" % (LIBRARY_INDEX_PATH))
+        index.close()
+        return None
+
+    LIBRARY_INDEX = index
+    return LIBRARY_INDEX
+
+
+def library_get_index_record(table, name):
+    """Returns the record stored under name in the given table of the
+    library index, or None if there is no index or no such record.
+    """
+    index = library_open_index()
+    if index is None:
+        return None
+    row = index.execute(
+        "SELECT record FROM %s WHERE name = ?" % (table), (name,)).fetchone()
+    if row is None:
+        return None
+    return json.loads(row[0])
 
+
+def library_cif_element_record(cif_data):
+    """Returns the element record of the library index for a data block
+    of mmLib/Data/elements.cif.
+    """
     element = cif_data.get_table("element")
-    element_desc.name            = element["name"]
-    element_desc.symbol          = element["symbol"]
-    element_desc.number          = int(element["number"])
-    element_desc.atomic_weight   = float(element["atomic_weight"])
-    element_desc.vdw_radius      = float(element["van_der_walls_radius"])
-    element_desc.covalent_radius = float(element.get("covalent_radius", 0.0))
-
-    rgb8 = element["color_rgb"]
+    return {
+        "name":            element["name"],
+        "symbol":          element["symbol"],
+        "number":          int(element["number"]),
+        "atomic_weight":   float(element["atomic_weight"]),
+        "vdw_radius":      float(element["van_der_walls_radius"]),
+        "covalent_radius": float(element.get("covalent_radius", 0.0)),
+        "color_rgb":       element["color_rgb"]}
+
+
+def library_construct_element_desc_from_record(element_record):
+    """Constructs the ElementDesc object from an element record.
+    """
+    element_desc = ElementDesc()
+
+    element_desc.name            = element_record["name"]
+    element_desc.symbol          = element_record["symbol"]
+    element_desc.number          = element_record["number"]
+    element_desc.atomic_weight   = element_record["atomic_weight"]
+    element_desc.vdw_radius      = element_record["vdw_radius"]
+    element_desc.covalent_radius = element_record["covalent_radius"]
+
+    rgb8 = element_record["color_rgb"]
     element_desc.color_rgbf = (int(rgb8[1:3], 16) / 255.0,
                                int(rgb8[3:5], 16) / 255.0,
                                int(rgb8[5:7], 16) / 255.0)
@@ -286,6 +390,27 @@ def library_construct_element_desc(symbol):
     return element_desc
 
 
+def library_construct_element_desc(symbol):
+    """Constructs the ElementDesc object for the given element symbol, from
+    the library index if there is one, otherwise from elements.cif.
+    """
+    element_record = library_get_index_record("element", symbol.lower())
+    if element_record is not None:
+        return library_construct_element_desc_from_record(element_record)
+
+    cif_data = library_get_element_cif_file().get_data(symbol)
+    if cif_data is None:
+        ConsoleOutput.warning("element description not found for %s" % (symbol))
+        return None
+
+    ## create element description
+    element_desc = library_construct_element_desc_from_record(
+        library_cif_element_record(cif_data))
+    element_desc.cif_data = cif_data
+
+    return element_desc
+
+
 def library_get_element_desc(symbol):
     """Loads/caches/returns an instance of the ElementDesc class for the given
     element symbol. The source of the element data is the
@@ -367,38 +492,21 @@ def library_open_monomer_lib_file(monomer_name):
     return libfil
 
 
-def library_construct_monomer_desc(res_name):
-    """Constructs the MonomerDesc object for the given residue name.
+def library_cif_monomer_record(rcsb_cif_data, res_name):
+    """Returns the monomer record of the library index for a data block of
+    the RCSB monomer library.
     """
-    ## return None when the res_name is an empty string
-    if len(res_name) < 1:
-        return None
-
-    if res_name in ALT_RES_NAME_DICT:
-        lookup_name = ALT_RES_NAME_DICT[res_name]
-    else:
-        lookup_name = res_name.upper()
-
-    libfil = library_open_monomer_lib_file(lookup_name)
-    if libfil is None:
-        ConsoleOutput.warning("monomer description not found for '%s'" % (res_name))
-        return None
-
-    ## generate monomer description    
-    mon_desc = MonomerDesc()
-    ## data from RCSB library
-    rcsb_cif_file = mmCIF.mmCIFFile()
-    rcsb_cif_file.load_file(libfil)
-    rcsb_cif_data = rcsb_cif_file[0]
-    libfil.close()
-
     chem_comp = rcsb_cif_data.get_table("chem_comp")[0]
-    mon_desc.res_name     = chem_comp.get_lower("res_name")
-    mon_desc.full_name    = chem_comp.get_lower("name")
-    mon_desc.type         = chem_comp.get_lower("type")
-    mon_desc.pdbx_type    = chem_comp.get_lower("pdbx_type")
-    mon_desc.formula      = chem_comp.get_lower("formula")
-    mon_desc.rcsb_class_1 = chem_comp.get_lower("rcsb_class_1")
+    monomer_record = {
+        "res_name":      chem_comp.get_lower("res_name"),
+        "full_name":     chem_comp.get_lower("name"),
+        "type":          chem_comp.get_lower("type"),
+        "pdbx_type":     chem_comp.get_lower("pdbx_type"),
+        "formula":       chem_comp.get_lower("formula"),
+        "rcsb_class_1":  chem_comp.get_lower("rcsb_class_1"),
+        "atom_list":     [],
+        "alt_atom_list": [],
+        "bond_list":     []}
 
     chem_comp_atom = rcsb_cif_data.get_table("chem_comp_atom")
     if chem_comp_atom is not None:
@@ -415,38 +523,78 @@ def library_construct_monomer_desc(res_name):
                     symbol, res_name)
                 ConsoleOutput.warning(msg)
 
-            mon_desc.atom_list.append({"name": name, "symbol": symbol})
-            mon_desc.atom_dict[name] = symbol
+            monomer_record["atom_list"].append((name, symbol))
             try:
                 alt_name = cif_row.getitem_lower("alt_atom_id")
             except KeyError:
                 pass
             else:
-                mon_desc.alt_atom_dict[name] = alt_name
+                monomer_record["alt_atom_list"].append((name, alt_name))
 
     chem_comp_bond = rcsb_cif_data.get_table("chem_comp_bond")
     if chem_comp_bond is not None:
         for cif_row in chem_comp_bond:
             atom1 = cif_row.getitem_lower("atom_id_1")
             atom2 = cif_row.getitem_lower("atom_id_2")
-            mon_desc.bond_list.append({"atom1": atom1, "atom2": atom2}) 
+            monomer_record["bond_list"].append((atom1, atom2))
+
+    return monomer_record
+
+
+def library_cif_mmlib_monomer_record(mmlib_cif_data):
+    """Returns the supplemental monomer record of the library index for a
+    data block of mmLib/Data/monomers.cif.
+    """
+    mmlib_record = {
+        "one_letter_code":    None,
+        "chem_type":          None,
+        "torsion_angle_list": []}
+
+    ## get additional chemical information on amino acids
+    chem_comp = mmlib_cif_data.get_table("chem_comp")
+    if chem_comp is not None:
+        mmlib_record["one_letter_code"] = chem_comp["one_letter_code"]
+        mmlib_record["chem_type"] = chem_comp["chem_type"]
+
+    ## get torsion angle definitions
+    torsion_angles = mmlib_cif_data.get_table("torsion_angles")
+    if torsion_angles is not None:
+        for cif_row in torsion_angles:
+            mmlib_record["torsion_angle_list"].append(
+                (cif_row["name"], cif_row["atom1"], cif_row["atom2"],
+                 cif_row["atom3"], cif_row["atom4"]))
+
+    return mmlib_record
+
+
+def library_construct_monomer_desc_from_records(monomer_record, mmlib_record):
+    """Constructs the MonomerDesc object from a monomer record and an
+    optional (None) supplemental mmLib monomer record.
+    """
+    mon_desc = MonomerDesc()
+
+    ## data from RCSB library
+    mon_desc.res_name     = monomer_record["res_name"]
+    mon_desc.full_name    = monomer_record["full_name"]
+    mon_desc.type         = monomer_record["type"]
+    mon_desc.pdbx_type    = monomer_record["pdbx_type"]
+    mon_desc.formula      = monomer_record["formula"]
+    mon_desc.rcsb_class_1 = monomer_record["rcsb_class_1"]
+
+    for name, symbol in monomer_record["atom_list"]:
+        mon_desc.atom_list.append({"name": name, "symbol": symbol})
+        mon_desc.atom_dict[name] = symbol
+    for name, alt_name in monomer_record["alt_atom_list"]:
+        mon_desc.alt_atom_dict[name] = alt_name
+    for atom1, atom2 in monomer_record["bond_list"]:
+        mon_desc.bond_list.append({"atom1": atom1, "atom2": atom2})
 
     ## data from mmLib supplemental library in mmLib/Data/monomers.cif
-    mmlib_cif_data = MMLIB_MONOMERS_CIF.get_data(res_name)
-    if mmlib_cif_data is not None:
-        ## get additional chemical information on amino acids
-        chem_comp = mmlib_cif_data.get_table("chem_comp")
-        if chem_comp is not None:
-            mon_desc.one_letter_code = chem_comp["one_letter_code"]
-            mon_desc.chem_type = chem_comp["chem_type"]
-
-        ## get torsion angle definitions
-        torsion_angles = mmlib_cif_data.get_table("torsion_angles")
-        if torsion_angles is not None:
-            for cif_row in torsion_angles:
-                mon_desc.torsion_angle_dict[cif_row["name"]] = (
-                    cif_row["atom1"], cif_row["atom2"], 
-                    cif_row["atom3"], cif_row["atom4"])
+    if mmlib_record is not None:
+        mon_desc.one_letter_code = mmlib_record["one_letter_code"]
+        mon_desc.chem_type = mmlib_record["chem_type"]
+        for name, atom1, atom2, atom3, atom4 in mmlib_record["torsion_angle_list"]:
+            mon_desc.torsion_angle_dict[name] = (atom1, atom2, atom3, atom4)
 
     ## set some derived flags on the monomer description
     mon_type = mon_desc.type.upper()
@@ -462,6 +610,51 @@ def library_construct_monomer_desc(res_name):
 
     return mon_desc
 
+
+def library_construct_monomer_desc(res_name):
+    """Constructs the MonomerDesc object for the given residue name.  The
+    precompiled library index is used if it has the monomer, otherwise the
+    monomer mmCIF file is parsed.
+    """
+    ## return None when the res_name is an empty string
+    if len(res_name) < 1:
+        return None
+
+    if res_name in ALT_RES_NAME_DICT:
+        lookup_name = ALT_RES_NAME_DICT[res_name]
+    else:
+        lookup_name = res_name.upper()
+
+    if library_open_index() is not None:
+        monomer_record = library_get_index_record("monomer", lookup_name.upper())
+        if monomer_record is not None:
+            mmlib_record = library_get_index_record(
+                "mmlib_monomer", res_name.lower())
+            return library_construct_monomer_desc_from_records(
+                monomer_record, mmlib_record)
+
+    libfil = library_open_monomer_lib_file(lookup_name)
+    if libfil is None:
+        ConsoleOutput.warning("monomer description not found for '%s'" % (res_name))
+        return None
+
+    ## data from RCSB library
+    rcsb_cif_file = mmCIF.mmCIFFile()
+    rcsb_cif_file.load_file(libfil)
+    rcsb_cif_data = rcsb_cif_file[0]
+    libfil.close()
+    monomer_record = library_cif_monomer_record(rcsb_cif_data, res_name)
+
+    ## data from mmLib supplemental library in mmLib/Data/monomers.cif
+    mmlib_cif_data = library_get_mmlib_monomers_cif().get_data(res_name)
+    if mmlib_cif_data is not None:
+        mmlib_record = library_cif_mmlib_monomer_record(mmlib_cif_data)
+    else:
+        mmlib_record = None
+
+    return library_construct_monomer_desc_from_records(
+        monomer_record, mmlib_record)
+
 def library_get_monomer_desc(res_name):
     """Loads/caches/returns the monomer description objec MonomerDesc
     for the given monomer residue name.
@@ -612,7 +805,7 @@ def library_guess_element_from_name(name0, res_name):
 def test_module():
     h = library_get_element_desc("H")
 
-    for cif_data in ELEMENT_CIF_FILE:
+    for cif_data in library_get_element_cif_file():
         if len(cif_data.name) == 1:
             print('    "%s" : True, "%s" : True,' % (
                 cif_data.name, cif_data.name.lower()))
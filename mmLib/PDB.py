@@ -7,6 +7,8 @@ specification have corresponding classes defined here. PDB files are
 loaded into a list of these cassed, and also can be constrcted/modified
 and written back out as PDB files.
 """
+import numpy
+
 
 class PDBError(Exception):
     """
@@ -1515,25 +1517,237 @@ PDBRecordOrder = [
 ## END PDB RECORD DEFINITIONS
 ###############################################################################
 
+def read_pdb_record(ln):
+    """Converts a PDB line to the correct PDB record object and returns
+    it, or returns None if the line is not a known PDB record.
+    """
+    ## find the record data element for the given line
+    ln = ln.rstrip()
+    rname = ln[:6].ljust(6)
+
+    try:
+        pdb_record_class = PDBRecordMap[rname]
+    except KeyError:
+        return None
+
+    ## create/add/parse the record
+    pdb_record = pdb_record_class()
+    pdb_record.read(ln)
+    return pdb_record
+
+
 def iter_pdb_records(iterable):
     """Reads a sequence of PDB lines from iterable sequence and converts
     them to the correct PDB record objects, then yields them.
     """
-    iterable = iter(iterable)
     for ln in iterable:
-        ## find the record data element for the given line
-        ln = ln.rstrip()
-        rname = ln[:6].ljust(6)
+        pdb_record = read_pdb_record(ln)
+        if pdb_record is not None:
+            yield pdb_record
+
+
+## the records of the coordinate section which are read column-wise by
+## PDBCoordinateBlock instead of record by record
+COORDINATE_RECORD_NAMES = (
+    ATOM._name,
+    HETATM._name,
+    ANISOU._name,
+    SIGATM._name,
+    SIGUIJ._name,
+    MODEL._name,
+    ENDMDL._name,
+    TER._name)
+
+
+def read_fixed_width_fields(line_list, field_list):
+    """Reads the fields described by field_list (in the format of
+    PDBRecord._field_list) from all the lines in line_list at once, using
+    fixed-width slicing of a NumPy character buffer.  The lines must be
+    either all str or all bytes.  Returns a dictionary mapping field names
+    to columns.  Float and integer fields are float arrays with NaN where
+    the field is blank or cannot be converted, string fields are lists of
+    str stripped the same way PDBRecord.read() strips them.
+    """
+    num_lines = len(line_list)
+    width = max([field[2] for field in field_list])
 
-        try:
-            pdb_record_class = PDBRecordMap[rname]
-        except KeyError:
+    if num_lines > 0 and isinstance(line_list[0], bytes):
+        char_type, code_type = "S", numpy.uint8
+    else:
+        char_type, code_type = "U", numpy.uint32
+
+    ## lines are truncated or NUL padded to the same width; turn the
+    ## padding and any control characters into blanks
+    buf = numpy.array(line_list, "%s%d" % (char_type, width))
+    chars = buf.view(code_type).reshape(num_lines, width)
+    chars[chars < 32] = 32
+    if char_type == "S":
+        chars[chars > 126] = 63
+
+    columns = {}
+    for (field, start, end, ftype, just, get_func) in field_list:
+        field_width = end - start + 1
+        col = numpy.ascontiguousarray(chars[:, start-1:end])
+        blank = (col == 32).all(axis=1)
+        svals = col.view("%s%d" % (char_type, field_width)).reshape(num_lines)
+
+        if ftype.startswith("string"):
+            if char_type == "S":
+                svals = svals.astype("U%d" % (field_width))
+            if just.endswith("lstrip"):
+                svals = numpy.char.lstrip(svals)
+            elif just.endswith("rstrip"):
+                svals = numpy.char.rstrip(svals)
+            else:
+                svals = numpy.char.strip(svals)
+            columns[field] = svals.tolist()
             continue
 
-        ## create/add/parse the record
-        pdb_record = pdb_record_class()
-        pdb_record.read(ln)
-        yield pdb_record
+        values = numpy.empty(num_lines, float)
+        values[blank] = numpy.nan
+
+        filled = ~blank
+        try:
+            values[filled] = svals[filled].astype(float)
+        except ValueError:
+            ## slow path: at least one field is invalid
+            for i in numpy.nonzero(filled)[0]:
+                try:
+                    values[i] = float(svals[i])
+                except ValueError:
+                    values[i] = numpy.nan
+
+        if ftype.startswith("integer"):
+            values[values != numpy.floor(values)] = numpy.nan
+
+        columns[field] = values
+
+    return columns
+
+
+class PDBCoordinateBlock(object):
+    """Collects the lines of the coordinate section of a PDB file
+    (ATOM, HETATM, ANISOU, SIGATM, SIGUIJ, MODEL, ENDMDL and TER records)
+    and reads them column-wise with read_fixed_width_fields() instead of
+    creating a PDBRecord for every line.
+
+    If max_atoms is given, the block is flushed (read, passed to
+    read_cb and cleared) whenever a ATOM/HETATM line would make it hold
+    more than max_atoms atoms, so a coordinate section of any size can be
+    streamed through a bounded amount of memory.  The SIGATM, ANISOU
+    and SIGUIJ records following a atom always stay in its block.
+
+    After read() the block has these attributes, with one row per
+    ATOM/HETATM record:
+
+    atom_columns   - the ATOM fields, see read_fixed_width_fields()
+    model_id_list  - MODEL serial number of each atom, or None
+    sigatm_columns, anisou_columns, siguij_columns -
+                     the fields of the SIGATM/ANISOU/SIGUIJ records, with
+                     the row index of the atom each record follows in
+                     sigatm_atom_index, anisou_atom_index and
+                     siguij_atom_index
+    """
+    def __init__(self, max_atoms = None, read_cb = None):
+        self.max_atoms = max_atoms
+        self.read_cb = read_cb
+
+        ## current MODEL serial number; it is kept across flushes
+        self.model_id = None
+
+        self.clear()
+
+    def __len__(self):
+        return len(self.atom_lines)
+
+    def clear(self):
+        """Removes all collected lines and columns.
+        """
+        self.atom_lines = []
+        self.model_id_list = []
+        self.sigatm_lines = []
+        self.sigatm_atom_index = []
+        self.anisou_lines = []
+        self.anisou_atom_index = []
+        self.siguij_lines = []
+        self.siguij_atom_index = []
+
+        self.atom_columns = None
+        self.sigatm_columns = None
+        self.anisou_columns = None
+        self.siguij_columns = None
+
+    def flush(self):
+        """Reads the collected lines, passes the block to read_cb and
+        clears it.  Does nothing if the block holds no atoms.
+        """
+        if len(self.atom_lines) == 0:
+            return
+        self.read()
+        if self.read_cb is not None:
+            self.read_cb(self)
+        self.clear()
+
+    def append(self, ln):
+        """Adds a line of the coordinate section to the block.  Returns
+        False, without adding it, if the line is not a coordinate record.
+        """
+        rname = ln[:6]
+        if isinstance(rname, bytes):
+            rname = rname.decode("latin-1")
+        rname = rname.rstrip().ljust(6)
+
+        if rname == ATOM._name or rname == HETATM._name:
+            if self.max_atoms and len(self.atom_lines) >= self.max_atoms:
+                self.flush()
+            self.atom_lines.append(ln)
+            self.model_id_list.append(self.model_id)
+
+        elif rname == ANISOU._name:
+            if self.atom_lines:
+                self.anisou_lines.append(ln)
+                self.anisou_atom_index.append(len(self.atom_lines) - 1)
+
+        elif rname == SIGATM._name:
+            if self.atom_lines:
+                self.sigatm_lines.append(ln)
+                self.sigatm_atom_index.append(len(self.atom_lines) - 1)
+
+        elif rname == SIGUIJ._name:
+            if self.atom_lines:
+                self.siguij_lines.append(ln)
+                self.siguij_atom_index.append(len(self.atom_lines) - 1)
+
+        elif rname == MODEL._name:
+            rec = MODEL()
+            if isinstance(ln, bytes):
+                ln = ln.decode("latin-1")
+            rec.read(ln.rstrip())
+            self.model_id = rec.get("serial")
+
+        elif rname == ENDMDL._name:
+            self.model_id = None
+
+        elif rname != TER._name:
+            return False
+
+        return True
+
+    def read(self):
+        """Converts the collected lines to columns.
+        """
+        self.atom_columns = read_fixed_width_fields(
+            self.atom_lines, ATOM._field_list)
+        self.sigatm_columns = read_fixed_width_fields(
+            self.sigatm_lines, SIGATM._field_list)
+        self.anisou_columns = read_fixed_width_fields(
+            self.anisou_lines, ANISOU._field_list)
+        self.siguij_columns = read_fixed_width_fields(
+            self.siguij_lines, SIGUIJ._field_list)
+
+        self.sigatm_atom_index = numpy.array(self.sigatm_atom_index, int)
+        self.anisou_atom_index = numpy.array(self.anisou_atom_index, int)
+        self.siguij_atom_index = numpy.array(self.siguij_atom_index, int)
 
 
 class PDBFile(list):
@@ -4,6 +4,8 @@
 ## included as part of this package.
 """Convert a Structure object to its PDBFile description.
 """
+import numpy
+
 from . import ConsoleOutput
 from . import Library
 from . import PDB
@@ -122,6 +124,21 @@ def setmapf(smap, skey, dmap, dkey):
     return False
 
 
+## maximum number of atoms read at a time from the coordinate section
+COORDINATE_BLOCK_SIZE = 10000
+
+## PDB records whose handlers look up chains or atoms in the Structure; they
+## usually come before the coordinate section, so they are saved and
+## processed after all atoms are loaded
+DEFERRED_RECORD_NAMES = (
+    PDB.SEQRES._name,
+    PDB.SSBOND._name,
+    PDB.LINK._name,
+    PDB.HYDBND._name,
+    PDB.SLTBRG._name,
+    PDB.CONECT._name)
+
+
 class PDBStructureBuilder(StructureBuilder.StructureBuilder,
                           PDB.RecordProcessor):
     """Builds a new Structure object by loading a PDB file.
@@ -138,8 +155,22 @@ class PDBStructureBuilder(StructureBuilder.StructureBuilder,
         return fragment_id
     
     def read_start(self, fil, update_cb = None):
-        self.pdb_file = PDB.PDBFile()
-        self.pdb_file.load_file(fil)
+        ## the file is read in a single pass by read_atoms; open file
+        ## names like PDBFile.load_file()
+        if isinstance(fil, str):
+            self.fil = open(fil, "r")
+            self.close_fil = True
+        else:
+            self.fil = fil
+            self.close_fil = False
+
+        ## store extracted bond information
+        self.bond_map = {}
+
+        ## secondary structure annotation
+        self.helix_list = []
+        self.beta_sheet_list = []
+        self.site_list = []
 
     def load_atom(self, atm_map):
         """Override load_atom to maintain a serial_num->atm map.
@@ -154,55 +185,210 @@ class PDBStructureBuilder(StructureBuilder.StructureBuilder,
     def read_atoms(self):
         ## map PDB atom serial numbers to the structure atom classes
         self.atom_serial_map = {}
-        ## current atom map
-        self.atm_map = {}
-        ## current model number
-        self.model_num = None
-
-        def filter_func(rec):
-            if isinstance(rec, PDB.ATOM) or \
-               isinstance(rec, PDB.SIGATM) or \
-               isinstance(rec, PDB.ANISOU) or \
-               isinstance(rec, PDB.SIGUIJ) or \
-               isinstance(rec, PDB.TER) or \
-               isinstance(rec, PDB.MODEL) or \
-               isinstance(rec, PDB.ENDMDL):
-                return True
-            return False
+        ## records processed by read_metadata
+        self.deferred_records = []
 
-        ## process the coordinate records
-        self.process_pdb_records(self.pdb_file, filter_func)
+        ## read the file in one pass: the coordinate section is loaded
+        ## in blocks, and the metadata records are processed as they are
+        ## read and then dropped
+        self.coordinate_block = PDB.PDBCoordinateBlock(
+            max_atoms = COORDINATE_BLOCK_SIZE,
+            read_cb   = self.load_coordinate_block)
 
-        ## load last atom read
-        if self.atm_map:
-            self.load_atom(self.atm_map)
+        self.process_pdb_records(self.iter_metadata_records(self.fil))
 
         ## cleanup
-        del self.model_num
-        del self.atm_map
-        
-    def read_metadata(self):
-        ## store extracted bond information
-        self.bond_map = {}
+        del self.coordinate_block
+        if self.close_fil:
+            self.fil.close()
+        del self.fil
+
+    def iter_metadata_records(self, fil):
+        """Reads the lines of the PDB file fil one at a time.  Coordinate
+        section lines are added to the coordinate block, records in
+        DEFERRED_RECORD_NAMES are saved in self.deferred_records, and all
+        other records are yielded.
+        """
+        block = self.coordinate_block
+        deferred_records = self.deferred_records
 
-        ## secondary structure annotation
-        self.helix_list = []
-        self.beta_sheet_list = []
-        self.site_list = []
+        for ln in fil:
+            if isinstance(ln, bytes):
+                ln = ln.decode("latin-1")
+
+            if block.append(ln):
+                continue
 
-        def filter_func(rec):
-            if isinstance(rec, PDB.ATOM) or \
-               isinstance(rec, PDB.SIGATM) or \
-               isinstance(rec, PDB.ANISOU) or \
-               isinstance(rec, PDB.SIGUIJ) or \
-               isinstance(rec, PDB.TER) or \
-               isinstance(rec, PDB.MODEL) or \
-               isinstance(rec, PDB.ENDMDL):
-                return False
-            return True
+            rec = PDB.read_pdb_record(ln)
+            if rec is None:
+                continue
 
-        ## process the non-coordinate records
-        self.process_pdb_records(self.pdb_file, filter_func)
+            if rec._name in DEFERRED_RECORD_NAMES:
+                deferred_records.append(rec)
+            else:
+                yield rec
+
+        ## load the last atoms
+        block.flush()
+
+    def load_coordinate_block(self, block):
+        """Loads the atoms of a PDBCoordinateBlock which has been read.
+        The equivalent of process_ATOM, process_SIGATM, process_ANISOU and
+        process_SIGUIJ, but working on whole columns.
+        """
+        num_atoms = len(block.model_id_list)
+        if num_atoms == 0:
+            return
+
+        nan = numpy.nan
+        cols = block.atom_columns
+
+        xyz = numpy.column_stack((cols["x"], cols["y"], cols["z"]))
+        has_xyz = (~numpy.isnan(xyz).any(axis=1)).tolist()
+
+        ## SIGATM
+        sig_xyz = numpy.empty((num_atoms, 3), float)
+        sig_xyz[:] = nan
+        sig_occupancy = numpy.empty(num_atoms, float)
+        sig_occupancy[:] = nan
+        sig_temp_factor = numpy.empty(num_atoms, float)
+        sig_temp_factor[:] = nan
+
+        if len(block.sigatm_atom_index) > 0:
+            scols = block.sigatm_columns
+            index = block.sigatm_atom_index
+            sig_xyz[index] = numpy.column_stack(
+                (scols["sigX"], scols["sigY"], scols["sigZ"]))
+            sig_occupancy[index] = scols["sigOccupancy"]
+            sig_temp_factor[index] = scols["sigTempFactor"]
+
+        has_sig_xyz = (~numpy.isnan(sig_xyz).any(axis=1)).tolist()
+
+        ## ANISOU/SIGUIJ; blank fields are read as 0.0
+        U, has_U = self.calc_U_columns(
+            num_atoms, block.anisou_atom_index, block.anisou_columns,
+            ("u[0][0]", "u[1][1]", "u[2][2]",
+             "u[0][1]", "u[0][2]", "u[1][2]"))
+        sig_U, has_sig_U = self.calc_U_columns(
+            num_atoms, block.siguij_atom_index, block.siguij_columns,
+            ("sig[1][1]", "sig[2][2]", "sig[3][3]",
+             "sig[1][2]", "sig[1][3]", "sig[2][3]"))
+
+        ## Python lists are much faster to index one item at a time
+        name_list = cols["name"]
+        alt_loc_list = cols["altLoc"]
+        res_name_list = cols["resName"]
+        chain_id_list = cols["chainID"]
+        icode_list = cols["iCode"]
+        column6768_list = cols["column6768"]
+        serial_list = cols["serial"].tolist()
+        res_seq_list = cols["resSeq"].tolist()
+        occupancy_list = cols["occupancy"].tolist()
+        temp_factor_list = cols["tempFactor"].tolist()
+        sig_occupancy_list = sig_occupancy.tolist()
+        sig_temp_factor_list = sig_temp_factor.tolist()
+        model_id_list = block.model_id_list
+
+        element_cache = {}
+
+        for i in range(num_atoms):
+            atm_map = {}
+
+            ## always derive element from atom name for PDB files -- they
+            ## are too messed up to use the element column
+            name = name_list[i]
+            res_name = res_name_list[i]
+            if name == "":
+                atm_map["name"] = ""
+                atm_map["element"] = ""
+            else:
+                atm_map["name"] = name.strip()
+
+                try:
+                    gelement = element_cache[(name, res_name)]
+                except KeyError:
+                    gelement = Library.library_guess_element_from_name(
+                        name, res_name)
+                    element_cache[(name, res_name)] = gelement
+                if gelement != None:
+                    atm_map["element"] = gelement
+
+            ## additional atom information
+            serial = serial_list[i]
+            if serial == serial:
+                atm_map["serial"] = int(serial)
+
+            atm_map["alt_loc"] = alt_loc_list[i]
+            atm_map["res_name"] = res_name
+            atm_map["chain_id"] = chain_id_list[i]
+
+            ## construct fragment_id
+            res_seq = res_seq_list[i]
+            if res_seq == res_seq:
+                atm_map["fragment_id"] = "%d%s" % (res_seq, icode_list[i])
+
+            ## add the model number for the atom
+            if model_id_list[i] != None:
+                atm_map["model_id"] = model_id_list[i]
+
+            ## position
+            if has_xyz[i]:
+                atm_map["position"] = xyz[i]
+
+            occupancy = occupancy_list[i]
+            if occupancy == occupancy:
+                atm_map["occupancy"] = occupancy
+            temp_factor = temp_factor_list[i]
+            if temp_factor == temp_factor:
+                atm_map["temp_factor"] = temp_factor
+
+            ## columns 67 and 68. Can be used for anything.
+            if column6768_list[i]:
+                atm_map["column6768"] = column6768_list[i]
+
+            ## SIGATM
+            if has_sig_xyz[i]:
+                atm_map["sig_position"] = sig_xyz[i]
+            sig_occupancy = sig_occupancy_list[i]
+            if sig_occupancy == sig_occupancy:
+                atm_map["sig_occupancy"] = sig_occupancy
+            sig_temp_factor = sig_temp_factor_list[i]
+            if sig_temp_factor == sig_temp_factor:
+                atm_map["sig_temp_factor"] = sig_temp_factor
+
+            ## ANISOU/SIGUIJ
+            if has_U[i]:
+                atm_map["U"] = U[i]
+            if has_sig_U[i]:
+                atm_map["sig_U"] = sig_U[i]
+
+            self.load_atom(atm_map)
+
+    def calc_U_columns(self, num_atoms, atom_index, columns, fields):
+        """Returns the (num_atoms, 3, 3) array of U tensors and the list
+        of flags marking the atoms which have one, from the ANISOU or
+        SIGUIJ columns of a PDBCoordinateBlock.
+        """
+        U = numpy.zeros((num_atoms, 3, 3), float)
+        has_U = numpy.zeros(num_atoms, bool)
+
+        if len(atom_index) > 0:
+            u11, u22, u33, u12, u13, u23 = [
+                numpy.nan_to_num(columns[field]) / 10000.0
+                for field in fields]
+            U[atom_index] = numpy.stack(
+                (numpy.column_stack((u11, u12, u13)),
+                 numpy.column_stack((u12, u22, u23)),
+                 numpy.column_stack((u13, u23, u33))), axis = 1)
+            has_U[atom_index] = True
+
+        return U, has_U.tolist()
+        
+    def read_metadata(self):
+        ## process the records which refer to chains and atoms; all other
+        ## records were processed while reading the file in read_atoms
+        self.process_pdb_records(self.deferred_records)
+        del self.deferred_records
 
         ## load chemical bond information
         self.load_bonds(self.bond_map)
@@ -218,103 +404,6 @@ class PDBStructureBuilder(StructureBuilder.StructureBuilder,
         self.load_sites(self.site_list)
         del self.site_list
 
-    def process_ATOM(self, rec):
-        ## load current atom since this record indicates a new atom
-        if self.atm_map:
-            self.load_atom(self.atm_map)
-            self.atm_map = {}
-
-        ## optimization
-        atm_map = self.atm_map
-
-        ## always derive element from atom name for PDB files -- they are
-        ## too messed up to use the element column
-        try:
-            name = rec["name"]
-        except KeyError:
-            atm_map["name"] = ""
-            atm_map["element"] = ""
-        else:
-            atm_map["name"] = name.strip()
-            
-            res_name = rec.get("resName", "")
-            gelement = Library.library_guess_element_from_name(name, res_name)
-            if gelement != None:
-                atm_map["element"] = gelement
-
-        ## additional atom information
-        if "serial" in rec:
-            atm_map["serial"] = rec["serial"]
-
-        if "altLoc" in rec:
-            atm_map["alt_loc"] = rec["altLoc"]
-
-        if "resName" in rec:
-            atm_map["res_name"] = rec["resName"]
-
-        if "chainID" in rec:
-            atm_map["chain_id"] = rec["chainID"]
-
-        ## construct fragment_id
-        if "resSeq" in rec:
-            if "iCode" in rec:
-                atm_map["fragment_id"] = "%d%s" % (rec["resSeq"],rec["iCode"])
-            else:
-                atm_map["fragment_id"] = "%d" % (rec["resSeq"])
-                
-        ## add the model number for the atom
-        if self.model_num != None:
-            atm_map["model_id"] = self.model_num
-
-        ## position
-        if "x" in rec:
-            atm_map["x"] = rec["x"]
-        if "y" in rec:
-            atm_map["y"] = rec["y"]
-        if "z" in rec:
-            atm_map["z"] = rec["z"]
-
-        if "occupancy" in rec:
-            atm_map["occupancy"] = rec["occupancy"]
-        if "tempFactor" in rec:
-            atm_map["temp_factor"] = rec["tempFactor"]
-
-        ## columns 67 and 68. Can be used for anything.
-        if "column6768" in rec:
-            atm_map["column6768"] = rec["column6768"]
-
-    def process_HETATM(self, rec):
-        self.process_ATOM(rec)
-
-    def process_SIGATM(self, rec):
-        setmapf(rec, "sigX", self.atm_map, "sig_x")
-        setmapf(rec, "sigY", self.atm_map, "sig_y")
-        setmapf(rec, "sigZ", self.atm_map, "sig_z")
-        setmapf(rec, "sigOccupancy", self.atm_map, "sig_occupancy")
-        setmapf(rec, "sigTempFactor", self.atm_map, "sig_temp_factor")
-
-    def process_ANISOU(self, rec):
-        self.atm_map["u11"] = rec.get("u[0][0]", 0.0) / 10000.0
-        self.atm_map["u22"] = rec.get("u[1][1]", 0.0) / 10000.0
-        self.atm_map["u33"] = rec.get("u[2][2]", 0.0) / 10000.0
-        self.atm_map["u12"] = rec.get("u[0][1]", 0.0) / 10000.0
-        self.atm_map["u13"] = rec.get("u[0][2]", 0.0) / 10000.0
-        self.atm_map["u23"] = rec.get("u[1][2]", 0.0) / 10000.0
-
-    def process_SIGUIJ(self, rec):
-        self.atm_map["sig_u11"] = rec.get("sig[1][1]", 0.0) / 10000.0
-        self.atm_map["sig_u22"] = rec.get("sig[2][2]", 0.0) / 10000.0
-        self.atm_map["sig_u33"] = rec.get("sig[3][3]", 0.0) / 10000.0
-        self.atm_map["sig_u12"] = rec.get("sig[1][2]", 0.0) / 10000.0
-        self.atm_map["sig_u13"] = rec.get("sig[1][3]", 0.0) / 10000.0
-        self.atm_map["sig_u23"] = rec.get("sig[2][3]", 0.0) / 10000.0
-
-    def process_MODEL(self, rec):
-        self.model_num = rec.get("serial")
-
-    def process_ENDMDL(self, rec):
-        self.model_num = None
-
     def process_HEADER(self, rec):
         self.struct.header = "%s:%s:%s" % (rec.get("idCode", ""),
                                            rec.get("classification", ""),
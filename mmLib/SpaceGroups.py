@@ -167,6 +167,20 @@ class SpaceGroup(object):
         self.pdb_name                = pdb_name
         self.symop_list              = symop_list
 
+        ## the SymOps stacked as R_array(n,3,3) rotations and t_array(n,3)
+        ## translations for applying all of them at once
+        if symop_list:
+            self.R_array = numpy.array([symop.R for symop in symop_list], float)
+            self.t_array = numpy.array([symop.t for symop in symop_list], float)
+        else:
+            self.R_array = numpy.zeros((0, 3, 3), float)
+            self.t_array = numpy.zeros((0, 3), float)
+
+    def count_symops(self):
+        """Returns the number of SymOps in the SpaceGroup.
+        """
+        return len(self.R_array)
+
     def iter_symops(self):
         """Iterates over all SymOps in the SpaceGroup.
         """
@@ -191,7577 +205,5314 @@ class SpaceGroup(object):
         for symop in self.symop_list:
             yield symop(vec)
 
+    def calc_equivalent_positions(self, frac):
+        """Returns the symmetry equivalent positions of all fractional
+        coordinates in frac, a (3,) vector or a (n,3) array, in one batched
+        operation.  The result has shape (n_ops,3) or (n_ops,n,3), and
+        result[k] is SymOp k of symop_list applied to frac.
+        """
+        frac = numpy.asarray(frac, float)
+        if frac.ndim == 1:
+            return numpy.dot(self.R_array, frac) + self.t_array
+        return numpy.matmul(frac, self.R_array.transpose(0, 2, 1)) + \
+               self.t_array[:, numpy.newaxis, :]
+
+
+## space group table, in the order space group names are searched by
+## GetSpaceGroup(); each entry holds the SpaceGroup constructor arguments
+## and the (rotation, translation) names of its SymOps.  The table is all
+## constants, so SpaceGroup/SymOp objects are only built on first use.
+SPACE_GROUP_TABLE = (
+    (1, 1, 1, "P1", "PG1", "TRICLINIC", "P 1", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        )),
+    (2, 2, 2, "P-1", "PG1bar", "TRICLINIC", "P -1", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        )),
+    (3, 2, 2, "P2", "PG2", "MONOCLINIC", "P 1 2 1", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        )),
+    (4, 2, 2, "P21", "PG2", "MONOCLINIC", "P 1 21 1", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_0"),
+        )),
+    (5, 4, 2, "C2", "PG2", "MONOCLINIC", "C 1 2 1", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        )),
+    (6, 2, 2, "Pm", "PGm", "MONOCLINIC", "P 1 m 1", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        )),
+    (7, 2, 2, "Pc", "PGm", "MONOCLINIC", "P 1 c 1", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        )),
+    (8, 4, 2, "Cm", "PGm", "MONOCLINIC", "C 1 m 1", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        )),
+    (9, 4, 2, "Cc", "PGm", "MONOCLINIC", "C 1 c 1", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        )),
+    (10, 4, 4, "P2/m", "PG2/m", "MONOCLINIC", "P 1 2/m 1", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        )),
+    (11, 4, 4, "P21/m", "PG2/m", "MONOCLINIC", "P 1 21/m 1", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_12_0"),
+        )),
+    (12, 8, 4, "C2/m", "PG2/m", "MONOCLINIC", "C 1 2/m 1", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_0"),
+        )),
+    (13, 4, 4, "P2/c", "PG2/m", "MONOCLINIC", "P 1 2/c 1", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        )),
+    (14, 4, 4, "P21/c", "PG2/m", "MONOCLINIC", "P 1 21/c 1", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_Z",    "Tr_0_12_12"),
+        )),
+    (15, 8, 4, "C2/c", "PG2/m", "MONOCLINIC", "C 1 2/c 1", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        )),
+    (16, 4, 4, "P222", "PG222", "ORTHORHOMBIC", "P 2 2 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        )),
+    (17, 4, 4, "P2221", "PG222", "ORTHORHOMBIC", "P 2 2 21", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        )),
+    (18, 4, 4, "P21212", "PG222", "ORTHORHOMBIC", "P 21 21 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        )),
+    (19, 4, 4, "P212121", "PG222", "ORTHORHOMBIC", "P 21 21 21", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        )),
+    (20, 8, 4, "C2221", "PG222", "ORTHORHOMBIC", "C 2 2 21", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        )),
+    (21, 8, 4, "C222", "PG222", "ORTHORHOMBIC", "C 2 2 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        )),
+    (22, 16, 4, "F222", "PG222", "ORTHORHOMBIC", "F 2 2 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_0_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_12"),
+        ("Rot_X_Y_Z",     "Tr_12_0_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_12"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        )),
+    (23, 8, 4, "I222", "PG222", "ORTHORHOMBIC", "I 2 2 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_12"),
+        )),
+    (24, 8, 4, "I212121", "PG222", "ORTHORHOMBIC", "I 21 21 21", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_12"),
+        )),
+    (25, 4, 4, "Pmm2", "PGmm2", "ORTHORHOMBIC", "P m m 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        )),
+    (26, 4, 4, "Pmc21", "PGmm2", "ORTHORHOMBIC", "P m c 21", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        )),
+    (27, 4, 4, "Pcc2", "PGmm2", "ORTHORHOMBIC", "P c c 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_12"),
+        )),
+    (28, 4, 4, "Pma2", "PGmm2", "ORTHORHOMBIC", "P m a 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_12_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_0_0"),
+        )),
+    (29, 4, 4, "Pca21", "PGmm2", "ORTHORHOMBIC", "P c a 21", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_X_mY_Z",    "Tr_12_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_0_12"),
+        )),
+    (30, 4, 4, "Pnc2", "PGmm2", "ORTHORHOMBIC", "P n c 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_12_12"),
+        )),
+    (31, 4, 4, "Pmn21", "PGmm2", "ORTHORHOMBIC", "P m n 21", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_X_mY_Z",    "Tr_12_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        )),
+    (32, 4, 4, "Pba2", "PGmm2", "ORTHORHOMBIC", "P b a 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        )),
+    (33, 4, 4, "Pna21", "PGmm2", "ORTHORHOMBIC", "P n a 21", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        )),
+    (34, 4, 4, "Pnn2", "PGmm2", "ORTHORHOMBIC", "P n n 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        )),
+    (35, 8, 4, "Cmm2", "PGmm2", "ORTHORHOMBIC", "C m m 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        )),
+    (36, 8, 4, "Cmc21", "PGmm2", "ORTHORHOMBIC", "C m c 21", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        )),
+    (37, 8, 4, "Ccc2", "PGmm2", "ORTHORHOMBIC", "C c c 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_12"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        )),
+    (38, 8, 4, "Amm2", "PGmm2", "ORTHORHOMBIC", "A m m 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_0_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_12"),
+        ("Rot_X_mY_Z",    "Tr_0_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_12_12"),
+        )),
+    (39, 8, 4, "Abm2", "PGmm2", "ORTHORHOMBIC", "A b m 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_12_0"),
+        ("Rot_X_Y_Z",     "Tr_0_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_12"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_12"),
+        )),
+    (40, 8, 4, "Ama2", "PGmm2", "ORTHORHOMBIC", "A m a 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_12_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_0_0"),
+        ("Rot_X_Y_Z",     "Tr_0_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_12"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        )),
+    (41, 8, 4, "Aba2", "PGmm2", "ORTHORHOMBIC", "A b a 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        ("Rot_X_Y_Z",     "Tr_0_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_12"),
+        ("Rot_X_mY_Z",    "Tr_12_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_0_12"),
+        )),
+    (42, 16, 4, "Fmm2", "PGmm2", "ORTHORHOMBIC", "F m m 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_0_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_12"),
+        ("Rot_X_mY_Z",    "Tr_0_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_12_12"),
+        ("Rot_X_Y_Z",     "Tr_12_0_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_X_mY_Z",    "Tr_12_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_0_12"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        )),
+    (43, 16, 4, "Fdd2", "PGmm2", "ORTHORHOMBIC", "F d d 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_14_14_14"),
+        ("Rot_mX_Y_Z",    "Tr_14_14_14"),
+        ("Rot_X_Y_Z",     "Tr_0_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_12"),
+        ("Rot_X_mY_Z",    "Tr_14_34_34"),
+        ("Rot_mX_Y_Z",    "Tr_14_34_34"),
+        ("Rot_X_Y_Z",     "Tr_12_0_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_X_mY_Z",    "Tr_34_14_34"),
+        ("Rot_mX_Y_Z",    "Tr_34_14_34"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_X_mY_Z",    "Tr_34_34_14"),
+        ("Rot_mX_Y_Z",    "Tr_34_34_14"),
+        )),
+    (44, 8, 4, "Imm2", "PGmm2", "ORTHORHOMBIC", "I m m 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        )),
+    (45, 8, 4, "Iba2", "PGmm2", "ORTHORHOMBIC", "I b a 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_12"),
+        )),
+    (46, 8, 4, "Ima2", "PGmm2", "ORTHORHOMBIC", "I m a 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_12_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_X_mY_Z",    "Tr_0_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_12_12"),
+        )),
+    (47, 8, 8, "Pmmm", "PGmmm", "ORTHORHOMBIC", "P 2/m 2/m 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        )),
+    (48, 8, 8, "Pnnn", "PGmmm", "ORTHORHOMBIC", "P 2/n 2/n 2/n", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_12"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        )),
+    (49, 8, 8, "Pccm", "PGmmm", "ORTHORHOMBIC", "P 2/c 2/c 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_12"),
+        )),
+    (50, 8, 8, "Pban", "PGmmm", "ORTHORHOMBIC", "P 2/b 2/a 2/n", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        )),
+    (51, 8, 8, "Pmma", "PGmmm", "ORTHORHOMBIC", "P 21/m 2/m 2/a", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_0_0"),
+        )),
+    (52, 8, 8, "Pnna", "PGmmm", "ORTHORHOMBIC", "P 2/n 21/n 2/a", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_0_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_12_12"),
+        )),
+    (53, 8, 8, "Pmna", "PGmmm", "ORTHORHOMBIC", "P 2/m 2/n 21/a", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_0_12"),
+        ("Rot_X_mY_Z",    "Tr_12_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        )),
+    (54, 8, 8, "Pcca", "PGmmm", "ORTHORHOMBIC", "P 21/c 2/c 2/a", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_0_12"),
+        )),
+    (55, 8, 8, "Pbam", "PGmmm", "ORTHORHOMBIC", "P 21/b 21/a 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        )),
+    (56, 8, 8, "Pccn", "PGmmm", "ORTHORHOMBIC", "P 21/c 21/c 2/n", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_0"),
+        ("Rot_X_mY_Z",    "Tr_0_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_0_12"),
+        )),
+    (57, 8, 8, "Pbcm", "PGmmm", "ORTHORHOMBIC", "P 2/b 21/c 21/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_12"),
+        ("Rot_X_mY_Z",    "Tr_0_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_12_0"),
+        )),
+    (58, 8, 8, "Pnnm", "PGmmm", "ORTHORHOMBIC", "P 21/n 21/n 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        )),
+    (59, 8, 8, "Pmmn", "PGmmm", "ORTHORHOMBIC", "P 21/m 21/m 2/n", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        )),
+    (60, 8, 8, "Pbcn", "PGmmm", "ORTHORHOMBIC", "P 21/b 2/c 21/n", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_12"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        )),
+    (61, 8, 8, "Pbca", "PGmmm", "ORTHORHOMBIC", "P 21/b 21/c 21/a", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_0_12"),
+        ("Rot_X_mY_Z",    "Tr_0_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        )),
+    (62, 8, 8, "Pnma", "PGmmm", "ORTHORHOMBIC", "P 21/n 21/m 21/a", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_0_12"),
+        ("Rot_X_mY_Z",    "Tr_0_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        )),
+    (63, 16, 8, "Cmcm", "PGmmm", "ORTHORHOMBIC", "C 2/m 2/c 21/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_12"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_12"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        )),
+    (64, 16, 8, "Cmca", "PGmmm", "ORTHORHOMBIC", "C 2/m 2/c 21/a", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_12_12"),
+        ("Rot_X_mY_Z",    "Tr_0_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_0_12"),
+        ("Rot_X_mY_Z",    "Tr_12_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        )),
+    (65, 16, 8, "Cmmm", "PGmmm", "ORTHORHOMBIC", "C 2/m 2/m 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        )),
+    (66, 16, 8, "Cccm", "PGmmm", "ORTHORHOMBIC", "C 2/c 2/c 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_12"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        )),
+    (67, 16, 8, "Cmma", "PGmmm", "ORTHORHOMBIC", "C 2/m 2/m 2/a", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_12_0"),
+        ("Rot_X_mY_Z",    "Tr_0_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_0_0"),
+        ("Rot_X_mY_Z",    "Tr_12_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        )),
+    (68, 16, 8, "Ccca", "PGmmm", "ORTHORHOMBIC", "C 2/c 2/c 2/a", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_0_12"),
+        ("Rot_X_mY_Z",    "Tr_0_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_0_12"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_12_0_12"),
+        ("Rot_X_Y_mZ",    "Tr_0_12_12"),
+        ("Rot_X_mY_Z",    "Tr_12_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_12_12"),
+        )),
+    (69, 32, 8, "Fmmm", "PGmmm", "ORTHORHOMBIC", "F 2/m 2/m 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_0_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_0_12_12"),
+        ("Rot_X_mY_Z",    "Tr_0_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_12_12"),
+        ("Rot_X_Y_Z",     "Tr_12_0_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_12_0_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_0_12"),
+        ("Rot_X_mY_Z",    "Tr_12_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_0_12"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        )),
+    (70, 32, 8, "Fddd", "PGmmm", "ORTHORHOMBIC", "F 2/d 2/d 2/d", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_14_14_14"),
+        ("Rot_X_Y_mZ",    "Tr_14_14_14"),
+        ("Rot_X_mY_Z",    "Tr_14_14_14"),
+        ("Rot_mX_Y_Z",    "Tr_14_14_14"),
+        ("Rot_X_Y_Z",     "Tr_0_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_14_34_34"),
+        ("Rot_X_Y_mZ",    "Tr_14_34_34"),
+        ("Rot_X_mY_Z",    "Tr_14_34_34"),
+        ("Rot_mX_Y_Z",    "Tr_14_34_34"),
+        ("Rot_X_Y_Z",     "Tr_12_0_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_34_14_34"),
+        ("Rot_X_Y_mZ",    "Tr_34_14_34"),
+        ("Rot_X_mY_Z",    "Tr_34_14_34"),
+        ("Rot_mX_Y_Z",    "Tr_34_14_34"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_34_34_14"),
+        ("Rot_X_Y_mZ",    "Tr_34_34_14"),
+        ("Rot_X_mY_Z",    "Tr_34_34_14"),
+        ("Rot_mX_Y_Z",    "Tr_34_34_14"),
+        )),
+    (71, 16, 8, "Immm", "PGmmm", "ORTHORHOMBIC", "I 2/m 2/m 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_12"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        )),
+    (72, 16, 8, "Ibam", "PGmmm", "ORTHORHOMBIC", "I 2/b 2/a 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_12"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_12"),
+        )),
+    (73, 16, 8, "Ibca", "PGmmm", "ORTHORHOMBIC", "I 21/b 21/c 21/a", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_0_12"),
+        ("Rot_X_mY_Z",    "Tr_0_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_0_12_0"),
+        ("Rot_X_mY_Z",    "Tr_12_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_12"),
+        )),
+    (74, 16, 8, "Imma", "PGmmm", "ORTHORHOMBIC", "I 21/m 21/m 21/a", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_12_0"),
+        ("Rot_X_mY_Z",    "Tr_0_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_0_12"),
+        ("Rot_X_mY_Z",    "Tr_12_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        )),
+    (75, 4, 4, "P4", "PG4", "TETRAGONAL", "P 4", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        )),
+    (76, 4, 4, "P41", "PG4", "TETRAGONAL", "P 41", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_mY_X_Z",    "Tr_0_0_14"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_34"),
+        )),
+    (77, 4, 4, "P42", "PG4", "TETRAGONAL", "P 42", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_12"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_12"),
+        )),
+    (78, 4, 4, "P43", "PG4", "TETRAGONAL", "P 43", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_mY_X_Z",    "Tr_0_0_34"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_14"),
+        )),
+    (79, 8, 4, "I4", "PG4", "TETRAGONAL", "I 4", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mY_X_Z",    "Tr_12_12_12"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_12"),
+        )),
+    (80, 8, 4, "I41", "PG4", "TETRAGONAL", "I 41", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mY_X_Z",    "Tr_0_12_14"),
+        ("Rot_Y_mX_Z",    "Tr_12_0_34"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_12_0_34"),
+        ("Rot_Y_mX_Z",    "Tr_0_12_14"),
+        )),
+    (81, 4, 4, "P-4", "PG4bar", "TETRAGONAL", "P -4", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        )),
+    (82, 8, 4, "I-4", "PG4bar", "TETRAGONAL", "I -4", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_Y_mX_mZ",   "Tr_12_12_12"),
+        ("Rot_mY_X_mZ",   "Tr_12_12_12"),
+        )),
+    (83, 8, 8, "P4/m", "PG4/m", "TETRAGONAL", "P 4/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        )),
+    (84, 8, 8, "P42/m", "PG4/m", "TETRAGONAL", "P 42/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_12"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_12"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_12"),
+        )),
+    (85, 8, 8, "P4/n", "PG4/m", "TETRAGONAL", "P 4/n", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_12_12_0"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        )),
+    (86, 8, 8, "P42/n", "PG4/m", "TETRAGONAL", "P 42/n", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_12_12_12"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_12"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        )),
+    (87, 16, 8, "I4/m", "PG4/m", "TETRAGONAL", "I 4/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mY_X_Z",    "Tr_12_12_12"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_12"),
+        ("Rot_Y_mX_mZ",   "Tr_12_12_12"),
+        ("Rot_mY_X_mZ",   "Tr_12_12_12"),
+        )),
+    (88, 16, 8, "I41/a", "PG4/m", "TETRAGONAL", "I 41/a", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mY_X_Z",    "Tr_0_12_14"),
+        ("Rot_Y_mX_Z",    "Tr_12_0_34"),
+        ("Rot_mX_mY_mZ",  "Tr_0_12_14"),
+        ("Rot_X_Y_mZ",    "Tr_12_0_34"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_12_12_12"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_12_0_34"),
+        ("Rot_Y_mX_Z",    "Tr_0_12_14"),
+        ("Rot_mX_mY_mZ",  "Tr_12_0_34"),
+        ("Rot_X_Y_mZ",    "Tr_0_12_14"),
+        ("Rot_Y_mX_mZ",   "Tr_12_12_12"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        )),
+    (89, 8, 8, "P422", "PG422", "TETRAGONAL", "P 4 2 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        )),
+    (90, 8, 8, "P4212", "PG422", "TETRAGONAL", "P 4 21 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_12_12_0"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        )),
+    (91, 8, 8, "P4122", "PG422", "TETRAGONAL", "P 41 2 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_mY_X_Z",    "Tr_0_0_14"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_34"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_12"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_34"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_14"),
+        )),
+    (92, 8, 8, "P41212", "PG422", "TETRAGONAL", "P 41 21 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_mY_X_Z",    "Tr_12_12_14"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_34"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_14"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_34"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_12"),
+        )),
+    (93, 8, 8, "P4222", "PG422", "TETRAGONAL", "P 42 2 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_12"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_12"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_12"),
+        )),
+    (94, 8, 8, "P42212", "PG422", "TETRAGONAL", "P 42 21 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_12_12_12"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_12"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        )),
+    (95, 8, 8, "P4322", "PG422", "TETRAGONAL", "P 43 2 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_mY_X_Z",    "Tr_0_0_34"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_14"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_12"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_14"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_34"),
+        )),
+    (96, 8, 8, "P43212", "PG422", "TETRAGONAL", "P 43 21 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_mY_X_Z",    "Tr_12_12_34"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_14"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_34"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_14"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_12"),
+        )),
+    (97, 16, 8, "I422", "PG422", "TETRAGONAL", "I 4 2 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mY_X_Z",    "Tr_12_12_12"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_12"),
+        ("Rot_Y_X_mZ",    "Tr_12_12_12"),
+        ("Rot_mY_mX_mZ",  "Tr_12_12_12"),
+        )),
+    (98, 16, 8, "I4122", "PG422", "TETRAGONAL", "I 41 2 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mY_X_Z",    "Tr_0_12_14"),
+        ("Rot_Y_mX_Z",    "Tr_12_0_34"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_34"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_14"),
+        ("Rot_Y_X_mZ",    "Tr_12_12_12"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_12_0_34"),
+        ("Rot_Y_mX_Z",    "Tr_0_12_14"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_14"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_34"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_12_12_12"),
+        )),
+    (99, 8, 8, "P4mm", "PG4mm", "TETRAGONAL", "P 4 m m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        )),
+    (100, 8, 8, "P4bm", "PG4mm", "TETRAGONAL", "P 4 b m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_0"),
+        ("Rot_Y_X_Z",     "Tr_12_12_0"),
+        )),
+    (101, 8, 8, "P42cm", "PG4mm", "TETRAGONAL", "P 42 c m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_12"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_12"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_12"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        )),
+    (102, 8, 8, "P42nm", "PG4mm", "TETRAGONAL", "P 42 n m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_12_12_12"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_12"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        )),
+    (103, 8, 8, "P4cc", "PG4mm", "TETRAGONAL", "P 4 c c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_12"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_12"),
+        ("Rot_Y_X_Z",     "Tr_0_0_12"),
+        )),
+    (104, 8, 8, "P4nc", "PG4mm", "TETRAGONAL", "P 4 n c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_12"),
+        ("Rot_Y_X_Z",     "Tr_12_12_12"),
+        )),
+    (105, 8, 8, "P42mc", "PG4mm", "TETRAGONAL", "P 42 m c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_12"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_12"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_12"),
+        ("Rot_Y_X_Z",     "Tr_0_0_12"),
+        )),
+    (106, 8, 8, "P42bc", "PG4mm", "TETRAGONAL", "P 42 b c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_12"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_12"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_12"),
+        ("Rot_Y_X_Z",     "Tr_12_12_12"),
+        )),
+    (107, 16, 8, "I4mm", "PG4mm", "TETRAGONAL", "I 4 m m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mY_X_Z",    "Tr_12_12_12"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_12"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_12"),
+        ("Rot_Y_X_Z",     "Tr_12_12_12"),
+        )),
+    (108, 16, 8, "I4cm", "PG4mm", "TETRAGONAL", "I 4 c m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_12"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_12"),
+        ("Rot_Y_X_Z",     "Tr_0_0_12"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mY_X_Z",    "Tr_12_12_12"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_12"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_0"),
+        ("Rot_Y_X_Z",     "Tr_12_12_0"),
+        )),
+    (109, 16, 8, "I41md", "PG4mm", "TETRAGONAL", "I 41 m d", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mY_X_Z",    "Tr_0_12_14"),
+        ("Rot_Y_mX_Z",    "Tr_12_0_34"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        ("Rot_mY_mX_Z",   "Tr_0_12_14"),
+        ("Rot_Y_X_Z",     "Tr_12_0_34"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_12_0_34"),
+        ("Rot_Y_mX_Z",    "Tr_0_12_14"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_12_0_34"),
+        ("Rot_Y_X_Z",     "Tr_0_12_14"),
+        )),
+    (110, 16, 8, "I41cd", "PG4mm", "TETRAGONAL", "I 41 c d", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mY_X_Z",    "Tr_0_12_14"),
+        ("Rot_Y_mX_Z",    "Tr_12_0_34"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_12_34"),
+        ("Rot_Y_X_Z",     "Tr_12_0_14"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_12_0_34"),
+        ("Rot_Y_mX_Z",    "Tr_0_12_14"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_12"),
+        ("Rot_mY_mX_Z",   "Tr_12_0_14"),
+        ("Rot_Y_X_Z",     "Tr_0_12_34"),
+        )),
+    (111, 8, 8, "P-42m", "PG4bar2m", "TETRAGONAL", "P -4 2 m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        )),
+    (112, 8, 8, "P-42c", "PG4bar2m", "TETRAGONAL", "P -4 2 c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_12"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_12"),
+        ("Rot_Y_X_Z",     "Tr_0_0_12"),
+        )),
+    (113, 8, 8, "P-421m", "PG4bar2m", "TETRAGONAL", "P -4 21 m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_0"),
+        ("Rot_Y_X_Z",     "Tr_12_12_0"),
+        )),
+    (114, 8, 8, "P-421c", "PG4bar2m", "TETRAGONAL", "P -4 21 c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_12"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_12"),
+        ("Rot_Y_X_Z",     "Tr_12_12_12"),
+        )),
+    (115, 8, 8, "P-4m2", "PG4barm2", "TETRAGONAL", "P -4 m 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        )),
+    (116, 8, 8, "P-4c2", "PG4barm2", "TETRAGONAL", "P -4 c 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_12"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_12"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_12"),
+        )),
+    (117, 8, 8, "P-4b2", "PG4barm2", "TETRAGONAL", "P -4 b 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        ("Rot_Y_X_mZ",    "Tr_12_12_0"),
+        ("Rot_mY_mX_mZ",  "Tr_12_12_0"),
+        )),
+    (118, 8, 8, "P-4n2", "PG4barm2", "TETRAGONAL", "P -4 n 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        ("Rot_Y_X_mZ",    "Tr_12_12_12"),
+        ("Rot_mY_mX_mZ",  "Tr_12_12_12"),
+        )),
+    (119, 16, 8, "I-4m2", "PG4barm2", "TETRAGONAL", "I -4 m 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mY_X_mZ",   "Tr_12_12_12"),
+        ("Rot_Y_mX_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        ("Rot_Y_X_mZ",    "Tr_12_12_12"),
+        ("Rot_mY_mX_mZ",  "Tr_12_12_12"),
+        )),
+    (120, 16, 8, "I-4c2", "PG4barm2", "TETRAGONAL", "I -4 c 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_12"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_12"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_12"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mY_X_mZ",   "Tr_12_12_12"),
+        ("Rot_Y_mX_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        ("Rot_Y_X_mZ",    "Tr_12_12_0"),
+        ("Rot_mY_mX_mZ",  "Tr_12_12_0"),
+        )),
+    (121, 16, 8, "I-42m", "PG4bar2m", "TETRAGONAL", "I -4 2 m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mY_X_mZ",   "Tr_12_12_12"),
+        ("Rot_Y_mX_mZ",   "Tr_12_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_12"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_12"),
+        ("Rot_Y_X_Z",     "Tr_12_12_12"),
+        )),
+    (122, 16, 8, "I-42d", "PG4bar2m", "TETRAGONAL", "I -4 2 d", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_34"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_34"),
+        ("Rot_mY_mX_Z",   "Tr_12_0_34"),
+        ("Rot_Y_X_Z",     "Tr_12_0_34"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mY_X_mZ",   "Tr_12_12_12"),
+        ("Rot_Y_mX_mZ",   "Tr_12_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_14"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_14"),
+        ("Rot_mY_mX_Z",   "Tr_0_12_14"),
+        ("Rot_Y_X_Z",     "Tr_0_12_14"),
+        )),
+    (123, 16, 16, "P4/mmm", "PG4/mmm", "TETRAGONAL", "P 4/m 2/m 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        )),
+    (124, 16, 16, "P4/mcc", "PG4/mmm", "TETRAGONAL", "P 4/m 2/c 2/c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_12"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_12"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_12"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_12"),
+        ("Rot_Y_X_Z",     "Tr_0_0_12"),
+        )),
+    (125, 16, 16, "P4/nbm", "PG4/mmm", "TETRAGONAL", "P 4/n 2/b 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_0"),
+        ("Rot_Y_mX_mZ",   "Tr_12_12_0"),
+        ("Rot_mY_X_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_0"),
+        ("Rot_Y_X_Z",     "Tr_12_12_0"),
+        )),
+    (126, 16, 16, "P4/nnc", "PG4/mmm", "TETRAGONAL", "P 4/n 2/n 2/c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_12"),
+        ("Rot_Y_mX_mZ",   "Tr_12_12_12"),
+        ("Rot_mY_X_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_12"),
+        ("Rot_Y_X_Z",     "Tr_12_12_12"),
+        )),
+    (127, 16, 16, "P4/mbm", "PG4/mmm", "TETRAGONAL", "P 4/m 21/b 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Y_X_mZ",    "Tr_12_12_0"),
+        ("Rot_mY_mX_mZ",  "Tr_12_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_0"),
+        ("Rot_Y_X_Z",     "Tr_12_12_0"),
+        )),
+    (128, 16, 16, "P4/mnc", "PG4/mmm", "TETRAGONAL", "P 4/m 21/n 2/c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_12"),
+        ("Rot_Y_X_mZ",    "Tr_12_12_12"),
+        ("Rot_mY_mX_mZ",  "Tr_12_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_12"),
+        ("Rot_Y_X_Z",     "Tr_12_12_12"),
+        )),
+    (129, 16, 16, "P4/nmm", "PG4/mmm", "TETRAGONAL", "P 4/n 21/m 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_12_12_0"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_0"),
+        ("Rot_Y_X_Z",     "Tr_12_12_0"),
+        )),
+    (130, 16, 16, "P4/ncc", "PG4/mmm", "TETRAGONAL", "P 4/n 2/c 2/c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_12_12_0"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_12"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_12"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_12"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_12"),
+        ("Rot_Y_X_Z",     "Tr_12_12_12"),
+        )),
+    (131, 16, 16, "P42/mmc", "PG4/mmm", "TETRAGONAL", "P 42/m 2/m 2/c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_12"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_12"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_12"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_12"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_12"),
+        ("Rot_Y_X_Z",     "Tr_0_0_12"),
+        )),
+    (132, 16, 16, "P42/mcm", "PG4/mmm", "TETRAGONAL", "P 42/m 2/c 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_12"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_12"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_12"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_12"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_12"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        )),
+    (133, 16, 16, "P42/nbc", "PG4/mmm", "TETRAGONAL", "P 42/n 2/b 2/c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_12_12_12"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_12"),
+        ("Rot_Y_X_mZ",    "Tr_12_12_0"),
+        ("Rot_mY_mX_mZ",  "Tr_12_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_12"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_12"),
+        ("Rot_Y_X_Z",     "Tr_0_0_12"),
+        )),
+    (134, 16, 16, "P42/nnm", "PG4/mmm", "TETRAGONAL", "P 42/n 2/n 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_12_12_12"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_12_12_12"),
+        ("Rot_mY_mX_mZ",  "Tr_12_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_12"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        )),
+    (135, 16, 16, "P42/mbc", "PG4/mmm", "TETRAGONAL", "P 42/m 21/b 2/c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_12"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Y_X_mZ",    "Tr_12_12_12"),
+        ("Rot_mY_mX_mZ",  "Tr_12_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_12"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_12"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_12"),
+        ("Rot_Y_X_Z",     "Tr_12_12_12"),
+        )),
+    (136, 16, 16, "P42/mnm", "PG4/mmm", "TETRAGONAL", "P 42/m 21/n 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_12_12_12"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_12"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_12_12_12"),
+        ("Rot_mY_X_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        )),
+    (137, 16, 16, "P42/nmc", "PG4/mmm", "TETRAGONAL", "P 42/n 21/m 2/c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_12_12_12"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_12"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_12"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_12"),
+        ("Rot_Y_X_Z",     "Tr_12_12_12"),
+        )),
+    (138, 16, 16, "P42/ncm", "PG4/mmm", "TETRAGONAL", "P 42/n 21/c 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_12_12_12"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_12"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_12"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_12"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_0"),
+        ("Rot_Y_X_Z",     "Tr_12_12_0"),
+        )),
+    (139, 32, 16, "I4/mmm", "PG4/mmm", "TETRAGONAL", "I 4/m 2/m 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mY_X_Z",    "Tr_12_12_12"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_12"),
+        ("Rot_Y_X_mZ",    "Tr_12_12_12"),
+        ("Rot_mY_mX_mZ",  "Tr_12_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_12"),
+        ("Rot_Y_mX_mZ",   "Tr_12_12_12"),
+        ("Rot_mY_X_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_12"),
+        ("Rot_Y_X_Z",     "Tr_12_12_12"),
+        )),
+    (140, 32, 16, "I4/mcm", "PG4/mmm", "TETRAGONAL", "I 4/m 2/c 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_12"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_12"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_12"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_12"),
+        ("Rot_Y_X_Z",     "Tr_0_0_12"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mY_X_Z",    "Tr_12_12_12"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Y_X_mZ",    "Tr_12_12_0"),
+        ("Rot_mY_mX_mZ",  "Tr_12_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_12"),
+        ("Rot_Y_mX_mZ",   "Tr_12_12_12"),
+        ("Rot_mY_X_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_0"),
+        ("Rot_Y_X_Z",     "Tr_12_12_0"),
+        )),
+    (141, 32, 16, "I41/amd", "PG4/mmm", "TETRAGONAL", "I 41/a 2/m 2/d", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mY_X_Z",    "Tr_0_12_14"),
+        ("Rot_Y_mX_Z",    "Tr_12_0_34"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_34"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_14"),
+        ("Rot_Y_X_mZ",    "Tr_12_12_12"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_12_14"),
+        ("Rot_X_Y_mZ",    "Tr_12_0_34"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_12_0_34"),
+        ("Rot_Y_X_Z",     "Tr_0_12_14"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_12_0_34"),
+        ("Rot_Y_mX_Z",    "Tr_0_12_14"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_14"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_34"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_12_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_12_0_34"),
+        ("Rot_X_Y_mZ",    "Tr_0_12_14"),
+        ("Rot_Y_mX_mZ",   "Tr_12_12_12"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        ("Rot_mY_mX_Z",   "Tr_0_12_14"),
+        ("Rot_Y_X_Z",     "Tr_12_0_34"),
+        )),
+    (142, 32, 16, "I41/acd", "PG4/mmm", "TETRAGONAL", "I 41/a 2/c 2/d", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mY_X_Z",    "Tr_0_12_14"),
+        ("Rot_Y_mX_Z",    "Tr_12_0_34"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_14"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_34"),
+        ("Rot_Y_X_mZ",    "Tr_12_12_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_12_14"),
+        ("Rot_X_Y_mZ",    "Tr_12_0_34"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_12"),
+        ("Rot_mY_mX_Z",   "Tr_12_0_14"),
+        ("Rot_Y_X_Z",     "Tr_0_12_34"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_12_0_34"),
+        ("Rot_Y_mX_Z",    "Tr_0_12_14"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_34"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_14"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_12"),
+        ("Rot_mY_mX_mZ",  "Tr_12_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_12_0_34"),
+        ("Rot_X_Y_mZ",    "Tr_0_12_14"),
+        ("Rot_Y_mX_mZ",   "Tr_12_12_12"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_12_34"),
+        ("Rot_Y_X_Z",     "Tr_12_0_14"),
+        )),
+    (143, 3, 3, "P3", "PG3", "TRIGONAL", "P 3", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        )),
+    (144, 3, 3, "P31", "PG3", "TRIGONAL", "P 31", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_13"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_23"),
+        )),
+    (145, 3, 3, "P32", "PG3", "TRIGONAL", "P 32", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_23"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_13"),
+        )),
+    (146, 9, 3, "H3", "PG3", "TRIGONAL", "H 3", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_23_13_13"),
+        ("Rot_mY_XmY_Z",  "Tr_23_13_13"),
+        ("Rot_mXY_mX_Z",  "Tr_23_13_13"),
+        ("Rot_X_Y_Z",     "Tr_13_23_23"),
+        ("Rot_mY_XmY_Z",  "Tr_13_23_23"),
+        ("Rot_mXY_mX_Z",  "Tr_13_23_23"),
+        )),
+    (1146, 3, 3, "R3", "PG3", "TRIGONAL", "R 3", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        )),
+    (147, 6, 6, "P-3", "PG3bar", "TRIGONAL", "P -3", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_Y_mXY_mZ",  "Tr_0_0_0"),
+        ("Rot_XmY_X_mZ",  "Tr_0_0_0"),
+        )),
+    (148, 18, 6, "H-3", "PG3bar", "TRIGONAL", "H -3", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_Y_mXY_mZ",  "Tr_0_0_0"),
+        ("Rot_XmY_X_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_23_13_13"),
+        ("Rot_mY_XmY_Z",  "Tr_23_13_13"),
+        ("Rot_mXY_mX_Z",  "Tr_23_13_13"),
+        ("Rot_mX_mY_mZ",  "Tr_23_13_13"),
+        ("Rot_Y_mXY_mZ",  "Tr_23_13_13"),
+        ("Rot_XmY_X_mZ",  "Tr_23_13_13"),
+        ("Rot_X_Y_Z",     "Tr_13_23_23"),
+        ("Rot_mY_XmY_Z",  "Tr_13_23_23"),
+        ("Rot_mXY_mX_Z",  "Tr_13_23_23"),
+        ("Rot_mX_mY_mZ",  "Tr_13_23_23"),
+        ("Rot_Y_mXY_mZ",  "Tr_13_23_23"),
+        ("Rot_XmY_X_mZ",  "Tr_13_23_23"),
+        )),
+    (1148, 6, 6, "R-3", "PG3bar", "TRIGONAL", "R -3", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_mZ_mX_mY",  "Tr_0_0_0"),
+        ("Rot_mY_mZ_mX",  "Tr_0_0_0"),
+        )),
+    (149, 6, 6, "P312", "PG312", "TRIGONAL", "P 3 1 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_mXY_Y_mZ",  "Tr_0_0_0"),
+        ("Rot_X_XmY_mZ",  "Tr_0_0_0"),
+        )),
+    (150, 6, 6, "P321", "PG321", "TRIGONAL", "P 3 2 1", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_XmY_mY_mZ", "Tr_0_0_0"),
+        ("Rot_mX_mXY_mZ", "Tr_0_0_0"),
+        )),
+    (151, 6, 6, "P3112", "PG312", "TRIGONAL", "P 31 1 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_13"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_23"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_23"),
+        ("Rot_mXY_Y_mZ",  "Tr_0_0_13"),
+        ("Rot_X_XmY_mZ",  "Tr_0_0_0"),
+        )),
+    (152, 6, 6, "P3121", "PG321", "TRIGONAL", "P 31 2 1", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_13"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_23"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_XmY_mY_mZ", "Tr_0_0_23"),
+        ("Rot_mX_mXY_mZ", "Tr_0_0_13"),
+        )),
+    (153, 6, 6, "P3212", "PG312", "TRIGONAL", "P 32 1 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_23"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_13"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_13"),
+        ("Rot_mXY_Y_mZ",  "Tr_0_0_23"),
+        ("Rot_X_XmY_mZ",  "Tr_0_0_0"),
+        )),
+    (154, 6, 6, "P3221", "PG321", "TRIGONAL", "P 32 2 1", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_23"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_13"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_XmY_mY_mZ", "Tr_0_0_13"),
+        ("Rot_mX_mXY_mZ", "Tr_0_0_23"),
+        )),
+    (155, 18, 6, "H32", "PG321", "TRIGONAL", "H 3 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_XmY_mY_mZ", "Tr_0_0_0"),
+        ("Rot_mX_mXY_mZ", "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_23_13_13"),
+        ("Rot_mY_XmY_Z",  "Tr_23_13_13"),
+        ("Rot_mXY_mX_Z",  "Tr_23_13_13"),
+        ("Rot_Y_X_mZ",    "Tr_23_13_13"),
+        ("Rot_XmY_mY_mZ", "Tr_23_13_13"),
+        ("Rot_mX_mXY_mZ", "Tr_23_13_13"),
+        ("Rot_X_Y_Z",     "Tr_13_23_23"),
+        ("Rot_mY_XmY_Z",  "Tr_13_23_23"),
+        ("Rot_mXY_mX_Z",  "Tr_13_23_23"),
+        ("Rot_Y_X_mZ",    "Tr_13_23_23"),
+        ("Rot_XmY_mY_mZ", "Tr_13_23_23"),
+        ("Rot_mX_mXY_mZ", "Tr_13_23_23"),
+        )),
+    (1155, 6, 6, "R32", "PG32", "TRIGONAL", "R 3 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_mX_mZ_mY",  "Tr_0_0_0"),
+        ("Rot_mZ_mY_mX",  "Tr_0_0_0"),
+        )),
+    (156, 6, 6, "P3m1", "PG3m1", "TRIGONAL", "P 3 m 1", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_mXY_Y_Z",   "Tr_0_0_0"),
+        ("Rot_X_XmY_Z",   "Tr_0_0_0"),
+        )),
+    (157, 6, 6, "P31m", "PG31m", "TRIGONAL", "P 3 1 m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        ("Rot_XmY_mY_Z",  "Tr_0_0_0"),
+        ("Rot_mX_mXY_Z",  "Tr_0_0_0"),
+        )),
+    (158, 6, 6, "P3c1", "PG3m1", "TRIGONAL", "P 3 c 1", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_12"),
+        ("Rot_mXY_Y_Z",   "Tr_0_0_12"),
+        ("Rot_X_XmY_Z",   "Tr_0_0_12"),
+        )),
+    (159, 6, 6, "P31c", "PG31m", "TRIGONAL", "P 3 1 c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_12"),
+        ("Rot_XmY_mY_Z",  "Tr_0_0_12"),
+        ("Rot_mX_mXY_Z",  "Tr_0_0_12"),
+        )),
+    (160, 18, 6, "H3m", "PG3m", "TRIGONAL", "H 3 m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_mXY_Y_Z",   "Tr_0_0_0"),
+        ("Rot_X_XmY_Z",   "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_23_13_13"),
+        ("Rot_mY_XmY_Z",  "Tr_23_13_13"),
+        ("Rot_mXY_mX_Z",  "Tr_23_13_13"),
+        ("Rot_mY_mX_Z",   "Tr_23_13_13"),
+        ("Rot_mXY_Y_Z",   "Tr_23_13_13"),
+        ("Rot_X_XmY_Z",   "Tr_23_13_13"),
+        ("Rot_X_Y_Z",     "Tr_13_23_23"),
+        ("Rot_mY_XmY_Z",  "Tr_13_23_23"),
+        ("Rot_mXY_mX_Z",  "Tr_13_23_23"),
+        ("Rot_mY_mX_Z",   "Tr_13_23_23"),
+        ("Rot_mXY_Y_Z",   "Tr_13_23_23"),
+        ("Rot_X_XmY_Z",   "Tr_13_23_23"),
+        )),
+    (1160, 6, 6, "R3m", "PG3m", "TRIGONAL", "R 3 m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        ("Rot_X_Z_Y",     "Tr_0_0_0"),
+        ("Rot_Z_Y_X",     "Tr_0_0_0"),
+        )),
+    (161, 18, 6, "H3c", "PG3m", "TRIGONAL", "H 3 c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_12"),
+        ("Rot_mXY_Y_Z",   "Tr_0_0_12"),
+        ("Rot_X_XmY_Z",   "Tr_0_0_12"),
+        ("Rot_X_Y_Z",     "Tr_23_13_13"),
+        ("Rot_mY_XmY_Z",  "Tr_23_13_13"),
+        ("Rot_mXY_mX_Z",  "Tr_23_13_13"),
+        ("Rot_mY_mX_Z",   "Tr_23_13_56"),
+        ("Rot_mXY_Y_Z",   "Tr_23_13_56"),
+        ("Rot_X_XmY_Z",   "Tr_23_13_56"),
+        ("Rot_X_Y_Z",     "Tr_13_23_23"),
+        ("Rot_mY_XmY_Z",  "Tr_13_23_23"),
+        ("Rot_mXY_mX_Z",  "Tr_13_23_23"),
+        ("Rot_mY_mX_Z",   "Tr_13_23_16"),
+        ("Rot_mXY_Y_Z",   "Tr_13_23_16"),
+        ("Rot_X_XmY_Z",   "Tr_13_23_16"),
+        )),
+    (1161, 6, 6, "R3c", "PG3m", "TRIGONAL", "R 3 c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_12_12_12"),
+        ("Rot_X_Z_Y",     "Tr_12_12_12"),
+        ("Rot_Z_Y_X",     "Tr_12_12_12"),
+        )),
+    (162, 12, 12, "P-31m", "PG3bar1m", "TRIGONAL", "P -3 1 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_mXY_Y_mZ",  "Tr_0_0_0"),
+        ("Rot_X_XmY_mZ",  "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_Y_mXY_mZ",  "Tr_0_0_0"),
+        ("Rot_XmY_X_mZ",  "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        ("Rot_XmY_mY_Z",  "Tr_0_0_0"),
+        ("Rot_mX_mXY_Z",  "Tr_0_0_0"),
+        )),
+    (163, 12, 12, "P-31c", "PG3bar1m", "TRIGONAL", "P -3 1 2/c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_12"),
+        ("Rot_mXY_Y_mZ",  "Tr_0_0_12"),
+        ("Rot_X_XmY_mZ",  "Tr_0_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_Y_mXY_mZ",  "Tr_0_0_0"),
+        ("Rot_XmY_X_mZ",  "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_12"),
+        ("Rot_XmY_mY_Z",  "Tr_0_0_12"),
+        ("Rot_mX_mXY_Z",  "Tr_0_0_12"),
+        )),
+    (164, 12, 12, "P-3m1", "PG3barm1", "TRIGONAL", "P -3 2/m 1", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_XmY_mY_mZ", "Tr_0_0_0"),
+        ("Rot_mX_mXY_mZ", "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_Y_mXY_mZ",  "Tr_0_0_0"),
+        ("Rot_XmY_X_mZ",  "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_mXY_Y_Z",   "Tr_0_0_0"),
+        ("Rot_X_XmY_Z",   "Tr_0_0_0"),
+        )),
+    (165, 12, 12, "P-3c1", "PG3barm1", "TRIGONAL", "P -3 2/c 1", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_12"),
+        ("Rot_XmY_mY_mZ", "Tr_0_0_12"),
+        ("Rot_mX_mXY_mZ", "Tr_0_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_Y_mXY_mZ",  "Tr_0_0_0"),
+        ("Rot_XmY_X_mZ",  "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_12"),
+        ("Rot_mXY_Y_Z",   "Tr_0_0_12"),
+        ("Rot_X_XmY_Z",   "Tr_0_0_12"),
+        )),
+    (166, 36, 12, "H-3m", "PG3barm", "TRIGONAL", "H -3 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_XmY_mY_mZ", "Tr_0_0_0"),
+        ("Rot_mX_mXY_mZ", "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_Y_mXY_mZ",  "Tr_0_0_0"),
+        ("Rot_XmY_X_mZ",  "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_mXY_Y_Z",   "Tr_0_0_0"),
+        ("Rot_X_XmY_Z",   "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_23_13_13"),
+        ("Rot_mY_XmY_Z",  "Tr_23_13_13"),
+        ("Rot_mXY_mX_Z",  "Tr_23_13_13"),
+        ("Rot_Y_X_mZ",    "Tr_23_13_13"),
+        ("Rot_XmY_mY_mZ", "Tr_23_13_13"),
+        ("Rot_mX_mXY_mZ", "Tr_23_13_13"),
+        ("Rot_mX_mY_mZ",  "Tr_23_13_13"),
+        ("Rot_Y_mXY_mZ",  "Tr_23_13_13"),
+        ("Rot_XmY_X_mZ",  "Tr_23_13_13"),
+        ("Rot_mY_mX_Z",   "Tr_23_13_13"),
+        ("Rot_mXY_Y_Z",   "Tr_23_13_13"),
+        ("Rot_X_XmY_Z",   "Tr_23_13_13"),
+        ("Rot_X_Y_Z",     "Tr_13_23_23"),
+        ("Rot_mY_XmY_Z",  "Tr_13_23_23"),
+        ("Rot_mXY_mX_Z",  "Tr_13_23_23"),
+        ("Rot_Y_X_mZ",    "Tr_13_23_23"),
+        ("Rot_XmY_mY_mZ", "Tr_13_23_23"),
+        ("Rot_mX_mXY_mZ", "Tr_13_23_23"),
+        ("Rot_mX_mY_mZ",  "Tr_13_23_23"),
+        ("Rot_Y_mXY_mZ",  "Tr_13_23_23"),
+        ("Rot_XmY_X_mZ",  "Tr_13_23_23"),
+        ("Rot_mY_mX_Z",   "Tr_13_23_23"),
+        ("Rot_mXY_Y_Z",   "Tr_13_23_23"),
+        ("Rot_X_XmY_Z",   "Tr_13_23_23"),
+        )),
+    (1166, 12, 12, "R-3m", "PG3barm", "TRIGONAL", "R -3 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_mX_mZ_mY",  "Tr_0_0_0"),
+        ("Rot_mZ_mY_mX",  "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_mZ_mX_mY",  "Tr_0_0_0"),
+        ("Rot_mY_mZ_mX",  "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        ("Rot_X_Z_Y",     "Tr_0_0_0"),
+        ("Rot_Z_Y_X",     "Tr_0_0_0"),
+        )),
+    (167, 36, 12, "H-3c", "PG3barm", "TRIGONAL", "H -3 2/c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_12"),
+        ("Rot_XmY_mY_mZ", "Tr_0_0_12"),
+        ("Rot_mX_mXY_mZ", "Tr_0_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_Y_mXY_mZ",  "Tr_0_0_0"),
+        ("Rot_XmY_X_mZ",  "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_12"),
+        ("Rot_mXY_Y_Z",   "Tr_0_0_12"),
+        ("Rot_X_XmY_Z",   "Tr_0_0_12"),
+        ("Rot_X_Y_Z",     "Tr_23_13_13"),
+        ("Rot_mY_XmY_Z",  "Tr_23_13_13"),
+        ("Rot_mXY_mX_Z",  "Tr_23_13_13"),
+        ("Rot_Y_X_mZ",    "Tr_23_13_56"),
+        ("Rot_XmY_mY_mZ", "Tr_23_13_56"),
+        ("Rot_mX_mXY_mZ", "Tr_23_13_56"),
+        ("Rot_mX_mY_mZ",  "Tr_23_13_13"),
+        ("Rot_Y_mXY_mZ",  "Tr_23_13_13"),
+        ("Rot_XmY_X_mZ",  "Tr_23_13_13"),
+        ("Rot_mY_mX_Z",   "Tr_23_13_56"),
+        ("Rot_mXY_Y_Z",   "Tr_23_13_56"),
+        ("Rot_X_XmY_Z",   "Tr_23_13_56"),
+        ("Rot_X_Y_Z",     "Tr_13_23_23"),
+        ("Rot_mY_XmY_Z",  "Tr_13_23_23"),
+        ("Rot_mXY_mX_Z",  "Tr_13_23_23"),
+        ("Rot_Y_X_mZ",    "Tr_13_23_16"),
+        ("Rot_XmY_mY_mZ", "Tr_13_23_16"),
+        ("Rot_mX_mXY_mZ", "Tr_13_23_16"),
+        ("Rot_mX_mY_mZ",  "Tr_13_23_23"),
+        ("Rot_Y_mXY_mZ",  "Tr_13_23_23"),
+        ("Rot_XmY_X_mZ",  "Tr_13_23_23"),
+        ("Rot_mY_mX_Z",   "Tr_13_23_16"),
+        ("Rot_mXY_Y_Z",   "Tr_13_23_16"),
+        ("Rot_X_XmY_Z",   "Tr_13_23_16"),
+        )),
+    (1167, 12, 12, "R-3c", "PG3barm", "TRIGONAL", "R -3 2/c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_12_12_12"),
+        ("Rot_mX_mZ_mY",  "Tr_12_12_12"),
+        ("Rot_mZ_mY_mX",  "Tr_12_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_mZ_mX_mY",  "Tr_0_0_0"),
+        ("Rot_mY_mZ_mX",  "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_12_12_12"),
+        ("Rot_X_Z_Y",     "Tr_12_12_12"),
+        ("Rot_Z_Y_X",     "Tr_12_12_12"),
+        )),
+    (168, 6, 6, "P6", "PG6", "HEXAGONAL", "P 6", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_Y_mXY_Z",   "Tr_0_0_0"),
+        ("Rot_XmY_X_Z",   "Tr_0_0_0"),
+        )),
+    (169, 6, 6, "P61", "PG6", "HEXAGONAL", "P 61", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_13"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_23"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_Y_mXY_Z",   "Tr_0_0_56"),
+        ("Rot_XmY_X_Z",   "Tr_0_0_16"),
+        )),
+    (170, 6, 6, "P65", "PG6", "HEXAGONAL", "P 65", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_23"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_13"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_Y_mXY_Z",   "Tr_0_0_16"),
+        ("Rot_XmY_X_Z",   "Tr_0_0_56"),
+        )),
+    (171, 6, 6, "P62", "PG6", "HEXAGONAL", "P 62", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_23"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_13"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_Y_mXY_Z",   "Tr_0_0_23"),
+        ("Rot_XmY_X_Z",   "Tr_0_0_13"),
+        )),
+    (172, 6, 6, "P64", "PG6", "HEXAGONAL", "P 64", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_13"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_23"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_Y_mXY_Z",   "Tr_0_0_13"),
+        ("Rot_XmY_X_Z",   "Tr_0_0_23"),
+        )),
+    (173, 6, 6, "P63", "PG6", "HEXAGONAL", "P 63", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_Y_mXY_Z",   "Tr_0_0_12"),
+        ("Rot_XmY_X_Z",   "Tr_0_0_12"),
+        )),
+    (174, 6, 6, "P-6", "PG6bar", "HEXAGONAL", "P -6", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_XmY_mZ", "Tr_0_0_0"),
+        ("Rot_mXY_mX_mZ", "Tr_0_0_0"),
+        )),
+    (175, 12, 12, "P6/m", "PG6/m", "HEXAGONAL", "P 6/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_Y_mXY_Z",   "Tr_0_0_0"),
+        ("Rot_XmY_X_Z",   "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_Y_mXY_mZ",  "Tr_0_0_0"),
+        ("Rot_XmY_X_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_XmY_mZ", "Tr_0_0_0"),
+        ("Rot_mXY_mX_mZ", "Tr_0_0_0"),
+        )),
+    (176, 12, 12, "P63/m", "PG6/m", "HEXAGONAL", "P 63/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_Y_mXY_Z",   "Tr_0_0_12"),
+        ("Rot_XmY_X_Z",   "Tr_0_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_Y_mXY_mZ",  "Tr_0_0_0"),
+        ("Rot_XmY_X_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_12"),
+        ("Rot_mY_XmY_mZ", "Tr_0_0_12"),
+        ("Rot_mXY_mX_mZ", "Tr_0_0_12"),
+        )),
+    (177, 12, 12, "P622", "PG622", "HEXAGONAL", "P 6 2 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_Y_mXY_Z",   "Tr_0_0_0"),
+        ("Rot_XmY_X_Z",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_XmY_mY_mZ", "Tr_0_0_0"),
+        ("Rot_mX_mXY_mZ", "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_mXY_Y_mZ",  "Tr_0_0_0"),
+        ("Rot_X_XmY_mZ",  "Tr_0_0_0"),
+        )),
+    (178, 12, 12, "P6122", "PG622", "HEXAGONAL", "P 61 2 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_13"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_23"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_Y_mXY_Z",   "Tr_0_0_56"),
+        ("Rot_XmY_X_Z",   "Tr_0_0_16"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_13"),
+        ("Rot_XmY_mY_mZ", "Tr_0_0_0"),
+        ("Rot_mX_mXY_mZ", "Tr_0_0_23"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_56"),
+        ("Rot_mXY_Y_mZ",  "Tr_0_0_12"),
+        ("Rot_X_XmY_mZ",  "Tr_0_0_16"),
+        )),
+    (179, 12, 12, "P6522", "PG622", "HEXAGONAL", "P 65 2 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_23"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_13"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_Y_mXY_Z",   "Tr_0_0_16"),
+        ("Rot_XmY_X_Z",   "Tr_0_0_56"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_23"),
+        ("Rot_XmY_mY_mZ", "Tr_0_0_0"),
+        ("Rot_mX_mXY_mZ", "Tr_0_0_13"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_16"),
+        ("Rot_mXY_Y_mZ",  "Tr_0_0_12"),
+        ("Rot_X_XmY_mZ",  "Tr_0_0_56"),
+        )),
+    (180, 12, 12, "P6222", "PG622", "HEXAGONAL", "P 62 2 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_23"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_13"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_Y_mXY_Z",   "Tr_0_0_23"),
+        ("Rot_XmY_X_Z",   "Tr_0_0_13"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_23"),
+        ("Rot_XmY_mY_mZ", "Tr_0_0_0"),
+        ("Rot_mX_mXY_mZ", "Tr_0_0_13"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_23"),
+        ("Rot_mXY_Y_mZ",  "Tr_0_0_0"),
+        ("Rot_X_XmY_mZ",  "Tr_0_0_13"),
+        )),
+    (181, 12, 12, "P6422", "PG622", "HEXAGONAL", "P 64 2 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_13"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_23"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_Y_mXY_Z",   "Tr_0_0_13"),
+        ("Rot_XmY_X_Z",   "Tr_0_0_23"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_13"),
+        ("Rot_XmY_mY_mZ", "Tr_0_0_0"),
+        ("Rot_mX_mXY_mZ", "Tr_0_0_23"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_13"),
+        ("Rot_mXY_Y_mZ",  "Tr_0_0_0"),
+        ("Rot_X_XmY_mZ",  "Tr_0_0_23"),
+        )),
+    (182, 12, 12, "P6322", "PG622", "HEXAGONAL", "P 63 2 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_Y_mXY_Z",   "Tr_0_0_12"),
+        ("Rot_XmY_X_Z",   "Tr_0_0_12"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_XmY_mY_mZ", "Tr_0_0_0"),
+        ("Rot_mX_mXY_mZ", "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_12"),
+        ("Rot_mXY_Y_mZ",  "Tr_0_0_12"),
+        ("Rot_X_XmY_mZ",  "Tr_0_0_12"),
+        )),
+    (183, 12, 12, "P6mm", "PG6mm", "HEXAGONAL", "P 6 m m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_Y_mXY_Z",   "Tr_0_0_0"),
+        ("Rot_XmY_X_Z",   "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_mXY_Y_Z",   "Tr_0_0_0"),
+        ("Rot_X_XmY_Z",   "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        ("Rot_XmY_mY_Z",  "Tr_0_0_0"),
+        ("Rot_mX_mXY_Z",  "Tr_0_0_0"),
+        )),
+    (184, 12, 12, "P6cc", "PG6mm", "HEXAGONAL", "P 6 c c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_Y_mXY_Z",   "Tr_0_0_0"),
+        ("Rot_XmY_X_Z",   "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_12"),
+        ("Rot_mXY_Y_Z",   "Tr_0_0_12"),
+        ("Rot_X_XmY_Z",   "Tr_0_0_12"),
+        ("Rot_Y_X_Z",     "Tr_0_0_12"),
+        ("Rot_XmY_mY_Z",  "Tr_0_0_12"),
+        ("Rot_mX_mXY_Z",  "Tr_0_0_12"),
+        )),
+    (185, 12, 12, "P63cm", "PG6mm", "HEXAGONAL", "P 63 c m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_Y_mXY_Z",   "Tr_0_0_12"),
+        ("Rot_XmY_X_Z",   "Tr_0_0_12"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_12"),
+        ("Rot_mXY_Y_Z",   "Tr_0_0_12"),
+        ("Rot_X_XmY_Z",   "Tr_0_0_12"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        ("Rot_XmY_mY_Z",  "Tr_0_0_0"),
+        ("Rot_mX_mXY_Z",  "Tr_0_0_0"),
+        )),
+    (186, 12, 12, "P63mc", "PG6mm", "HEXAGONAL", "P 63 m c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_Y_mXY_Z",   "Tr_0_0_12"),
+        ("Rot_XmY_X_Z",   "Tr_0_0_12"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_mXY_Y_Z",   "Tr_0_0_0"),
+        ("Rot_X_XmY_Z",   "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_12"),
+        ("Rot_XmY_mY_Z",  "Tr_0_0_12"),
+        ("Rot_mX_mXY_Z",  "Tr_0_0_12"),
+        )),
+    (187, 12, 12, "P-6m2", "PG6barm2", "HEXAGONAL", "P -6 m 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_XmY_mZ", "Tr_0_0_0"),
+        ("Rot_mXY_mX_mZ", "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_mXY_Y_Z",   "Tr_0_0_0"),
+        ("Rot_X_XmY_Z",   "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_mXY_Y_mZ",  "Tr_0_0_0"),
+        ("Rot_X_XmY_mZ",  "Tr_0_0_0"),
+        )),
+    (188, 12, 12, "P-6c2", "PG6barm2", "HEXAGONAL", "P -6 c 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_12"),
+        ("Rot_mY_XmY_mZ", "Tr_0_0_12"),
+        ("Rot_mXY_mX_mZ", "Tr_0_0_12"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_12"),
+        ("Rot_mXY_Y_Z",   "Tr_0_0_12"),
+        ("Rot_X_XmY_Z",   "Tr_0_0_12"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_mXY_Y_mZ",  "Tr_0_0_0"),
+        ("Rot_X_XmY_mZ",  "Tr_0_0_0"),
+        )),
+    (189, 12, 12, "P-62m", "PG6bar2m", "HEXAGONAL", "P -6 2 m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_XmY_mZ", "Tr_0_0_0"),
+        ("Rot_mXY_mX_mZ", "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_XmY_mY_mZ", "Tr_0_0_0"),
+        ("Rot_mX_mXY_mZ", "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        ("Rot_XmY_mY_Z",  "Tr_0_0_0"),
+        ("Rot_mX_mXY_Z",  "Tr_0_0_0"),
+        )),
+    (190, 12, 12, "P-62c", "PG6bar2m", "HEXAGONAL", "P -6 2 c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_12"),
+        ("Rot_mY_XmY_mZ", "Tr_0_0_12"),
+        ("Rot_mXY_mX_mZ", "Tr_0_0_12"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_XmY_mY_mZ", "Tr_0_0_0"),
+        ("Rot_mX_mXY_mZ", "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_12"),
+        ("Rot_XmY_mY_Z",  "Tr_0_0_12"),
+        ("Rot_mX_mXY_Z",  "Tr_0_0_12"),
+        )),
+    (191, 24, 24, "P6/mmm", "PG6/mmm", "HEXAGONAL", "P 6/m 2/m 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_Y_mXY_Z",   "Tr_0_0_0"),
+        ("Rot_XmY_X_Z",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_XmY_mY_mZ", "Tr_0_0_0"),
+        ("Rot_mX_mXY_mZ", "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_mXY_Y_mZ",  "Tr_0_0_0"),
+        ("Rot_X_XmY_mZ",  "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_Y_mXY_mZ",  "Tr_0_0_0"),
+        ("Rot_XmY_X_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_mXY_mX_mZ", "Tr_0_0_0"),
+        ("Rot_mY_XmY_mZ", "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_mXY_Y_Z",   "Tr_0_0_0"),
+        ("Rot_X_XmY_Z",   "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        ("Rot_XmY_mY_Z",  "Tr_0_0_0"),
+        ("Rot_mX_mXY_Z",  "Tr_0_0_0"),
+        )),
+    (192, 24, 24, "P6/mcc", "PG6/mmm", "HEXAGONAL", "P 6/m 2/c 2/c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_Y_mXY_Z",   "Tr_0_0_0"),
+        ("Rot_XmY_X_Z",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_12"),
+        ("Rot_XmY_mY_mZ", "Tr_0_0_12"),
+        ("Rot_mX_mXY_mZ", "Tr_0_0_12"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_12"),
+        ("Rot_mXY_Y_mZ",  "Tr_0_0_12"),
+        ("Rot_X_XmY_mZ",  "Tr_0_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_Y_mXY_mZ",  "Tr_0_0_0"),
+        ("Rot_XmY_X_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_mXY_mX_mZ", "Tr_0_0_0"),
+        ("Rot_mY_XmY_mZ", "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_12"),
+        ("Rot_mXY_Y_Z",   "Tr_0_0_12"),
+        ("Rot_X_XmY_Z",   "Tr_0_0_12"),
+        ("Rot_Y_X_Z",     "Tr_0_0_12"),
+        ("Rot_XmY_mY_Z",  "Tr_0_0_12"),
+        ("Rot_mX_mXY_Z",  "Tr_0_0_12"),
+        )),
+    (193, 24, 24, "P63/mcm", "PG6/mmm", "HEXAGONAL", "P 63/m 2/c 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_Y_mXY_Z",   "Tr_0_0_12"),
+        ("Rot_XmY_X_Z",   "Tr_0_0_12"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_12"),
+        ("Rot_XmY_mY_mZ", "Tr_0_0_12"),
+        ("Rot_mX_mXY_mZ", "Tr_0_0_12"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_mXY_Y_mZ",  "Tr_0_0_0"),
+        ("Rot_X_XmY_mZ",  "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_Y_mXY_mZ",  "Tr_0_0_0"),
+        ("Rot_XmY_X_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_12"),
+        ("Rot_mXY_mX_mZ", "Tr_0_0_12"),
+        ("Rot_mY_XmY_mZ", "Tr_0_0_12"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_12"),
+        ("Rot_mXY_Y_Z",   "Tr_0_0_12"),
+        ("Rot_X_XmY_Z",   "Tr_0_0_12"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        ("Rot_XmY_mY_Z",  "Tr_0_0_0"),
+        ("Rot_mX_mXY_Z",  "Tr_0_0_0"),
+        )),
+    (194, 24, 24, "P63/mmc", "PG6/mmm", "HEXAGONAL", "P 63/m 2/m 2/c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mY_XmY_Z",  "Tr_0_0_0"),
+        ("Rot_mXY_mX_Z",  "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_Y_mXY_Z",   "Tr_0_0_12"),
+        ("Rot_XmY_X_Z",   "Tr_0_0_12"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_XmY_mY_mZ", "Tr_0_0_0"),
+        ("Rot_mX_mXY_mZ", "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_12"),
+        ("Rot_mXY_Y_mZ",  "Tr_0_0_12"),
+        ("Rot_X_XmY_mZ",  "Tr_0_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_Y_mXY_mZ",  "Tr_0_0_0"),
+        ("Rot_XmY_X_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_12"),
+        ("Rot_mXY_mX_mZ", "Tr_0_0_12"),
+        ("Rot_mY_XmY_mZ", "Tr_0_0_12"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_mXY_Y_Z",   "Tr_0_0_0"),
+        ("Rot_X_XmY_Z",   "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_12"),
+        ("Rot_XmY_mY_Z",  "Tr_0_0_12"),
+        ("Rot_mX_mXY_Z",  "Tr_0_0_12"),
+        )),
+    (195, 12, 12, "P23", "PG23", "CUBIC", "P 2 3", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        )),
+    (196, 48, 12, "F23", "PG23", "CUBIC", "F 2 3", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_0_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_12"),
+        ("Rot_Z_X_Y",     "Tr_0_12_12"),
+        ("Rot_Z_mX_mY",   "Tr_0_12_12"),
+        ("Rot_mZ_mX_Y",   "Tr_0_12_12"),
+        ("Rot_mZ_X_mY",   "Tr_0_12_12"),
+        ("Rot_Y_Z_X",     "Tr_0_12_12"),
+        ("Rot_mY_Z_mX",   "Tr_0_12_12"),
+        ("Rot_Y_mZ_mX",   "Tr_0_12_12"),
+        ("Rot_mY_mZ_X",   "Tr_0_12_12"),
+        ("Rot_X_Y_Z",     "Tr_12_0_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_12"),
+        ("Rot_Z_X_Y",     "Tr_12_0_12"),
+        ("Rot_Z_mX_mY",   "Tr_12_0_12"),
+        ("Rot_mZ_mX_Y",   "Tr_12_0_12"),
+        ("Rot_mZ_X_mY",   "Tr_12_0_12"),
+        ("Rot_Y_Z_X",     "Tr_12_0_12"),
+        ("Rot_mY_Z_mX",   "Tr_12_0_12"),
+        ("Rot_Y_mZ_mX",   "Tr_12_0_12"),
+        ("Rot_mY_mZ_X",   "Tr_12_0_12"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Z_X_Y",     "Tr_12_12_0"),
+        ("Rot_Z_mX_mY",   "Tr_12_12_0"),
+        ("Rot_mZ_mX_Y",   "Tr_12_12_0"),
+        ("Rot_mZ_X_mY",   "Tr_12_12_0"),
+        ("Rot_Y_Z_X",     "Tr_12_12_0"),
+        ("Rot_mY_Z_mX",   "Tr_12_12_0"),
+        ("Rot_Y_mZ_mX",   "Tr_12_12_0"),
+        ("Rot_mY_mZ_X",   "Tr_12_12_0"),
+        )),
+    (197, 24, 12, "I23", "PG23", "CUBIC", "I 2 3", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_12"),
+        ("Rot_Z_X_Y",     "Tr_12_12_12"),
+        ("Rot_Z_mX_mY",   "Tr_12_12_12"),
+        ("Rot_mZ_mX_Y",   "Tr_12_12_12"),
+        ("Rot_mZ_X_mY",   "Tr_12_12_12"),
+        ("Rot_Y_Z_X",     "Tr_12_12_12"),
+        ("Rot_mY_Z_mX",   "Tr_12_12_12"),
+        ("Rot_Y_mZ_mX",   "Tr_12_12_12"),
+        ("Rot_mY_mZ_X",   "Tr_12_12_12"),
+        )),
+    (198, 12, 12, "P213", "PG23", "CUBIC", "P 21 3", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_12_12_0"),
+        ("Rot_mZ_mX_Y",   "Tr_12_0_12"),
+        ("Rot_mZ_X_mY",   "Tr_0_12_12"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_12_12"),
+        ("Rot_Y_mZ_mX",   "Tr_12_12_0"),
+        ("Rot_mY_mZ_X",   "Tr_12_0_12"),
+        )),
+    (199, 24, 12, "I213", "PG23", "CUBIC", "I 21 3", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_12_12_0"),
+        ("Rot_mZ_mX_Y",   "Tr_12_0_12"),
+        ("Rot_mZ_X_mY",   "Tr_0_12_12"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_12_12"),
+        ("Rot_Y_mZ_mX",   "Tr_12_12_0"),
+        ("Rot_mY_mZ_X",   "Tr_12_0_12"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_12"),
+        ("Rot_Z_X_Y",     "Tr_12_12_12"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_12"),
+        ("Rot_mZ_mX_Y",   "Tr_0_12_0"),
+        ("Rot_mZ_X_mY",   "Tr_12_0_0"),
+        ("Rot_Y_Z_X",     "Tr_12_12_12"),
+        ("Rot_mY_Z_mX",   "Tr_12_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_12"),
+        ("Rot_mY_mZ_X",   "Tr_0_12_0"),
+        )),
+    (200, 24, 24, "Pm-3", "PGm3bar", "CUBIC", "P 2/m -3", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_mZ_mX_mY",  "Tr_0_0_0"),
+        ("Rot_mZ_X_Y",    "Tr_0_0_0"),
+        ("Rot_Z_X_mY",    "Tr_0_0_0"),
+        ("Rot_Z_mX_Y",    "Tr_0_0_0"),
+        ("Rot_mY_mZ_mX",  "Tr_0_0_0"),
+        ("Rot_Y_mZ_X",    "Tr_0_0_0"),
+        ("Rot_mY_Z_X",    "Tr_0_0_0"),
+        ("Rot_Y_Z_mX",    "Tr_0_0_0"),
+        )),
+    (201, 24, 24, "Pn-3", "PGm3bar", "CUBIC", "P 2/n -3", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_12"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        ("Rot_mZ_mX_mY",  "Tr_12_12_12"),
+        ("Rot_mZ_X_Y",    "Tr_12_12_12"),
+        ("Rot_Z_X_mY",    "Tr_12_12_12"),
+        ("Rot_Z_mX_Y",    "Tr_12_12_12"),
+        ("Rot_mY_mZ_mX",  "Tr_12_12_12"),
+        ("Rot_Y_mZ_X",    "Tr_12_12_12"),
+        ("Rot_mY_Z_X",    "Tr_12_12_12"),
+        ("Rot_Y_Z_mX",    "Tr_12_12_12"),
+        )),
+    (202, 96, 24, "Fm-3", "PGm3bar", "CUBIC", "F 2/m -3", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_mZ_mX_mY",  "Tr_0_0_0"),
+        ("Rot_mZ_X_Y",    "Tr_0_0_0"),
+        ("Rot_Z_X_mY",    "Tr_0_0_0"),
+        ("Rot_Z_mX_Y",    "Tr_0_0_0"),
+        ("Rot_mY_mZ_mX",  "Tr_0_0_0"),
+        ("Rot_Y_mZ_X",    "Tr_0_0_0"),
+        ("Rot_mY_Z_X",    "Tr_0_0_0"),
+        ("Rot_Y_Z_mX",    "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_0_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_12"),
+        ("Rot_Z_X_Y",     "Tr_0_12_12"),
+        ("Rot_Z_mX_mY",   "Tr_0_12_12"),
+        ("Rot_mZ_mX_Y",   "Tr_0_12_12"),
+        ("Rot_mZ_X_mY",   "Tr_0_12_12"),
+        ("Rot_Y_Z_X",     "Tr_0_12_12"),
+        ("Rot_mY_Z_mX",   "Tr_0_12_12"),
+        ("Rot_Y_mZ_mX",   "Tr_0_12_12"),
+        ("Rot_mY_mZ_X",   "Tr_0_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_0_12_12"),
+        ("Rot_X_mY_Z",    "Tr_0_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_12_12"),
+        ("Rot_mZ_mX_mY",  "Tr_0_12_12"),
+        ("Rot_mZ_X_Y",    "Tr_0_12_12"),
+        ("Rot_Z_X_mY",    "Tr_0_12_12"),
+        ("Rot_Z_mX_Y",    "Tr_0_12_12"),
+        ("Rot_mY_mZ_mX",  "Tr_0_12_12"),
+        ("Rot_Y_mZ_X",    "Tr_0_12_12"),
+        ("Rot_mY_Z_X",    "Tr_0_12_12"),
+        ("Rot_Y_Z_mX",    "Tr_0_12_12"),
+        ("Rot_X_Y_Z",     "Tr_12_0_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_12"),
+        ("Rot_Z_X_Y",     "Tr_12_0_12"),
+        ("Rot_Z_mX_mY",   "Tr_12_0_12"),
+        ("Rot_mZ_mX_Y",   "Tr_12_0_12"),
+        ("Rot_mZ_X_mY",   "Tr_12_0_12"),
+        ("Rot_Y_Z_X",     "Tr_12_0_12"),
+        ("Rot_mY_Z_mX",   "Tr_12_0_12"),
+        ("Rot_Y_mZ_mX",   "Tr_12_0_12"),
+        ("Rot_mY_mZ_X",   "Tr_12_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_12_0_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_0_12"),
+        ("Rot_X_mY_Z",    "Tr_12_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_0_12"),
+        ("Rot_mZ_mX_mY",  "Tr_12_0_12"),
+        ("Rot_mZ_X_Y",    "Tr_12_0_12"),
+        ("Rot_Z_X_mY",    "Tr_12_0_12"),
+        ("Rot_Z_mX_Y",    "Tr_12_0_12"),
+        ("Rot_mY_mZ_mX",  "Tr_12_0_12"),
+        ("Rot_Y_mZ_X",    "Tr_12_0_12"),
+        ("Rot_mY_Z_X",    "Tr_12_0_12"),
+        ("Rot_Y_Z_mX",    "Tr_12_0_12"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Z_X_Y",     "Tr_12_12_0"),
+        ("Rot_Z_mX_mY",   "Tr_12_12_0"),
+        ("Rot_mZ_mX_Y",   "Tr_12_12_0"),
+        ("Rot_mZ_X_mY",   "Tr_12_12_0"),
+        ("Rot_Y_Z_X",     "Tr_12_12_0"),
+        ("Rot_mY_Z_mX",   "Tr_12_12_0"),
+        ("Rot_Y_mZ_mX",   "Tr_12_12_0"),
+        ("Rot_mY_mZ_X",   "Tr_12_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        ("Rot_mZ_mX_mY",  "Tr_12_12_0"),
+        ("Rot_mZ_X_Y",    "Tr_12_12_0"),
+        ("Rot_Z_X_mY",    "Tr_12_12_0"),
+        ("Rot_Z_mX_Y",    "Tr_12_12_0"),
+        ("Rot_mY_mZ_mX",  "Tr_12_12_0"),
+        ("Rot_Y_mZ_X",    "Tr_12_12_0"),
+        ("Rot_mY_Z_X",    "Tr_12_12_0"),
+        ("Rot_Y_Z_mX",    "Tr_12_12_0"),
+        )),
+    (203, 96, 24, "Fd-3", "PGm3bar", "CUBIC", "F 2/d -3", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_14_14_14"),
+        ("Rot_X_Y_mZ",    "Tr_14_14_14"),
+        ("Rot_X_mY_Z",    "Tr_14_14_14"),
+        ("Rot_mX_Y_Z",    "Tr_14_14_14"),
+        ("Rot_mZ_mX_mY",  "Tr_14_14_14"),
+        ("Rot_mZ_X_Y",    "Tr_14_14_14"),
+        ("Rot_Z_X_mY",    "Tr_14_14_14"),
+        ("Rot_Z_mX_Y",    "Tr_14_14_14"),
+        ("Rot_mY_mZ_mX",  "Tr_14_14_14"),
+        ("Rot_Y_mZ_X",    "Tr_14_14_14"),
+        ("Rot_mY_Z_X",    "Tr_14_14_14"),
+        ("Rot_Y_Z_mX",    "Tr_14_14_14"),
+        ("Rot_X_Y_Z",     "Tr_0_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_12"),
+        ("Rot_Z_X_Y",     "Tr_0_12_12"),
+        ("Rot_Z_mX_mY",   "Tr_0_12_12"),
+        ("Rot_mZ_mX_Y",   "Tr_0_12_12"),
+        ("Rot_mZ_X_mY",   "Tr_0_12_12"),
+        ("Rot_Y_Z_X",     "Tr_0_12_12"),
+        ("Rot_mY_Z_mX",   "Tr_0_12_12"),
+        ("Rot_Y_mZ_mX",   "Tr_0_12_12"),
+        ("Rot_mY_mZ_X",   "Tr_0_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_14_34_34"),
+        ("Rot_X_Y_mZ",    "Tr_14_34_34"),
+        ("Rot_X_mY_Z",    "Tr_14_34_34"),
+        ("Rot_mX_Y_Z",    "Tr_14_34_34"),
+        ("Rot_mZ_mX_mY",  "Tr_14_34_34"),
+        ("Rot_mZ_X_Y",    "Tr_14_34_34"),
+        ("Rot_Z_X_mY",    "Tr_14_34_34"),
+        ("Rot_Z_mX_Y",    "Tr_14_34_34"),
+        ("Rot_mY_mZ_mX",  "Tr_14_34_34"),
+        ("Rot_Y_mZ_X",    "Tr_14_34_34"),
+        ("Rot_mY_Z_X",    "Tr_14_34_34"),
+        ("Rot_Y_Z_mX",    "Tr_14_34_34"),
+        ("Rot_X_Y_Z",     "Tr_12_0_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_12"),
+        ("Rot_Z_X_Y",     "Tr_12_0_12"),
+        ("Rot_Z_mX_mY",   "Tr_12_0_12"),
+        ("Rot_mZ_mX_Y",   "Tr_12_0_12"),
+        ("Rot_mZ_X_mY",   "Tr_12_0_12"),
+        ("Rot_Y_Z_X",     "Tr_12_0_12"),
+        ("Rot_mY_Z_mX",   "Tr_12_0_12"),
+        ("Rot_Y_mZ_mX",   "Tr_12_0_12"),
+        ("Rot_mY_mZ_X",   "Tr_12_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_34_14_34"),
+        ("Rot_X_Y_mZ",    "Tr_34_14_34"),
+        ("Rot_X_mY_Z",    "Tr_34_14_34"),
+        ("Rot_mX_Y_Z",    "Tr_34_14_34"),
+        ("Rot_mZ_mX_mY",  "Tr_34_14_34"),
+        ("Rot_mZ_X_Y",    "Tr_34_14_34"),
+        ("Rot_Z_X_mY",    "Tr_34_14_34"),
+        ("Rot_Z_mX_Y",    "Tr_34_14_34"),
+        ("Rot_mY_mZ_mX",  "Tr_34_14_34"),
+        ("Rot_Y_mZ_X",    "Tr_34_14_34"),
+        ("Rot_mY_Z_X",    "Tr_34_14_34"),
+        ("Rot_Y_Z_mX",    "Tr_34_14_34"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Z_X_Y",     "Tr_12_12_0"),
+        ("Rot_Z_mX_mY",   "Tr_12_12_0"),
+        ("Rot_mZ_mX_Y",   "Tr_12_12_0"),
+        ("Rot_mZ_X_mY",   "Tr_12_12_0"),
+        ("Rot_Y_Z_X",     "Tr_12_12_0"),
+        ("Rot_mY_Z_mX",   "Tr_12_12_0"),
+        ("Rot_Y_mZ_mX",   "Tr_12_12_0"),
+        ("Rot_mY_mZ_X",   "Tr_12_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_34_34_14"),
+        ("Rot_X_Y_mZ",    "Tr_34_34_14"),
+        ("Rot_X_mY_Z",    "Tr_34_34_14"),
+        ("Rot_mX_Y_Z",    "Tr_34_34_14"),
+        ("Rot_mZ_mX_mY",  "Tr_34_34_14"),
+        ("Rot_mZ_X_Y",    "Tr_34_34_14"),
+        ("Rot_Z_X_mY",    "Tr_34_34_14"),
+        ("Rot_Z_mX_Y",    "Tr_34_34_14"),
+        ("Rot_mY_mZ_mX",  "Tr_34_34_14"),
+        ("Rot_Y_mZ_X",    "Tr_34_34_14"),
+        ("Rot_mY_Z_X",    "Tr_34_34_14"),
+        ("Rot_Y_Z_mX",    "Tr_34_34_14"),
+        )),
+    (204, 48, 24, "Im-3", "PGm3bar", "CUBIC", "I 2/m -3", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_mZ_mX_mY",  "Tr_0_0_0"),
+        ("Rot_mZ_X_Y",    "Tr_0_0_0"),
+        ("Rot_Z_X_mY",    "Tr_0_0_0"),
+        ("Rot_Z_mX_Y",    "Tr_0_0_0"),
+        ("Rot_mY_mZ_mX",  "Tr_0_0_0"),
+        ("Rot_Y_mZ_X",    "Tr_0_0_0"),
+        ("Rot_mY_Z_X",    "Tr_0_0_0"),
+        ("Rot_Y_Z_mX",    "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_12"),
+        ("Rot_Z_X_Y",     "Tr_12_12_12"),
+        ("Rot_Z_mX_mY",   "Tr_12_12_12"),
+        ("Rot_mZ_mX_Y",   "Tr_12_12_12"),
+        ("Rot_mZ_X_mY",   "Tr_12_12_12"),
+        ("Rot_Y_Z_X",     "Tr_12_12_12"),
+        ("Rot_mY_Z_mX",   "Tr_12_12_12"),
+        ("Rot_Y_mZ_mX",   "Tr_12_12_12"),
+        ("Rot_mY_mZ_X",   "Tr_12_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_12"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        ("Rot_mZ_mX_mY",  "Tr_12_12_12"),
+        ("Rot_mZ_X_Y",    "Tr_12_12_12"),
+        ("Rot_Z_X_mY",    "Tr_12_12_12"),
+        ("Rot_Z_mX_Y",    "Tr_12_12_12"),
+        ("Rot_mY_mZ_mX",  "Tr_12_12_12"),
+        ("Rot_Y_mZ_X",    "Tr_12_12_12"),
+        ("Rot_mY_Z_X",    "Tr_12_12_12"),
+        ("Rot_Y_Z_mX",    "Tr_12_12_12"),
+        )),
+    (205, 24, 24, "Pa-3", "PGm3bar", "CUBIC", "P 21/a -3", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_12_12_0"),
+        ("Rot_mZ_mX_Y",   "Tr_12_0_12"),
+        ("Rot_mZ_X_mY",   "Tr_0_12_12"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_12_12"),
+        ("Rot_Y_mZ_mX",   "Tr_12_12_0"),
+        ("Rot_mY_mZ_X",   "Tr_12_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_0_12"),
+        ("Rot_X_mY_Z",    "Tr_0_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        ("Rot_mZ_mX_mY",  "Tr_0_0_0"),
+        ("Rot_mZ_X_Y",    "Tr_12_12_0"),
+        ("Rot_Z_X_mY",    "Tr_12_0_12"),
+        ("Rot_Z_mX_Y",    "Tr_0_12_12"),
+        ("Rot_mY_mZ_mX",  "Tr_0_0_0"),
+        ("Rot_Y_mZ_X",    "Tr_0_12_12"),
+        ("Rot_mY_Z_X",    "Tr_12_12_0"),
+        ("Rot_Y_Z_mX",    "Tr_12_0_12"),
+        )),
+    (206, 48, 24, "Ia-3", "PGm3bar", "CUBIC", "I 21/a -3", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_12_12_0"),
+        ("Rot_mZ_mX_Y",   "Tr_12_0_12"),
+        ("Rot_mZ_X_mY",   "Tr_0_12_12"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_12_12"),
+        ("Rot_Y_mZ_mX",   "Tr_12_12_0"),
+        ("Rot_mY_mZ_X",   "Tr_12_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_0_12"),
+        ("Rot_X_mY_Z",    "Tr_0_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        ("Rot_mZ_mX_mY",  "Tr_0_0_0"),
+        ("Rot_mZ_X_Y",    "Tr_12_12_0"),
+        ("Rot_Z_X_mY",    "Tr_12_0_12"),
+        ("Rot_Z_mX_Y",    "Tr_0_12_12"),
+        ("Rot_mY_mZ_mX",  "Tr_0_0_0"),
+        ("Rot_Y_mZ_X",    "Tr_0_12_12"),
+        ("Rot_mY_Z_X",    "Tr_12_12_0"),
+        ("Rot_Y_Z_mX",    "Tr_12_0_12"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_12"),
+        ("Rot_Z_X_Y",     "Tr_12_12_12"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_12"),
+        ("Rot_mZ_mX_Y",   "Tr_0_12_0"),
+        ("Rot_mZ_X_mY",   "Tr_12_0_0"),
+        ("Rot_Y_Z_X",     "Tr_12_12_12"),
+        ("Rot_mY_Z_mX",   "Tr_12_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_12"),
+        ("Rot_mY_mZ_X",   "Tr_0_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_0_12_0"),
+        ("Rot_X_mY_Z",    "Tr_12_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_12"),
+        ("Rot_mZ_mX_mY",  "Tr_12_12_12"),
+        ("Rot_mZ_X_Y",    "Tr_0_0_12"),
+        ("Rot_Z_X_mY",    "Tr_0_12_0"),
+        ("Rot_Z_mX_Y",    "Tr_12_0_0"),
+        ("Rot_mY_mZ_mX",  "Tr_12_12_12"),
+        ("Rot_Y_mZ_X",    "Tr_12_0_0"),
+        ("Rot_mY_Z_X",    "Tr_0_0_12"),
+        ("Rot_Y_Z_mX",    "Tr_0_12_0"),
+        )),
+    (207, 24, 24, "P432", "PG432", "CUBIC", "P 4 3 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_X_Z_mY",    "Tr_0_0_0"),
+        ("Rot_mX_Z_Y",    "Tr_0_0_0"),
+        ("Rot_mX_mZ_mY",  "Tr_0_0_0"),
+        ("Rot_X_mZ_Y",    "Tr_0_0_0"),
+        ("Rot_Z_Y_mX",    "Tr_0_0_0"),
+        ("Rot_Z_mY_X",    "Tr_0_0_0"),
+        ("Rot_mZ_Y_X",    "Tr_0_0_0"),
+        ("Rot_mZ_mY_mX",  "Tr_0_0_0"),
+        )),
+    (208, 24, 24, "P4232", "PG432", "CUBIC", "P 42 3 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_12_12_12"),
+        ("Rot_mY_mX_mZ",  "Tr_12_12_12"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_12"),
+        ("Rot_mY_X_Z",    "Tr_12_12_12"),
+        ("Rot_X_Z_mY",    "Tr_12_12_12"),
+        ("Rot_mX_Z_Y",    "Tr_12_12_12"),
+        ("Rot_mX_mZ_mY",  "Tr_12_12_12"),
+        ("Rot_X_mZ_Y",    "Tr_12_12_12"),
+        ("Rot_Z_Y_mX",    "Tr_12_12_12"),
+        ("Rot_Z_mY_X",    "Tr_12_12_12"),
+        ("Rot_mZ_Y_X",    "Tr_12_12_12"),
+        ("Rot_mZ_mY_mX",  "Tr_12_12_12"),
+        )),
+    (209, 96, 24, "F432", "PG432", "CUBIC", "F 4 3 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_X_Z_mY",    "Tr_0_0_0"),
+        ("Rot_mX_Z_Y",    "Tr_0_0_0"),
+        ("Rot_mX_mZ_mY",  "Tr_0_0_0"),
+        ("Rot_X_mZ_Y",    "Tr_0_0_0"),
+        ("Rot_Z_Y_mX",    "Tr_0_0_0"),
+        ("Rot_Z_mY_X",    "Tr_0_0_0"),
+        ("Rot_mZ_Y_X",    "Tr_0_0_0"),
+        ("Rot_mZ_mY_mX",  "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_0_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_12"),
+        ("Rot_Z_X_Y",     "Tr_0_12_12"),
+        ("Rot_Z_mX_mY",   "Tr_0_12_12"),
+        ("Rot_mZ_mX_Y",   "Tr_0_12_12"),
+        ("Rot_mZ_X_mY",   "Tr_0_12_12"),
+        ("Rot_Y_Z_X",     "Tr_0_12_12"),
+        ("Rot_mY_Z_mX",   "Tr_0_12_12"),
+        ("Rot_Y_mZ_mX",   "Tr_0_12_12"),
+        ("Rot_mY_mZ_X",   "Tr_0_12_12"),
+        ("Rot_Y_X_mZ",    "Tr_0_12_12"),
+        ("Rot_mY_mX_mZ",  "Tr_0_12_12"),
+        ("Rot_Y_mX_Z",    "Tr_0_12_12"),
+        ("Rot_mY_X_Z",    "Tr_0_12_12"),
+        ("Rot_X_Z_mY",    "Tr_0_12_12"),
+        ("Rot_mX_Z_Y",    "Tr_0_12_12"),
+        ("Rot_mX_mZ_mY",  "Tr_0_12_12"),
+        ("Rot_X_mZ_Y",    "Tr_0_12_12"),
+        ("Rot_Z_Y_mX",    "Tr_0_12_12"),
+        ("Rot_Z_mY_X",    "Tr_0_12_12"),
+        ("Rot_mZ_Y_X",    "Tr_0_12_12"),
+        ("Rot_mZ_mY_mX",  "Tr_0_12_12"),
+        ("Rot_X_Y_Z",     "Tr_12_0_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_12"),
+        ("Rot_Z_X_Y",     "Tr_12_0_12"),
+        ("Rot_Z_mX_mY",   "Tr_12_0_12"),
+        ("Rot_mZ_mX_Y",   "Tr_12_0_12"),
+        ("Rot_mZ_X_mY",   "Tr_12_0_12"),
+        ("Rot_Y_Z_X",     "Tr_12_0_12"),
+        ("Rot_mY_Z_mX",   "Tr_12_0_12"),
+        ("Rot_Y_mZ_mX",   "Tr_12_0_12"),
+        ("Rot_mY_mZ_X",   "Tr_12_0_12"),
+        ("Rot_Y_X_mZ",    "Tr_12_0_12"),
+        ("Rot_mY_mX_mZ",  "Tr_12_0_12"),
+        ("Rot_Y_mX_Z",    "Tr_12_0_12"),
+        ("Rot_mY_X_Z",    "Tr_12_0_12"),
+        ("Rot_X_Z_mY",    "Tr_12_0_12"),
+        ("Rot_mX_Z_Y",    "Tr_12_0_12"),
+        ("Rot_mX_mZ_mY",  "Tr_12_0_12"),
+        ("Rot_X_mZ_Y",    "Tr_12_0_12"),
+        ("Rot_Z_Y_mX",    "Tr_12_0_12"),
+        ("Rot_Z_mY_X",    "Tr_12_0_12"),
+        ("Rot_mZ_Y_X",    "Tr_12_0_12"),
+        ("Rot_mZ_mY_mX",  "Tr_12_0_12"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Z_X_Y",     "Tr_12_12_0"),
+        ("Rot_Z_mX_mY",   "Tr_12_12_0"),
+        ("Rot_mZ_mX_Y",   "Tr_12_12_0"),
+        ("Rot_mZ_X_mY",   "Tr_12_12_0"),
+        ("Rot_Y_Z_X",     "Tr_12_12_0"),
+        ("Rot_mY_Z_mX",   "Tr_12_12_0"),
+        ("Rot_Y_mZ_mX",   "Tr_12_12_0"),
+        ("Rot_mY_mZ_X",   "Tr_12_12_0"),
+        ("Rot_Y_X_mZ",    "Tr_12_12_0"),
+        ("Rot_mY_mX_mZ",  "Tr_12_12_0"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_0"),
+        ("Rot_mY_X_Z",    "Tr_12_12_0"),
+        ("Rot_X_Z_mY",    "Tr_12_12_0"),
+        ("Rot_mX_Z_Y",    "Tr_12_12_0"),
+        ("Rot_mX_mZ_mY",  "Tr_12_12_0"),
+        ("Rot_X_mZ_Y",    "Tr_12_12_0"),
+        ("Rot_Z_Y_mX",    "Tr_12_12_0"),
+        ("Rot_Z_mY_X",    "Tr_12_12_0"),
+        ("Rot_mZ_Y_X",    "Tr_12_12_0"),
+        ("Rot_mZ_mY_mX",  "Tr_12_12_0"),
+        )),
+    (210, 96, 24, "F4132", "PG432", "CUBIC", "F 41 3 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_12"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_12_0_12"),
+        ("Rot_mZ_mX_Y",   "Tr_0_12_12"),
+        ("Rot_mZ_X_mY",   "Tr_12_12_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_12_12_0"),
+        ("Rot_Y_mZ_mX",   "Tr_12_0_12"),
+        ("Rot_mY_mZ_X",   "Tr_0_12_12"),
+        ("Rot_Y_X_mZ",    "Tr_34_14_34"),
+        ("Rot_mY_mX_mZ",  "Tr_14_14_14"),
+        ("Rot_Y_mX_Z",    "Tr_14_34_34"),
+        ("Rot_mY_X_Z",    "Tr_34_34_14"),
+        ("Rot_X_Z_mY",    "Tr_34_14_34"),
+        ("Rot_mX_Z_Y",    "Tr_34_34_14"),
+        ("Rot_mX_mZ_mY",  "Tr_14_14_14"),
+        ("Rot_X_mZ_Y",    "Tr_14_34_34"),
+        ("Rot_Z_Y_mX",    "Tr_34_14_34"),
+        ("Rot_Z_mY_X",    "Tr_14_34_34"),
+        ("Rot_mZ_Y_X",    "Tr_34_34_14"),
+        ("Rot_mZ_mY_mX",  "Tr_14_14_14"),
+        ("Rot_X_Y_Z",     "Tr_0_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Z_X_Y",     "Tr_0_12_12"),
+        ("Rot_Z_mX_mY",   "Tr_12_12_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_12_0_12"),
+        ("Rot_Y_Z_X",     "Tr_0_12_12"),
+        ("Rot_mY_Z_mX",   "Tr_12_0_12"),
+        ("Rot_Y_mZ_mX",   "Tr_12_12_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_34_34_14"),
+        ("Rot_mY_mX_mZ",  "Tr_14_34_34"),
+        ("Rot_Y_mX_Z",    "Tr_14_14_14"),
+        ("Rot_mY_X_Z",    "Tr_34_14_34"),
+        ("Rot_X_Z_mY",    "Tr_34_34_14"),
+        ("Rot_mX_Z_Y",    "Tr_34_14_34"),
+        ("Rot_mX_mZ_mY",  "Tr_14_34_34"),
+        ("Rot_X_mZ_Y",    "Tr_14_14_14"),
+        ("Rot_Z_Y_mX",    "Tr_34_34_14"),
+        ("Rot_Z_mY_X",    "Tr_14_14_14"),
+        ("Rot_mZ_Y_X",    "Tr_34_14_34"),
+        ("Rot_mZ_mY_mX",  "Tr_14_34_34"),
+        ("Rot_X_Y_Z",     "Tr_12_0_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_12_0_12"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_12_12_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_12_12"),
+        ("Rot_Y_Z_X",     "Tr_12_0_12"),
+        ("Rot_mY_Z_mX",   "Tr_0_12_12"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_12_12_0"),
+        ("Rot_Y_X_mZ",    "Tr_14_14_14"),
+        ("Rot_mY_mX_mZ",  "Tr_34_14_34"),
+        ("Rot_Y_mX_Z",    "Tr_34_34_14"),
+        ("Rot_mY_X_Z",    "Tr_14_34_34"),
+        ("Rot_X_Z_mY",    "Tr_14_14_14"),
+        ("Rot_mX_Z_Y",    "Tr_14_34_34"),
+        ("Rot_mX_mZ_mY",  "Tr_34_14_34"),
+        ("Rot_X_mZ_Y",    "Tr_34_34_14"),
+        ("Rot_Z_Y_mX",    "Tr_14_14_14"),
+        ("Rot_Z_mY_X",    "Tr_34_34_14"),
+        ("Rot_mZ_Y_X",    "Tr_14_34_34"),
+        ("Rot_mZ_mY_mX",  "Tr_34_14_34"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_12"),
+        ("Rot_Z_X_Y",     "Tr_12_12_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_12_12"),
+        ("Rot_mZ_mX_Y",   "Tr_12_0_12"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_12_12_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_12_12"),
+        ("Rot_mY_mZ_X",   "Tr_12_0_12"),
+        ("Rot_Y_X_mZ",    "Tr_14_34_34"),
+        ("Rot_mY_mX_mZ",  "Tr_34_34_14"),
+        ("Rot_Y_mX_Z",    "Tr_34_14_34"),
+        ("Rot_mY_X_Z",    "Tr_14_14_14"),
+        ("Rot_X_Z_mY",    "Tr_14_34_34"),
+        ("Rot_mX_Z_Y",    "Tr_14_14_14"),
+        ("Rot_mX_mZ_mY",  "Tr_34_34_14"),
+        ("Rot_X_mZ_Y",    "Tr_34_14_34"),
+        ("Rot_Z_Y_mX",    "Tr_14_34_34"),
+        ("Rot_Z_mY_X",    "Tr_34_14_34"),
+        ("Rot_mZ_Y_X",    "Tr_14_14_14"),
+        ("Rot_mZ_mY_mX",  "Tr_34_34_14"),
+        )),
+    (211, 48, 24, "I432", "PG432", "CUBIC", "I 4 3 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_X_Z_mY",    "Tr_0_0_0"),
+        ("Rot_mX_Z_Y",    "Tr_0_0_0"),
+        ("Rot_mX_mZ_mY",  "Tr_0_0_0"),
+        ("Rot_X_mZ_Y",    "Tr_0_0_0"),
+        ("Rot_Z_Y_mX",    "Tr_0_0_0"),
+        ("Rot_Z_mY_X",    "Tr_0_0_0"),
+        ("Rot_mZ_Y_X",    "Tr_0_0_0"),
+        ("Rot_mZ_mY_mX",  "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_12"),
+        ("Rot_Z_X_Y",     "Tr_12_12_12"),
+        ("Rot_Z_mX_mY",   "Tr_12_12_12"),
+        ("Rot_mZ_mX_Y",   "Tr_12_12_12"),
+        ("Rot_mZ_X_mY",   "Tr_12_12_12"),
+        ("Rot_Y_Z_X",     "Tr_12_12_12"),
+        ("Rot_mY_Z_mX",   "Tr_12_12_12"),
+        ("Rot_Y_mZ_mX",   "Tr_12_12_12"),
+        ("Rot_mY_mZ_X",   "Tr_12_12_12"),
+        ("Rot_Y_X_mZ",    "Tr_12_12_12"),
+        ("Rot_mY_mX_mZ",  "Tr_12_12_12"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_12"),
+        ("Rot_mY_X_Z",    "Tr_12_12_12"),
+        ("Rot_X_Z_mY",    "Tr_12_12_12"),
+        ("Rot_mX_Z_Y",    "Tr_12_12_12"),
+        ("Rot_mX_mZ_mY",  "Tr_12_12_12"),
+        ("Rot_X_mZ_Y",    "Tr_12_12_12"),
+        ("Rot_Z_Y_mX",    "Tr_12_12_12"),
+        ("Rot_Z_mY_X",    "Tr_12_12_12"),
+        ("Rot_mZ_Y_X",    "Tr_12_12_12"),
+        ("Rot_mZ_mY_mX",  "Tr_12_12_12"),
+        )),
+    (212, 24, 24, "P4332", "PG432", "CUBIC", "P 43 3 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_12_12_0"),
+        ("Rot_mZ_mX_Y",   "Tr_12_0_12"),
+        ("Rot_mZ_X_mY",   "Tr_0_12_12"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_12_12"),
+        ("Rot_Y_mZ_mX",   "Tr_12_12_0"),
+        ("Rot_mY_mZ_X",   "Tr_12_0_12"),
+        ("Rot_Y_X_mZ",    "Tr_14_34_34"),
+        ("Rot_mY_mX_mZ",  "Tr_14_14_14"),
+        ("Rot_Y_mX_Z",    "Tr_34_34_14"),
+        ("Rot_mY_X_Z",    "Tr_34_14_34"),
+        ("Rot_X_Z_mY",    "Tr_14_34_34"),
+        ("Rot_mX_Z_Y",    "Tr_34_14_34"),
+        ("Rot_mX_mZ_mY",  "Tr_14_14_14"),
+        ("Rot_X_mZ_Y",    "Tr_34_34_14"),
+        ("Rot_Z_Y_mX",    "Tr_14_34_34"),
+        ("Rot_Z_mY_X",    "Tr_34_34_14"),
+        ("Rot_mZ_Y_X",    "Tr_34_14_34"),
+        ("Rot_mZ_mY_mX",  "Tr_14_14_14"),
+        )),
+    (213, 24, 24, "P4132", "PG432", "CUBIC", "P 41 3 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_12_12_0"),
+        ("Rot_mZ_mX_Y",   "Tr_12_0_12"),
+        ("Rot_mZ_X_mY",   "Tr_0_12_12"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_12_12"),
+        ("Rot_Y_mZ_mX",   "Tr_12_12_0"),
+        ("Rot_mY_mZ_X",   "Tr_12_0_12"),
+        ("Rot_Y_X_mZ",    "Tr_34_14_14"),
+        ("Rot_mY_mX_mZ",  "Tr_34_34_34"),
+        ("Rot_Y_mX_Z",    "Tr_14_14_34"),
+        ("Rot_mY_X_Z",    "Tr_14_34_14"),
+        ("Rot_X_Z_mY",    "Tr_34_14_14"),
+        ("Rot_mX_Z_Y",    "Tr_14_34_14"),
+        ("Rot_mX_mZ_mY",  "Tr_34_34_34"),
+        ("Rot_X_mZ_Y",    "Tr_14_14_34"),
+        ("Rot_Z_Y_mX",    "Tr_34_14_14"),
+        ("Rot_Z_mY_X",    "Tr_14_14_34"),
+        ("Rot_mZ_Y_X",    "Tr_14_34_14"),
+        ("Rot_mZ_mY_mX",  "Tr_34_34_34"),
+        )),
+    (214, 48, 24, "I4132", "PG432", "CUBIC", "I 41 3 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_12_12_0"),
+        ("Rot_mZ_mX_Y",   "Tr_12_0_12"),
+        ("Rot_mZ_X_mY",   "Tr_0_12_12"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_12_12"),
+        ("Rot_Y_mZ_mX",   "Tr_12_12_0"),
+        ("Rot_mY_mZ_X",   "Tr_12_0_12"),
+        ("Rot_Y_X_mZ",    "Tr_34_14_14"),
+        ("Rot_mY_mX_mZ",  "Tr_34_34_34"),
+        ("Rot_Y_mX_Z",    "Tr_14_14_34"),
+        ("Rot_mY_X_Z",    "Tr_14_34_14"),
+        ("Rot_X_Z_mY",    "Tr_34_14_14"),
+        ("Rot_mX_Z_Y",    "Tr_14_34_14"),
+        ("Rot_mX_mZ_mY",  "Tr_34_34_34"),
+        ("Rot_X_mZ_Y",    "Tr_14_14_34"),
+        ("Rot_Z_Y_mX",    "Tr_34_14_14"),
+        ("Rot_Z_mY_X",    "Tr_14_14_34"),
+        ("Rot_mZ_Y_X",    "Tr_14_34_14"),
+        ("Rot_mZ_mY_mX",  "Tr_34_34_34"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_12"),
+        ("Rot_Z_X_Y",     "Tr_12_12_12"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_12"),
+        ("Rot_mZ_mX_Y",   "Tr_0_12_0"),
+        ("Rot_mZ_X_mY",   "Tr_12_0_0"),
+        ("Rot_Y_Z_X",     "Tr_12_12_12"),
+        ("Rot_mY_Z_mX",   "Tr_12_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_12"),
+        ("Rot_mY_mZ_X",   "Tr_0_12_0"),
+        ("Rot_Y_X_mZ",    "Tr_14_34_34"),
+        ("Rot_mY_mX_mZ",  "Tr_14_14_14"),
+        ("Rot_Y_mX_Z",    "Tr_34_34_14"),
+        ("Rot_mY_X_Z",    "Tr_34_14_34"),
+        ("Rot_X_Z_mY",    "Tr_14_34_34"),
+        ("Rot_mX_Z_Y",    "Tr_34_14_34"),
+        ("Rot_mX_mZ_mY",  "Tr_14_14_14"),
+        ("Rot_X_mZ_Y",    "Tr_34_34_14"),
+        ("Rot_Z_Y_mX",    "Tr_14_34_34"),
+        ("Rot_Z_mY_X",    "Tr_34_34_14"),
+        ("Rot_mZ_Y_X",    "Tr_34_14_34"),
+        ("Rot_mZ_mY_mX",  "Tr_14_14_14"),
+        )),
+    (215, 24, 24, "P-43m", "PG4bar3m", "CUBIC", "P -4 3 m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_X_Z_Y",     "Tr_0_0_0"),
+        ("Rot_mX_Z_mY",   "Tr_0_0_0"),
+        ("Rot_mX_mZ_Y",   "Tr_0_0_0"),
+        ("Rot_X_mZ_mY",   "Tr_0_0_0"),
+        ("Rot_Z_Y_X",     "Tr_0_0_0"),
+        ("Rot_Z_mY_mX",   "Tr_0_0_0"),
+        ("Rot_mZ_Y_mX",   "Tr_0_0_0"),
+        ("Rot_mZ_mY_X",   "Tr_0_0_0"),
+        )),
+    (216, 96, 24, "F-43m", "PG4bar3m", "CUBIC", "F -4 3 m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_X_Z_Y",     "Tr_0_0_0"),
+        ("Rot_mX_Z_mY",   "Tr_0_0_0"),
+        ("Rot_mX_mZ_Y",   "Tr_0_0_0"),
+        ("Rot_X_mZ_mY",   "Tr_0_0_0"),
+        ("Rot_Z_Y_X",     "Tr_0_0_0"),
+        ("Rot_Z_mY_mX",   "Tr_0_0_0"),
+        ("Rot_mZ_Y_mX",   "Tr_0_0_0"),
+        ("Rot_mZ_mY_X",   "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_0_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_12"),
+        ("Rot_Z_X_Y",     "Tr_0_12_12"),
+        ("Rot_Z_mX_mY",   "Tr_0_12_12"),
+        ("Rot_mZ_mX_Y",   "Tr_0_12_12"),
+        ("Rot_mZ_X_mY",   "Tr_0_12_12"),
+        ("Rot_Y_Z_X",     "Tr_0_12_12"),
+        ("Rot_mY_Z_mX",   "Tr_0_12_12"),
+        ("Rot_Y_mZ_mX",   "Tr_0_12_12"),
+        ("Rot_mY_mZ_X",   "Tr_0_12_12"),
+        ("Rot_Y_X_Z",     "Tr_0_12_12"),
+        ("Rot_mY_mX_Z",   "Tr_0_12_12"),
+        ("Rot_Y_mX_mZ",   "Tr_0_12_12"),
+        ("Rot_mY_X_mZ",   "Tr_0_12_12"),
+        ("Rot_X_Z_Y",     "Tr_0_12_12"),
+        ("Rot_mX_Z_mY",   "Tr_0_12_12"),
+        ("Rot_mX_mZ_Y",   "Tr_0_12_12"),
+        ("Rot_X_mZ_mY",   "Tr_0_12_12"),
+        ("Rot_Z_Y_X",     "Tr_0_12_12"),
+        ("Rot_Z_mY_mX",   "Tr_0_12_12"),
+        ("Rot_mZ_Y_mX",   "Tr_0_12_12"),
+        ("Rot_mZ_mY_X",   "Tr_0_12_12"),
+        ("Rot_X_Y_Z",     "Tr_12_0_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_12"),
+        ("Rot_Z_X_Y",     "Tr_12_0_12"),
+        ("Rot_Z_mX_mY",   "Tr_12_0_12"),
+        ("Rot_mZ_mX_Y",   "Tr_12_0_12"),
+        ("Rot_mZ_X_mY",   "Tr_12_0_12"),
+        ("Rot_Y_Z_X",     "Tr_12_0_12"),
+        ("Rot_mY_Z_mX",   "Tr_12_0_12"),
+        ("Rot_Y_mZ_mX",   "Tr_12_0_12"),
+        ("Rot_mY_mZ_X",   "Tr_12_0_12"),
+        ("Rot_Y_X_Z",     "Tr_12_0_12"),
+        ("Rot_mY_mX_Z",   "Tr_12_0_12"),
+        ("Rot_Y_mX_mZ",   "Tr_12_0_12"),
+        ("Rot_mY_X_mZ",   "Tr_12_0_12"),
+        ("Rot_X_Z_Y",     "Tr_12_0_12"),
+        ("Rot_mX_Z_mY",   "Tr_12_0_12"),
+        ("Rot_mX_mZ_Y",   "Tr_12_0_12"),
+        ("Rot_X_mZ_mY",   "Tr_12_0_12"),
+        ("Rot_Z_Y_X",     "Tr_12_0_12"),
+        ("Rot_Z_mY_mX",   "Tr_12_0_12"),
+        ("Rot_mZ_Y_mX",   "Tr_12_0_12"),
+        ("Rot_mZ_mY_X",   "Tr_12_0_12"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Z_X_Y",     "Tr_12_12_0"),
+        ("Rot_Z_mX_mY",   "Tr_12_12_0"),
+        ("Rot_mZ_mX_Y",   "Tr_12_12_0"),
+        ("Rot_mZ_X_mY",   "Tr_12_12_0"),
+        ("Rot_Y_Z_X",     "Tr_12_12_0"),
+        ("Rot_mY_Z_mX",   "Tr_12_12_0"),
+        ("Rot_Y_mZ_mX",   "Tr_12_12_0"),
+        ("Rot_mY_mZ_X",   "Tr_12_12_0"),
+        ("Rot_Y_X_Z",     "Tr_12_12_0"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_0"),
+        ("Rot_Y_mX_mZ",   "Tr_12_12_0"),
+        ("Rot_mY_X_mZ",   "Tr_12_12_0"),
+        ("Rot_X_Z_Y",     "Tr_12_12_0"),
+        ("Rot_mX_Z_mY",   "Tr_12_12_0"),
+        ("Rot_mX_mZ_Y",   "Tr_12_12_0"),
+        ("Rot_X_mZ_mY",   "Tr_12_12_0"),
+        ("Rot_Z_Y_X",     "Tr_12_12_0"),
+        ("Rot_Z_mY_mX",   "Tr_12_12_0"),
+        ("Rot_mZ_Y_mX",   "Tr_12_12_0"),
+        ("Rot_mZ_mY_X",   "Tr_12_12_0"),
+        )),
+    (217, 48, 24, "I-43m", "PG4bar3m", "CUBIC", "I -4 3 m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_X_Z_Y",     "Tr_0_0_0"),
+        ("Rot_mX_Z_mY",   "Tr_0_0_0"),
+        ("Rot_mX_mZ_Y",   "Tr_0_0_0"),
+        ("Rot_X_mZ_mY",   "Tr_0_0_0"),
+        ("Rot_Z_Y_X",     "Tr_0_0_0"),
+        ("Rot_Z_mY_mX",   "Tr_0_0_0"),
+        ("Rot_mZ_Y_mX",   "Tr_0_0_0"),
+        ("Rot_mZ_mY_X",   "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_12"),
+        ("Rot_Z_X_Y",     "Tr_12_12_12"),
+        ("Rot_Z_mX_mY",   "Tr_12_12_12"),
+        ("Rot_mZ_mX_Y",   "Tr_12_12_12"),
+        ("Rot_mZ_X_mY",   "Tr_12_12_12"),
+        ("Rot_Y_Z_X",     "Tr_12_12_12"),
+        ("Rot_mY_Z_mX",   "Tr_12_12_12"),
+        ("Rot_Y_mZ_mX",   "Tr_12_12_12"),
+        ("Rot_mY_mZ_X",   "Tr_12_12_12"),
+        ("Rot_Y_X_Z",     "Tr_12_12_12"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_12"),
+        ("Rot_Y_mX_mZ",   "Tr_12_12_12"),
+        ("Rot_mY_X_mZ",   "Tr_12_12_12"),
+        ("Rot_X_Z_Y",     "Tr_12_12_12"),
+        ("Rot_mX_Z_mY",   "Tr_12_12_12"),
+        ("Rot_mX_mZ_Y",   "Tr_12_12_12"),
+        ("Rot_X_mZ_mY",   "Tr_12_12_12"),
+        ("Rot_Z_Y_X",     "Tr_12_12_12"),
+        ("Rot_Z_mY_mX",   "Tr_12_12_12"),
+        ("Rot_mZ_Y_mX",   "Tr_12_12_12"),
+        ("Rot_mZ_mY_X",   "Tr_12_12_12"),
+        )),
+    (218, 24, 24, "P-43n", "PG4bar3m", "CUBIC", "P -4 3 n", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_12_12_12"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_12"),
+        ("Rot_Y_mX_mZ",   "Tr_12_12_12"),
+        ("Rot_mY_X_mZ",   "Tr_12_12_12"),
+        ("Rot_X_Z_Y",     "Tr_12_12_12"),
+        ("Rot_mX_Z_mY",   "Tr_12_12_12"),
+        ("Rot_mX_mZ_Y",   "Tr_12_12_12"),
+        ("Rot_X_mZ_mY",   "Tr_12_12_12"),
+        ("Rot_Z_Y_X",     "Tr_12_12_12"),
+        ("Rot_Z_mY_mX",   "Tr_12_12_12"),
+        ("Rot_mZ_Y_mX",   "Tr_12_12_12"),
+        ("Rot_mZ_mY_X",   "Tr_12_12_12"),
+        )),
+    (219, 96, 24, "F-43c", "PG4bar3m", "CUBIC", "F -4 3 c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_12_12_12"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_12"),
+        ("Rot_Y_mX_mZ",   "Tr_12_12_12"),
+        ("Rot_mY_X_mZ",   "Tr_12_12_12"),
+        ("Rot_X_Z_Y",     "Tr_12_12_12"),
+        ("Rot_mX_Z_mY",   "Tr_12_12_12"),
+        ("Rot_mX_mZ_Y",   "Tr_12_12_12"),
+        ("Rot_X_mZ_mY",   "Tr_12_12_12"),
+        ("Rot_Z_Y_X",     "Tr_12_12_12"),
+        ("Rot_Z_mY_mX",   "Tr_12_12_12"),
+        ("Rot_mZ_Y_mX",   "Tr_12_12_12"),
+        ("Rot_mZ_mY_X",   "Tr_12_12_12"),
+        ("Rot_X_Y_Z",     "Tr_0_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_12"),
+        ("Rot_Z_X_Y",     "Tr_0_12_12"),
+        ("Rot_Z_mX_mY",   "Tr_0_12_12"),
+        ("Rot_mZ_mX_Y",   "Tr_0_12_12"),
+        ("Rot_mZ_X_mY",   "Tr_0_12_12"),
+        ("Rot_Y_Z_X",     "Tr_0_12_12"),
+        ("Rot_mY_Z_mX",   "Tr_0_12_12"),
+        ("Rot_Y_mZ_mX",   "Tr_0_12_12"),
+        ("Rot_mY_mZ_X",   "Tr_0_12_12"),
+        ("Rot_Y_X_Z",     "Tr_12_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_12_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_12_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_12_0_0"),
+        ("Rot_X_Z_Y",     "Tr_12_0_0"),
+        ("Rot_mX_Z_mY",   "Tr_12_0_0"),
+        ("Rot_mX_mZ_Y",   "Tr_12_0_0"),
+        ("Rot_X_mZ_mY",   "Tr_12_0_0"),
+        ("Rot_Z_Y_X",     "Tr_12_0_0"),
+        ("Rot_Z_mY_mX",   "Tr_12_0_0"),
+        ("Rot_mZ_Y_mX",   "Tr_12_0_0"),
+        ("Rot_mZ_mY_X",   "Tr_12_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_0_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_12"),
+        ("Rot_Z_X_Y",     "Tr_12_0_12"),
+        ("Rot_Z_mX_mY",   "Tr_12_0_12"),
+        ("Rot_mZ_mX_Y",   "Tr_12_0_12"),
+        ("Rot_mZ_X_mY",   "Tr_12_0_12"),
+        ("Rot_Y_Z_X",     "Tr_12_0_12"),
+        ("Rot_mY_Z_mX",   "Tr_12_0_12"),
+        ("Rot_Y_mZ_mX",   "Tr_12_0_12"),
+        ("Rot_mY_mZ_X",   "Tr_12_0_12"),
+        ("Rot_Y_X_Z",     "Tr_0_12_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_12_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_12_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_12_0"),
+        ("Rot_X_Z_Y",     "Tr_0_12_0"),
+        ("Rot_mX_Z_mY",   "Tr_0_12_0"),
+        ("Rot_mX_mZ_Y",   "Tr_0_12_0"),
+        ("Rot_X_mZ_mY",   "Tr_0_12_0"),
+        ("Rot_Z_Y_X",     "Tr_0_12_0"),
+        ("Rot_Z_mY_mX",   "Tr_0_12_0"),
+        ("Rot_mZ_Y_mX",   "Tr_0_12_0"),
+        ("Rot_mZ_mY_X",   "Tr_0_12_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Z_X_Y",     "Tr_12_12_0"),
+        ("Rot_Z_mX_mY",   "Tr_12_12_0"),
+        ("Rot_mZ_mX_Y",   "Tr_12_12_0"),
+        ("Rot_mZ_X_mY",   "Tr_12_12_0"),
+        ("Rot_Y_Z_X",     "Tr_12_12_0"),
+        ("Rot_mY_Z_mX",   "Tr_12_12_0"),
+        ("Rot_Y_mZ_mX",   "Tr_12_12_0"),
+        ("Rot_mY_mZ_X",   "Tr_12_12_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_12"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_12"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_12"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_12"),
+        ("Rot_X_Z_Y",     "Tr_0_0_12"),
+        ("Rot_mX_Z_mY",   "Tr_0_0_12"),
+        ("Rot_mX_mZ_Y",   "Tr_0_0_12"),
+        ("Rot_X_mZ_mY",   "Tr_0_0_12"),
+        ("Rot_Z_Y_X",     "Tr_0_0_12"),
+        ("Rot_Z_mY_mX",   "Tr_0_0_12"),
+        ("Rot_mZ_Y_mX",   "Tr_0_0_12"),
+        ("Rot_mZ_mY_X",   "Tr_0_0_12"),
+        )),
+    (220, 48, 24, "I-43d", "PG4bar3m", "CUBIC", "I -4 3 d", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_12_12_0"),
+        ("Rot_mZ_mX_Y",   "Tr_12_0_12"),
+        ("Rot_mZ_X_mY",   "Tr_0_12_12"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_12_12"),
+        ("Rot_Y_mZ_mX",   "Tr_12_12_0"),
+        ("Rot_mY_mZ_X",   "Tr_12_0_12"),
+        ("Rot_Y_X_Z",     "Tr_14_14_14"),
+        ("Rot_mY_mX_Z",   "Tr_14_34_34"),
+        ("Rot_Y_mX_mZ",   "Tr_34_14_34"),
+        ("Rot_mY_X_mZ",   "Tr_34_34_14"),
+        ("Rot_X_Z_Y",     "Tr_14_14_14"),
+        ("Rot_mX_Z_mY",   "Tr_34_34_14"),
+        ("Rot_mX_mZ_Y",   "Tr_14_34_34"),
+        ("Rot_X_mZ_mY",   "Tr_34_14_34"),
+        ("Rot_Z_Y_X",     "Tr_14_14_14"),
+        ("Rot_Z_mY_mX",   "Tr_34_14_34"),
+        ("Rot_mZ_Y_mX",   "Tr_34_34_14"),
+        ("Rot_mZ_mY_X",   "Tr_14_34_34"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_12"),
+        ("Rot_Z_X_Y",     "Tr_12_12_12"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_12"),
+        ("Rot_mZ_mX_Y",   "Tr_0_12_0"),
+        ("Rot_mZ_X_mY",   "Tr_12_0_0"),
+        ("Rot_Y_Z_X",     "Tr_12_12_12"),
+        ("Rot_mY_Z_mX",   "Tr_12_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_12"),
+        ("Rot_mY_mZ_X",   "Tr_0_12_0"),
+        ("Rot_Y_X_Z",     "Tr_34_34_34"),
+        ("Rot_mY_mX_Z",   "Tr_34_14_14"),
+        ("Rot_Y_mX_mZ",   "Tr_14_34_14"),
+        ("Rot_mY_X_mZ",   "Tr_14_14_34"),
+        ("Rot_X_Z_Y",     "Tr_34_34_34"),
+        ("Rot_mX_Z_mY",   "Tr_14_14_34"),
+        ("Rot_mX_mZ_Y",   "Tr_34_14_14"),
+        ("Rot_X_mZ_mY",   "Tr_14_34_14"),
+        ("Rot_Z_Y_X",     "Tr_34_34_34"),
+        ("Rot_Z_mY_mX",   "Tr_14_34_14"),
+        ("Rot_mZ_Y_mX",   "Tr_14_14_34"),
+        ("Rot_mZ_mY_X",   "Tr_34_14_14"),
+        )),
+    (221, 48, 48, "Pm-3m", "PGm3barm", "CUBIC", "P 4/m -3 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_X_Z_mY",    "Tr_0_0_0"),
+        ("Rot_mX_Z_Y",    "Tr_0_0_0"),
+        ("Rot_mX_mZ_mY",  "Tr_0_0_0"),
+        ("Rot_X_mZ_Y",    "Tr_0_0_0"),
+        ("Rot_Z_Y_mX",    "Tr_0_0_0"),
+        ("Rot_Z_mY_X",    "Tr_0_0_0"),
+        ("Rot_mZ_Y_X",    "Tr_0_0_0"),
+        ("Rot_mZ_mY_mX",  "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_mZ_mX_mY",  "Tr_0_0_0"),
+        ("Rot_mZ_X_Y",    "Tr_0_0_0"),
+        ("Rot_Z_X_mY",    "Tr_0_0_0"),
+        ("Rot_Z_mX_Y",    "Tr_0_0_0"),
+        ("Rot_mY_mZ_mX",  "Tr_0_0_0"),
+        ("Rot_Y_mZ_X",    "Tr_0_0_0"),
+        ("Rot_mY_Z_X",    "Tr_0_0_0"),
+        ("Rot_Y_Z_mX",    "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_mZ_Y",   "Tr_0_0_0"),
+        ("Rot_X_mZ_mY",   "Tr_0_0_0"),
+        ("Rot_X_Z_Y",     "Tr_0_0_0"),
+        ("Rot_mX_Z_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mY_X",   "Tr_0_0_0"),
+        ("Rot_mZ_Y_mX",   "Tr_0_0_0"),
+        ("Rot_Z_mY_mX",   "Tr_0_0_0"),
+        ("Rot_Z_Y_X",     "Tr_0_0_0"),
+        )),
+    (222, 48, 48, "Pn-3n", "PGm3barm", "CUBIC", "P 4/n -3 2/n", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_X_Z_mY",    "Tr_0_0_0"),
+        ("Rot_mX_Z_Y",    "Tr_0_0_0"),
+        ("Rot_mX_mZ_mY",  "Tr_0_0_0"),
+        ("Rot_X_mZ_Y",    "Tr_0_0_0"),
+        ("Rot_Z_Y_mX",    "Tr_0_0_0"),
+        ("Rot_Z_mY_X",    "Tr_0_0_0"),
+        ("Rot_mZ_Y_X",    "Tr_0_0_0"),
+        ("Rot_mZ_mY_mX",  "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_12"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        ("Rot_mZ_mX_mY",  "Tr_12_12_12"),
+        ("Rot_mZ_X_Y",    "Tr_12_12_12"),
+        ("Rot_Z_X_mY",    "Tr_12_12_12"),
+        ("Rot_Z_mX_Y",    "Tr_12_12_12"),
+        ("Rot_mY_mZ_mX",  "Tr_12_12_12"),
+        ("Rot_Y_mZ_X",    "Tr_12_12_12"),
+        ("Rot_mY_Z_X",    "Tr_12_12_12"),
+        ("Rot_Y_Z_mX",    "Tr_12_12_12"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_12"),
+        ("Rot_Y_X_Z",     "Tr_12_12_12"),
+        ("Rot_mY_X_mZ",   "Tr_12_12_12"),
+        ("Rot_Y_mX_mZ",   "Tr_12_12_12"),
+        ("Rot_mX_mZ_Y",   "Tr_12_12_12"),
+        ("Rot_X_mZ_mY",   "Tr_12_12_12"),
+        ("Rot_X_Z_Y",     "Tr_12_12_12"),
+        ("Rot_mX_Z_mY",   "Tr_12_12_12"),
+        ("Rot_mZ_mY_X",   "Tr_12_12_12"),
+        ("Rot_mZ_Y_mX",   "Tr_12_12_12"),
+        ("Rot_Z_mY_mX",   "Tr_12_12_12"),
+        ("Rot_Z_Y_X",     "Tr_12_12_12"),
+        )),
+    (223, 48, 48, "Pm-3n", "PGm3barm", "CUBIC", "P 42/m -3 2/n", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_12_12_12"),
+        ("Rot_mY_mX_mZ",  "Tr_12_12_12"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_12"),
+        ("Rot_mY_X_Z",    "Tr_12_12_12"),
+        ("Rot_X_Z_mY",    "Tr_12_12_12"),
+        ("Rot_mX_Z_Y",    "Tr_12_12_12"),
+        ("Rot_mX_mZ_mY",  "Tr_12_12_12"),
+        ("Rot_X_mZ_Y",    "Tr_12_12_12"),
+        ("Rot_Z_Y_mX",    "Tr_12_12_12"),
+        ("Rot_Z_mY_X",    "Tr_12_12_12"),
+        ("Rot_mZ_Y_X",    "Tr_12_12_12"),
+        ("Rot_mZ_mY_mX",  "Tr_12_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_mZ_mX_mY",  "Tr_0_0_0"),
+        ("Rot_mZ_X_Y",    "Tr_0_0_0"),
+        ("Rot_Z_X_mY",    "Tr_0_0_0"),
+        ("Rot_Z_mX_Y",    "Tr_0_0_0"),
+        ("Rot_mY_mZ_mX",  "Tr_0_0_0"),
+        ("Rot_Y_mZ_X",    "Tr_0_0_0"),
+        ("Rot_mY_Z_X",    "Tr_0_0_0"),
+        ("Rot_Y_Z_mX",    "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_12"),
+        ("Rot_Y_X_Z",     "Tr_12_12_12"),
+        ("Rot_mY_X_mZ",   "Tr_12_12_12"),
+        ("Rot_Y_mX_mZ",   "Tr_12_12_12"),
+        ("Rot_mX_mZ_Y",   "Tr_12_12_12"),
+        ("Rot_X_mZ_mY",   "Tr_12_12_12"),
+        ("Rot_X_Z_Y",     "Tr_12_12_12"),
+        ("Rot_mX_Z_mY",   "Tr_12_12_12"),
+        ("Rot_mZ_mY_X",   "Tr_12_12_12"),
+        ("Rot_mZ_Y_mX",   "Tr_12_12_12"),
+        ("Rot_Z_mY_mX",   "Tr_12_12_12"),
+        ("Rot_Z_Y_X",     "Tr_12_12_12"),
+        )),
+    (224, 48, 48, "Pn-3m", "PGm3barm", "CUBIC", "P 42/n -3 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_12_12_12"),
+        ("Rot_mY_mX_mZ",  "Tr_12_12_12"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_12"),
+        ("Rot_mY_X_Z",    "Tr_12_12_12"),
+        ("Rot_X_Z_mY",    "Tr_12_12_12"),
+        ("Rot_mX_Z_Y",    "Tr_12_12_12"),
+        ("Rot_mX_mZ_mY",  "Tr_12_12_12"),
+        ("Rot_X_mZ_Y",    "Tr_12_12_12"),
+        ("Rot_Z_Y_mX",    "Tr_12_12_12"),
+        ("Rot_Z_mY_X",    "Tr_12_12_12"),
+        ("Rot_mZ_Y_X",    "Tr_12_12_12"),
+        ("Rot_mZ_mY_mX",  "Tr_12_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_12"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        ("Rot_mZ_mX_mY",  "Tr_12_12_12"),
+        ("Rot_mZ_X_Y",    "Tr_12_12_12"),
+        ("Rot_Z_X_mY",    "Tr_12_12_12"),
+        ("Rot_Z_mX_Y",    "Tr_12_12_12"),
+        ("Rot_mY_mZ_mX",  "Tr_12_12_12"),
+        ("Rot_Y_mZ_X",    "Tr_12_12_12"),
+        ("Rot_mY_Z_X",    "Tr_12_12_12"),
+        ("Rot_Y_Z_mX",    "Tr_12_12_12"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_mZ_Y",   "Tr_0_0_0"),
+        ("Rot_X_mZ_mY",   "Tr_0_0_0"),
+        ("Rot_X_Z_Y",     "Tr_0_0_0"),
+        ("Rot_mX_Z_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mY_X",   "Tr_0_0_0"),
+        ("Rot_mZ_Y_mX",   "Tr_0_0_0"),
+        ("Rot_Z_mY_mX",   "Tr_0_0_0"),
+        ("Rot_Z_Y_X",     "Tr_0_0_0"),
+        )),
+    (225, 192, 48, "Fm-3m", "PGm3barm", "CUBIC", "F 4/m -3 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_X_Z_mY",    "Tr_0_0_0"),
+        ("Rot_mX_Z_Y",    "Tr_0_0_0"),
+        ("Rot_mX_mZ_mY",  "Tr_0_0_0"),
+        ("Rot_X_mZ_Y",    "Tr_0_0_0"),
+        ("Rot_Z_Y_mX",    "Tr_0_0_0"),
+        ("Rot_Z_mY_X",    "Tr_0_0_0"),
+        ("Rot_mZ_Y_X",    "Tr_0_0_0"),
+        ("Rot_mZ_mY_mX",  "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_mZ_mX_mY",  "Tr_0_0_0"),
+        ("Rot_mZ_X_Y",    "Tr_0_0_0"),
+        ("Rot_Z_X_mY",    "Tr_0_0_0"),
+        ("Rot_Z_mX_Y",    "Tr_0_0_0"),
+        ("Rot_mY_mZ_mX",  "Tr_0_0_0"),
+        ("Rot_Y_mZ_X",    "Tr_0_0_0"),
+        ("Rot_mY_Z_X",    "Tr_0_0_0"),
+        ("Rot_Y_Z_mX",    "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_mZ_Y",   "Tr_0_0_0"),
+        ("Rot_X_mZ_mY",   "Tr_0_0_0"),
+        ("Rot_X_Z_Y",     "Tr_0_0_0"),
+        ("Rot_mX_Z_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mY_X",   "Tr_0_0_0"),
+        ("Rot_mZ_Y_mX",   "Tr_0_0_0"),
+        ("Rot_Z_mY_mX",   "Tr_0_0_0"),
+        ("Rot_Z_Y_X",     "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_0_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_12"),
+        ("Rot_Z_X_Y",     "Tr_0_12_12"),
+        ("Rot_Z_mX_mY",   "Tr_0_12_12"),
+        ("Rot_mZ_mX_Y",   "Tr_0_12_12"),
+        ("Rot_mZ_X_mY",   "Tr_0_12_12"),
+        ("Rot_Y_Z_X",     "Tr_0_12_12"),
+        ("Rot_mY_Z_mX",   "Tr_0_12_12"),
+        ("Rot_Y_mZ_mX",   "Tr_0_12_12"),
+        ("Rot_mY_mZ_X",   "Tr_0_12_12"),
+        ("Rot_Y_X_mZ",    "Tr_0_12_12"),
+        ("Rot_mY_mX_mZ",  "Tr_0_12_12"),
+        ("Rot_Y_mX_Z",    "Tr_0_12_12"),
+        ("Rot_mY_X_Z",    "Tr_0_12_12"),
+        ("Rot_X_Z_mY",    "Tr_0_12_12"),
+        ("Rot_mX_Z_Y",    "Tr_0_12_12"),
+        ("Rot_mX_mZ_mY",  "Tr_0_12_12"),
+        ("Rot_X_mZ_Y",    "Tr_0_12_12"),
+        ("Rot_Z_Y_mX",    "Tr_0_12_12"),
+        ("Rot_Z_mY_X",    "Tr_0_12_12"),
+        ("Rot_mZ_Y_X",    "Tr_0_12_12"),
+        ("Rot_mZ_mY_mX",  "Tr_0_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_0_12_12"),
+        ("Rot_X_mY_Z",    "Tr_0_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_12_12"),
+        ("Rot_mZ_mX_mY",  "Tr_0_12_12"),
+        ("Rot_mZ_X_Y",    "Tr_0_12_12"),
+        ("Rot_Z_X_mY",    "Tr_0_12_12"),
+        ("Rot_Z_mX_Y",    "Tr_0_12_12"),
+        ("Rot_mY_mZ_mX",  "Tr_0_12_12"),
+        ("Rot_Y_mZ_X",    "Tr_0_12_12"),
+        ("Rot_mY_Z_X",    "Tr_0_12_12"),
+        ("Rot_Y_Z_mX",    "Tr_0_12_12"),
+        ("Rot_mY_mX_Z",   "Tr_0_12_12"),
+        ("Rot_Y_X_Z",     "Tr_0_12_12"),
+        ("Rot_mY_X_mZ",   "Tr_0_12_12"),
+        ("Rot_Y_mX_mZ",   "Tr_0_12_12"),
+        ("Rot_mX_mZ_Y",   "Tr_0_12_12"),
+        ("Rot_X_mZ_mY",   "Tr_0_12_12"),
+        ("Rot_X_Z_Y",     "Tr_0_12_12"),
+        ("Rot_mX_Z_mY",   "Tr_0_12_12"),
+        ("Rot_mZ_mY_X",   "Tr_0_12_12"),
+        ("Rot_mZ_Y_mX",   "Tr_0_12_12"),
+        ("Rot_Z_mY_mX",   "Tr_0_12_12"),
+        ("Rot_Z_Y_X",     "Tr_0_12_12"),
+        ("Rot_X_Y_Z",     "Tr_12_0_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_12"),
+        ("Rot_Z_X_Y",     "Tr_12_0_12"),
+        ("Rot_Z_mX_mY",   "Tr_12_0_12"),
+        ("Rot_mZ_mX_Y",   "Tr_12_0_12"),
+        ("Rot_mZ_X_mY",   "Tr_12_0_12"),
+        ("Rot_Y_Z_X",     "Tr_12_0_12"),
+        ("Rot_mY_Z_mX",   "Tr_12_0_12"),
+        ("Rot_Y_mZ_mX",   "Tr_12_0_12"),
+        ("Rot_mY_mZ_X",   "Tr_12_0_12"),
+        ("Rot_Y_X_mZ",    "Tr_12_0_12"),
+        ("Rot_mY_mX_mZ",  "Tr_12_0_12"),
+        ("Rot_Y_mX_Z",    "Tr_12_0_12"),
+        ("Rot_mY_X_Z",    "Tr_12_0_12"),
+        ("Rot_X_Z_mY",    "Tr_12_0_12"),
+        ("Rot_mX_Z_Y",    "Tr_12_0_12"),
+        ("Rot_mX_mZ_mY",  "Tr_12_0_12"),
+        ("Rot_X_mZ_Y",    "Tr_12_0_12"),
+        ("Rot_Z_Y_mX",    "Tr_12_0_12"),
+        ("Rot_Z_mY_X",    "Tr_12_0_12"),
+        ("Rot_mZ_Y_X",    "Tr_12_0_12"),
+        ("Rot_mZ_mY_mX",  "Tr_12_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_12_0_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_0_12"),
+        ("Rot_X_mY_Z",    "Tr_12_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_0_12"),
+        ("Rot_mZ_mX_mY",  "Tr_12_0_12"),
+        ("Rot_mZ_X_Y",    "Tr_12_0_12"),
+        ("Rot_Z_X_mY",    "Tr_12_0_12"),
+        ("Rot_Z_mX_Y",    "Tr_12_0_12"),
+        ("Rot_mY_mZ_mX",  "Tr_12_0_12"),
+        ("Rot_Y_mZ_X",    "Tr_12_0_12"),
+        ("Rot_mY_Z_X",    "Tr_12_0_12"),
+        ("Rot_Y_Z_mX",    "Tr_12_0_12"),
+        ("Rot_mY_mX_Z",   "Tr_12_0_12"),
+        ("Rot_Y_X_Z",     "Tr_12_0_12"),
+        ("Rot_mY_X_mZ",   "Tr_12_0_12"),
+        ("Rot_Y_mX_mZ",   "Tr_12_0_12"),
+        ("Rot_mX_mZ_Y",   "Tr_12_0_12"),
+        ("Rot_X_mZ_mY",   "Tr_12_0_12"),
+        ("Rot_X_Z_Y",     "Tr_12_0_12"),
+        ("Rot_mX_Z_mY",   "Tr_12_0_12"),
+        ("Rot_mZ_mY_X",   "Tr_12_0_12"),
+        ("Rot_mZ_Y_mX",   "Tr_12_0_12"),
+        ("Rot_Z_mY_mX",   "Tr_12_0_12"),
+        ("Rot_Z_Y_X",     "Tr_12_0_12"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Z_X_Y",     "Tr_12_12_0"),
+        ("Rot_Z_mX_mY",   "Tr_12_12_0"),
+        ("Rot_mZ_mX_Y",   "Tr_12_12_0"),
+        ("Rot_mZ_X_mY",   "Tr_12_12_0"),
+        ("Rot_Y_Z_X",     "Tr_12_12_0"),
+        ("Rot_mY_Z_mX",   "Tr_12_12_0"),
+        ("Rot_Y_mZ_mX",   "Tr_12_12_0"),
+        ("Rot_mY_mZ_X",   "Tr_12_12_0"),
+        ("Rot_Y_X_mZ",    "Tr_12_12_0"),
+        ("Rot_mY_mX_mZ",  "Tr_12_12_0"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_0"),
+        ("Rot_mY_X_Z",    "Tr_12_12_0"),
+        ("Rot_X_Z_mY",    "Tr_12_12_0"),
+        ("Rot_mX_Z_Y",    "Tr_12_12_0"),
+        ("Rot_mX_mZ_mY",  "Tr_12_12_0"),
+        ("Rot_X_mZ_Y",    "Tr_12_12_0"),
+        ("Rot_Z_Y_mX",    "Tr_12_12_0"),
+        ("Rot_Z_mY_X",    "Tr_12_12_0"),
+        ("Rot_mZ_Y_X",    "Tr_12_12_0"),
+        ("Rot_mZ_mY_mX",  "Tr_12_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        ("Rot_mZ_mX_mY",  "Tr_12_12_0"),
+        ("Rot_mZ_X_Y",    "Tr_12_12_0"),
+        ("Rot_Z_X_mY",    "Tr_12_12_0"),
+        ("Rot_Z_mX_Y",    "Tr_12_12_0"),
+        ("Rot_mY_mZ_mX",  "Tr_12_12_0"),
+        ("Rot_Y_mZ_X",    "Tr_12_12_0"),
+        ("Rot_mY_Z_X",    "Tr_12_12_0"),
+        ("Rot_Y_Z_mX",    "Tr_12_12_0"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_0"),
+        ("Rot_Y_X_Z",     "Tr_12_12_0"),
+        ("Rot_mY_X_mZ",   "Tr_12_12_0"),
+        ("Rot_Y_mX_mZ",   "Tr_12_12_0"),
+        ("Rot_mX_mZ_Y",   "Tr_12_12_0"),
+        ("Rot_X_mZ_mY",   "Tr_12_12_0"),
+        ("Rot_X_Z_Y",     "Tr_12_12_0"),
+        ("Rot_mX_Z_mY",   "Tr_12_12_0"),
+        ("Rot_mZ_mY_X",   "Tr_12_12_0"),
+        ("Rot_mZ_Y_mX",   "Tr_12_12_0"),
+        ("Rot_Z_mY_mX",   "Tr_12_12_0"),
+        ("Rot_Z_Y_X",     "Tr_12_12_0"),
+        )),
+    (226, 192, 48, "Fm-3c", "PGm3barm", "CUBIC", "F 4/m -3 2/c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_12_12_12"),
+        ("Rot_mY_mX_mZ",  "Tr_12_12_12"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_12"),
+        ("Rot_mY_X_Z",    "Tr_12_12_12"),
+        ("Rot_X_Z_mY",    "Tr_12_12_12"),
+        ("Rot_mX_Z_Y",    "Tr_12_12_12"),
+        ("Rot_mX_mZ_mY",  "Tr_12_12_12"),
+        ("Rot_X_mZ_Y",    "Tr_12_12_12"),
+        ("Rot_Z_Y_mX",    "Tr_12_12_12"),
+        ("Rot_Z_mY_X",    "Tr_12_12_12"),
+        ("Rot_mZ_Y_X",    "Tr_12_12_12"),
+        ("Rot_mZ_mY_mX",  "Tr_12_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_mZ_mX_mY",  "Tr_0_0_0"),
+        ("Rot_mZ_X_Y",    "Tr_0_0_0"),
+        ("Rot_Z_X_mY",    "Tr_0_0_0"),
+        ("Rot_Z_mX_Y",    "Tr_0_0_0"),
+        ("Rot_mY_mZ_mX",  "Tr_0_0_0"),
+        ("Rot_Y_mZ_X",    "Tr_0_0_0"),
+        ("Rot_mY_Z_X",    "Tr_0_0_0"),
+        ("Rot_Y_Z_mX",    "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_12"),
+        ("Rot_Y_X_Z",     "Tr_12_12_12"),
+        ("Rot_mY_X_mZ",   "Tr_12_12_12"),
+        ("Rot_Y_mX_mZ",   "Tr_12_12_12"),
+        ("Rot_mX_mZ_Y",   "Tr_12_12_12"),
+        ("Rot_X_mZ_mY",   "Tr_12_12_12"),
+        ("Rot_X_Z_Y",     "Tr_12_12_12"),
+        ("Rot_mX_Z_mY",   "Tr_12_12_12"),
+        ("Rot_mZ_mY_X",   "Tr_12_12_12"),
+        ("Rot_mZ_Y_mX",   "Tr_12_12_12"),
+        ("Rot_Z_mY_mX",   "Tr_12_12_12"),
+        ("Rot_Z_Y_X",     "Tr_12_12_12"),
+        ("Rot_X_Y_Z",     "Tr_0_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_12"),
+        ("Rot_Z_X_Y",     "Tr_0_12_12"),
+        ("Rot_Z_mX_mY",   "Tr_0_12_12"),
+        ("Rot_mZ_mX_Y",   "Tr_0_12_12"),
+        ("Rot_mZ_X_mY",   "Tr_0_12_12"),
+        ("Rot_Y_Z_X",     "Tr_0_12_12"),
+        ("Rot_mY_Z_mX",   "Tr_0_12_12"),
+        ("Rot_Y_mZ_mX",   "Tr_0_12_12"),
+        ("Rot_mY_mZ_X",   "Tr_0_12_12"),
+        ("Rot_Y_X_mZ",    "Tr_12_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_12_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_12_0_0"),
+        ("Rot_mY_X_Z",    "Tr_12_0_0"),
+        ("Rot_X_Z_mY",    "Tr_12_0_0"),
+        ("Rot_mX_Z_Y",    "Tr_12_0_0"),
+        ("Rot_mX_mZ_mY",  "Tr_12_0_0"),
+        ("Rot_X_mZ_Y",    "Tr_12_0_0"),
+        ("Rot_Z_Y_mX",    "Tr_12_0_0"),
+        ("Rot_Z_mY_X",    "Tr_12_0_0"),
+        ("Rot_mZ_Y_X",    "Tr_12_0_0"),
+        ("Rot_mZ_mY_mX",  "Tr_12_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_0_12_12"),
+        ("Rot_X_mY_Z",    "Tr_0_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_0_12_12"),
+        ("Rot_mZ_mX_mY",  "Tr_0_12_12"),
+        ("Rot_mZ_X_Y",    "Tr_0_12_12"),
+        ("Rot_Z_X_mY",    "Tr_0_12_12"),
+        ("Rot_Z_mX_Y",    "Tr_0_12_12"),
+        ("Rot_mY_mZ_mX",  "Tr_0_12_12"),
+        ("Rot_Y_mZ_X",    "Tr_0_12_12"),
+        ("Rot_mY_Z_X",    "Tr_0_12_12"),
+        ("Rot_Y_Z_mX",    "Tr_0_12_12"),
+        ("Rot_mY_mX_Z",   "Tr_12_0_0"),
+        ("Rot_Y_X_Z",     "Tr_12_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_12_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_12_0_0"),
+        ("Rot_mX_mZ_Y",   "Tr_12_0_0"),
+        ("Rot_X_mZ_mY",   "Tr_12_0_0"),
+        ("Rot_X_Z_Y",     "Tr_12_0_0"),
+        ("Rot_mX_Z_mY",   "Tr_12_0_0"),
+        ("Rot_mZ_mY_X",   "Tr_12_0_0"),
+        ("Rot_mZ_Y_mX",   "Tr_12_0_0"),
+        ("Rot_Z_mY_mX",   "Tr_12_0_0"),
+        ("Rot_Z_Y_X",     "Tr_12_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_0_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_12"),
+        ("Rot_Z_X_Y",     "Tr_12_0_12"),
+        ("Rot_Z_mX_mY",   "Tr_12_0_12"),
+        ("Rot_mZ_mX_Y",   "Tr_12_0_12"),
+        ("Rot_mZ_X_mY",   "Tr_12_0_12"),
+        ("Rot_Y_Z_X",     "Tr_12_0_12"),
+        ("Rot_mY_Z_mX",   "Tr_12_0_12"),
+        ("Rot_Y_mZ_mX",   "Tr_12_0_12"),
+        ("Rot_mY_mZ_X",   "Tr_12_0_12"),
+        ("Rot_Y_X_mZ",    "Tr_0_12_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_12_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_12_0"),
+        ("Rot_mY_X_Z",    "Tr_0_12_0"),
+        ("Rot_X_Z_mY",    "Tr_0_12_0"),
+        ("Rot_mX_Z_Y",    "Tr_0_12_0"),
+        ("Rot_mX_mZ_mY",  "Tr_0_12_0"),
+        ("Rot_X_mZ_Y",    "Tr_0_12_0"),
+        ("Rot_Z_Y_mX",    "Tr_0_12_0"),
+        ("Rot_Z_mY_X",    "Tr_0_12_0"),
+        ("Rot_mZ_Y_X",    "Tr_0_12_0"),
+        ("Rot_mZ_mY_mX",  "Tr_0_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_12_0_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_0_12"),
+        ("Rot_X_mY_Z",    "Tr_12_0_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_0_12"),
+        ("Rot_mZ_mX_mY",  "Tr_12_0_12"),
+        ("Rot_mZ_X_Y",    "Tr_12_0_12"),
+        ("Rot_Z_X_mY",    "Tr_12_0_12"),
+        ("Rot_Z_mX_Y",    "Tr_12_0_12"),
+        ("Rot_mY_mZ_mX",  "Tr_12_0_12"),
+        ("Rot_Y_mZ_X",    "Tr_12_0_12"),
+        ("Rot_mY_Z_X",    "Tr_12_0_12"),
+        ("Rot_Y_Z_mX",    "Tr_12_0_12"),
+        ("Rot_mY_mX_Z",   "Tr_0_12_0"),
+        ("Rot_Y_X_Z",     "Tr_0_12_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_12_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_12_0"),
+        ("Rot_mX_mZ_Y",   "Tr_0_12_0"),
+        ("Rot_X_mZ_mY",   "Tr_0_12_0"),
+        ("Rot_X_Z_Y",     "Tr_0_12_0"),
+        ("Rot_mX_Z_mY",   "Tr_0_12_0"),
+        ("Rot_mZ_mY_X",   "Tr_0_12_0"),
+        ("Rot_mZ_Y_mX",   "Tr_0_12_0"),
+        ("Rot_Z_mY_mX",   "Tr_0_12_0"),
+        ("Rot_Z_Y_X",     "Tr_0_12_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Z_X_Y",     "Tr_12_12_0"),
+        ("Rot_Z_mX_mY",   "Tr_12_12_0"),
+        ("Rot_mZ_mX_Y",   "Tr_12_12_0"),
+        ("Rot_mZ_X_mY",   "Tr_12_12_0"),
+        ("Rot_Y_Z_X",     "Tr_12_12_0"),
+        ("Rot_mY_Z_mX",   "Tr_12_12_0"),
+        ("Rot_Y_mZ_mX",   "Tr_12_12_0"),
+        ("Rot_mY_mZ_X",   "Tr_12_12_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_12"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_12"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_12"),
+        ("Rot_mY_X_Z",    "Tr_0_0_12"),
+        ("Rot_X_Z_mY",    "Tr_0_0_12"),
+        ("Rot_mX_Z_Y",    "Tr_0_0_12"),
+        ("Rot_mX_mZ_mY",  "Tr_0_0_12"),
+        ("Rot_X_mZ_Y",    "Tr_0_0_12"),
+        ("Rot_Z_Y_mX",    "Tr_0_0_12"),
+        ("Rot_Z_mY_X",    "Tr_0_0_12"),
+        ("Rot_mZ_Y_X",    "Tr_0_0_12"),
+        ("Rot_mZ_mY_mX",  "Tr_0_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        ("Rot_mZ_mX_mY",  "Tr_12_12_0"),
+        ("Rot_mZ_X_Y",    "Tr_12_12_0"),
+        ("Rot_Z_X_mY",    "Tr_12_12_0"),
+        ("Rot_Z_mX_Y",    "Tr_12_12_0"),
+        ("Rot_mY_mZ_mX",  "Tr_12_12_0"),
+        ("Rot_Y_mZ_X",    "Tr_12_12_0"),
+        ("Rot_mY_Z_X",    "Tr_12_12_0"),
+        ("Rot_Y_Z_mX",    "Tr_12_12_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_12"),
+        ("Rot_Y_X_Z",     "Tr_0_0_12"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_12"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_12"),
+        ("Rot_mX_mZ_Y",   "Tr_0_0_12"),
+        ("Rot_X_mZ_mY",   "Tr_0_0_12"),
+        ("Rot_X_Z_Y",     "Tr_0_0_12"),
+        ("Rot_mX_Z_mY",   "Tr_0_0_12"),
+        ("Rot_mZ_mY_X",   "Tr_0_0_12"),
+        ("Rot_mZ_Y_mX",   "Tr_0_0_12"),
+        ("Rot_Z_mY_mX",   "Tr_0_0_12"),
+        ("Rot_Z_Y_X",     "Tr_0_0_12"),
+        )),
+    (227, 192, 48, "Fd-3m", "PGm3barm", "CUBIC", "F 41/d -3 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_12"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_12_0_12"),
+        ("Rot_mZ_mX_Y",   "Tr_0_12_12"),
+        ("Rot_mZ_X_mY",   "Tr_12_12_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_12_12_0"),
+        ("Rot_Y_mZ_mX",   "Tr_12_0_12"),
+        ("Rot_mY_mZ_X",   "Tr_0_12_12"),
+        ("Rot_Y_X_mZ",    "Tr_34_14_34"),
+        ("Rot_mY_mX_mZ",  "Tr_14_14_14"),
+        ("Rot_Y_mX_Z",    "Tr_14_34_34"),
+        ("Rot_mY_X_Z",    "Tr_34_34_14"),
+        ("Rot_X_Z_mY",    "Tr_34_14_34"),
+        ("Rot_mX_Z_Y",    "Tr_34_34_14"),
+        ("Rot_mX_mZ_mY",  "Tr_14_14_14"),
+        ("Rot_X_mZ_Y",    "Tr_14_34_34"),
+        ("Rot_Z_Y_mX",    "Tr_34_14_34"),
+        ("Rot_Z_mY_X",    "Tr_14_34_34"),
+        ("Rot_mZ_Y_X",    "Tr_34_34_14"),
+        ("Rot_mZ_mY_mX",  "Tr_14_14_14"),
+        ("Rot_mX_mY_mZ",  "Tr_14_14_14"),
+        ("Rot_X_Y_mZ",    "Tr_14_34_34"),
+        ("Rot_X_mY_Z",    "Tr_34_34_14"),
+        ("Rot_mX_Y_Z",    "Tr_34_14_34"),
+        ("Rot_mZ_mX_mY",  "Tr_14_14_14"),
+        ("Rot_mZ_X_Y",    "Tr_34_14_34"),
+        ("Rot_Z_X_mY",    "Tr_14_34_34"),
+        ("Rot_Z_mX_Y",    "Tr_34_34_14"),
+        ("Rot_mY_mZ_mX",  "Tr_14_14_14"),
+        ("Rot_Y_mZ_X",    "Tr_34_34_14"),
+        ("Rot_mY_Z_X",    "Tr_34_14_34"),
+        ("Rot_Y_Z_mX",    "Tr_14_34_34"),
+        ("Rot_mY_mX_Z",   "Tr_12_0_12"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_12_12"),
+        ("Rot_Y_mX_mZ",   "Tr_12_12_0"),
+        ("Rot_mX_mZ_Y",   "Tr_12_0_12"),
+        ("Rot_X_mZ_mY",   "Tr_12_12_0"),
+        ("Rot_X_Z_Y",     "Tr_0_0_0"),
+        ("Rot_mX_Z_mY",   "Tr_0_12_12"),
+        ("Rot_mZ_mY_X",   "Tr_12_0_12"),
+        ("Rot_mZ_Y_mX",   "Tr_0_12_12"),
+        ("Rot_Z_mY_mX",   "Tr_12_12_0"),
+        ("Rot_Z_Y_X",     "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_0_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Z_X_Y",     "Tr_0_12_12"),
+        ("Rot_Z_mX_mY",   "Tr_12_12_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_12_0_12"),
+        ("Rot_Y_Z_X",     "Tr_0_12_12"),
+        ("Rot_mY_Z_mX",   "Tr_12_0_12"),
+        ("Rot_Y_mZ_mX",   "Tr_12_12_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_34_34_14"),
+        ("Rot_mY_mX_mZ",  "Tr_14_34_34"),
+        ("Rot_Y_mX_Z",    "Tr_14_14_14"),
+        ("Rot_mY_X_Z",    "Tr_34_14_34"),
+        ("Rot_X_Z_mY",    "Tr_34_34_14"),
+        ("Rot_mX_Z_Y",    "Tr_34_14_34"),
+        ("Rot_mX_mZ_mY",  "Tr_14_34_34"),
+        ("Rot_X_mZ_Y",    "Tr_14_14_14"),
+        ("Rot_Z_Y_mX",    "Tr_34_34_14"),
+        ("Rot_Z_mY_X",    "Tr_14_14_14"),
+        ("Rot_mZ_Y_X",    "Tr_34_14_34"),
+        ("Rot_mZ_mY_mX",  "Tr_14_34_34"),
+        ("Rot_mX_mY_mZ",  "Tr_14_34_34"),
+        ("Rot_X_Y_mZ",    "Tr_14_14_14"),
+        ("Rot_X_mY_Z",    "Tr_34_14_34"),
+        ("Rot_mX_Y_Z",    "Tr_34_34_14"),
+        ("Rot_mZ_mX_mY",  "Tr_14_34_34"),
+        ("Rot_mZ_X_Y",    "Tr_34_34_14"),
+        ("Rot_Z_X_mY",    "Tr_14_14_14"),
+        ("Rot_Z_mX_Y",    "Tr_34_14_34"),
+        ("Rot_mY_mZ_mX",  "Tr_14_34_34"),
+        ("Rot_Y_mZ_X",    "Tr_34_14_34"),
+        ("Rot_mY_Z_X",    "Tr_34_34_14"),
+        ("Rot_Y_Z_mX",    "Tr_14_14_14"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_0"),
+        ("Rot_Y_X_Z",     "Tr_0_12_12"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_12_0_12"),
+        ("Rot_mX_mZ_Y",   "Tr_12_12_0"),
+        ("Rot_X_mZ_mY",   "Tr_12_0_12"),
+        ("Rot_X_Z_Y",     "Tr_0_12_12"),
+        ("Rot_mX_Z_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mY_X",   "Tr_12_12_0"),
+        ("Rot_mZ_Y_mX",   "Tr_0_0_0"),
+        ("Rot_Z_mY_mX",   "Tr_12_0_12"),
+        ("Rot_Z_Y_X",     "Tr_0_12_12"),
+        ("Rot_X_Y_Z",     "Tr_12_0_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_12_0_12"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_12_12_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_12_12"),
+        ("Rot_Y_Z_X",     "Tr_12_0_12"),
+        ("Rot_mY_Z_mX",   "Tr_0_12_12"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_12_12_0"),
+        ("Rot_Y_X_mZ",    "Tr_14_14_14"),
+        ("Rot_mY_mX_mZ",  "Tr_34_14_34"),
+        ("Rot_Y_mX_Z",    "Tr_34_34_14"),
+        ("Rot_mY_X_Z",    "Tr_14_34_34"),
+        ("Rot_X_Z_mY",    "Tr_14_14_14"),
+        ("Rot_mX_Z_Y",    "Tr_14_34_34"),
+        ("Rot_mX_mZ_mY",  "Tr_34_14_34"),
+        ("Rot_X_mZ_Y",    "Tr_34_34_14"),
+        ("Rot_Z_Y_mX",    "Tr_14_14_14"),
+        ("Rot_Z_mY_X",    "Tr_34_34_14"),
+        ("Rot_mZ_Y_X",    "Tr_14_34_34"),
+        ("Rot_mZ_mY_mX",  "Tr_34_14_34"),
+        ("Rot_mX_mY_mZ",  "Tr_34_14_34"),
+        ("Rot_X_Y_mZ",    "Tr_34_34_14"),
+        ("Rot_X_mY_Z",    "Tr_14_34_34"),
+        ("Rot_mX_Y_Z",    "Tr_14_14_14"),
+        ("Rot_mZ_mX_mY",  "Tr_34_14_34"),
+        ("Rot_mZ_X_Y",    "Tr_14_14_14"),
+        ("Rot_Z_X_mY",    "Tr_34_34_14"),
+        ("Rot_Z_mX_Y",    "Tr_14_34_34"),
+        ("Rot_mY_mZ_mX",  "Tr_34_14_34"),
+        ("Rot_Y_mZ_X",    "Tr_14_34_34"),
+        ("Rot_mY_Z_X",    "Tr_14_14_14"),
+        ("Rot_Y_Z_mX",    "Tr_34_34_14"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_12_0_12"),
+        ("Rot_mY_X_mZ",   "Tr_12_12_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_12_12"),
+        ("Rot_mX_mZ_Y",   "Tr_0_0_0"),
+        ("Rot_X_mZ_mY",   "Tr_0_12_12"),
+        ("Rot_X_Z_Y",     "Tr_12_0_12"),
+        ("Rot_mX_Z_mY",   "Tr_12_12_0"),
+        ("Rot_mZ_mY_X",   "Tr_0_0_0"),
+        ("Rot_mZ_Y_mX",   "Tr_12_12_0"),
+        ("Rot_Z_mY_mX",   "Tr_0_12_12"),
+        ("Rot_Z_Y_X",     "Tr_12_0_12"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_12"),
+        ("Rot_Z_X_Y",     "Tr_12_12_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_12_12"),
+        ("Rot_mZ_mX_Y",   "Tr_12_0_12"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_12_12_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_12_12"),
+        ("Rot_mY_mZ_X",   "Tr_12_0_12"),
+        ("Rot_Y_X_mZ",    "Tr_14_34_34"),
+        ("Rot_mY_mX_mZ",  "Tr_34_34_14"),
+        ("Rot_Y_mX_Z",    "Tr_34_14_34"),
+        ("Rot_mY_X_Z",    "Tr_14_14_14"),
+        ("Rot_X_Z_mY",    "Tr_14_34_34"),
+        ("Rot_mX_Z_Y",    "Tr_14_14_14"),
+        ("Rot_mX_mZ_mY",  "Tr_34_34_14"),
+        ("Rot_X_mZ_Y",    "Tr_34_14_34"),
+        ("Rot_Z_Y_mX",    "Tr_14_34_34"),
+        ("Rot_Z_mY_X",    "Tr_34_14_34"),
+        ("Rot_mZ_Y_X",    "Tr_14_14_14"),
+        ("Rot_mZ_mY_mX",  "Tr_34_34_14"),
+        ("Rot_mX_mY_mZ",  "Tr_34_34_14"),
+        ("Rot_X_Y_mZ",    "Tr_34_14_34"),
+        ("Rot_X_mY_Z",    "Tr_14_14_14"),
+        ("Rot_mX_Y_Z",    "Tr_14_34_34"),
+        ("Rot_mZ_mX_mY",  "Tr_34_34_14"),
+        ("Rot_mZ_X_Y",    "Tr_14_34_34"),
+        ("Rot_Z_X_mY",    "Tr_34_14_34"),
+        ("Rot_Z_mX_Y",    "Tr_14_14_14"),
+        ("Rot_mY_mZ_mX",  "Tr_34_34_14"),
+        ("Rot_Y_mZ_X",    "Tr_14_14_14"),
+        ("Rot_mY_Z_X",    "Tr_14_34_34"),
+        ("Rot_Y_Z_mX",    "Tr_34_14_34"),
+        ("Rot_mY_mX_Z",   "Tr_0_12_12"),
+        ("Rot_Y_X_Z",     "Tr_12_12_0"),
+        ("Rot_mY_X_mZ",   "Tr_12_0_12"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_mZ_Y",   "Tr_0_12_12"),
+        ("Rot_X_mZ_mY",   "Tr_0_0_0"),
+        ("Rot_X_Z_Y",     "Tr_12_12_0"),
+        ("Rot_mX_Z_mY",   "Tr_12_0_12"),
+        ("Rot_mZ_mY_X",   "Tr_0_12_12"),
+        ("Rot_mZ_Y_mX",   "Tr_12_0_12"),
+        ("Rot_Z_mY_mX",   "Tr_0_0_0"),
+        ("Rot_Z_Y_X",     "Tr_12_12_0"),
+        )),
+    (228, 192, 48, "Fd-3c", "PGm3barm", "CUBIC", "F 41/d -3 2/c", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_12"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_12_0_12"),
+        ("Rot_mZ_mX_Y",   "Tr_0_12_12"),
+        ("Rot_mZ_X_mY",   "Tr_12_12_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_12_12_0"),
+        ("Rot_Y_mZ_mX",   "Tr_12_0_12"),
+        ("Rot_mY_mZ_X",   "Tr_0_12_12"),
+        ("Rot_Y_X_mZ",    "Tr_34_14_34"),
+        ("Rot_mY_mX_mZ",  "Tr_14_14_14"),
+        ("Rot_Y_mX_Z",    "Tr_14_34_34"),
+        ("Rot_mY_X_Z",    "Tr_34_34_14"),
+        ("Rot_X_Z_mY",    "Tr_34_14_34"),
+        ("Rot_mX_Z_Y",    "Tr_34_34_14"),
+        ("Rot_mX_mZ_mY",  "Tr_14_14_14"),
+        ("Rot_X_mZ_Y",    "Tr_14_34_34"),
+        ("Rot_Z_Y_mX",    "Tr_34_14_34"),
+        ("Rot_Z_mY_X",    "Tr_14_34_34"),
+        ("Rot_mZ_Y_X",    "Tr_34_34_14"),
+        ("Rot_mZ_mY_mX",  "Tr_14_14_14"),
+        ("Rot_mX_mY_mZ",  "Tr_34_34_34"),
+        ("Rot_X_Y_mZ",    "Tr_34_14_14"),
+        ("Rot_X_mY_Z",    "Tr_14_14_34"),
+        ("Rot_mX_Y_Z",    "Tr_14_34_14"),
+        ("Rot_mZ_mX_mY",  "Tr_34_34_34"),
+        ("Rot_mZ_X_Y",    "Tr_14_34_14"),
+        ("Rot_Z_X_mY",    "Tr_34_14_14"),
+        ("Rot_Z_mX_Y",    "Tr_14_14_34"),
+        ("Rot_mY_mZ_mX",  "Tr_34_34_34"),
+        ("Rot_Y_mZ_X",    "Tr_14_14_34"),
+        ("Rot_mY_Z_X",    "Tr_14_34_14"),
+        ("Rot_Y_Z_mX",    "Tr_34_14_14"),
+        ("Rot_mY_mX_Z",   "Tr_0_12_0"),
+        ("Rot_Y_X_Z",     "Tr_12_12_12"),
+        ("Rot_mY_X_mZ",   "Tr_12_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_12"),
+        ("Rot_mX_mZ_Y",   "Tr_0_12_0"),
+        ("Rot_X_mZ_mY",   "Tr_0_0_12"),
+        ("Rot_X_Z_Y",     "Tr_12_12_12"),
+        ("Rot_mX_Z_mY",   "Tr_12_0_0"),
+        ("Rot_mZ_mY_X",   "Tr_0_12_0"),
+        ("Rot_mZ_Y_mX",   "Tr_12_0_0"),
+        ("Rot_Z_mY_mX",   "Tr_0_0_12"),
+        ("Rot_Z_Y_X",     "Tr_12_12_12"),
+        ("Rot_X_Y_Z",     "Tr_0_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Z_X_Y",     "Tr_0_12_12"),
+        ("Rot_Z_mX_mY",   "Tr_12_12_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_12_0_12"),
+        ("Rot_Y_Z_X",     "Tr_0_12_12"),
+        ("Rot_mY_Z_mX",   "Tr_12_0_12"),
+        ("Rot_Y_mZ_mX",   "Tr_12_12_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_34_34_14"),
+        ("Rot_mY_mX_mZ",  "Tr_14_34_34"),
+        ("Rot_Y_mX_Z",    "Tr_14_14_14"),
+        ("Rot_mY_X_Z",    "Tr_34_14_34"),
+        ("Rot_X_Z_mY",    "Tr_34_34_14"),
+        ("Rot_mX_Z_Y",    "Tr_34_14_34"),
+        ("Rot_mX_mZ_mY",  "Tr_14_34_34"),
+        ("Rot_X_mZ_Y",    "Tr_14_14_14"),
+        ("Rot_Z_Y_mX",    "Tr_34_34_14"),
+        ("Rot_Z_mY_X",    "Tr_14_14_14"),
+        ("Rot_mZ_Y_X",    "Tr_34_14_34"),
+        ("Rot_mZ_mY_mX",  "Tr_14_34_34"),
+        ("Rot_mX_mY_mZ",  "Tr_34_14_14"),
+        ("Rot_X_Y_mZ",    "Tr_34_34_34"),
+        ("Rot_X_mY_Z",    "Tr_14_34_14"),
+        ("Rot_mX_Y_Z",    "Tr_14_14_34"),
+        ("Rot_mZ_mX_mY",  "Tr_34_14_14"),
+        ("Rot_mZ_X_Y",    "Tr_14_14_34"),
+        ("Rot_Z_X_mY",    "Tr_34_34_34"),
+        ("Rot_Z_mX_Y",    "Tr_14_34_14"),
+        ("Rot_mY_mZ_mX",  "Tr_34_14_14"),
+        ("Rot_Y_mZ_X",    "Tr_14_34_14"),
+        ("Rot_mY_Z_X",    "Tr_14_14_34"),
+        ("Rot_Y_Z_mX",    "Tr_34_34_34"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_12"),
+        ("Rot_Y_X_Z",     "Tr_12_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_12_12_12"),
+        ("Rot_Y_mX_mZ",   "Tr_0_12_0"),
+        ("Rot_mX_mZ_Y",   "Tr_0_0_12"),
+        ("Rot_X_mZ_mY",   "Tr_0_12_0"),
+        ("Rot_X_Z_Y",     "Tr_12_0_0"),
+        ("Rot_mX_Z_mY",   "Tr_12_12_12"),
+        ("Rot_mZ_mY_X",   "Tr_0_0_12"),
+        ("Rot_mZ_Y_mX",   "Tr_12_12_12"),
+        ("Rot_Z_mY_mX",   "Tr_0_12_0"),
+        ("Rot_Z_Y_X",     "Tr_12_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_0_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_12_0_12"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_12_12_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_12_12"),
+        ("Rot_Y_Z_X",     "Tr_12_0_12"),
+        ("Rot_mY_Z_mX",   "Tr_0_12_12"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_12_12_0"),
+        ("Rot_Y_X_mZ",    "Tr_14_14_14"),
+        ("Rot_mY_mX_mZ",  "Tr_34_14_34"),
+        ("Rot_Y_mX_Z",    "Tr_34_34_14"),
+        ("Rot_mY_X_Z",    "Tr_14_34_34"),
+        ("Rot_X_Z_mY",    "Tr_14_14_14"),
+        ("Rot_mX_Z_Y",    "Tr_14_34_34"),
+        ("Rot_mX_mZ_mY",  "Tr_34_14_34"),
+        ("Rot_X_mZ_Y",    "Tr_34_34_14"),
+        ("Rot_Z_Y_mX",    "Tr_14_14_14"),
+        ("Rot_Z_mY_X",    "Tr_34_34_14"),
+        ("Rot_mZ_Y_X",    "Tr_14_34_34"),
+        ("Rot_mZ_mY_mX",  "Tr_34_14_34"),
+        ("Rot_mX_mY_mZ",  "Tr_14_34_14"),
+        ("Rot_X_Y_mZ",    "Tr_14_14_34"),
+        ("Rot_X_mY_Z",    "Tr_34_14_14"),
+        ("Rot_mX_Y_Z",    "Tr_34_34_34"),
+        ("Rot_mZ_mX_mY",  "Tr_14_34_14"),
+        ("Rot_mZ_X_Y",    "Tr_34_34_34"),
+        ("Rot_Z_X_mY",    "Tr_14_14_34"),
+        ("Rot_Z_mX_Y",    "Tr_34_14_14"),
+        ("Rot_mY_mZ_mX",  "Tr_14_34_14"),
+        ("Rot_Y_mZ_X",    "Tr_34_14_14"),
+        ("Rot_mY_Z_X",    "Tr_34_34_34"),
+        ("Rot_Y_Z_mX",    "Tr_14_14_34"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_12"),
+        ("Rot_Y_X_Z",     "Tr_0_12_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_12"),
+        ("Rot_Y_mX_mZ",   "Tr_12_0_0"),
+        ("Rot_mX_mZ_Y",   "Tr_12_12_12"),
+        ("Rot_X_mZ_mY",   "Tr_12_0_0"),
+        ("Rot_X_Z_Y",     "Tr_0_12_0"),
+        ("Rot_mX_Z_mY",   "Tr_0_0_12"),
+        ("Rot_mZ_mY_X",   "Tr_12_12_12"),
+        ("Rot_mZ_Y_mX",   "Tr_0_0_12"),
+        ("Rot_Z_mY_mX",   "Tr_12_0_0"),
+        ("Rot_Z_Y_X",     "Tr_0_12_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_12"),
+        ("Rot_Z_X_Y",     "Tr_12_12_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_12_12"),
+        ("Rot_mZ_mX_Y",   "Tr_12_0_12"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_12_12_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_12_12"),
+        ("Rot_mY_mZ_X",   "Tr_12_0_12"),
+        ("Rot_Y_X_mZ",    "Tr_14_34_34"),
+        ("Rot_mY_mX_mZ",  "Tr_34_34_14"),
+        ("Rot_Y_mX_Z",    "Tr_34_14_34"),
+        ("Rot_mY_X_Z",    "Tr_14_14_14"),
+        ("Rot_X_Z_mY",    "Tr_14_34_34"),
+        ("Rot_mX_Z_Y",    "Tr_14_14_14"),
+        ("Rot_mX_mZ_mY",  "Tr_34_34_14"),
+        ("Rot_X_mZ_Y",    "Tr_34_14_34"),
+        ("Rot_Z_Y_mX",    "Tr_14_34_34"),
+        ("Rot_Z_mY_X",    "Tr_34_14_34"),
+        ("Rot_mZ_Y_X",    "Tr_14_14_14"),
+        ("Rot_mZ_mY_mX",  "Tr_34_34_14"),
+        ("Rot_mX_mY_mZ",  "Tr_14_14_34"),
+        ("Rot_X_Y_mZ",    "Tr_14_34_14"),
+        ("Rot_X_mY_Z",    "Tr_34_34_34"),
+        ("Rot_mX_Y_Z",    "Tr_34_14_14"),
+        ("Rot_mZ_mX_mY",  "Tr_14_14_34"),
+        ("Rot_mZ_X_Y",    "Tr_34_14_14"),
+        ("Rot_Z_X_mY",    "Tr_14_34_14"),
+        ("Rot_Z_mX_Y",    "Tr_34_34_34"),
+        ("Rot_mY_mZ_mX",  "Tr_14_14_34"),
+        ("Rot_Y_mZ_X",    "Tr_34_34_34"),
+        ("Rot_mY_Z_X",    "Tr_34_14_14"),
+        ("Rot_Y_Z_mX",    "Tr_14_34_14"),
+        ("Rot_mY_mX_Z",   "Tr_12_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_12"),
+        ("Rot_mY_X_mZ",   "Tr_0_12_0"),
+        ("Rot_Y_mX_mZ",   "Tr_12_12_12"),
+        ("Rot_mX_mZ_Y",   "Tr_12_0_0"),
+        ("Rot_X_mZ_mY",   "Tr_12_12_12"),
+        ("Rot_X_Z_Y",     "Tr_0_0_12"),
+        ("Rot_mX_Z_mY",   "Tr_0_12_0"),
+        ("Rot_mZ_mY_X",   "Tr_12_0_0"),
+        ("Rot_mZ_Y_mX",   "Tr_0_12_0"),
+        ("Rot_Z_mY_mX",   "Tr_12_12_12"),
+        ("Rot_Z_Y_X",     "Tr_0_0_12"),
+        )),
+    (229, 96, 48, "Im-3m", "PGm3barm", "CUBIC", "I 4/m -3 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_0_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_0"),
+        ("Rot_mY_mX_mZ",  "Tr_0_0_0"),
+        ("Rot_Y_mX_Z",    "Tr_0_0_0"),
+        ("Rot_mY_X_Z",    "Tr_0_0_0"),
+        ("Rot_X_Z_mY",    "Tr_0_0_0"),
+        ("Rot_mX_Z_Y",    "Tr_0_0_0"),
+        ("Rot_mX_mZ_mY",  "Tr_0_0_0"),
+        ("Rot_X_mZ_Y",    "Tr_0_0_0"),
+        ("Rot_Z_Y_mX",    "Tr_0_0_0"),
+        ("Rot_Z_mY_X",    "Tr_0_0_0"),
+        ("Rot_mZ_Y_X",    "Tr_0_0_0"),
+        ("Rot_mZ_mY_mX",  "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_0"),
+        ("Rot_mZ_mX_mY",  "Tr_0_0_0"),
+        ("Rot_mZ_X_Y",    "Tr_0_0_0"),
+        ("Rot_Z_X_mY",    "Tr_0_0_0"),
+        ("Rot_Z_mX_Y",    "Tr_0_0_0"),
+        ("Rot_mY_mZ_mX",  "Tr_0_0_0"),
+        ("Rot_Y_mZ_X",    "Tr_0_0_0"),
+        ("Rot_mY_Z_X",    "Tr_0_0_0"),
+        ("Rot_Y_Z_mX",    "Tr_0_0_0"),
+        ("Rot_mY_mX_Z",   "Tr_0_0_0"),
+        ("Rot_Y_X_Z",     "Tr_0_0_0"),
+        ("Rot_mY_X_mZ",   "Tr_0_0_0"),
+        ("Rot_Y_mX_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_mZ_Y",   "Tr_0_0_0"),
+        ("Rot_X_mZ_mY",   "Tr_0_0_0"),
+        ("Rot_X_Z_Y",     "Tr_0_0_0"),
+        ("Rot_mX_Z_mY",   "Tr_0_0_0"),
+        ("Rot_mZ_mY_X",   "Tr_0_0_0"),
+        ("Rot_mZ_Y_mX",   "Tr_0_0_0"),
+        ("Rot_Z_mY_mX",   "Tr_0_0_0"),
+        ("Rot_Z_Y_X",     "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_12"),
+        ("Rot_Z_X_Y",     "Tr_12_12_12"),
+        ("Rot_Z_mX_mY",   "Tr_12_12_12"),
+        ("Rot_mZ_mX_Y",   "Tr_12_12_12"),
+        ("Rot_mZ_X_mY",   "Tr_12_12_12"),
+        ("Rot_Y_Z_X",     "Tr_12_12_12"),
+        ("Rot_mY_Z_mX",   "Tr_12_12_12"),
+        ("Rot_Y_mZ_mX",   "Tr_12_12_12"),
+        ("Rot_mY_mZ_X",   "Tr_12_12_12"),
+        ("Rot_Y_X_mZ",    "Tr_12_12_12"),
+        ("Rot_mY_mX_mZ",  "Tr_12_12_12"),
+        ("Rot_Y_mX_Z",    "Tr_12_12_12"),
+        ("Rot_mY_X_Z",    "Tr_12_12_12"),
+        ("Rot_X_Z_mY",    "Tr_12_12_12"),
+        ("Rot_mX_Z_Y",    "Tr_12_12_12"),
+        ("Rot_mX_mZ_mY",  "Tr_12_12_12"),
+        ("Rot_X_mZ_Y",    "Tr_12_12_12"),
+        ("Rot_Z_Y_mX",    "Tr_12_12_12"),
+        ("Rot_Z_mY_X",    "Tr_12_12_12"),
+        ("Rot_mZ_Y_X",    "Tr_12_12_12"),
+        ("Rot_mZ_mY_mX",  "Tr_12_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_12"),
+        ("Rot_X_mY_Z",    "Tr_12_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_12"),
+        ("Rot_mZ_mX_mY",  "Tr_12_12_12"),
+        ("Rot_mZ_X_Y",    "Tr_12_12_12"),
+        ("Rot_Z_X_mY",    "Tr_12_12_12"),
+        ("Rot_Z_mX_Y",    "Tr_12_12_12"),
+        ("Rot_mY_mZ_mX",  "Tr_12_12_12"),
+        ("Rot_Y_mZ_X",    "Tr_12_12_12"),
+        ("Rot_mY_Z_X",    "Tr_12_12_12"),
+        ("Rot_Y_Z_mX",    "Tr_12_12_12"),
+        ("Rot_mY_mX_Z",   "Tr_12_12_12"),
+        ("Rot_Y_X_Z",     "Tr_12_12_12"),
+        ("Rot_mY_X_mZ",   "Tr_12_12_12"),
+        ("Rot_Y_mX_mZ",   "Tr_12_12_12"),
+        ("Rot_mX_mZ_Y",   "Tr_12_12_12"),
+        ("Rot_X_mZ_mY",   "Tr_12_12_12"),
+        ("Rot_X_Z_Y",     "Tr_12_12_12"),
+        ("Rot_mX_Z_mY",   "Tr_12_12_12"),
+        ("Rot_mZ_mY_X",   "Tr_12_12_12"),
+        ("Rot_mZ_Y_mX",   "Tr_12_12_12"),
+        ("Rot_Z_mY_mX",   "Tr_12_12_12"),
+        ("Rot_Z_Y_X",     "Tr_12_12_12"),
+        )),
+    (230, 96, 48, "Ia-3d", "PGm3barm", "CUBIC", "I 41/a -3 2/d", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_Z_mX_mY",   "Tr_12_12_0"),
+        ("Rot_mZ_mX_Y",   "Tr_12_0_12"),
+        ("Rot_mZ_X_mY",   "Tr_0_12_12"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_12_12"),
+        ("Rot_Y_mZ_mX",   "Tr_12_12_0"),
+        ("Rot_mY_mZ_X",   "Tr_12_0_12"),
+        ("Rot_Y_X_mZ",    "Tr_34_14_14"),
+        ("Rot_mY_mX_mZ",  "Tr_34_34_34"),
+        ("Rot_Y_mX_Z",    "Tr_14_14_34"),
+        ("Rot_mY_X_Z",    "Tr_14_34_14"),
+        ("Rot_X_Z_mY",    "Tr_34_14_14"),
+        ("Rot_mX_Z_Y",    "Tr_14_34_14"),
+        ("Rot_mX_mZ_mY",  "Tr_34_34_34"),
+        ("Rot_X_mZ_Y",    "Tr_14_14_34"),
+        ("Rot_Z_Y_mX",    "Tr_34_14_14"),
+        ("Rot_Z_mY_X",    "Tr_14_14_34"),
+        ("Rot_mZ_Y_X",    "Tr_14_34_14"),
+        ("Rot_mZ_mY_mX",  "Tr_34_34_34"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_0_12"),
+        ("Rot_X_mY_Z",    "Tr_0_12_12"),
+        ("Rot_mX_Y_Z",    "Tr_12_12_0"),
+        ("Rot_mZ_mX_mY",  "Tr_0_0_0"),
+        ("Rot_mZ_X_Y",    "Tr_12_12_0"),
+        ("Rot_Z_X_mY",    "Tr_12_0_12"),
+        ("Rot_Z_mX_Y",    "Tr_0_12_12"),
+        ("Rot_mY_mZ_mX",  "Tr_0_0_0"),
+        ("Rot_Y_mZ_X",    "Tr_0_12_12"),
+        ("Rot_mY_Z_X",    "Tr_12_12_0"),
+        ("Rot_Y_Z_mX",    "Tr_12_0_12"),
+        ("Rot_mY_mX_Z",   "Tr_14_34_34"),
+        ("Rot_Y_X_Z",     "Tr_14_14_14"),
+        ("Rot_mY_X_mZ",   "Tr_34_34_14"),
+        ("Rot_Y_mX_mZ",   "Tr_34_14_34"),
+        ("Rot_mX_mZ_Y",   "Tr_14_34_34"),
+        ("Rot_X_mZ_mY",   "Tr_34_14_34"),
+        ("Rot_X_Z_Y",     "Tr_14_14_14"),
+        ("Rot_mX_Z_mY",   "Tr_34_34_14"),
+        ("Rot_mZ_mY_X",   "Tr_14_34_34"),
+        ("Rot_mZ_Y_mX",   "Tr_34_34_14"),
+        ("Rot_Z_mY_mX",   "Tr_34_14_34"),
+        ("Rot_Z_Y_X",     "Tr_14_14_14"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_12"),
+        ("Rot_Z_X_Y",     "Tr_12_12_12"),
+        ("Rot_Z_mX_mY",   "Tr_0_0_12"),
+        ("Rot_mZ_mX_Y",   "Tr_0_12_0"),
+        ("Rot_mZ_X_mY",   "Tr_12_0_0"),
+        ("Rot_Y_Z_X",     "Tr_12_12_12"),
+        ("Rot_mY_Z_mX",   "Tr_12_0_0"),
+        ("Rot_Y_mZ_mX",   "Tr_0_0_12"),
+        ("Rot_mY_mZ_X",   "Tr_0_12_0"),
+        ("Rot_Y_X_mZ",    "Tr_14_34_34"),
+        ("Rot_mY_mX_mZ",  "Tr_14_14_14"),
+        ("Rot_Y_mX_Z",    "Tr_34_34_14"),
+        ("Rot_mY_X_Z",    "Tr_34_14_34"),
+        ("Rot_X_Z_mY",    "Tr_14_34_34"),
+        ("Rot_mX_Z_Y",    "Tr_34_14_34"),
+        ("Rot_mX_mZ_mY",  "Tr_14_14_14"),
+        ("Rot_X_mZ_Y",    "Tr_34_34_14"),
+        ("Rot_Z_Y_mX",    "Tr_14_34_34"),
+        ("Rot_Z_mY_X",    "Tr_34_34_14"),
+        ("Rot_mZ_Y_X",    "Tr_34_14_34"),
+        ("Rot_mZ_mY_mX",  "Tr_14_14_14"),
+        ("Rot_mX_mY_mZ",  "Tr_12_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_0_12_0"),
+        ("Rot_X_mY_Z",    "Tr_12_0_0"),
+        ("Rot_mX_Y_Z",    "Tr_0_0_12"),
+        ("Rot_mZ_mX_mY",  "Tr_12_12_12"),
+        ("Rot_mZ_X_Y",    "Tr_0_0_12"),
+        ("Rot_Z_X_mY",    "Tr_0_12_0"),
+        ("Rot_Z_mX_Y",    "Tr_12_0_0"),
+        ("Rot_mY_mZ_mX",  "Tr_12_12_12"),
+        ("Rot_Y_mZ_X",    "Tr_12_0_0"),
+        ("Rot_mY_Z_X",    "Tr_0_0_12"),
+        ("Rot_Y_Z_mX",    "Tr_0_12_0"),
+        ("Rot_mY_mX_Z",   "Tr_34_14_14"),
+        ("Rot_Y_X_Z",     "Tr_34_34_34"),
+        ("Rot_mY_X_mZ",   "Tr_14_14_34"),
+        ("Rot_Y_mX_mZ",   "Tr_14_34_14"),
+        ("Rot_mX_mZ_Y",   "Tr_34_14_14"),
+        ("Rot_X_mZ_mY",   "Tr_14_34_14"),
+        ("Rot_X_Z_Y",     "Tr_34_34_34"),
+        ("Rot_mX_Z_mY",   "Tr_14_14_34"),
+        ("Rot_mZ_mY_X",   "Tr_34_14_14"),
+        ("Rot_mZ_Y_mX",   "Tr_14_14_34"),
+        ("Rot_Z_mY_mX",   "Tr_14_34_14"),
+        ("Rot_Z_Y_X",     "Tr_34_34_34"),
+        )),
+    (1003, 2, 2, "P2", "PG2C", "MONOCLINIC", "P 1 1 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        )),
+    (1004, 2, 2, "P1121", "PG2C", "MONOCLINIC", "P 1 1 21", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        )),
+    (3004, 4, 2, "I21", "PG2", "MONOCLINIC", "I 1 21 1", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_12"),
+        )),
+    (1005, 4, 2, "B2", "PG2C", "MONOCLINIC", "B 1 1 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_0_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        )),
+    (2005, 4, 2, "A2", "PG2C", "MONOCLINIC", "A 2 1 1", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_12"),
+        )),
+    (3005, 4, 2, "C21", "PG2", "MONOCLINIC", "C 1 21 1", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_0"),
+        )),
+    (1006, 2, 2, "P11m", "PG2C", "MONOCLINIC", "P 1 1 m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        )),
+    (1007, 2, 2, "P11b", "PG2C", "MONOCLINIC", "P 1 1 b", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_12_0"),
+        )),
+    (1008, 4, 2, "B11m", "PG2", "MONOCLINIC", "B 1 1 m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_X_mY_Z",    "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_X_mY_Z",    "Tr_12_12_0"),
+        )),
+    (1009, 4, 2, "B11b", "PG2C", "MONOCLINIC", "B 1 1 b", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_12_0"),
+        ("Rot_X_Y_Z",     "Tr_12_0_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_12"),
+        )),
+    (1010, 4, 4, "P112/m", "PG2C", "MONOCLINIC", "P 1 1 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        )),
+    (1011, 4, 4, "P1121/m", "PG2C", "MONOCLINIC", "P 1 1 21/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_12"),
+        )),
+    (1012, 8, 4, "B112/m", "PG2C", "MONOCLINIC", "B 1 1 2/m", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_Z",     "Tr_12_0_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_0_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_mX_mY_mZ",  "Tr_12_0_12"),
+        )),
+    (1013, 4, 4, "P112/b", "PG2C", "MONOCLINIC", "P 1 1 2/b", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_12_0"),
+        )),
+    (1014, 4, 4, "P1121/b", "PG2C", "MONOCLINIC", "P 1 1 21/b", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_12"),
+        ("Rot_X_Y_mZ",    "Tr_0_12_12"),
+        )),
+    (1015, 8, 4, "B112/b", "PG2C", "MONOCLINIC", "B 1 1 2/b", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_0_12_0"),
+        ("Rot_X_Y_Z",     "Tr_12_0_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_12"),
+        ("Rot_mX_mY_mZ",  "Tr_12_0_12"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_12"),
+        )),
+    (1017, 4, 4, "P2122", "PG222", "ORTHORHOMBIC", "P 21 2 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_0"),
+        )),
+    (2017, 4, 4, "P2212", "PG222", "ORTHORHOMBIC", "P 2 21 2", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        )),
+    (1018, 4, 4, "P21212a", "PG222", "ORTHORHOMBIC", "P 21 21 2 (a)", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_0"),
+        )),
+    (2018, 4, 4, "P21221", "PG222", "ORTHORHOMBIC", "P 21 2 21", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        )),
+    (3018, 4, 4, "P22121", "PG222", "ORTHORHOMBIC", "P 2 21 21", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_12"),
+        )),
+    (1020, 8, 4, "C2221a", "PG222", "ORTHORHOMBIC", "C 2 2 21a)", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_12"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_12"),
+        )),
+    (1021, 8, 4, "C222a", "PG222", "ORTHORHOMBIC", "C 2 2 2a", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_0"),
+        )),
+    (1022, 16, 4, "F222a", "PG222", "ORTHORHOMBIC", "F 2 2 2a", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_0"),
+        ("Rot_X_Y_Z",     "Tr_0_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_12_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_12_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_0_12"),
+        ("Rot_X_Y_Z",     "Tr_12_0_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_12_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_12_12"),
+        ("Rot_X_Y_Z",     "Tr_12_12_0"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_0"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_0"),
+        )),
+    (1023, 8, 4, "I222a", "PG222", "ORTHORHOMBIC", "I 2 2 2a", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_12"),
+        )),
+    (1059, 8, 8, "Pmmn2", "PGmmm", "ORTHORHOMBIC", "P 21/m 21/m 2/n", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_0"),
+        ("Rot_mX_mY_mZ",  "Tr_0_0_0"),
+        ("Rot_X_Y_mZ",    "Tr_12_12_0"),
+        ("Rot_X_mY_Z",    "Tr_0_12_0"),
+        ("Rot_mX_Y_Z",    "Tr_12_0_0"),
+        )),
+    (1094, 8, 8, "P42212a", "PG422", "TETRAGONAL", "P 42 21 2a", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_mY_X_Z",    "Tr_0_12_12"),
+        ("Rot_Y_mX_Z",    "Tr_12_0_12"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_0"),
+        ("Rot_Y_X_mZ",    "Tr_0_0_12"),
+        ("Rot_mY_mX_mZ",  "Tr_12_12_12"),
+        )),
+    (1197, 24, 12, "I23a", "PG23", "CUBIC", "I 2 3a", (
+        ("Rot_X_Y_Z",     "Tr_0_0_0"),
+        ("Rot_mX_mY_Z",   "Tr_12_12_0"),
+        ("Rot_X_mY_mZ",   "Tr_12_0_0"),
+        ("Rot_mX_Y_mZ",   "Tr_0_12_0"),
+        ("Rot_Y_Z_X",     "Tr_0_0_0"),
+        ("Rot_mY_mZ_X",   "Tr_12_12_0"),
+        ("Rot_Y_mZ_mX",   "Tr_12_0_0"),
+        ("Rot_mY_Z_mX",   "Tr_0_12_0"),
+        ("Rot_Z_X_Y",     "Tr_0_0_0"),
+        ("Rot_mZ_mX_Y",   "Tr_12_12_0"),
+        ("Rot_Z_mX_mY",   "Tr_12_0_0"),
+        ("Rot_mZ_X_mY",   "Tr_0_12_0"),
+        ("Rot_X_Y_Z",     "Tr_12_12_12"),
+        ("Rot_mX_mY_Z",   "Tr_0_0_12"),
+        ("Rot_X_mY_mZ",   "Tr_0_12_12"),
+        ("Rot_mX_Y_mZ",   "Tr_12_0_12"),
+        ("Rot_Y_Z_X",     "Tr_12_12_12"),
+        ("Rot_mY_mZ_X",   "Tr_0_0_12"),
+        ("Rot_Y_mZ_mX",   "Tr_0_12_12"),
+        ("Rot_mY_Z_mX",   "Tr_12_0_12"),
+        ("Rot_Z_X_Y",     "Tr_12_12_12"),
+        ("Rot_mZ_mX_Y",   "Tr_0_0_12"),
+        ("Rot_Z_mX_mY",   "Tr_0_12_12"),
+        ("Rot_mZ_X_mY",   "Tr_12_0_12"),
+        )),
+    )
+
+
+## SpaceGroup objects built so far, by table index
+SPACE_GROUP_CACHE = {}
+
+## space group name/number -> table index, and the same for the
+## normalized names of normalize_space_group_name(); built on first lookup
+SPACE_GROUP_NAME_DICT = None
+SPACE_GROUP_NORMALIZED_NAME_DICT = None
+
+
+def construct_space_group(index):
+    """Returns the SpaceGroup for entry index of SPACE_GROUP_TABLE, building
+    it on first use.
+    """
+    try:
+        return SPACE_GROUP_CACHE[index]
+    except KeyError:
+        pass
+
+    (number, num_sym_equiv, num_primitive_sym_equiv, short_name,
+     point_group_name, crystal_system, pdb_name, symop_names) = SPACE_GROUP_TABLE[index]
+
+    module_dict = globals()
+    symop_list = [SymOp(module_dict[rot_name], module_dict[tr_name])
+                  for rot_name, tr_name in symop_names]
+
+    sg = SpaceGroup(
+        number                  = number,
+        num_sym_equiv           = num_sym_equiv,
+        num_primitive_sym_equiv = num_primitive_sym_equiv,
+        short_name              = short_name,
+        point_group_name        = point_group_name,
+        crystal_system          = crystal_system,
+        pdb_name                = pdb_name,
+        symop_list              = symop_list)
+
+    SPACE_GROUP_CACHE[index] = sg
+    return sg
+
+
+def normalize_space_group_name(name):
+    """Returns name with case and white space removed, so "p 21 21 21" and
+    "P212121" both become "P212121".  Space group numbers given as
+    strings become ints.
+    """
+    if isinstance(name, int):
+        return name
+    name = "".join(str(name).split()).upper()
+    if name.isdigit():
+        return int(name)
+    return name
+
+
+def get_space_group_name_dict():
+    """Returns the dictionary mapping every name accepted by
+    SpaceGroup.check_group_name() to the index of the first space group
+    in SPACE_GROUP_TABLE with that name.
+    """
+    global SPACE_GROUP_NAME_DICT
+    global SPACE_GROUP_NORMALIZED_NAME_DICT
+
+    if SPACE_GROUP_NAME_DICT is None:
+        name_dict = {}
+        normalized_name_dict = {}
+        for index, entry in enumerate(SPACE_GROUP_TABLE):
+            number, short_name, point_group_name, pdb_name = (
+                entry[0], entry[3], entry[4], entry[6])
+            for name in (short_name, pdb_name, point_group_name, number):
+                name_dict.setdefault(name, index)
+                normalized_name_dict.setdefault(
+                    normalize_space_group_name(name), index)
+        SPACE_GROUP_NAME_DICT = name_dict
+        SPACE_GROUP_NORMALIZED_NAME_DICT = normalized_name_dict
+
+    return SPACE_GROUP_NAME_DICT
+
+
+def get_space_group_index(name):
+    """Returns the SPACE_GROUP_TABLE index of the space group with the given
+    name or number, or None if it is not found.  Exact names are tried
+    first, then names compared without case and white space.
+    """
+    name_dict = get_space_group_name_dict()
+    try:
+        index = name_dict.get(name)
+    except TypeError:
+        return None
+    if index is None and name is not None:
+        index = SPACE_GROUP_NORMALIZED_NAME_DICT.get(
+            normalize_space_group_name(name))
+    return index
+
+
+def __getattr__(name):
+    """Builds the SpaceGroupList and sgN module attributes of the original
+    module on demand.
+    """
+    if name == "SpaceGroupList":
+        return [construct_space_group(index)
+                for index in range(len(SPACE_GROUP_TABLE))]
 
-## spacegroup definitions
-sg1 = SpaceGroup(
-    number                  = 1,
-    num_sym_equiv           = 1,
-    num_primitive_sym_equiv = 1,
-    short_name              = "P1",
-    point_group_name        = "PG1",
-    crystal_system          = "TRICLINIC",
-    pdb_name                = "P 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0)])
-
-sg2 = SpaceGroup(
-    number                  = 2,
-    num_sym_equiv           = 2,
-    num_primitive_sym_equiv = 2,
-    short_name              = "P-1",
-    point_group_name        = "PG1bar",
-    crystal_system          = "TRICLINIC",
-    pdb_name                = "P -1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0)])
-
-sg3 = SpaceGroup(
-    number                  = 3,
-    num_sym_equiv           = 2,
-    num_primitive_sym_equiv = 2,
-    short_name              = "P2",
-    point_group_name        = "PG2",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 2 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0)])
-
-sg4 = SpaceGroup(
-    number                  = 4,
-    num_sym_equiv           = 2,
-    num_primitive_sym_equiv = 2,
-    short_name              = "P21",
-    point_group_name        = "PG2",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 21 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0)])
-
-sg5 = SpaceGroup(
-    number                  = 5,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 2,
-    short_name              = "C2",
-    point_group_name        = "PG2",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "C 1 2 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0)])
-
-sg6 = SpaceGroup(
-    number                  = 6,
-    num_sym_equiv           = 2,
-    num_primitive_sym_equiv = 2,
-    short_name              = "Pm",
-    point_group_name        = "PGm",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 m 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0)])
-
-sg7 = SpaceGroup(
-    number                  = 7,
-    num_sym_equiv           = 2,
-    num_primitive_sym_equiv = 2,
-    short_name              = "Pc",
-    point_group_name        = "PGm",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 c 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12)])
-
-sg8 = SpaceGroup(
-    number                  = 8,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 2,
-    short_name              = "Cm",
-    point_group_name        = "PGm",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "C 1 m 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0)])
-
-sg9 = SpaceGroup(
-    number                  = 9,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 2,
-    short_name              = "Cc",
-    point_group_name        = "PGm",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "C 1 c 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12)])
-
-sg10 = SpaceGroup(
-    number                  = 10,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P2/m",
-    point_group_name        = "PG2/m",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 2/m 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0)])
-
-sg11 = SpaceGroup(
-    number                  = 11,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P21/m",
-    point_group_name        = "PG2/m",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 21/m 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_0)])
-
-sg12 = SpaceGroup(
-    number                  = 12,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "C2/m",
-    point_group_name        = "PG2/m",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "C 1 2/m 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0)])
-
-sg13 = SpaceGroup(
-    number                  = 13,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P2/c",
-    point_group_name        = "PG2/m",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 2/c 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12)])
-
-sg14 = SpaceGroup(
-    number                  = 14,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P21/c",
-    point_group_name        = "PG2/m",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 21/c 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12)])
-
-sg15 = SpaceGroup(
-    number                  = 15,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "C2/c",
-    point_group_name        = "PG2/m",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "C 1 2/c 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12)])
-
-sg16 = SpaceGroup(
-    number                  = 16,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P222",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 2 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0)])
-
-sg17 = SpaceGroup(
-    number                  = 17,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P2221",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 2 2 21",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0)])
-
-sg18 = SpaceGroup(
-    number                  = 18,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P21212",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21 21 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0)])
-
-sg19 = SpaceGroup(
-    number                  = 19,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P212121",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21 21 21",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0)])
-
-sg20 = SpaceGroup(
-    number                  = 20,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "C2221",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C 2 2 21",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0)])
-
-sg21 = SpaceGroup(
-    number                  = 21,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "C222",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C 2 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0)])
-
-sg22 = SpaceGroup(
-    number                  = 22,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 4,
-    short_name              = "F222",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "F 2 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0)])
-
-sg23 = SpaceGroup(
-    number                  = 23,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "I222",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "I 2 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12)])
-
-sg24 = SpaceGroup(
-    number                  = 24,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "I212121",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "I 21 21 21",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12)])
-
-sg25 = SpaceGroup(
-    number                  = 25,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Pmm2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P m m 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0)])
-
-sg26 = SpaceGroup(
-    number                  = 26,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Pmc21",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P m c 21",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0)])
-
-sg27 = SpaceGroup(
-    number                  = 27,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Pcc2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P c c 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12)])
-
-sg28 = SpaceGroup(
-    number                  = 28,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Pma2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P m a 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_0)])
-
-sg29 = SpaceGroup(
-    number                  = 29,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Pca21",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P c a 21",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_12)])
-
-sg30 = SpaceGroup(
-    number                  = 30,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Pnc2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P n c 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_12_12)])
-
-sg31 = SpaceGroup(
-    number                  = 31,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Pmn21",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P m n 21",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0)])
-
-sg32 = SpaceGroup(
-    number                  = 32,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Pba2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P b a 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg33 = SpaceGroup(
-    number                  = 33,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Pna21",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P n a 21",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12)])
-
-sg34 = SpaceGroup(
-    number                  = 34,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Pnn2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P n n 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12)])
-
-sg35 = SpaceGroup(
-    number                  = 35,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Cmm2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C m m 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg36 = SpaceGroup(
-    number                  = 36,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Cmc21",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C m c 21",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg37 = SpaceGroup(
-    number                  = 37,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Ccc2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C c c 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12)])
-
-sg38 = SpaceGroup(
-    number                  = 38,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Amm2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "A m m 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_12_12)])
-
-sg39 = SpaceGroup(
-    number                  = 39,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Abm2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "A b m 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12)])
-
-sg40 = SpaceGroup(
-    number                  = 40,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Ama2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "A m a 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12)])
-
-sg41 = SpaceGroup(
-    number                  = 41,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Aba2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "A b a 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_12)])
-
-sg42 = SpaceGroup(
-    number                  = 42,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Fmm2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "F m m 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg43 = SpaceGroup(
-    number                  = 43,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Fdd2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "F d d 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_14_14_14),
-        SymOp(Rot_mX_Y_Z,    Tr_14_14_14),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_14_34_34),
-        SymOp(Rot_mX_Y_Z,    Tr_14_34_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_34_14_34),
-        SymOp(Rot_mX_Y_Z,    Tr_34_14_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_34_34_14),
-        SymOp(Rot_mX_Y_Z,    Tr_34_34_14)])
-
-sg44 = SpaceGroup(
-    number                  = 44,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Imm2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "I m m 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12)])
-
-sg45 = SpaceGroup(
-    number                  = 45,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Iba2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "I b a 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12)])
-
-sg46 = SpaceGroup(
-    number                  = 46,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "Ima2",
-    point_group_name        = "PGmm2",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "I m a 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_12_12)])
-
-sg47 = SpaceGroup(
-    number                  = 47,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pmmm",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 2/m 2/m 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0)])
-
-sg48 = SpaceGroup(
-    number                  = 48,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pnnn",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 2/n 2/n 2/n",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12)])
-
-sg49 = SpaceGroup(
-    number                  = 49,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pccm",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 2/c 2/c 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12)])
-
-sg50 = SpaceGroup(
-    number                  = 50,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pban",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 2/b 2/a 2/n",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg51 = SpaceGroup(
-    number                  = 51,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pmma",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21/m 2/m 2/a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_0)])
-
-sg52 = SpaceGroup(
-    number                  = 52,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pnna",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 2/n 21/n 2/a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_12_12)])
-
-sg53 = SpaceGroup(
-    number                  = 53,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pmna",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 2/m 2/n 21/a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0)])
-
-sg54 = SpaceGroup(
-    number                  = 54,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pcca",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21/c 2/c 2/a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_12)])
-
-sg55 = SpaceGroup(
-    number                  = 55,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pbam",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21/b 21/a 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg56 = SpaceGroup(
-    number                  = 56,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pccn",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21/c 21/c 2/n",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_12)])
-
-sg57 = SpaceGroup(
-    number                  = 57,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pbcm",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 2/b 21/c 21/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_12_0)])
-
-sg58 = SpaceGroup(
-    number                  = 58,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pnnm",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21/n 21/n 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12)])
-
-sg59 = SpaceGroup(
-    number                  = 59,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pmmn",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21/m 21/m 2/n",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0)])
-
-sg60 = SpaceGroup(
-    number                  = 60,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pbcn",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21/b 2/c 21/n",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg61 = SpaceGroup(
-    number                  = 61,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pbca",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21/b 21/c 21/a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg62 = SpaceGroup(
-    number                  = 62,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pnma",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21/n 21/m 21/a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12)])
-
-sg63 = SpaceGroup(
-    number                  = 63,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Cmcm",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C 2/m 2/c 21/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg64 = SpaceGroup(
-    number                  = 64,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Cmca",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C 2/m 2/c 21/a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg65 = SpaceGroup(
-    number                  = 65,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Cmmm",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C 2/m 2/m 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg66 = SpaceGroup(
-    number                  = 66,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Cccm",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C 2/c 2/c 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12)])
-
-sg67 = SpaceGroup(
-    number                  = 67,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Cmma",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C 2/m 2/m 2/a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg68 = SpaceGroup(
-    number                  = 68,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Ccca",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C 2/c 2/c 2/a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_0_12),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_12_12)])
-
-sg69 = SpaceGroup(
-    number                  = 69,
-    num_sym_equiv           = 32,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Fmmm",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "F 2/m 2/m 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_0_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0)])
-
-sg70 = SpaceGroup(
-    number                  = 70,
-    num_sym_equiv           = 32,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Fddd",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "F 2/d 2/d 2/d",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_14_14_14),
-        SymOp(Rot_X_Y_mZ,    Tr_14_14_14),
-        SymOp(Rot_X_mY_Z,    Tr_14_14_14),
-        SymOp(Rot_mX_Y_Z,    Tr_14_14_14),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_14_34_34),
-        SymOp(Rot_X_Y_mZ,    Tr_14_34_34),
-        SymOp(Rot_X_mY_Z,    Tr_14_34_34),
-        SymOp(Rot_mX_Y_Z,    Tr_14_34_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_34_14_34),
-        SymOp(Rot_X_Y_mZ,    Tr_34_14_34),
-        SymOp(Rot_X_mY_Z,    Tr_34_14_34),
-        SymOp(Rot_mX_Y_Z,    Tr_34_14_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_34_34_14),
-        SymOp(Rot_X_Y_mZ,    Tr_34_34_14),
-        SymOp(Rot_X_mY_Z,    Tr_34_34_14),
-        SymOp(Rot_mX_Y_Z,    Tr_34_34_14)])
-
-sg71 = SpaceGroup(
-    number                  = 71,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Immm",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "I 2/m 2/m 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12)])
-
-sg72 = SpaceGroup(
-    number                  = 72,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Ibam",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "I 2/b 2/a 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12)])
-
-sg73 = SpaceGroup(
-    number                  = 73,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Ibca",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "I 21/b 21/c 21/a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12)])
-
-sg74 = SpaceGroup(
-    number                  = 74,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Imma",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "I 21/m 21/m 21/a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12)])
-
-sg75 = SpaceGroup(
-    number                  = 75,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P4",
-    point_group_name        = "PG4",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0)])
-
-sg76 = SpaceGroup(
-    number                  = 76,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P41",
-    point_group_name        = "PG4",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 41",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_14),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_34)])
-
-sg77 = SpaceGroup(
-    number                  = 77,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P42",
-    point_group_name        = "PG4",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_12),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_12)])
-
-sg78 = SpaceGroup(
-    number                  = 78,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P43",
-    point_group_name        = "PG4",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 43",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_34),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_14)])
-
-sg79 = SpaceGroup(
-    number                  = 79,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "I4",
-    point_group_name        = "PG4",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 4",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12)])
-
-sg80 = SpaceGroup(
-    number                  = 80,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "I41",
-    point_group_name        = "PG4",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 41",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_12_14),
-        SymOp(Rot_Y_mX_Z,    Tr_12_0_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_0_34),
-        SymOp(Rot_Y_mX_Z,    Tr_0_12_14)])
-
-sg81 = SpaceGroup(
-    number                  = 81,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P-4",
-    point_group_name        = "PG4bar",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P -4",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0)])
-
-sg82 = SpaceGroup(
-    number                  = 82,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "I-4",
-    point_group_name        = "PG4bar",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I -4",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12)])
-
-sg83 = SpaceGroup(
-    number                  = 83,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P4/m",
-    point_group_name        = "PG4/m",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0)])
-
-sg84 = SpaceGroup(
-    number                  = 84,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P42/m",
-    point_group_name        = "PG4/m",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_12),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_12)])
-
-sg85 = SpaceGroup(
-    number                  = 85,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P4/n",
-    point_group_name        = "PG4/m",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4/n",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_0),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0)])
-
-sg86 = SpaceGroup(
-    number                  = 86,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P42/n",
-    point_group_name        = "PG4/m",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42/n",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0)])
-
-sg87 = SpaceGroup(
-    number                  = 87,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "I4/m",
-    point_group_name        = "PG4/m",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 4/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12)])
-
-sg88 = SpaceGroup(
-    number                  = 88,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "I41/a",
-    point_group_name        = "PG4/m",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 41/a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_12_14),
-        SymOp(Rot_Y_mX_Z,    Tr_12_0_34),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_12_14),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_34),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_0_34),
-        SymOp(Rot_Y_mX_Z,    Tr_0_12_14),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_0_34),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_14),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0)])
-
-sg89 = SpaceGroup(
-    number                  = 89,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P422",
-    point_group_name        = "PG422",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0)])
-
-sg90 = SpaceGroup(
-    number                  = 90,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P4212",
-    point_group_name        = "PG422",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4 21 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_0),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0)])
-
-sg91 = SpaceGroup(
-    number                  = 91,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P4122",
-    point_group_name        = "PG422",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 41 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_14),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_34),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_34),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_14)])
-
-sg92 = SpaceGroup(
-    number                  = 92,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P41212",
-    point_group_name        = "PG422",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 41 21 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_14),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_34),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_14),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_34),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12)])
-
-sg93 = SpaceGroup(
-    number                  = 93,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P4222",
-    point_group_name        = "PG422",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_12),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12)])
-
-sg94 = SpaceGroup(
-    number                  = 94,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P42212",
-    point_group_name        = "PG422",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42 21 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0)])
-
-sg95 = SpaceGroup(
-    number                  = 95,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P4322",
-    point_group_name        = "PG422",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 43 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_34),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_14),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_14),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_34)])
-
-sg96 = SpaceGroup(
-    number                  = 96,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P43212",
-    point_group_name        = "PG422",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 43 21 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_34),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_14),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_34),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_14),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12)])
-
-sg97 = SpaceGroup(
-    number                  = 97,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "I422",
-    point_group_name        = "PG422",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 4 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12)])
-
-sg98 = SpaceGroup(
-    number                  = 98,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "I4122",
-    point_group_name        = "PG422",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 41 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_12_14),
-        SymOp(Rot_Y_mX_Z,    Tr_12_0_34),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_34),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_14),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_0_34),
-        SymOp(Rot_Y_mX_Z,    Tr_0_12_14),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_14),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_34),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12)])
-
-sg99 = SpaceGroup(
-    number                  = 99,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P4mm",
-    point_group_name        = "PG4mm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4 m m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0)])
-
-sg100 = SpaceGroup(
-    number                  = 100,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P4bm",
-    point_group_name        = "PG4mm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4 b m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_0)])
-
-sg101 = SpaceGroup(
-    number                  = 101,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P42cm",
-    point_group_name        = "PG4mm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42 c m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_12),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0)])
-
-sg102 = SpaceGroup(
-    number                  = 102,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P42nm",
-    point_group_name        = "PG4mm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42 n m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0)])
-
-sg103 = SpaceGroup(
-    number                  = 103,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P4cc",
-    point_group_name        = "PG4mm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4 c c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12)])
-
-sg104 = SpaceGroup(
-    number                  = 104,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P4nc",
-    point_group_name        = "PG4mm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4 n c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12)])
-
-sg105 = SpaceGroup(
-    number                  = 105,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P42mc",
-    point_group_name        = "PG4mm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42 m c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_12),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12)])
-
-sg106 = SpaceGroup(
-    number                  = 106,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P42bc",
-    point_group_name        = "PG4mm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42 b c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_12),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12)])
-
-sg107 = SpaceGroup(
-    number                  = 107,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "I4mm",
-    point_group_name        = "PG4mm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 4 m m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12)])
-
-sg108 = SpaceGroup(
-    number                  = 108,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "I4cm",
-    point_group_name        = "PG4mm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 4 c m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_0)])
-
-sg109 = SpaceGroup(
-    number                  = 109,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "I41md",
-    point_group_name        = "PG4mm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 41 m d",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_12_14),
-        SymOp(Rot_Y_mX_Z,    Tr_12_0_34),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_12_14),
-        SymOp(Rot_Y_X_Z,     Tr_12_0_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_0_34),
-        SymOp(Rot_Y_mX_Z,    Tr_0_12_14),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_0_34),
-        SymOp(Rot_Y_X_Z,     Tr_0_12_14)])
-
-sg110 = SpaceGroup(
-    number                  = 110,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "I41cd",
-    point_group_name        = "PG4mm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 41 c d",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_12_14),
-        SymOp(Rot_Y_mX_Z,    Tr_12_0_34),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_12_34),
-        SymOp(Rot_Y_X_Z,     Tr_12_0_14),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_0_34),
-        SymOp(Rot_Y_mX_Z,    Tr_0_12_14),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_0_14),
-        SymOp(Rot_Y_X_Z,     Tr_0_12_34)])
-
-sg111 = SpaceGroup(
-    number                  = 111,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P-42m",
-    point_group_name        = "PG4bar2m",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P -4 2 m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0)])
-
-sg112 = SpaceGroup(
-    number                  = 112,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P-42c",
-    point_group_name        = "PG4bar2m",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P -4 2 c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12)])
-
-sg113 = SpaceGroup(
-    number                  = 113,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P-421m",
-    point_group_name        = "PG4bar2m",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P -4 21 m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_0)])
-
-sg114 = SpaceGroup(
-    number                  = 114,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P-421c",
-    point_group_name        = "PG4bar2m",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P -4 21 c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12)])
-
-sg115 = SpaceGroup(
-    number                  = 115,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P-4m2",
-    point_group_name        = "PG4barm2",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P -4 m 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0)])
-
-sg116 = SpaceGroup(
-    number                  = 116,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P-4c2",
-    point_group_name        = "PG4barm2",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P -4 c 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12)])
-
-sg117 = SpaceGroup(
-    number                  = 117,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P-4b2",
-    point_group_name        = "PG4barm2",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P -4 b 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_0)])
-
-sg118 = SpaceGroup(
-    number                  = 118,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P-4n2",
-    point_group_name        = "PG4barm2",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P -4 n 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12)])
-
-sg119 = SpaceGroup(
-    number                  = 119,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "I-4m2",
-    point_group_name        = "PG4barm2",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I -4 m 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12)])
-
-sg120 = SpaceGroup(
-    number                  = 120,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "I-4c2",
-    point_group_name        = "PG4barm2",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I -4 c 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_0)])
-
-sg121 = SpaceGroup(
-    number                  = 121,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "I-42m",
-    point_group_name        = "PG4bar2m",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I -4 2 m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12)])
-
-sg122 = SpaceGroup(
-    number                  = 122,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 8,
-    short_name              = "I-42d",
-    point_group_name        = "PG4bar2m",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I -4 2 d",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_34),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_34),
-        SymOp(Rot_mY_mX_Z,   Tr_12_0_34),
-        SymOp(Rot_Y_X_Z,     Tr_12_0_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_14),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_14),
-        SymOp(Rot_mY_mX_Z,   Tr_0_12_14),
-        SymOp(Rot_Y_X_Z,     Tr_0_12_14)])
-
-sg123 = SpaceGroup(
-    number                  = 123,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P4/mmm",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4/m 2/m 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0)])
-
-sg124 = SpaceGroup(
-    number                  = 124,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P4/mcc",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4/m 2/c 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12)])
-
-sg125 = SpaceGroup(
-    number                  = 125,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P4/nbm",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4/n 2/b 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_0),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_0)])
-
-sg126 = SpaceGroup(
-    number                  = 126,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P4/nnc",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4/n 2/n 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12)])
-
-sg127 = SpaceGroup(
-    number                  = 127,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P4/mbm",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4/m 21/b 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_0)])
-
-sg128 = SpaceGroup(
-    number                  = 128,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P4/mnc",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4/m 21/n 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12)])
-
-sg129 = SpaceGroup(
-    number                  = 129,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P4/nmm",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4/n 21/m 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_0),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_0)])
-
-sg130 = SpaceGroup(
-    number                  = 130,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P4/ncc",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 4/n 2/c 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_0),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12)])
-
-sg131 = SpaceGroup(
-    number                  = 131,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P42/mmc",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42/m 2/m 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_12),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12)])
-
-sg132 = SpaceGroup(
-    number                  = 132,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P42/mcm",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42/m 2/c 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_12),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0)])
-
-sg133 = SpaceGroup(
-    number                  = 133,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P42/nbc",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42/n 2/b 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12)])
-
-sg134 = SpaceGroup(
-    number                  = 134,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P42/nnm",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42/n 2/n 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0)])
-
-sg135 = SpaceGroup(
-    number                  = 135,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P42/mbc",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42/m 21/b 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_12),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12)])
-
-sg136 = SpaceGroup(
-    number                  = 136,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P42/mnm",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42/m 21/n 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0)])
-
-sg137 = SpaceGroup(
-    number                  = 137,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P42/nmc",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42/n 21/m 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12)])
-
-sg138 = SpaceGroup(
-    number                  = 138,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 16,
-    short_name              = "P42/ncm",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42/n 21/c 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_0)])
-
-sg139 = SpaceGroup(
-    number                  = 139,
-    num_sym_equiv           = 32,
-    num_primitive_sym_equiv = 16,
-    short_name              = "I4/mmm",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 4/m 2/m 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12)])
-
-sg140 = SpaceGroup(
-    number                  = 140,
-    num_sym_equiv           = 32,
-    num_primitive_sym_equiv = 16,
-    short_name              = "I4/mcm",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 4/m 2/c 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_0)])
-
-sg141 = SpaceGroup(
-    number                  = 141,
-    num_sym_equiv           = 32,
-    num_primitive_sym_equiv = 16,
-    short_name              = "I41/amd",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 41/a 2/m 2/d",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_12_14),
-        SymOp(Rot_Y_mX_Z,    Tr_12_0_34),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_34),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_14),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_12_14),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_34),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_0_34),
-        SymOp(Rot_Y_X_Z,     Tr_0_12_14),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_0_34),
-        SymOp(Rot_Y_mX_Z,    Tr_0_12_14),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_14),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_34),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_0_34),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_14),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_12_14),
-        SymOp(Rot_Y_X_Z,     Tr_12_0_34)])
-
-sg142 = SpaceGroup(
-    number                  = 142,
-    num_sym_equiv           = 32,
-    num_primitive_sym_equiv = 16,
-    short_name              = "I41/acd",
-    point_group_name        = "PG4/mmm",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "I 41/a 2/c 2/d",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_12_14),
-        SymOp(Rot_Y_mX_Z,    Tr_12_0_34),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_14),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_34),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_12_14),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_34),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_0_14),
-        SymOp(Rot_Y_X_Z,     Tr_0_12_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_0_34),
-        SymOp(Rot_Y_mX_Z,    Tr_0_12_14),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_34),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_14),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_0_34),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_14),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_12_34),
-        SymOp(Rot_Y_X_Z,     Tr_12_0_14)])
-
-sg143 = SpaceGroup(
-    number                  = 143,
-    num_sym_equiv           = 3,
-    num_primitive_sym_equiv = 3,
-    short_name              = "P3",
-    point_group_name        = "PG3",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0)])
-
-sg144 = SpaceGroup(
-    number                  = 144,
-    num_sym_equiv           = 3,
-    num_primitive_sym_equiv = 3,
-    short_name              = "P31",
-    point_group_name        = "PG3",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 31",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_23)])
-
-sg145 = SpaceGroup(
-    number                  = 145,
-    num_sym_equiv           = 3,
-    num_primitive_sym_equiv = 3,
-    short_name              = "P32",
-    point_group_name        = "PG3",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 32",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_13)])
-
-sg146 = SpaceGroup(
-    number                  = 146,
-    num_sym_equiv           = 9,
-    num_primitive_sym_equiv = 3,
-    short_name              = "H3",
-    point_group_name        = "PG3",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "H 3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_23_13_13),
-        SymOp(Rot_mY_XmY_Z,  Tr_23_13_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_23_13_13),
-        SymOp(Rot_X_Y_Z,     Tr_13_23_23),
-        SymOp(Rot_mY_XmY_Z,  Tr_13_23_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_13_23_23)])
-
-sg1146 = SpaceGroup(
-    number                  = 1146,
-    num_sym_equiv           = 3,
-    num_primitive_sym_equiv = 3,
-    short_name              = "R3",
-    point_group_name        = "PG3",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "R 3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0)])
-
-sg147 = SpaceGroup(
-    number                  = 147,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P-3",
-    point_group_name        = "PG3bar",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P -3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0)])
-
-sg148 = SpaceGroup(
-    number                  = 148,
-    num_sym_equiv           = 18,
-    num_primitive_sym_equiv = 6,
-    short_name              = "H-3",
-    point_group_name        = "PG3bar",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "H -3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_23_13_13),
-        SymOp(Rot_mY_XmY_Z,  Tr_23_13_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_23_13_13),
-        SymOp(Rot_mX_mY_mZ,  Tr_23_13_13),
-        SymOp(Rot_Y_mXY_mZ,  Tr_23_13_13),
-        SymOp(Rot_XmY_X_mZ,  Tr_23_13_13),
-        SymOp(Rot_X_Y_Z,     Tr_13_23_23),
-        SymOp(Rot_mY_XmY_Z,  Tr_13_23_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_13_23_23),
-        SymOp(Rot_mX_mY_mZ,  Tr_13_23_23),
-        SymOp(Rot_Y_mXY_mZ,  Tr_13_23_23),
-        SymOp(Rot_XmY_X_mZ,  Tr_13_23_23)])
-
-sg1148 = SpaceGroup(
-    number                  = 1148,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "R-3",
-    point_group_name        = "PG3bar",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "R -3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0)])
-
-sg149 = SpaceGroup(
-    number                  = 149,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P312",
-    point_group_name        = "PG312",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 3 1 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_0)])
-
-sg150 = SpaceGroup(
-    number                  = 150,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P321",
-    point_group_name        = "PG321",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 3 2 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_0)])
-
-sg151 = SpaceGroup(
-    number                  = 151,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P3112",
-    point_group_name        = "PG312",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 31 1 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_23),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_23),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_13),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_0)])
-
-sg152 = SpaceGroup(
-    number                  = 152,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P3121",
-    point_group_name        = "PG321",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 31 2 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_23),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_23),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_13)])
-
-sg153 = SpaceGroup(
-    number                  = 153,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P3212",
-    point_group_name        = "PG312",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 32 1 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_13),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_13),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_23),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_0)])
-
-sg154 = SpaceGroup(
-    number                  = 154,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P3221",
-    point_group_name        = "PG321",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 32 2 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_13),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_13),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_23)])
-
-sg155 = SpaceGroup(
-    number                  = 155,
-    num_sym_equiv           = 18,
-    num_primitive_sym_equiv = 6,
-    short_name              = "H32",
-    point_group_name        = "PG321",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "H 3 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_23_13_13),
-        SymOp(Rot_mY_XmY_Z,  Tr_23_13_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_23_13_13),
-        SymOp(Rot_Y_X_mZ,    Tr_23_13_13),
-        SymOp(Rot_XmY_mY_mZ, Tr_23_13_13),
-        SymOp(Rot_mX_mXY_mZ, Tr_23_13_13),
-        SymOp(Rot_X_Y_Z,     Tr_13_23_23),
-        SymOp(Rot_mY_XmY_Z,  Tr_13_23_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_13_23_23),
-        SymOp(Rot_Y_X_mZ,    Tr_13_23_23),
-        SymOp(Rot_XmY_mY_mZ, Tr_13_23_23),
-        SymOp(Rot_mX_mXY_mZ, Tr_13_23_23)])
-
-sg1155 = SpaceGroup(
-    number                  = 1155,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "R32",
-    point_group_name        = "PG32",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "R 3 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_0_0)])
-
-sg156 = SpaceGroup(
-    number                  = 156,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P3m1",
-    point_group_name        = "PG3m1",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 3 m 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_0),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_0)])
-
-sg157 = SpaceGroup(
-    number                  = 157,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P31m",
-    point_group_name        = "PG31m",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 3 1 m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_0)])
-
-sg158 = SpaceGroup(
-    number                  = 158,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P3c1",
-    point_group_name        = "PG3m1",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 3 c 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_12),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_12)])
-
-sg159 = SpaceGroup(
-    number                  = 159,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P31c",
-    point_group_name        = "PG31m",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P 3 1 c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_12),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_12)])
-
-sg160 = SpaceGroup(
-    number                  = 160,
-    num_sym_equiv           = 18,
-    num_primitive_sym_equiv = 6,
-    short_name              = "H3m",
-    point_group_name        = "PG3m",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "H 3 m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_0),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_23_13_13),
-        SymOp(Rot_mY_XmY_Z,  Tr_23_13_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_23_13_13),
-        SymOp(Rot_mY_mX_Z,   Tr_23_13_13),
-        SymOp(Rot_mXY_Y_Z,   Tr_23_13_13),
-        SymOp(Rot_X_XmY_Z,   Tr_23_13_13),
-        SymOp(Rot_X_Y_Z,     Tr_13_23_23),
-        SymOp(Rot_mY_XmY_Z,  Tr_13_23_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_13_23_23),
-        SymOp(Rot_mY_mX_Z,   Tr_13_23_23),
-        SymOp(Rot_mXY_Y_Z,   Tr_13_23_23),
-        SymOp(Rot_X_XmY_Z,   Tr_13_23_23)])
-
-sg1160 = SpaceGroup(
-    number                  = 1160,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "R3m",
-    point_group_name        = "PG3m",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "R 3 m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_0)])
-
-sg161 = SpaceGroup(
-    number                  = 161,
-    num_sym_equiv           = 18,
-    num_primitive_sym_equiv = 6,
-    short_name              = "H3c",
-    point_group_name        = "PG3m",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "H 3 c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_12),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_23_13_13),
-        SymOp(Rot_mY_XmY_Z,  Tr_23_13_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_23_13_13),
-        SymOp(Rot_mY_mX_Z,   Tr_23_13_56),
-        SymOp(Rot_mXY_Y_Z,   Tr_23_13_56),
-        SymOp(Rot_X_XmY_Z,   Tr_23_13_56),
-        SymOp(Rot_X_Y_Z,     Tr_13_23_23),
-        SymOp(Rot_mY_XmY_Z,  Tr_13_23_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_13_23_23),
-        SymOp(Rot_mY_mX_Z,   Tr_13_23_16),
-        SymOp(Rot_mXY_Y_Z,   Tr_13_23_16),
-        SymOp(Rot_X_XmY_Z,   Tr_13_23_16)])
-
-sg1161 = SpaceGroup(
-    number                  = 1161,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "R3c",
-    point_group_name        = "PG3m",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "R 3 c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_12)])
-
-sg162 = SpaceGroup(
-    number                  = 162,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P-31m",
-    point_group_name        = "PG3bar1m",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P -3 1 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_0)])
-
-sg163 = SpaceGroup(
-    number                  = 163,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P-31c",
-    point_group_name        = "PG3bar1m",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P -3 1 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_12),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_12),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_12)])
-
-sg164 = SpaceGroup(
-    number                  = 164,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P-3m1",
-    point_group_name        = "PG3barm1",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P -3 2/m 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_0),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_0)])
-
-sg165 = SpaceGroup(
-    number                  = 165,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P-3c1",
-    point_group_name        = "PG3barm1",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "P -3 2/c 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_12),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_12),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_12)])
-
-sg166 = SpaceGroup(
-    number                  = 166,
-    num_sym_equiv           = 36,
-    num_primitive_sym_equiv = 12,
-    short_name              = "H-3m",
-    point_group_name        = "PG3barm",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "H -3 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_0),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_23_13_13),
-        SymOp(Rot_mY_XmY_Z,  Tr_23_13_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_23_13_13),
-        SymOp(Rot_Y_X_mZ,    Tr_23_13_13),
-        SymOp(Rot_XmY_mY_mZ, Tr_23_13_13),
-        SymOp(Rot_mX_mXY_mZ, Tr_23_13_13),
-        SymOp(Rot_mX_mY_mZ,  Tr_23_13_13),
-        SymOp(Rot_Y_mXY_mZ,  Tr_23_13_13),
-        SymOp(Rot_XmY_X_mZ,  Tr_23_13_13),
-        SymOp(Rot_mY_mX_Z,   Tr_23_13_13),
-        SymOp(Rot_mXY_Y_Z,   Tr_23_13_13),
-        SymOp(Rot_X_XmY_Z,   Tr_23_13_13),
-        SymOp(Rot_X_Y_Z,     Tr_13_23_23),
-        SymOp(Rot_mY_XmY_Z,  Tr_13_23_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_13_23_23),
-        SymOp(Rot_Y_X_mZ,    Tr_13_23_23),
-        SymOp(Rot_XmY_mY_mZ, Tr_13_23_23),
-        SymOp(Rot_mX_mXY_mZ, Tr_13_23_23),
-        SymOp(Rot_mX_mY_mZ,  Tr_13_23_23),
-        SymOp(Rot_Y_mXY_mZ,  Tr_13_23_23),
-        SymOp(Rot_XmY_X_mZ,  Tr_13_23_23),
-        SymOp(Rot_mY_mX_Z,   Tr_13_23_23),
-        SymOp(Rot_mXY_Y_Z,   Tr_13_23_23),
-        SymOp(Rot_X_XmY_Z,   Tr_13_23_23)])
-
-sg1166 = SpaceGroup(
-    number                  = 1166,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "R-3m",
-    point_group_name        = "PG3barm",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "R -3 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_0)])
-
-sg167 = SpaceGroup(
-    number                  = 167,
-    num_sym_equiv           = 36,
-    num_primitive_sym_equiv = 12,
-    short_name              = "H-3c",
-    point_group_name        = "PG3barm",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "H -3 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_12),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_12),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_23_13_13),
-        SymOp(Rot_mY_XmY_Z,  Tr_23_13_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_23_13_13),
-        SymOp(Rot_Y_X_mZ,    Tr_23_13_56),
-        SymOp(Rot_XmY_mY_mZ, Tr_23_13_56),
-        SymOp(Rot_mX_mXY_mZ, Tr_23_13_56),
-        SymOp(Rot_mX_mY_mZ,  Tr_23_13_13),
-        SymOp(Rot_Y_mXY_mZ,  Tr_23_13_13),
-        SymOp(Rot_XmY_X_mZ,  Tr_23_13_13),
-        SymOp(Rot_mY_mX_Z,   Tr_23_13_56),
-        SymOp(Rot_mXY_Y_Z,   Tr_23_13_56),
-        SymOp(Rot_X_XmY_Z,   Tr_23_13_56),
-        SymOp(Rot_X_Y_Z,     Tr_13_23_23),
-        SymOp(Rot_mY_XmY_Z,  Tr_13_23_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_13_23_23),
-        SymOp(Rot_Y_X_mZ,    Tr_13_23_16),
-        SymOp(Rot_XmY_mY_mZ, Tr_13_23_16),
-        SymOp(Rot_mX_mXY_mZ, Tr_13_23_16),
-        SymOp(Rot_mX_mY_mZ,  Tr_13_23_23),
-        SymOp(Rot_Y_mXY_mZ,  Tr_13_23_23),
-        SymOp(Rot_XmY_X_mZ,  Tr_13_23_23),
-        SymOp(Rot_mY_mX_Z,   Tr_13_23_16),
-        SymOp(Rot_mXY_Y_Z,   Tr_13_23_16),
-        SymOp(Rot_X_XmY_Z,   Tr_13_23_16)])
-
-sg1167 = SpaceGroup(
-    number                  = 1167,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "R-3c",
-    point_group_name        = "PG3barm",
-    crystal_system          = "TRIGONAL",
-    pdb_name                = "R -3 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12),
-        SymOp(Rot_mX_mZ_mY,  Tr_12_12_12),
-        SymOp(Rot_mZ_mY_mX,  Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_12)])
-
-sg168 = SpaceGroup(
-    number                  = 168,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P6",
-    point_group_name        = "PG6",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 6",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_0),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_0)])
-
-sg169 = SpaceGroup(
-    number                  = 169,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P61",
-    point_group_name        = "PG6",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 61",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_23),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_56),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_16)])
-
-sg170 = SpaceGroup(
-    number                  = 170,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P65",
-    point_group_name        = "PG6",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 65",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_13),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_16),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_56)])
-
-sg171 = SpaceGroup(
-    number                  = 171,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P62",
-    point_group_name        = "PG6",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 62",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_13),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_23),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_13)])
-
-sg172 = SpaceGroup(
-    number                  = 172,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P64",
-    point_group_name        = "PG6",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 64",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_23),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_13),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_23)])
-
-sg173 = SpaceGroup(
-    number                  = 173,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P63",
-    point_group_name        = "PG6",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 63",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_12),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_12)])
-
-sg174 = SpaceGroup(
-    number                  = 174,
-    num_sym_equiv           = 6,
-    num_primitive_sym_equiv = 6,
-    short_name              = "P-6",
-    point_group_name        = "PG6bar",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P -6",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_XmY_mZ, Tr_0_0_0),
-        SymOp(Rot_mXY_mX_mZ, Tr_0_0_0)])
-
-sg175 = SpaceGroup(
-    number                  = 175,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P6/m",
-    point_group_name        = "PG6/m",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 6/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_0),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_XmY_mZ, Tr_0_0_0),
-        SymOp(Rot_mXY_mX_mZ, Tr_0_0_0)])
-
-sg176 = SpaceGroup(
-    number                  = 176,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P63/m",
-    point_group_name        = "PG6/m",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 63/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_12),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_XmY_mZ, Tr_0_0_12),
-        SymOp(Rot_mXY_mX_mZ, Tr_0_0_12)])
-
-sg177 = SpaceGroup(
-    number                  = 177,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P622",
-    point_group_name        = "PG622",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 6 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_0),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_0)])
-
-sg178 = SpaceGroup(
-    number                  = 178,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P6122",
-    point_group_name        = "PG622",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 61 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_23),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_56),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_16),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_13),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_23),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_56),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_12),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_16)])
-
-sg179 = SpaceGroup(
-    number                  = 179,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P6522",
-    point_group_name        = "PG622",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 65 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_13),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_16),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_56),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_23),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_13),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_16),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_12),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_56)])
-
-sg180 = SpaceGroup(
-    number                  = 180,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P6222",
-    point_group_name        = "PG622",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 62 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_23),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_13),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_23),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_13),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_23),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_13),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_23),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_13)])
-
-sg181 = SpaceGroup(
-    number                  = 181,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P6422",
-    point_group_name        = "PG622",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 64 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_13),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_23),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_13),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_23),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_13),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_23),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_13),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_23)])
-
-sg182 = SpaceGroup(
-    number                  = 182,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P6322",
-    point_group_name        = "PG622",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 63 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_12),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_12),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_12)])
-
-sg183 = SpaceGroup(
-    number                  = 183,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P6mm",
-    point_group_name        = "PG6mm",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 6 m m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_0),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_0),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_0)])
-
-sg184 = SpaceGroup(
-    number                  = 184,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P6cc",
-    point_group_name        = "PG6mm",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 6 c c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_0),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_12),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_12),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_12)])
-
-sg185 = SpaceGroup(
-    number                  = 185,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P63cm",
-    point_group_name        = "PG6mm",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 63 c m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_12),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_12),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_0)])
-
-sg186 = SpaceGroup(
-    number                  = 186,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P63mc",
-    point_group_name        = "PG6mm",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 63 m c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_12),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_0),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_12),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_12)])
-
-sg187 = SpaceGroup(
-    number                  = 187,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P-6m2",
-    point_group_name        = "PG6barm2",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P -6 m 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_XmY_mZ, Tr_0_0_0),
-        SymOp(Rot_mXY_mX_mZ, Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_0),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_0)])
-
-sg188 = SpaceGroup(
-    number                  = 188,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P-6c2",
-    point_group_name        = "PG6barm2",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P -6 c 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_XmY_mZ, Tr_0_0_12),
-        SymOp(Rot_mXY_mX_mZ, Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_12),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_0)])
-
-sg189 = SpaceGroup(
-    number                  = 189,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P-62m",
-    point_group_name        = "PG6bar2m",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P -6 2 m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_XmY_mZ, Tr_0_0_0),
-        SymOp(Rot_mXY_mX_mZ, Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_0)])
-
-sg190 = SpaceGroup(
-    number                  = 190,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P-62c",
-    point_group_name        = "PG6bar2m",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P -6 2 c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_XmY_mZ, Tr_0_0_12),
-        SymOp(Rot_mXY_mX_mZ, Tr_0_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_12),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_12)])
-
-sg191 = SpaceGroup(
-    number                  = 191,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "P6/mmm",
-    point_group_name        = "PG6/mmm",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 6/m 2/m 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_0),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_mXY_mX_mZ, Tr_0_0_0),
-        SymOp(Rot_mY_XmY_mZ, Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_0),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_0)])
-
-sg192 = SpaceGroup(
-    number                  = 192,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "P6/mcc",
-    point_group_name        = "PG6/mmm",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 6/m 2/c 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_0),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_12),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_12),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_mXY_mX_mZ, Tr_0_0_0),
-        SymOp(Rot_mY_XmY_mZ, Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_12),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_12),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_12)])
-
-sg193 = SpaceGroup(
-    number                  = 193,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "P63/mcm",
-    point_group_name        = "PG6/mmm",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 63/m 2/c 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_12),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_12),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_12),
-        SymOp(Rot_mXY_mX_mZ, Tr_0_0_12),
-        SymOp(Rot_mY_XmY_mZ, Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_12),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_0)])
-
-sg194 = SpaceGroup(
-    number                  = 194,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "P63/mmc",
-    point_group_name        = "PG6/mmm",
-    crystal_system          = "HEXAGONAL",
-    pdb_name                = "P 63/m 2/m 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_XmY_Z,  Tr_0_0_0),
-        SymOp(Rot_mXY_mX_Z,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_mXY_Z,   Tr_0_0_12),
-        SymOp(Rot_XmY_X_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_XmY_mY_mZ, Tr_0_0_0),
-        SymOp(Rot_mX_mXY_mZ, Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12),
-        SymOp(Rot_mXY_Y_mZ,  Tr_0_0_12),
-        SymOp(Rot_X_XmY_mZ,  Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mXY_mZ,  Tr_0_0_0),
-        SymOp(Rot_XmY_X_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_12),
-        SymOp(Rot_mXY_mX_mZ, Tr_0_0_12),
-        SymOp(Rot_mY_XmY_mZ, Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_mXY_Y_Z,   Tr_0_0_0),
-        SymOp(Rot_X_XmY_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12),
-        SymOp(Rot_XmY_mY_Z,  Tr_0_0_12),
-        SymOp(Rot_mX_mXY_Z,  Tr_0_0_12)])
-
-sg195 = SpaceGroup(
-    number                  = 195,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P23",
-    point_group_name        = "PG23",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 2 3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0)])
-
-sg196 = SpaceGroup(
-    number                  = 196,
-    num_sym_equiv           = 48,
-    num_primitive_sym_equiv = 12,
-    short_name              = "F23",
-    point_group_name        = "PG23",
-    crystal_system          = "CUBIC",
-    pdb_name                = "F 2 3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_0_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_0_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_0_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_0),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_0)])
-
-sg197 = SpaceGroup(
-    number                  = 197,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 12,
-    short_name              = "I23",
-    point_group_name        = "PG23",
-    crystal_system          = "CUBIC",
-    pdb_name                = "I 2 3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_12)])
-
-sg198 = SpaceGroup(
-    number                  = 198,
-    num_sym_equiv           = 12,
-    num_primitive_sym_equiv = 12,
-    short_name              = "P213",
-    point_group_name        = "PG23",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 21 3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12)])
-
-sg199 = SpaceGroup(
-    number                  = 199,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 12,
-    short_name              = "I213",
-    point_group_name        = "PG23",
-    crystal_system          = "CUBIC",
-    pdb_name                = "I 21 3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_0)])
-
-sg200 = SpaceGroup(
-    number                  = 200,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "Pm-3",
-    point_group_name        = "PGm3bar",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 2/m -3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_X_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_X_mY,    Tr_0_0_0),
-        SymOp(Rot_Z_mX_Y,    Tr_0_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_mZ_X,    Tr_0_0_0),
-        SymOp(Rot_mY_Z_X,    Tr_0_0_0),
-        SymOp(Rot_Y_Z_mX,    Tr_0_0_0)])
-
-sg201 = SpaceGroup(
-    number                  = 201,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "Pn-3",
-    point_group_name        = "PGm3bar",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 2/n -3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_12_12),
-        SymOp(Rot_mZ_X_Y,    Tr_12_12_12),
-        SymOp(Rot_Z_X_mY,    Tr_12_12_12),
-        SymOp(Rot_Z_mX_Y,    Tr_12_12_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_12_12),
-        SymOp(Rot_Y_mZ_X,    Tr_12_12_12),
-        SymOp(Rot_mY_Z_X,    Tr_12_12_12),
-        SymOp(Rot_Y_Z_mX,    Tr_12_12_12)])
-
-sg202 = SpaceGroup(
-    number                  = 202,
-    num_sym_equiv           = 96,
-    num_primitive_sym_equiv = 24,
-    short_name              = "Fm-3",
-    point_group_name        = "PGm3bar",
-    crystal_system          = "CUBIC",
-    pdb_name                = "F 2/m -3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_X_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_X_mY,    Tr_0_0_0),
-        SymOp(Rot_Z_mX_Y,    Tr_0_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_mZ_X,    Tr_0_0_0),
-        SymOp(Rot_mY_Z_X,    Tr_0_0_0),
-        SymOp(Rot_Y_Z_mX,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_0_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_12_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_12_12),
-        SymOp(Rot_mZ_X_Y,    Tr_0_12_12),
-        SymOp(Rot_Z_X_mY,    Tr_0_12_12),
-        SymOp(Rot_Z_mX_Y,    Tr_0_12_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_12_12),
-        SymOp(Rot_Y_mZ_X,    Tr_0_12_12),
-        SymOp(Rot_mY_Z_X,    Tr_0_12_12),
-        SymOp(Rot_Y_Z_mX,    Tr_0_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_0_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_0_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_0_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_0_12),
-        SymOp(Rot_mZ_X_Y,    Tr_12_0_12),
-        SymOp(Rot_Z_X_mY,    Tr_12_0_12),
-        SymOp(Rot_Z_mX_Y,    Tr_12_0_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_0_12),
-        SymOp(Rot_Y_mZ_X,    Tr_12_0_12),
-        SymOp(Rot_mY_Z_X,    Tr_12_0_12),
-        SymOp(Rot_Y_Z_mX,    Tr_12_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_0),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_12_0),
-        SymOp(Rot_mZ_X_Y,    Tr_12_12_0),
-        SymOp(Rot_Z_X_mY,    Tr_12_12_0),
-        SymOp(Rot_Z_mX_Y,    Tr_12_12_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_12_0),
-        SymOp(Rot_Y_mZ_X,    Tr_12_12_0),
-        SymOp(Rot_mY_Z_X,    Tr_12_12_0),
-        SymOp(Rot_Y_Z_mX,    Tr_12_12_0)])
-
-sg203 = SpaceGroup(
-    number                  = 203,
-    num_sym_equiv           = 96,
-    num_primitive_sym_equiv = 24,
-    short_name              = "Fd-3",
-    point_group_name        = "PGm3bar",
-    crystal_system          = "CUBIC",
-    pdb_name                = "F 2/d -3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_14_14_14),
-        SymOp(Rot_X_Y_mZ,    Tr_14_14_14),
-        SymOp(Rot_X_mY_Z,    Tr_14_14_14),
-        SymOp(Rot_mX_Y_Z,    Tr_14_14_14),
-        SymOp(Rot_mZ_mX_mY,  Tr_14_14_14),
-        SymOp(Rot_mZ_X_Y,    Tr_14_14_14),
-        SymOp(Rot_Z_X_mY,    Tr_14_14_14),
-        SymOp(Rot_Z_mX_Y,    Tr_14_14_14),
-        SymOp(Rot_mY_mZ_mX,  Tr_14_14_14),
-        SymOp(Rot_Y_mZ_X,    Tr_14_14_14),
-        SymOp(Rot_mY_Z_X,    Tr_14_14_14),
-        SymOp(Rot_Y_Z_mX,    Tr_14_14_14),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_0_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_14_34_34),
-        SymOp(Rot_X_Y_mZ,    Tr_14_34_34),
-        SymOp(Rot_X_mY_Z,    Tr_14_34_34),
-        SymOp(Rot_mX_Y_Z,    Tr_14_34_34),
-        SymOp(Rot_mZ_mX_mY,  Tr_14_34_34),
-        SymOp(Rot_mZ_X_Y,    Tr_14_34_34),
-        SymOp(Rot_Z_X_mY,    Tr_14_34_34),
-        SymOp(Rot_Z_mX_Y,    Tr_14_34_34),
-        SymOp(Rot_mY_mZ_mX,  Tr_14_34_34),
-        SymOp(Rot_Y_mZ_X,    Tr_14_34_34),
-        SymOp(Rot_mY_Z_X,    Tr_14_34_34),
-        SymOp(Rot_Y_Z_mX,    Tr_14_34_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_0_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_0_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_34_14_34),
-        SymOp(Rot_X_Y_mZ,    Tr_34_14_34),
-        SymOp(Rot_X_mY_Z,    Tr_34_14_34),
-        SymOp(Rot_mX_Y_Z,    Tr_34_14_34),
-        SymOp(Rot_mZ_mX_mY,  Tr_34_14_34),
-        SymOp(Rot_mZ_X_Y,    Tr_34_14_34),
-        SymOp(Rot_Z_X_mY,    Tr_34_14_34),
-        SymOp(Rot_Z_mX_Y,    Tr_34_14_34),
-        SymOp(Rot_mY_mZ_mX,  Tr_34_14_34),
-        SymOp(Rot_Y_mZ_X,    Tr_34_14_34),
-        SymOp(Rot_mY_Z_X,    Tr_34_14_34),
-        SymOp(Rot_Y_Z_mX,    Tr_34_14_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_0),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_34_34_14),
-        SymOp(Rot_X_Y_mZ,    Tr_34_34_14),
-        SymOp(Rot_X_mY_Z,    Tr_34_34_14),
-        SymOp(Rot_mX_Y_Z,    Tr_34_34_14),
-        SymOp(Rot_mZ_mX_mY,  Tr_34_34_14),
-        SymOp(Rot_mZ_X_Y,    Tr_34_34_14),
-        SymOp(Rot_Z_X_mY,    Tr_34_34_14),
-        SymOp(Rot_Z_mX_Y,    Tr_34_34_14),
-        SymOp(Rot_mY_mZ_mX,  Tr_34_34_14),
-        SymOp(Rot_Y_mZ_X,    Tr_34_34_14),
-        SymOp(Rot_mY_Z_X,    Tr_34_34_14),
-        SymOp(Rot_Y_Z_mX,    Tr_34_34_14)])
-
-sg204 = SpaceGroup(
-    number                  = 204,
-    num_sym_equiv           = 48,
-    num_primitive_sym_equiv = 24,
-    short_name              = "Im-3",
-    point_group_name        = "PGm3bar",
-    crystal_system          = "CUBIC",
-    pdb_name                = "I 2/m -3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_X_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_X_mY,    Tr_0_0_0),
-        SymOp(Rot_Z_mX_Y,    Tr_0_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_mZ_X,    Tr_0_0_0),
-        SymOp(Rot_mY_Z_X,    Tr_0_0_0),
-        SymOp(Rot_Y_Z_mX,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_12_12),
-        SymOp(Rot_mZ_X_Y,    Tr_12_12_12),
-        SymOp(Rot_Z_X_mY,    Tr_12_12_12),
-        SymOp(Rot_Z_mX_Y,    Tr_12_12_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_12_12),
-        SymOp(Rot_Y_mZ_X,    Tr_12_12_12),
-        SymOp(Rot_mY_Z_X,    Tr_12_12_12),
-        SymOp(Rot_Y_Z_mX,    Tr_12_12_12)])
-
-sg205 = SpaceGroup(
-    number                  = 205,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "Pa-3",
-    point_group_name        = "PGm3bar",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 21/a -3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_X_Y,    Tr_12_12_0),
-        SymOp(Rot_Z_X_mY,    Tr_12_0_12),
-        SymOp(Rot_Z_mX_Y,    Tr_0_12_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_mZ_X,    Tr_0_12_12),
-        SymOp(Rot_mY_Z_X,    Tr_12_12_0),
-        SymOp(Rot_Y_Z_mX,    Tr_12_0_12)])
-
-sg206 = SpaceGroup(
-    number                  = 206,
-    num_sym_equiv           = 48,
-    num_primitive_sym_equiv = 24,
-    short_name              = "Ia-3",
-    point_group_name        = "PGm3bar",
-    crystal_system          = "CUBIC",
-    pdb_name                = "I 21/a -3",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_X_Y,    Tr_12_12_0),
-        SymOp(Rot_Z_X_mY,    Tr_12_0_12),
-        SymOp(Rot_Z_mX_Y,    Tr_0_12_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_mZ_X,    Tr_0_12_12),
-        SymOp(Rot_mY_Z_X,    Tr_12_12_0),
-        SymOp(Rot_Y_Z_mX,    Tr_12_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_12_12),
-        SymOp(Rot_mZ_X_Y,    Tr_0_0_12),
-        SymOp(Rot_Z_X_mY,    Tr_0_12_0),
-        SymOp(Rot_Z_mX_Y,    Tr_12_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_12_12),
-        SymOp(Rot_Y_mZ_X,    Tr_12_0_0),
-        SymOp(Rot_mY_Z_X,    Tr_0_0_12),
-        SymOp(Rot_Y_Z_mX,    Tr_0_12_0)])
-
-sg207 = SpaceGroup(
-    number                  = 207,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "P432",
-    point_group_name        = "PG432",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 4 3 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Z_mY,    Tr_0_0_0),
-        SymOp(Rot_mX_Z_Y,    Tr_0_0_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_0_0),
-        SymOp(Rot_X_mZ_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_Y_mX,    Tr_0_0_0),
-        SymOp(Rot_Z_mY_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_Y_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_0_0)])
-
-sg208 = SpaceGroup(
-    number                  = 208,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "P4232",
-    point_group_name        = "PG432",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 42 3 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_X_Z_mY,    Tr_12_12_12),
-        SymOp(Rot_mX_Z_Y,    Tr_12_12_12),
-        SymOp(Rot_mX_mZ_mY,  Tr_12_12_12),
-        SymOp(Rot_X_mZ_Y,    Tr_12_12_12),
-        SymOp(Rot_Z_Y_mX,    Tr_12_12_12),
-        SymOp(Rot_Z_mY_X,    Tr_12_12_12),
-        SymOp(Rot_mZ_Y_X,    Tr_12_12_12),
-        SymOp(Rot_mZ_mY_mX,  Tr_12_12_12)])
-
-sg209 = SpaceGroup(
-    number                  = 209,
-    num_sym_equiv           = 96,
-    num_primitive_sym_equiv = 24,
-    short_name              = "F432",
-    point_group_name        = "PG432",
-    crystal_system          = "CUBIC",
-    pdb_name                = "F 4 3 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Z_mY,    Tr_0_0_0),
-        SymOp(Rot_mX_Z_Y,    Tr_0_0_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_0_0),
-        SymOp(Rot_X_mZ_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_Y_mX,    Tr_0_0_0),
-        SymOp(Rot_Z_mY_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_Y_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_0_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_0_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_12_12),
-        SymOp(Rot_X_Z_mY,    Tr_0_12_12),
-        SymOp(Rot_mX_Z_Y,    Tr_0_12_12),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_12_12),
-        SymOp(Rot_X_mZ_Y,    Tr_0_12_12),
-        SymOp(Rot_Z_Y_mX,    Tr_0_12_12),
-        SymOp(Rot_Z_mY_X,    Tr_0_12_12),
-        SymOp(Rot_mZ_Y_X,    Tr_0_12_12),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_0_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_0_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_12_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_0_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_0_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_0_12),
-        SymOp(Rot_X_Z_mY,    Tr_12_0_12),
-        SymOp(Rot_mX_Z_Y,    Tr_12_0_12),
-        SymOp(Rot_mX_mZ_mY,  Tr_12_0_12),
-        SymOp(Rot_X_mZ_Y,    Tr_12_0_12),
-        SymOp(Rot_Z_Y_mX,    Tr_12_0_12),
-        SymOp(Rot_Z_mY_X,    Tr_12_0_12),
-        SymOp(Rot_mZ_Y_X,    Tr_12_0_12),
-        SymOp(Rot_mZ_mY_mX,  Tr_12_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_0),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_0),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_0),
-        SymOp(Rot_X_Z_mY,    Tr_12_12_0),
-        SymOp(Rot_mX_Z_Y,    Tr_12_12_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_12_12_0),
-        SymOp(Rot_X_mZ_Y,    Tr_12_12_0),
-        SymOp(Rot_Z_Y_mX,    Tr_12_12_0),
-        SymOp(Rot_Z_mY_X,    Tr_12_12_0),
-        SymOp(Rot_mZ_Y_X,    Tr_12_12_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_12_12_0)])
-
-sg210 = SpaceGroup(
-    number                  = 210,
-    num_sym_equiv           = 96,
-    num_primitive_sym_equiv = 24,
-    short_name              = "F4132",
-    point_group_name        = "PG432",
-    crystal_system          = "CUBIC",
-    pdb_name                = "F 41 3 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_34_14_34),
-        SymOp(Rot_mY_mX_mZ,  Tr_14_14_14),
-        SymOp(Rot_Y_mX_Z,    Tr_14_34_34),
-        SymOp(Rot_mY_X_Z,    Tr_34_34_14),
-        SymOp(Rot_X_Z_mY,    Tr_34_14_34),
-        SymOp(Rot_mX_Z_Y,    Tr_34_34_14),
-        SymOp(Rot_mX_mZ_mY,  Tr_14_14_14),
-        SymOp(Rot_X_mZ_Y,    Tr_14_34_34),
-        SymOp(Rot_Z_Y_mX,    Tr_34_14_34),
-        SymOp(Rot_Z_mY_X,    Tr_14_34_34),
-        SymOp(Rot_mZ_Y_X,    Tr_34_34_14),
-        SymOp(Rot_mZ_mY_mX,  Tr_14_14_14),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_34_34_14),
-        SymOp(Rot_mY_mX_mZ,  Tr_14_34_34),
-        SymOp(Rot_Y_mX_Z,    Tr_14_14_14),
-        SymOp(Rot_mY_X_Z,    Tr_34_14_34),
-        SymOp(Rot_X_Z_mY,    Tr_34_34_14),
-        SymOp(Rot_mX_Z_Y,    Tr_34_14_34),
-        SymOp(Rot_mX_mZ_mY,  Tr_14_34_34),
-        SymOp(Rot_X_mZ_Y,    Tr_14_14_14),
-        SymOp(Rot_Z_Y_mX,    Tr_34_34_14),
-        SymOp(Rot_Z_mY_X,    Tr_14_14_14),
-        SymOp(Rot_mZ_Y_X,    Tr_34_14_34),
-        SymOp(Rot_mZ_mY_mX,  Tr_14_34_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_12_0_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_0_12),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_14_14_14),
-        SymOp(Rot_mY_mX_mZ,  Tr_34_14_34),
-        SymOp(Rot_Y_mX_Z,    Tr_34_34_14),
-        SymOp(Rot_mY_X_Z,    Tr_14_34_34),
-        SymOp(Rot_X_Z_mY,    Tr_14_14_14),
-        SymOp(Rot_mX_Z_Y,    Tr_14_34_34),
-        SymOp(Rot_mX_mZ_mY,  Tr_34_14_34),
-        SymOp(Rot_X_mZ_Y,    Tr_34_34_14),
-        SymOp(Rot_Z_Y_mX,    Tr_14_14_14),
-        SymOp(Rot_Z_mY_X,    Tr_34_34_14),
-        SymOp(Rot_mZ_Y_X,    Tr_14_34_34),
-        SymOp(Rot_mZ_mY_mX,  Tr_34_14_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_14_34_34),
-        SymOp(Rot_mY_mX_mZ,  Tr_34_34_14),
-        SymOp(Rot_Y_mX_Z,    Tr_34_14_34),
-        SymOp(Rot_mY_X_Z,    Tr_14_14_14),
-        SymOp(Rot_X_Z_mY,    Tr_14_34_34),
-        SymOp(Rot_mX_Z_Y,    Tr_14_14_14),
-        SymOp(Rot_mX_mZ_mY,  Tr_34_34_14),
-        SymOp(Rot_X_mZ_Y,    Tr_34_14_34),
-        SymOp(Rot_Z_Y_mX,    Tr_14_34_34),
-        SymOp(Rot_Z_mY_X,    Tr_34_14_34),
-        SymOp(Rot_mZ_Y_X,    Tr_14_14_14),
-        SymOp(Rot_mZ_mY_mX,  Tr_34_34_14)])
-
-sg211 = SpaceGroup(
-    number                  = 211,
-    num_sym_equiv           = 48,
-    num_primitive_sym_equiv = 24,
-    short_name              = "I432",
-    point_group_name        = "PG432",
-    crystal_system          = "CUBIC",
-    pdb_name                = "I 4 3 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Z_mY,    Tr_0_0_0),
-        SymOp(Rot_mX_Z_Y,    Tr_0_0_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_0_0),
-        SymOp(Rot_X_mZ_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_Y_mX,    Tr_0_0_0),
-        SymOp(Rot_Z_mY_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_Y_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_X_Z_mY,    Tr_12_12_12),
-        SymOp(Rot_mX_Z_Y,    Tr_12_12_12),
-        SymOp(Rot_mX_mZ_mY,  Tr_12_12_12),
-        SymOp(Rot_X_mZ_Y,    Tr_12_12_12),
-        SymOp(Rot_Z_Y_mX,    Tr_12_12_12),
-        SymOp(Rot_Z_mY_X,    Tr_12_12_12),
-        SymOp(Rot_mZ_Y_X,    Tr_12_12_12),
-        SymOp(Rot_mZ_mY_mX,  Tr_12_12_12)])
-
-sg212 = SpaceGroup(
-    number                  = 212,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "P4332",
-    point_group_name        = "PG432",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 43 3 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_14_34_34),
-        SymOp(Rot_mY_mX_mZ,  Tr_14_14_14),
-        SymOp(Rot_Y_mX_Z,    Tr_34_34_14),
-        SymOp(Rot_mY_X_Z,    Tr_34_14_34),
-        SymOp(Rot_X_Z_mY,    Tr_14_34_34),
-        SymOp(Rot_mX_Z_Y,    Tr_34_14_34),
-        SymOp(Rot_mX_mZ_mY,  Tr_14_14_14),
-        SymOp(Rot_X_mZ_Y,    Tr_34_34_14),
-        SymOp(Rot_Z_Y_mX,    Tr_14_34_34),
-        SymOp(Rot_Z_mY_X,    Tr_34_34_14),
-        SymOp(Rot_mZ_Y_X,    Tr_34_14_34),
-        SymOp(Rot_mZ_mY_mX,  Tr_14_14_14)])
-
-sg213 = SpaceGroup(
-    number                  = 213,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "P4132",
-    point_group_name        = "PG432",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 41 3 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_34_14_14),
-        SymOp(Rot_mY_mX_mZ,  Tr_34_34_34),
-        SymOp(Rot_Y_mX_Z,    Tr_14_14_34),
-        SymOp(Rot_mY_X_Z,    Tr_14_34_14),
-        SymOp(Rot_X_Z_mY,    Tr_34_14_14),
-        SymOp(Rot_mX_Z_Y,    Tr_14_34_14),
-        SymOp(Rot_mX_mZ_mY,  Tr_34_34_34),
-        SymOp(Rot_X_mZ_Y,    Tr_14_14_34),
-        SymOp(Rot_Z_Y_mX,    Tr_34_14_14),
-        SymOp(Rot_Z_mY_X,    Tr_14_14_34),
-        SymOp(Rot_mZ_Y_X,    Tr_14_34_14),
-        SymOp(Rot_mZ_mY_mX,  Tr_34_34_34)])
-
-sg214 = SpaceGroup(
-    number                  = 214,
-    num_sym_equiv           = 48,
-    num_primitive_sym_equiv = 24,
-    short_name              = "I4132",
-    point_group_name        = "PG432",
-    crystal_system          = "CUBIC",
-    pdb_name                = "I 41 3 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_34_14_14),
-        SymOp(Rot_mY_mX_mZ,  Tr_34_34_34),
-        SymOp(Rot_Y_mX_Z,    Tr_14_14_34),
-        SymOp(Rot_mY_X_Z,    Tr_14_34_14),
-        SymOp(Rot_X_Z_mY,    Tr_34_14_14),
-        SymOp(Rot_mX_Z_Y,    Tr_14_34_14),
-        SymOp(Rot_mX_mZ_mY,  Tr_34_34_34),
-        SymOp(Rot_X_mZ_Y,    Tr_14_14_34),
-        SymOp(Rot_Z_Y_mX,    Tr_34_14_14),
-        SymOp(Rot_Z_mY_X,    Tr_14_14_34),
-        SymOp(Rot_mZ_Y_X,    Tr_14_34_14),
-        SymOp(Rot_mZ_mY_mX,  Tr_34_34_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_14_34_34),
-        SymOp(Rot_mY_mX_mZ,  Tr_14_14_14),
-        SymOp(Rot_Y_mX_Z,    Tr_34_34_14),
-        SymOp(Rot_mY_X_Z,    Tr_34_14_34),
-        SymOp(Rot_X_Z_mY,    Tr_14_34_34),
-        SymOp(Rot_mX_Z_Y,    Tr_34_14_34),
-        SymOp(Rot_mX_mZ_mY,  Tr_14_14_14),
-        SymOp(Rot_X_mZ_Y,    Tr_34_34_14),
-        SymOp(Rot_Z_Y_mX,    Tr_14_34_34),
-        SymOp(Rot_Z_mY_X,    Tr_34_34_14),
-        SymOp(Rot_mZ_Y_X,    Tr_34_14_34),
-        SymOp(Rot_mZ_mY_mX,  Tr_14_14_14)])
-
-sg215 = SpaceGroup(
-    number                  = 215,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "P-43m",
-    point_group_name        = "PG4bar3m",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P -4 3 m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_0),
-        SymOp(Rot_mX_Z_mY,   Tr_0_0_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_0_0),
-        SymOp(Rot_X_mZ_mY,   Tr_0_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_0),
-        SymOp(Rot_Z_mY_mX,   Tr_0_0_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_0_0),
-        SymOp(Rot_mZ_mY_X,   Tr_0_0_0)])
-
-sg216 = SpaceGroup(
-    number                  = 216,
-    num_sym_equiv           = 96,
-    num_primitive_sym_equiv = 24,
-    short_name              = "F-43m",
-    point_group_name        = "PG4bar3m",
-    crystal_system          = "CUBIC",
-    pdb_name                = "F -4 3 m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_0),
-        SymOp(Rot_mX_Z_mY,   Tr_0_0_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_0_0),
-        SymOp(Rot_X_mZ_mY,   Tr_0_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_0),
-        SymOp(Rot_Z_mY_mX,   Tr_0_0_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_0_0),
-        SymOp(Rot_mZ_mY_X,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_0_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_0_12_12),
-        SymOp(Rot_mX_Z_mY,   Tr_0_12_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_12_12),
-        SymOp(Rot_X_mZ_mY,   Tr_0_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_0_12_12),
-        SymOp(Rot_Z_mY_mX,   Tr_0_12_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_12_12),
-        SymOp(Rot_mZ_mY_X,   Tr_0_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_0_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_0_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_0_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_0_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_0_12),
-        SymOp(Rot_mX_Z_mY,   Tr_12_0_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_0_12),
-        SymOp(Rot_X_mZ_mY,   Tr_12_0_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_0_12),
-        SymOp(Rot_Z_mY_mX,   Tr_12_0_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_0_12),
-        SymOp(Rot_mZ_mY_X,   Tr_12_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_0),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_0),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_0),
-        SymOp(Rot_mX_Z_mY,   Tr_12_12_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_12_0),
-        SymOp(Rot_X_mZ_mY,   Tr_12_12_0),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_0),
-        SymOp(Rot_Z_mY_mX,   Tr_12_12_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_12_0),
-        SymOp(Rot_mZ_mY_X,   Tr_12_12_0)])
-
-sg217 = SpaceGroup(
-    number                  = 217,
-    num_sym_equiv           = 48,
-    num_primitive_sym_equiv = 24,
-    short_name              = "I-43m",
-    point_group_name        = "PG4bar3m",
-    crystal_system          = "CUBIC",
-    pdb_name                = "I -4 3 m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_0),
-        SymOp(Rot_mX_Z_mY,   Tr_0_0_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_0_0),
-        SymOp(Rot_X_mZ_mY,   Tr_0_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_0),
-        SymOp(Rot_Z_mY_mX,   Tr_0_0_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_0_0),
-        SymOp(Rot_mZ_mY_X,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_12),
-        SymOp(Rot_mX_Z_mY,   Tr_12_12_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_12_12),
-        SymOp(Rot_X_mZ_mY,   Tr_12_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_12),
-        SymOp(Rot_Z_mY_mX,   Tr_12_12_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_12_12),
-        SymOp(Rot_mZ_mY_X,   Tr_12_12_12)])
-
-sg218 = SpaceGroup(
-    number                  = 218,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 24,
-    short_name              = "P-43n",
-    point_group_name        = "PG4bar3m",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P -4 3 n",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_12),
-        SymOp(Rot_mX_Z_mY,   Tr_12_12_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_12_12),
-        SymOp(Rot_X_mZ_mY,   Tr_12_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_12),
-        SymOp(Rot_Z_mY_mX,   Tr_12_12_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_12_12),
-        SymOp(Rot_mZ_mY_X,   Tr_12_12_12)])
-
-sg219 = SpaceGroup(
-    number                  = 219,
-    num_sym_equiv           = 96,
-    num_primitive_sym_equiv = 24,
-    short_name              = "F-43c",
-    point_group_name        = "PG4bar3m",
-    crystal_system          = "CUBIC",
-    pdb_name                = "F -4 3 c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_12),
-        SymOp(Rot_mX_Z_mY,   Tr_12_12_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_12_12),
-        SymOp(Rot_X_mZ_mY,   Tr_12_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_12),
-        SymOp(Rot_Z_mY_mX,   Tr_12_12_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_12_12),
-        SymOp(Rot_mZ_mY_X,   Tr_12_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_0_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_12_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_12_0_0),
-        SymOp(Rot_mX_Z_mY,   Tr_12_0_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_0_0),
-        SymOp(Rot_X_mZ_mY,   Tr_12_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_12_0_0),
-        SymOp(Rot_Z_mY_mX,   Tr_12_0_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_0_0),
-        SymOp(Rot_mZ_mY_X,   Tr_12_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_0_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_0_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_12_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_12_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_12_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_12_0),
-        SymOp(Rot_mX_Z_mY,   Tr_0_12_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_12_0),
-        SymOp(Rot_X_mZ_mY,   Tr_0_12_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_12_0),
-        SymOp(Rot_Z_mY_mX,   Tr_0_12_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_12_0),
-        SymOp(Rot_mZ_mY_X,   Tr_0_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_0),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_12),
-        SymOp(Rot_mX_Z_mY,   Tr_0_0_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_0_12),
-        SymOp(Rot_X_mZ_mY,   Tr_0_0_12),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_12),
-        SymOp(Rot_Z_mY_mX,   Tr_0_0_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_0_12),
-        SymOp(Rot_mZ_mY_X,   Tr_0_0_12)])
-
-sg220 = SpaceGroup(
-    number                  = 220,
-    num_sym_equiv           = 48,
-    num_primitive_sym_equiv = 24,
-    short_name              = "I-43d",
-    point_group_name        = "PG4bar3m",
-    crystal_system          = "CUBIC",
-    pdb_name                = "I -4 3 d",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_14_14_14),
-        SymOp(Rot_mY_mX_Z,   Tr_14_34_34),
-        SymOp(Rot_Y_mX_mZ,   Tr_34_14_34),
-        SymOp(Rot_mY_X_mZ,   Tr_34_34_14),
-        SymOp(Rot_X_Z_Y,     Tr_14_14_14),
-        SymOp(Rot_mX_Z_mY,   Tr_34_34_14),
-        SymOp(Rot_mX_mZ_Y,   Tr_14_34_34),
-        SymOp(Rot_X_mZ_mY,   Tr_34_14_34),
-        SymOp(Rot_Z_Y_X,     Tr_14_14_14),
-        SymOp(Rot_Z_mY_mX,   Tr_34_14_34),
-        SymOp(Rot_mZ_Y_mX,   Tr_34_34_14),
-        SymOp(Rot_mZ_mY_X,   Tr_14_34_34),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_34_34_34),
-        SymOp(Rot_mY_mX_Z,   Tr_34_14_14),
-        SymOp(Rot_Y_mX_mZ,   Tr_14_34_14),
-        SymOp(Rot_mY_X_mZ,   Tr_14_14_34),
-        SymOp(Rot_X_Z_Y,     Tr_34_34_34),
-        SymOp(Rot_mX_Z_mY,   Tr_14_14_34),
-        SymOp(Rot_mX_mZ_Y,   Tr_34_14_14),
-        SymOp(Rot_X_mZ_mY,   Tr_14_34_14),
-        SymOp(Rot_Z_Y_X,     Tr_34_34_34),
-        SymOp(Rot_Z_mY_mX,   Tr_14_34_14),
-        SymOp(Rot_mZ_Y_mX,   Tr_14_14_34),
-        SymOp(Rot_mZ_mY_X,   Tr_34_14_14)])
-
-sg221 = SpaceGroup(
-    number                  = 221,
-    num_sym_equiv           = 48,
-    num_primitive_sym_equiv = 48,
-    short_name              = "Pm-3m",
-    point_group_name        = "PGm3barm",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 4/m -3 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Z_mY,    Tr_0_0_0),
-        SymOp(Rot_mX_Z_Y,    Tr_0_0_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_0_0),
-        SymOp(Rot_X_mZ_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_Y_mX,    Tr_0_0_0),
-        SymOp(Rot_Z_mY_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_Y_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_X_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_X_mY,    Tr_0_0_0),
-        SymOp(Rot_Z_mX_Y,    Tr_0_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_mZ_X,    Tr_0_0_0),
-        SymOp(Rot_mY_Z_X,    Tr_0_0_0),
-        SymOp(Rot_Y_Z_mX,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_0_0),
-        SymOp(Rot_X_mZ_mY,   Tr_0_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_0),
-        SymOp(Rot_mX_Z_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mY_X,   Tr_0_0_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_0_0),
-        SymOp(Rot_Z_mY_mX,   Tr_0_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_0)])
-
-sg222 = SpaceGroup(
-    number                  = 222,
-    num_sym_equiv           = 48,
-    num_primitive_sym_equiv = 48,
-    short_name              = "Pn-3n",
-    point_group_name        = "PGm3barm",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 4/n -3 2/n",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Z_mY,    Tr_0_0_0),
-        SymOp(Rot_mX_Z_Y,    Tr_0_0_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_0_0),
-        SymOp(Rot_X_mZ_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_Y_mX,    Tr_0_0_0),
-        SymOp(Rot_Z_mY_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_Y_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_12_12),
-        SymOp(Rot_mZ_X_Y,    Tr_12_12_12),
-        SymOp(Rot_Z_X_mY,    Tr_12_12_12),
-        SymOp(Rot_Z_mX_Y,    Tr_12_12_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_12_12),
-        SymOp(Rot_Y_mZ_X,    Tr_12_12_12),
-        SymOp(Rot_mY_Z_X,    Tr_12_12_12),
-        SymOp(Rot_Y_Z_mX,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_12_12),
-        SymOp(Rot_X_mZ_mY,   Tr_12_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_12),
-        SymOp(Rot_mX_Z_mY,   Tr_12_12_12),
-        SymOp(Rot_mZ_mY_X,   Tr_12_12_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_12_12),
-        SymOp(Rot_Z_mY_mX,   Tr_12_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_12)])
-
-sg223 = SpaceGroup(
-    number                  = 223,
-    num_sym_equiv           = 48,
-    num_primitive_sym_equiv = 48,
-    short_name              = "Pm-3n",
-    point_group_name        = "PGm3barm",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 42/m -3 2/n",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_X_Z_mY,    Tr_12_12_12),
-        SymOp(Rot_mX_Z_Y,    Tr_12_12_12),
-        SymOp(Rot_mX_mZ_mY,  Tr_12_12_12),
-        SymOp(Rot_X_mZ_Y,    Tr_12_12_12),
-        SymOp(Rot_Z_Y_mX,    Tr_12_12_12),
-        SymOp(Rot_Z_mY_X,    Tr_12_12_12),
-        SymOp(Rot_mZ_Y_X,    Tr_12_12_12),
-        SymOp(Rot_mZ_mY_mX,  Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_X_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_X_mY,    Tr_0_0_0),
-        SymOp(Rot_Z_mX_Y,    Tr_0_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_mZ_X,    Tr_0_0_0),
-        SymOp(Rot_mY_Z_X,    Tr_0_0_0),
-        SymOp(Rot_Y_Z_mX,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_12_12),
-        SymOp(Rot_X_mZ_mY,   Tr_12_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_12),
-        SymOp(Rot_mX_Z_mY,   Tr_12_12_12),
-        SymOp(Rot_mZ_mY_X,   Tr_12_12_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_12_12),
-        SymOp(Rot_Z_mY_mX,   Tr_12_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_12)])
-
-sg224 = SpaceGroup(
-    number                  = 224,
-    num_sym_equiv           = 48,
-    num_primitive_sym_equiv = 48,
-    short_name              = "Pn-3m",
-    point_group_name        = "PGm3barm",
-    crystal_system          = "CUBIC",
-    pdb_name                = "P 42/n -3 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_X_Z_mY,    Tr_12_12_12),
-        SymOp(Rot_mX_Z_Y,    Tr_12_12_12),
-        SymOp(Rot_mX_mZ_mY,  Tr_12_12_12),
-        SymOp(Rot_X_mZ_Y,    Tr_12_12_12),
-        SymOp(Rot_Z_Y_mX,    Tr_12_12_12),
-        SymOp(Rot_Z_mY_X,    Tr_12_12_12),
-        SymOp(Rot_mZ_Y_X,    Tr_12_12_12),
-        SymOp(Rot_mZ_mY_mX,  Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_12_12),
-        SymOp(Rot_mZ_X_Y,    Tr_12_12_12),
-        SymOp(Rot_Z_X_mY,    Tr_12_12_12),
-        SymOp(Rot_Z_mX_Y,    Tr_12_12_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_12_12),
-        SymOp(Rot_Y_mZ_X,    Tr_12_12_12),
-        SymOp(Rot_mY_Z_X,    Tr_12_12_12),
-        SymOp(Rot_Y_Z_mX,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_0_0),
-        SymOp(Rot_X_mZ_mY,   Tr_0_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_0),
-        SymOp(Rot_mX_Z_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mY_X,   Tr_0_0_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_0_0),
-        SymOp(Rot_Z_mY_mX,   Tr_0_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_0)])
-
-sg225 = SpaceGroup(
-    number                  = 225,
-    num_sym_equiv           = 192,
-    num_primitive_sym_equiv = 48,
-    short_name              = "Fm-3m",
-    point_group_name        = "PGm3barm",
-    crystal_system          = "CUBIC",
-    pdb_name                = "F 4/m -3 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Z_mY,    Tr_0_0_0),
-        SymOp(Rot_mX_Z_Y,    Tr_0_0_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_0_0),
-        SymOp(Rot_X_mZ_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_Y_mX,    Tr_0_0_0),
-        SymOp(Rot_Z_mY_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_Y_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_X_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_X_mY,    Tr_0_0_0),
-        SymOp(Rot_Z_mX_Y,    Tr_0_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_mZ_X,    Tr_0_0_0),
-        SymOp(Rot_mY_Z_X,    Tr_0_0_0),
-        SymOp(Rot_Y_Z_mX,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_0_0),
-        SymOp(Rot_X_mZ_mY,   Tr_0_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_0),
-        SymOp(Rot_mX_Z_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mY_X,   Tr_0_0_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_0_0),
-        SymOp(Rot_Z_mY_mX,   Tr_0_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_0_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_0_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_12_12),
-        SymOp(Rot_X_Z_mY,    Tr_0_12_12),
-        SymOp(Rot_mX_Z_Y,    Tr_0_12_12),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_12_12),
-        SymOp(Rot_X_mZ_Y,    Tr_0_12_12),
-        SymOp(Rot_Z_Y_mX,    Tr_0_12_12),
-        SymOp(Rot_Z_mY_X,    Tr_0_12_12),
-        SymOp(Rot_mZ_Y_X,    Tr_0_12_12),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_12_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_12_12),
-        SymOp(Rot_mZ_X_Y,    Tr_0_12_12),
-        SymOp(Rot_Z_X_mY,    Tr_0_12_12),
-        SymOp(Rot_Z_mX_Y,    Tr_0_12_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_12_12),
-        SymOp(Rot_Y_mZ_X,    Tr_0_12_12),
-        SymOp(Rot_mY_Z_X,    Tr_0_12_12),
-        SymOp(Rot_Y_Z_mX,    Tr_0_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_12_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_12_12),
-        SymOp(Rot_X_mZ_mY,   Tr_0_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_0_12_12),
-        SymOp(Rot_mX_Z_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mY_X,   Tr_0_12_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_12_12),
-        SymOp(Rot_Z_mY_mX,   Tr_0_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_0_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_0_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_0_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_12_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_0_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_0_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_0_12),
-        SymOp(Rot_X_Z_mY,    Tr_12_0_12),
-        SymOp(Rot_mX_Z_Y,    Tr_12_0_12),
-        SymOp(Rot_mX_mZ_mY,  Tr_12_0_12),
-        SymOp(Rot_X_mZ_Y,    Tr_12_0_12),
-        SymOp(Rot_Z_Y_mX,    Tr_12_0_12),
-        SymOp(Rot_Z_mY_X,    Tr_12_0_12),
-        SymOp(Rot_mZ_Y_X,    Tr_12_0_12),
-        SymOp(Rot_mZ_mY_mX,  Tr_12_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_0_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_0_12),
-        SymOp(Rot_mZ_X_Y,    Tr_12_0_12),
-        SymOp(Rot_Z_X_mY,    Tr_12_0_12),
-        SymOp(Rot_Z_mX_Y,    Tr_12_0_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_0_12),
-        SymOp(Rot_Y_mZ_X,    Tr_12_0_12),
-        SymOp(Rot_mY_Z_X,    Tr_12_0_12),
-        SymOp(Rot_Y_Z_mX,    Tr_12_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_0_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_0_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_0_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_0_12),
-        SymOp(Rot_X_mZ_mY,   Tr_12_0_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_0_12),
-        SymOp(Rot_mX_Z_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mY_X,   Tr_12_0_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_0_12),
-        SymOp(Rot_Z_mY_mX,   Tr_12_0_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_0),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_0),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_0),
-        SymOp(Rot_X_Z_mY,    Tr_12_12_0),
-        SymOp(Rot_mX_Z_Y,    Tr_12_12_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_12_12_0),
-        SymOp(Rot_X_mZ_Y,    Tr_12_12_0),
-        SymOp(Rot_Z_Y_mX,    Tr_12_12_0),
-        SymOp(Rot_Z_mY_X,    Tr_12_12_0),
-        SymOp(Rot_mZ_Y_X,    Tr_12_12_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_12_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_12_0),
-        SymOp(Rot_mZ_X_Y,    Tr_12_12_0),
-        SymOp(Rot_Z_X_mY,    Tr_12_12_0),
-        SymOp(Rot_Z_mX_Y,    Tr_12_12_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_12_0),
-        SymOp(Rot_Y_mZ_X,    Tr_12_12_0),
-        SymOp(Rot_mY_Z_X,    Tr_12_12_0),
-        SymOp(Rot_Y_Z_mX,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_0),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_12_0),
-        SymOp(Rot_X_mZ_mY,   Tr_12_12_0),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_0),
-        SymOp(Rot_mX_Z_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mY_X,   Tr_12_12_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_12_0),
-        SymOp(Rot_Z_mY_mX,   Tr_12_12_0),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_0)])
-
-sg226 = SpaceGroup(
-    number                  = 226,
-    num_sym_equiv           = 192,
-    num_primitive_sym_equiv = 48,
-    short_name              = "Fm-3c",
-    point_group_name        = "PGm3barm",
-    crystal_system          = "CUBIC",
-    pdb_name                = "F 4/m -3 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_X_Z_mY,    Tr_12_12_12),
-        SymOp(Rot_mX_Z_Y,    Tr_12_12_12),
-        SymOp(Rot_mX_mZ_mY,  Tr_12_12_12),
-        SymOp(Rot_X_mZ_Y,    Tr_12_12_12),
-        SymOp(Rot_Z_Y_mX,    Tr_12_12_12),
-        SymOp(Rot_Z_mY_X,    Tr_12_12_12),
-        SymOp(Rot_mZ_Y_X,    Tr_12_12_12),
-        SymOp(Rot_mZ_mY_mX,  Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_X_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_X_mY,    Tr_0_0_0),
-        SymOp(Rot_Z_mX_Y,    Tr_0_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_mZ_X,    Tr_0_0_0),
-        SymOp(Rot_mY_Z_X,    Tr_0_0_0),
-        SymOp(Rot_Y_Z_mX,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_12_12),
-        SymOp(Rot_X_mZ_mY,   Tr_12_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_12),
-        SymOp(Rot_mX_Z_mY,   Tr_12_12_12),
-        SymOp(Rot_mZ_mY_X,   Tr_12_12_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_12_12),
-        SymOp(Rot_Z_mY_mX,   Tr_12_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_0_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_12_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_12_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_12_0_0),
-        SymOp(Rot_X_Z_mY,    Tr_12_0_0),
-        SymOp(Rot_mX_Z_Y,    Tr_12_0_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_12_0_0),
-        SymOp(Rot_X_mZ_Y,    Tr_12_0_0),
-        SymOp(Rot_Z_Y_mX,    Tr_12_0_0),
-        SymOp(Rot_Z_mY_X,    Tr_12_0_0),
-        SymOp(Rot_mZ_Y_X,    Tr_12_0_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_12_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_0_12_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_12_12),
-        SymOp(Rot_mZ_X_Y,    Tr_0_12_12),
-        SymOp(Rot_Z_X_mY,    Tr_0_12_12),
-        SymOp(Rot_Z_mX_Y,    Tr_0_12_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_12_12),
-        SymOp(Rot_Y_mZ_X,    Tr_0_12_12),
-        SymOp(Rot_mY_Z_X,    Tr_0_12_12),
-        SymOp(Rot_Y_Z_mX,    Tr_0_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_12_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_0_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_0_0),
-        SymOp(Rot_X_mZ_mY,   Tr_12_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_12_0_0),
-        SymOp(Rot_mX_Z_mY,   Tr_12_0_0),
-        SymOp(Rot_mZ_mY_X,   Tr_12_0_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_0_0),
-        SymOp(Rot_Z_mY_mX,   Tr_12_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_12_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_0_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_0_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_0_12_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_12_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_12_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_12_0),
-        SymOp(Rot_X_Z_mY,    Tr_0_12_0),
-        SymOp(Rot_mX_Z_Y,    Tr_0_12_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_12_0),
-        SymOp(Rot_X_mZ_Y,    Tr_0_12_0),
-        SymOp(Rot_Z_Y_mX,    Tr_0_12_0),
-        SymOp(Rot_Z_mY_X,    Tr_0_12_0),
-        SymOp(Rot_mZ_Y_X,    Tr_0_12_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_0_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_0_12),
-        SymOp(Rot_mZ_X_Y,    Tr_12_0_12),
-        SymOp(Rot_Z_X_mY,    Tr_12_0_12),
-        SymOp(Rot_Z_mX_Y,    Tr_12_0_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_0_12),
-        SymOp(Rot_Y_mZ_X,    Tr_12_0_12),
-        SymOp(Rot_mY_Z_X,    Tr_12_0_12),
-        SymOp(Rot_Y_Z_mX,    Tr_12_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_0_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_12_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_12_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_12_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_12_0),
-        SymOp(Rot_X_mZ_mY,   Tr_0_12_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_12_0),
-        SymOp(Rot_mX_Z_mY,   Tr_0_12_0),
-        SymOp(Rot_mZ_mY_X,   Tr_0_12_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_12_0),
-        SymOp(Rot_Z_mY_mX,   Tr_0_12_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_0),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_12),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_12),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_12),
-        SymOp(Rot_X_Z_mY,    Tr_0_0_12),
-        SymOp(Rot_mX_Z_Y,    Tr_0_0_12),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_0_12),
-        SymOp(Rot_X_mZ_Y,    Tr_0_0_12),
-        SymOp(Rot_Z_Y_mX,    Tr_0_0_12),
-        SymOp(Rot_Z_mY_X,    Tr_0_0_12),
-        SymOp(Rot_mZ_Y_X,    Tr_0_0_12),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_12_0),
-        SymOp(Rot_mZ_X_Y,    Tr_12_12_0),
-        SymOp(Rot_Z_X_mY,    Tr_12_12_0),
-        SymOp(Rot_Z_mX_Y,    Tr_12_12_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_12_0),
-        SymOp(Rot_Y_mZ_X,    Tr_12_12_0),
-        SymOp(Rot_mY_Z_X,    Tr_12_12_0),
-        SymOp(Rot_Y_Z_mX,    Tr_12_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_0_12),
-        SymOp(Rot_X_mZ_mY,   Tr_0_0_12),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_12),
-        SymOp(Rot_mX_Z_mY,   Tr_0_0_12),
-        SymOp(Rot_mZ_mY_X,   Tr_0_0_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_0_12),
-        SymOp(Rot_Z_mY_mX,   Tr_0_0_12),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_12)])
-
-sg227 = SpaceGroup(
-    number                  = 227,
-    num_sym_equiv           = 192,
-    num_primitive_sym_equiv = 48,
-    short_name              = "Fd-3m",
-    point_group_name        = "PGm3barm",
-    crystal_system          = "CUBIC",
-    pdb_name                = "F 41/d -3 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_34_14_34),
-        SymOp(Rot_mY_mX_mZ,  Tr_14_14_14),
-        SymOp(Rot_Y_mX_Z,    Tr_14_34_34),
-        SymOp(Rot_mY_X_Z,    Tr_34_34_14),
-        SymOp(Rot_X_Z_mY,    Tr_34_14_34),
-        SymOp(Rot_mX_Z_Y,    Tr_34_34_14),
-        SymOp(Rot_mX_mZ_mY,  Tr_14_14_14),
-        SymOp(Rot_X_mZ_Y,    Tr_14_34_34),
-        SymOp(Rot_Z_Y_mX,    Tr_34_14_34),
-        SymOp(Rot_Z_mY_X,    Tr_14_34_34),
-        SymOp(Rot_mZ_Y_X,    Tr_34_34_14),
-        SymOp(Rot_mZ_mY_mX,  Tr_14_14_14),
-        SymOp(Rot_mX_mY_mZ,  Tr_14_14_14),
-        SymOp(Rot_X_Y_mZ,    Tr_14_34_34),
-        SymOp(Rot_X_mY_Z,    Tr_34_34_14),
-        SymOp(Rot_mX_Y_Z,    Tr_34_14_34),
-        SymOp(Rot_mZ_mX_mY,  Tr_14_14_14),
-        SymOp(Rot_mZ_X_Y,    Tr_34_14_34),
-        SymOp(Rot_Z_X_mY,    Tr_14_34_34),
-        SymOp(Rot_Z_mX_Y,    Tr_34_34_14),
-        SymOp(Rot_mY_mZ_mX,  Tr_14_14_14),
-        SymOp(Rot_Y_mZ_X,    Tr_34_34_14),
-        SymOp(Rot_mY_Z_X,    Tr_34_14_34),
-        SymOp(Rot_Y_Z_mX,    Tr_14_34_34),
-        SymOp(Rot_mY_mX_Z,   Tr_12_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_0_12),
-        SymOp(Rot_X_mZ_mY,   Tr_12_12_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_0),
-        SymOp(Rot_mX_Z_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mY_X,   Tr_12_0_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_12_12),
-        SymOp(Rot_Z_mY_mX,   Tr_12_12_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_34_34_14),
-        SymOp(Rot_mY_mX_mZ,  Tr_14_34_34),
-        SymOp(Rot_Y_mX_Z,    Tr_14_14_14),
-        SymOp(Rot_mY_X_Z,    Tr_34_14_34),
-        SymOp(Rot_X_Z_mY,    Tr_34_34_14),
-        SymOp(Rot_mX_Z_Y,    Tr_34_14_34),
-        SymOp(Rot_mX_mZ_mY,  Tr_14_34_34),
-        SymOp(Rot_X_mZ_Y,    Tr_14_14_14),
-        SymOp(Rot_Z_Y_mX,    Tr_34_34_14),
-        SymOp(Rot_Z_mY_X,    Tr_14_14_14),
-        SymOp(Rot_mZ_Y_X,    Tr_34_14_34),
-        SymOp(Rot_mZ_mY_mX,  Tr_14_34_34),
-        SymOp(Rot_mX_mY_mZ,  Tr_14_34_34),
-        SymOp(Rot_X_Y_mZ,    Tr_14_14_14),
-        SymOp(Rot_X_mY_Z,    Tr_34_14_34),
-        SymOp(Rot_mX_Y_Z,    Tr_34_34_14),
-        SymOp(Rot_mZ_mX_mY,  Tr_14_34_34),
-        SymOp(Rot_mZ_X_Y,    Tr_34_34_14),
-        SymOp(Rot_Z_X_mY,    Tr_14_14_14),
-        SymOp(Rot_Z_mX_Y,    Tr_34_14_34),
-        SymOp(Rot_mY_mZ_mX,  Tr_14_34_34),
-        SymOp(Rot_Y_mZ_X,    Tr_34_14_34),
-        SymOp(Rot_mY_Z_X,    Tr_34_34_14),
-        SymOp(Rot_Y_Z_mX,    Tr_14_14_14),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_0_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_12_0),
-        SymOp(Rot_X_mZ_mY,   Tr_12_0_12),
-        SymOp(Rot_X_Z_Y,     Tr_0_12_12),
-        SymOp(Rot_mX_Z_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mY_X,   Tr_12_12_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_0_0),
-        SymOp(Rot_Z_mY_mX,   Tr_12_0_12),
-        SymOp(Rot_Z_Y_X,     Tr_0_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_12_0_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_0_12),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_14_14_14),
-        SymOp(Rot_mY_mX_mZ,  Tr_34_14_34),
-        SymOp(Rot_Y_mX_Z,    Tr_34_34_14),
-        SymOp(Rot_mY_X_Z,    Tr_14_34_34),
-        SymOp(Rot_X_Z_mY,    Tr_14_14_14),
-        SymOp(Rot_mX_Z_Y,    Tr_14_34_34),
-        SymOp(Rot_mX_mZ_mY,  Tr_34_14_34),
-        SymOp(Rot_X_mZ_Y,    Tr_34_34_14),
-        SymOp(Rot_Z_Y_mX,    Tr_14_14_14),
-        SymOp(Rot_Z_mY_X,    Tr_34_34_14),
-        SymOp(Rot_mZ_Y_X,    Tr_14_34_34),
-        SymOp(Rot_mZ_mY_mX,  Tr_34_14_34),
-        SymOp(Rot_mX_mY_mZ,  Tr_34_14_34),
-        SymOp(Rot_X_Y_mZ,    Tr_34_34_14),
-        SymOp(Rot_X_mY_Z,    Tr_14_34_34),
-        SymOp(Rot_mX_Y_Z,    Tr_14_14_14),
-        SymOp(Rot_mZ_mX_mY,  Tr_34_14_34),
-        SymOp(Rot_mZ_X_Y,    Tr_14_14_14),
-        SymOp(Rot_Z_X_mY,    Tr_34_34_14),
-        SymOp(Rot_Z_mX_Y,    Tr_14_34_34),
-        SymOp(Rot_mY_mZ_mX,  Tr_34_14_34),
-        SymOp(Rot_Y_mZ_X,    Tr_14_34_34),
-        SymOp(Rot_mY_Z_X,    Tr_14_14_14),
-        SymOp(Rot_Y_Z_mX,    Tr_34_34_14),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_0_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_12_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_0_0),
-        SymOp(Rot_X_mZ_mY,   Tr_0_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_0_12),
-        SymOp(Rot_mX_Z_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mY_X,   Tr_0_0_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_12_0),
-        SymOp(Rot_Z_mY_mX,   Tr_0_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_14_34_34),
-        SymOp(Rot_mY_mX_mZ,  Tr_34_34_14),
-        SymOp(Rot_Y_mX_Z,    Tr_34_14_34),
-        SymOp(Rot_mY_X_Z,    Tr_14_14_14),
-        SymOp(Rot_X_Z_mY,    Tr_14_34_34),
-        SymOp(Rot_mX_Z_Y,    Tr_14_14_14),
-        SymOp(Rot_mX_mZ_mY,  Tr_34_34_14),
-        SymOp(Rot_X_mZ_Y,    Tr_34_14_34),
-        SymOp(Rot_Z_Y_mX,    Tr_14_34_34),
-        SymOp(Rot_Z_mY_X,    Tr_34_14_34),
-        SymOp(Rot_mZ_Y_X,    Tr_14_14_14),
-        SymOp(Rot_mZ_mY_mX,  Tr_34_34_14),
-        SymOp(Rot_mX_mY_mZ,  Tr_34_34_14),
-        SymOp(Rot_X_Y_mZ,    Tr_34_14_34),
-        SymOp(Rot_X_mY_Z,    Tr_14_14_14),
-        SymOp(Rot_mX_Y_Z,    Tr_14_34_34),
-        SymOp(Rot_mZ_mX_mY,  Tr_34_34_14),
-        SymOp(Rot_mZ_X_Y,    Tr_14_34_34),
-        SymOp(Rot_Z_X_mY,    Tr_34_14_34),
-        SymOp(Rot_Z_mX_Y,    Tr_14_14_14),
-        SymOp(Rot_mY_mZ_mX,  Tr_34_34_14),
-        SymOp(Rot_Y_mZ_X,    Tr_14_14_14),
-        SymOp(Rot_mY_Z_X,    Tr_14_34_34),
-        SymOp(Rot_Y_Z_mX,    Tr_34_14_34),
-        SymOp(Rot_mY_mX_Z,   Tr_0_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_0),
-        SymOp(Rot_mY_X_mZ,   Tr_12_0_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_12_12),
-        SymOp(Rot_X_mZ_mY,   Tr_0_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_0),
-        SymOp(Rot_mX_Z_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mY_X,   Tr_0_12_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_0_12),
-        SymOp(Rot_Z_mY_mX,   Tr_0_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_0)])
-
-sg228 = SpaceGroup(
-    number                  = 228,
-    num_sym_equiv           = 192,
-    num_primitive_sym_equiv = 48,
-    short_name              = "Fd-3c",
-    point_group_name        = "PGm3barm",
-    crystal_system          = "CUBIC",
-    pdb_name                = "F 41/d -3 2/c",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_34_14_34),
-        SymOp(Rot_mY_mX_mZ,  Tr_14_14_14),
-        SymOp(Rot_Y_mX_Z,    Tr_14_34_34),
-        SymOp(Rot_mY_X_Z,    Tr_34_34_14),
-        SymOp(Rot_X_Z_mY,    Tr_34_14_34),
-        SymOp(Rot_mX_Z_Y,    Tr_34_34_14),
-        SymOp(Rot_mX_mZ_mY,  Tr_14_14_14),
-        SymOp(Rot_X_mZ_Y,    Tr_14_34_34),
-        SymOp(Rot_Z_Y_mX,    Tr_34_14_34),
-        SymOp(Rot_Z_mY_X,    Tr_14_34_34),
-        SymOp(Rot_mZ_Y_X,    Tr_34_34_14),
-        SymOp(Rot_mZ_mY_mX,  Tr_14_14_14),
-        SymOp(Rot_mX_mY_mZ,  Tr_34_34_34),
-        SymOp(Rot_X_Y_mZ,    Tr_34_14_14),
-        SymOp(Rot_X_mY_Z,    Tr_14_14_34),
-        SymOp(Rot_mX_Y_Z,    Tr_14_34_14),
-        SymOp(Rot_mZ_mX_mY,  Tr_34_34_34),
-        SymOp(Rot_mZ_X_Y,    Tr_14_34_14),
-        SymOp(Rot_Z_X_mY,    Tr_34_14_14),
-        SymOp(Rot_Z_mX_Y,    Tr_14_14_34),
-        SymOp(Rot_mY_mZ_mX,  Tr_34_34_34),
-        SymOp(Rot_Y_mZ_X,    Tr_14_14_34),
-        SymOp(Rot_mY_Z_X,    Tr_14_34_14),
-        SymOp(Rot_Y_Z_mX,    Tr_34_14_14),
-        SymOp(Rot_mY_mX_Z,   Tr_0_12_0),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_12_0),
-        SymOp(Rot_X_mZ_mY,   Tr_0_0_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_12),
-        SymOp(Rot_mX_Z_mY,   Tr_12_0_0),
-        SymOp(Rot_mZ_mY_X,   Tr_0_12_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_0_0),
-        SymOp(Rot_Z_mY_mX,   Tr_0_0_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_34_34_14),
-        SymOp(Rot_mY_mX_mZ,  Tr_14_34_34),
-        SymOp(Rot_Y_mX_Z,    Tr_14_14_14),
-        SymOp(Rot_mY_X_Z,    Tr_34_14_34),
-        SymOp(Rot_X_Z_mY,    Tr_34_34_14),
-        SymOp(Rot_mX_Z_Y,    Tr_34_14_34),
-        SymOp(Rot_mX_mZ_mY,  Tr_14_34_34),
-        SymOp(Rot_X_mZ_Y,    Tr_14_14_14),
-        SymOp(Rot_Z_Y_mX,    Tr_34_34_14),
-        SymOp(Rot_Z_mY_X,    Tr_14_14_14),
-        SymOp(Rot_mZ_Y_X,    Tr_34_14_34),
-        SymOp(Rot_mZ_mY_mX,  Tr_14_34_34),
-        SymOp(Rot_mX_mY_mZ,  Tr_34_14_14),
-        SymOp(Rot_X_Y_mZ,    Tr_34_34_34),
-        SymOp(Rot_X_mY_Z,    Tr_14_34_14),
-        SymOp(Rot_mX_Y_Z,    Tr_14_14_34),
-        SymOp(Rot_mZ_mX_mY,  Tr_34_14_14),
-        SymOp(Rot_mZ_X_Y,    Tr_14_14_34),
-        SymOp(Rot_Z_X_mY,    Tr_34_34_34),
-        SymOp(Rot_Z_mX_Y,    Tr_14_34_14),
-        SymOp(Rot_mY_mZ_mX,  Tr_34_14_14),
-        SymOp(Rot_Y_mZ_X,    Tr_14_34_14),
-        SymOp(Rot_mY_Z_X,    Tr_14_14_34),
-        SymOp(Rot_Y_Z_mX,    Tr_34_34_34),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_12_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_0_12),
-        SymOp(Rot_X_mZ_mY,   Tr_0_12_0),
-        SymOp(Rot_X_Z_Y,     Tr_12_0_0),
-        SymOp(Rot_mX_Z_mY,   Tr_12_12_12),
-        SymOp(Rot_mZ_mY_X,   Tr_0_0_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_12_12),
-        SymOp(Rot_Z_mY_mX,   Tr_0_12_0),
-        SymOp(Rot_Z_Y_X,     Tr_12_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_12_0_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_0_12),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_14_14_14),
-        SymOp(Rot_mY_mX_mZ,  Tr_34_14_34),
-        SymOp(Rot_Y_mX_Z,    Tr_34_34_14),
-        SymOp(Rot_mY_X_Z,    Tr_14_34_34),
-        SymOp(Rot_X_Z_mY,    Tr_14_14_14),
-        SymOp(Rot_mX_Z_Y,    Tr_14_34_34),
-        SymOp(Rot_mX_mZ_mY,  Tr_34_14_34),
-        SymOp(Rot_X_mZ_Y,    Tr_34_34_14),
-        SymOp(Rot_Z_Y_mX,    Tr_14_14_14),
-        SymOp(Rot_Z_mY_X,    Tr_34_34_14),
-        SymOp(Rot_mZ_Y_X,    Tr_14_34_34),
-        SymOp(Rot_mZ_mY_mX,  Tr_34_14_34),
-        SymOp(Rot_mX_mY_mZ,  Tr_14_34_14),
-        SymOp(Rot_X_Y_mZ,    Tr_14_14_34),
-        SymOp(Rot_X_mY_Z,    Tr_34_14_14),
-        SymOp(Rot_mX_Y_Z,    Tr_34_34_34),
-        SymOp(Rot_mZ_mX_mY,  Tr_14_34_14),
-        SymOp(Rot_mZ_X_Y,    Tr_34_34_34),
-        SymOp(Rot_Z_X_mY,    Tr_14_14_34),
-        SymOp(Rot_Z_mX_Y,    Tr_34_14_14),
-        SymOp(Rot_mY_mZ_mX,  Tr_14_34_14),
-        SymOp(Rot_Y_mZ_X,    Tr_34_14_14),
-        SymOp(Rot_mY_Z_X,    Tr_34_34_34),
-        SymOp(Rot_Y_Z_mX,    Tr_14_14_34),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_0_12_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_0_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_12_12),
-        SymOp(Rot_X_mZ_mY,   Tr_12_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_12_0),
-        SymOp(Rot_mX_Z_mY,   Tr_0_0_12),
-        SymOp(Rot_mZ_mY_X,   Tr_12_12_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_0_12),
-        SymOp(Rot_Z_mY_mX,   Tr_12_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_14_34_34),
-        SymOp(Rot_mY_mX_mZ,  Tr_34_34_14),
-        SymOp(Rot_Y_mX_Z,    Tr_34_14_34),
-        SymOp(Rot_mY_X_Z,    Tr_14_14_14),
-        SymOp(Rot_X_Z_mY,    Tr_14_34_34),
-        SymOp(Rot_mX_Z_Y,    Tr_14_14_14),
-        SymOp(Rot_mX_mZ_mY,  Tr_34_34_14),
-        SymOp(Rot_X_mZ_Y,    Tr_34_14_34),
-        SymOp(Rot_Z_Y_mX,    Tr_14_34_34),
-        SymOp(Rot_Z_mY_X,    Tr_34_14_34),
-        SymOp(Rot_mZ_Y_X,    Tr_14_14_14),
-        SymOp(Rot_mZ_mY_mX,  Tr_34_34_14),
-        SymOp(Rot_mX_mY_mZ,  Tr_14_14_34),
-        SymOp(Rot_X_Y_mZ,    Tr_14_34_14),
-        SymOp(Rot_X_mY_Z,    Tr_34_34_34),
-        SymOp(Rot_mX_Y_Z,    Tr_34_14_14),
-        SymOp(Rot_mZ_mX_mY,  Tr_14_14_34),
-        SymOp(Rot_mZ_X_Y,    Tr_34_14_14),
-        SymOp(Rot_Z_X_mY,    Tr_14_34_14),
-        SymOp(Rot_Z_mX_Y,    Tr_34_34_34),
-        SymOp(Rot_mY_mZ_mX,  Tr_14_14_34),
-        SymOp(Rot_Y_mZ_X,    Tr_34_34_34),
-        SymOp(Rot_mY_Z_X,    Tr_34_14_14),
-        SymOp(Rot_Y_Z_mX,    Tr_14_34_14),
-        SymOp(Rot_mY_mX_Z,   Tr_12_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_12),
-        SymOp(Rot_mY_X_mZ,   Tr_0_12_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_0_0),
-        SymOp(Rot_X_mZ_mY,   Tr_12_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_12),
-        SymOp(Rot_mX_Z_mY,   Tr_0_12_0),
-        SymOp(Rot_mZ_mY_X,   Tr_12_0_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_12_0),
-        SymOp(Rot_Z_mY_mX,   Tr_12_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_12)])
-
-sg229 = SpaceGroup(
-    number                  = 229,
-    num_sym_equiv           = 96,
-    num_primitive_sym_equiv = 48,
-    short_name              = "Im-3m",
-    point_group_name        = "PGm3barm",
-    crystal_system          = "CUBIC",
-    pdb_name                = "I 4/m -3 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_mZ,  Tr_0_0_0),
-        SymOp(Rot_Y_mX_Z,    Tr_0_0_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Z_mY,    Tr_0_0_0),
-        SymOp(Rot_mX_Z_Y,    Tr_0_0_0),
-        SymOp(Rot_mX_mZ_mY,  Tr_0_0_0),
-        SymOp(Rot_X_mZ_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_Y_mX,    Tr_0_0_0),
-        SymOp(Rot_Z_mY_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_Y_X,    Tr_0_0_0),
-        SymOp(Rot_mZ_mY_mX,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_X_Y,    Tr_0_0_0),
-        SymOp(Rot_Z_X_mY,    Tr_0_0_0),
-        SymOp(Rot_Z_mX_Y,    Tr_0_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_mZ_X,    Tr_0_0_0),
-        SymOp(Rot_mY_Z_X,    Tr_0_0_0),
-        SymOp(Rot_Y_Z_mX,    Tr_0_0_0),
-        SymOp(Rot_mY_mX_Z,   Tr_0_0_0),
-        SymOp(Rot_Y_X_Z,     Tr_0_0_0),
-        SymOp(Rot_mY_X_mZ,   Tr_0_0_0),
-        SymOp(Rot_Y_mX_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_mZ_Y,   Tr_0_0_0),
-        SymOp(Rot_X_mZ_mY,   Tr_0_0_0),
-        SymOp(Rot_X_Z_Y,     Tr_0_0_0),
-        SymOp(Rot_mX_Z_mY,   Tr_0_0_0),
-        SymOp(Rot_mZ_mY_X,   Tr_0_0_0),
-        SymOp(Rot_mZ_Y_mX,   Tr_0_0_0),
-        SymOp(Rot_Z_mY_mX,   Tr_0_0_0),
-        SymOp(Rot_Z_Y_X,     Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_12),
-        SymOp(Rot_Y_X_mZ,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_12_12),
-        SymOp(Rot_mY_X_Z,    Tr_12_12_12),
-        SymOp(Rot_X_Z_mY,    Tr_12_12_12),
-        SymOp(Rot_mX_Z_Y,    Tr_12_12_12),
-        SymOp(Rot_mX_mZ_mY,  Tr_12_12_12),
-        SymOp(Rot_X_mZ_Y,    Tr_12_12_12),
-        SymOp(Rot_Z_Y_mX,    Tr_12_12_12),
-        SymOp(Rot_Z_mY_X,    Tr_12_12_12),
-        SymOp(Rot_mZ_Y_X,    Tr_12_12_12),
-        SymOp(Rot_mZ_mY_mX,  Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_12_12),
-        SymOp(Rot_mZ_X_Y,    Tr_12_12_12),
-        SymOp(Rot_Z_X_mY,    Tr_12_12_12),
-        SymOp(Rot_Z_mX_Y,    Tr_12_12_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_12_12),
-        SymOp(Rot_Y_mZ_X,    Tr_12_12_12),
-        SymOp(Rot_mY_Z_X,    Tr_12_12_12),
-        SymOp(Rot_Y_Z_mX,    Tr_12_12_12),
-        SymOp(Rot_mY_mX_Z,   Tr_12_12_12),
-        SymOp(Rot_Y_X_Z,     Tr_12_12_12),
-        SymOp(Rot_mY_X_mZ,   Tr_12_12_12),
-        SymOp(Rot_Y_mX_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_mZ_Y,   Tr_12_12_12),
-        SymOp(Rot_X_mZ_mY,   Tr_12_12_12),
-        SymOp(Rot_X_Z_Y,     Tr_12_12_12),
-        SymOp(Rot_mX_Z_mY,   Tr_12_12_12),
-        SymOp(Rot_mZ_mY_X,   Tr_12_12_12),
-        SymOp(Rot_mZ_Y_mX,   Tr_12_12_12),
-        SymOp(Rot_Z_mY_mX,   Tr_12_12_12),
-        SymOp(Rot_Z_Y_X,     Tr_12_12_12)])
-
-sg230 = SpaceGroup(
-    number                  = 230,
-    num_sym_equiv           = 96,
-    num_primitive_sym_equiv = 48,
-    short_name              = "Ia-3d",
-    point_group_name        = "PGm3barm",
-    crystal_system          = "CUBIC",
-    pdb_name                = "I 41/a -3 2/d",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_12_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_0_12),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_12),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_12_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_0_12),
-        SymOp(Rot_Y_X_mZ,    Tr_34_14_14),
-        SymOp(Rot_mY_mX_mZ,  Tr_34_34_34),
-        SymOp(Rot_Y_mX_Z,    Tr_14_14_34),
-        SymOp(Rot_mY_X_Z,    Tr_14_34_14),
-        SymOp(Rot_X_Z_mY,    Tr_34_14_14),
-        SymOp(Rot_mX_Z_Y,    Tr_14_34_14),
-        SymOp(Rot_mX_mZ_mY,  Tr_34_34_34),
-        SymOp(Rot_X_mZ_Y,    Tr_14_14_34),
-        SymOp(Rot_Z_Y_mX,    Tr_34_14_14),
-        SymOp(Rot_Z_mY_X,    Tr_14_14_34),
-        SymOp(Rot_mZ_Y_X,    Tr_14_34_14),
-        SymOp(Rot_mZ_mY_mX,  Tr_34_34_34),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_12),
-        SymOp(Rot_mX_Y_Z,    Tr_12_12_0),
-        SymOp(Rot_mZ_mX_mY,  Tr_0_0_0),
-        SymOp(Rot_mZ_X_Y,    Tr_12_12_0),
-        SymOp(Rot_Z_X_mY,    Tr_12_0_12),
-        SymOp(Rot_Z_mX_Y,    Tr_0_12_12),
-        SymOp(Rot_mY_mZ_mX,  Tr_0_0_0),
-        SymOp(Rot_Y_mZ_X,    Tr_0_12_12),
-        SymOp(Rot_mY_Z_X,    Tr_12_12_0),
-        SymOp(Rot_Y_Z_mX,    Tr_12_0_12),
-        SymOp(Rot_mY_mX_Z,   Tr_14_34_34),
-        SymOp(Rot_Y_X_Z,     Tr_14_14_14),
-        SymOp(Rot_mY_X_mZ,   Tr_34_34_14),
-        SymOp(Rot_Y_mX_mZ,   Tr_34_14_34),
-        SymOp(Rot_mX_mZ_Y,   Tr_14_34_34),
-        SymOp(Rot_X_mZ_mY,   Tr_34_14_34),
-        SymOp(Rot_X_Z_Y,     Tr_14_14_14),
-        SymOp(Rot_mX_Z_mY,   Tr_34_34_14),
-        SymOp(Rot_mZ_mY_X,   Tr_14_34_34),
-        SymOp(Rot_mZ_Y_mX,   Tr_34_34_14),
-        SymOp(Rot_Z_mY_mX,   Tr_34_14_34),
-        SymOp(Rot_Z_Y_X,     Tr_14_14_14),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_0_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_12_0),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_0),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_0_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_12_0),
-        SymOp(Rot_Y_X_mZ,    Tr_14_34_34),
-        SymOp(Rot_mY_mX_mZ,  Tr_14_14_14),
-        SymOp(Rot_Y_mX_Z,    Tr_34_34_14),
-        SymOp(Rot_mY_X_Z,    Tr_34_14_34),
-        SymOp(Rot_X_Z_mY,    Tr_14_34_34),
-        SymOp(Rot_mX_Z_Y,    Tr_34_14_34),
-        SymOp(Rot_mX_mZ_mY,  Tr_14_14_14),
-        SymOp(Rot_X_mZ_Y,    Tr_34_34_14),
-        SymOp(Rot_Z_Y_mX,    Tr_14_34_34),
-        SymOp(Rot_Z_mY_X,    Tr_34_34_14),
-        SymOp(Rot_mZ_Y_X,    Tr_34_14_34),
-        SymOp(Rot_mZ_mY_mX,  Tr_14_14_14),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_0_0),
-        SymOp(Rot_mX_Y_Z,    Tr_0_0_12),
-        SymOp(Rot_mZ_mX_mY,  Tr_12_12_12),
-        SymOp(Rot_mZ_X_Y,    Tr_0_0_12),
-        SymOp(Rot_Z_X_mY,    Tr_0_12_0),
-        SymOp(Rot_Z_mX_Y,    Tr_12_0_0),
-        SymOp(Rot_mY_mZ_mX,  Tr_12_12_12),
-        SymOp(Rot_Y_mZ_X,    Tr_12_0_0),
-        SymOp(Rot_mY_Z_X,    Tr_0_0_12),
-        SymOp(Rot_Y_Z_mX,    Tr_0_12_0),
-        SymOp(Rot_mY_mX_Z,   Tr_34_14_14),
-        SymOp(Rot_Y_X_Z,     Tr_34_34_34),
-        SymOp(Rot_mY_X_mZ,   Tr_14_14_34),
-        SymOp(Rot_Y_mX_mZ,   Tr_14_34_14),
-        SymOp(Rot_mX_mZ_Y,   Tr_34_14_14),
-        SymOp(Rot_X_mZ_mY,   Tr_14_34_14),
-        SymOp(Rot_X_Z_Y,     Tr_34_34_34),
-        SymOp(Rot_mX_Z_mY,   Tr_14_14_34),
-        SymOp(Rot_mZ_mY_X,   Tr_34_14_14),
-        SymOp(Rot_mZ_Y_mX,   Tr_14_14_34),
-        SymOp(Rot_Z_mY_mX,   Tr_14_34_14),
-        SymOp(Rot_Z_Y_X,     Tr_34_34_34)])
-
-sg1003 = SpaceGroup(
-    number                  = 1003,
-    num_sym_equiv           = 2,
-    num_primitive_sym_equiv = 2,
-    short_name              = "P2",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 1 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0)])
-
-sg1004 = SpaceGroup(
-    number                  = 1004,
-    num_sym_equiv           = 2,
-    num_primitive_sym_equiv = 2,
-    short_name              = "P1121",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 1 21",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12)])
-
-sg3004 = SpaceGroup(
-    number                  = 3004,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 2,
-    short_name              = "I21",
-    point_group_name        = "PG2",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "I 1 21 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12)])
-
-sg1005 = SpaceGroup(
-    number                  = 1005,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 2,
-    short_name              = "B2",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "B 1 1 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12)])
-
-sg2005 = SpaceGroup(
-    number                  = 2005,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 2,
-    short_name              = "A2",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "A 2 1 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12)])
-
-sg3005 = SpaceGroup(
-    number                  = 3005,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 2,
-    short_name              = "C21",
-    point_group_name        = "PG2",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "C 1 21 1",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_0)])
-
-sg1006 = SpaceGroup(
-    number                  = 1006,
-    num_sym_equiv           = 2,
-    num_primitive_sym_equiv = 2,
-    short_name              = "P11m",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 1 m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0)])
-
-sg1007 = SpaceGroup(
-    number                  = 1007,
-    num_sym_equiv           = 2,
-    num_primitive_sym_equiv = 2,
-    short_name              = "P11b",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 1 b",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_0)])
-
-sg1008 = SpaceGroup(
-    number                  = 1008,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 2,
-    short_name              = "B11m",
-    point_group_name        = "PG2",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "B 1 1 m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_12_12_0)])
-
-sg1009 = SpaceGroup(
-    number                  = 1009,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 2,
-    short_name              = "B11b",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "B 1 1 b",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12)])
-
-sg1010 = SpaceGroup(
-    number                  = 1010,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P112/m",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 1 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0)])
-
-sg1011 = SpaceGroup(
-    number                  = 1011,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P1121/m",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 1 21/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_12)])
-
-sg1012 = SpaceGroup(
-    number                  = 1012,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "B112/m",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "B 1 1 2/m",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_0_12)])
-
-sg1013 = SpaceGroup(
-    number                  = 1013,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P112/b",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 1 2/b",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_0)])
-
-sg1014 = SpaceGroup(
-    number                  = 1014,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P1121/b",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "P 1 1 21/b",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_12)])
-
-sg1015 = SpaceGroup(
-    number                  = 1015,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "B112/b",
-    point_group_name        = "PG2C",
-    crystal_system          = "MONOCLINIC",
-    pdb_name                = "B 1 1 2/b",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_0_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_12),
-        SymOp(Rot_mX_mY_mZ,  Tr_12_0_12),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_12)])
-
-sg1017 = SpaceGroup(
-    number                  = 1017,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P2122",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21 2 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_0)])
-
-sg2017 = SpaceGroup(
-    number                  = 2017,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P2212",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 2 21 2",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0)])
-
-sg1018 = SpaceGroup(
-    number                  = 1018,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P21212a",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21 21 2 (a)",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0)])
-
-sg2018 = SpaceGroup(
-    number                  = 2018,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P21221",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21 2 21",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12)])
-
-sg3018 = SpaceGroup(
-    number                  = 3018,
-    num_sym_equiv           = 4,
-    num_primitive_sym_equiv = 4,
-    short_name              = "P22121",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 2 21 21",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12)])
-
-sg1020 = SpaceGroup(
-    number                  = 1020,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "C2221a",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C 2 2 21a)",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12)])
-
-sg1021 = SpaceGroup(
-    number                  = 1021,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "C222a",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "C 2 2 2a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_0)])
-
-sg1022 = SpaceGroup(
-    number                  = 1022,
-    num_sym_equiv           = 16,
-    num_primitive_sym_equiv = 4,
-    short_name              = "F222a",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "F 2 2 2a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_0_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_12_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_0_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_0_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_12_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_12_12),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_0),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_0),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_0)])
-
-sg1023 = SpaceGroup(
-    number                  = 1023,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 4,
-    short_name              = "I222a",
-    point_group_name        = "PG222",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "I 2 2 2a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12)])
-
-sg1059 = SpaceGroup(
-    number                  = 1059,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "Pmmn2",
-    point_group_name        = "PGmmm",
-    crystal_system          = "ORTHORHOMBIC",
-    pdb_name                = "P 21/m 21/m 2/n",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_0),
-        SymOp(Rot_mX_mY_mZ,  Tr_0_0_0),
-        SymOp(Rot_X_Y_mZ,    Tr_12_12_0),
-        SymOp(Rot_X_mY_Z,    Tr_0_12_0),
-        SymOp(Rot_mX_Y_Z,    Tr_12_0_0)])
-
-sg1094 = SpaceGroup(
-    number                  = 1094,
-    num_sym_equiv           = 8,
-    num_primitive_sym_equiv = 8,
-    short_name              = "P42212a",
-    point_group_name        = "PG422",
-    crystal_system          = "TETRAGONAL",
-    pdb_name                = "P 42 21 2a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_mY_X_Z,    Tr_0_12_12),
-        SymOp(Rot_Y_mX_Z,    Tr_12_0_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_0),
-        SymOp(Rot_Y_X_mZ,    Tr_0_0_12),
-        SymOp(Rot_mY_mX_mZ,  Tr_12_12_12)])
-
-sg1197 = SpaceGroup(
-    number                  = 1197,
-    num_sym_equiv           = 24,
-    num_primitive_sym_equiv = 12,
-    short_name              = "I23a",
-    point_group_name        = "PG23",
-    crystal_system          = "CUBIC",
-    pdb_name                = "I 2 3a",
-    symop_list = [
-        SymOp(Rot_X_Y_Z,     Tr_0_0_0),
-        SymOp(Rot_mX_mY_Z,   Tr_12_12_0),
-        SymOp(Rot_X_mY_mZ,   Tr_12_0_0),
-        SymOp(Rot_mX_Y_mZ,   Tr_0_12_0),
-        SymOp(Rot_Y_Z_X,     Tr_0_0_0),
-        SymOp(Rot_mY_mZ_X,   Tr_12_12_0),
-        SymOp(Rot_Y_mZ_mX,   Tr_12_0_0),
-        SymOp(Rot_mY_Z_mX,   Tr_0_12_0),
-        SymOp(Rot_Z_X_Y,     Tr_0_0_0),
-        SymOp(Rot_mZ_mX_Y,   Tr_12_12_0),
-        SymOp(Rot_Z_mX_mY,   Tr_12_0_0),
-        SymOp(Rot_mZ_X_mY,   Tr_0_12_0),
-        SymOp(Rot_X_Y_Z,     Tr_12_12_12),
-        SymOp(Rot_mX_mY_Z,   Tr_0_0_12),
-        SymOp(Rot_X_mY_mZ,   Tr_0_12_12),
-        SymOp(Rot_mX_Y_mZ,   Tr_12_0_12),
-        SymOp(Rot_Y_Z_X,     Tr_12_12_12),
-        SymOp(Rot_mY_mZ_X,   Tr_0_0_12),
-        SymOp(Rot_Y_mZ_mX,   Tr_0_12_12),
-        SymOp(Rot_mY_Z_mX,   Tr_12_0_12),
-        SymOp(Rot_Z_X_Y,     Tr_12_12_12),
-        SymOp(Rot_mZ_mX_Y,   Tr_0_0_12),
-        SymOp(Rot_Z_mX_mY,   Tr_0_12_12),
-        SymOp(Rot_mZ_X_mY,   Tr_12_0_12)])
-
+    if name.startswith("sg") and name[2:].isdigit():
+        index = get_space_group_name_dict().get(int(name[2:]))
+        if index is not None:
+            return construct_space_group(index)
 
-## list of the space groups
-SpaceGroupList = [
-    sg1,
-    sg2,
-    sg3,
-    sg4,
-    sg5,
-    sg6,
-    sg7,
-    sg8,
-    sg9,
-    sg10,
-    sg11,
-    sg12,
-    sg13,
-    sg14,
-    sg15,
-    sg16,
-    sg17,
-    sg18,
-    sg19,
-    sg20,
-    sg21,
-    sg22,
-    sg23,
-    sg24,
-    sg25,
-    sg26,
-    sg27,
-    sg28,
-    sg29,
-    sg30,
-    sg31,
-    sg32,
-    sg33,
-    sg34,
-    sg35,
-    sg36,
-    sg37,
-    sg38,
-    sg39,
-    sg40,
-    sg41,
-    sg42,
-    sg43,
-    sg44,
-    sg45,
-    sg46,
-    sg47,
-    sg48,
-    sg49,
-    sg50,
-    sg51,
-    sg52,
-    sg53,
-    sg54,
-    sg55,
-    sg56,
-    sg57,
-    sg58,
-    sg59,
-    sg60,
-    sg61,
-    sg62,
-    sg63,
-    sg64,
-    sg65,
-    sg66,
-    sg67,
-    sg68,
-    sg69,
-    sg70,
-    sg71,
-    sg72,
-    sg73,
-    sg74,
-    sg75,
-    sg76,
-    sg77,
-    sg78,
-    sg79,
-    sg80,
-    sg81,
-    sg82,
-    sg83,
-    sg84,
-    sg85,
-    sg86,
-    sg87,
-    sg88,
-    sg89,
-    sg90,
-    sg91,
-    sg92,
-    sg93,
-    sg94,
-    sg95,
-    sg96,
-    sg97,
-    sg98,
-    sg99,
-    sg100,
-    sg101,
-    sg102,
-    sg103,
-    sg104,
-    sg105,
-    sg106,
-    sg107,
-    sg108,
-    sg109,
-    sg110,
-    sg111,
-    sg112,
-    sg113,
-    sg114,
-    sg115,
-    sg116,
-    sg117,
-    sg118,
-    sg119,
-    sg120,
-    sg121,
-    sg122,
-    sg123,
-    sg124,
-    sg125,
-    sg126,
-    sg127,
-    sg128,
-    sg129,
-    sg130,
-    sg131,
-    sg132,
-    sg133,
-    sg134,
-    sg135,
-    sg136,
-    sg137,
-    sg138,
-    sg139,
-    sg140,
-    sg141,
-    sg142,
-    sg143,
-    sg144,
-    sg145,
-    sg146,
-    sg1146,
-    sg147,
-    sg148,
-    sg1148,
-    sg149,
-    sg150,
-    sg151,
-    sg152,
-    sg153,
-    sg154,
-    sg155,
-    sg1155,
-    sg156,
-    sg157,
-    sg158,
-    sg159,
-    sg160,
-    sg1160,
-    sg161,
-    sg1161,
-    sg162,
-    sg163,
-    sg164,
-    sg165,
-    sg166,
-    sg1166,
-    sg167,
-    sg1167,
-    sg168,
-    sg169,
-    sg170,
-    sg171,
-    sg172,
-    sg173,
-    sg174,
-    sg175,
-    sg176,
-    sg177,
-    sg178,
-    sg179,
-    sg180,
-    sg181,
-    sg182,
-    sg183,
-    sg184,
-    sg185,
-    sg186,
-    sg187,
-    sg188,
-    sg189,
-    sg190,
-    sg191,
-    sg192,
-    sg193,
-    sg194,
-    sg195,
-    sg196,
-    sg197,
-    sg198,
-    sg199,
-    sg200,
-    sg201,
-    sg202,
-    sg203,
-    sg204,
-    sg205,
-    sg206,
-    sg207,
-    sg208,
-    sg209,
-    sg210,
-    sg211,
-    sg212,
-    sg213,
-    sg214,
-    sg215,
-    sg216,
-    sg217,
-    sg218,
-    sg219,
-    sg220,
-    sg221,
-    sg222,
-    sg223,
-    sg224,
-    sg225,
-    sg226,
-    sg227,
-    sg228,
-    sg229,
-    sg230,
-    sg1003,
-    sg1004,
-    sg3004,
-    sg1005,
-    sg2005,
-    sg3005,
-    sg1006,
-    sg1007,
-    sg1008,
-    sg1009,
-    sg1010,
-    sg1011,
-    sg1012,
-    sg1013,
-    sg1014,
-    sg1015,
-    sg1017,
-    sg2017,
-    sg1018,
-    sg2018,
-    sg3018,
-    sg1020,
-    sg1021,
-    sg1022,
-    sg1023,
-    sg1059,
-    sg1094,
-    sg1197]
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
 
 def GetSpaceGroup(name):
     """Returns the SpaceGroup instance for the given name. If the space group 
     is not found, return the P1 space group as default.
     """
-    for sg in SpaceGroupList:
-        if sg.check_group_name(name):
-            return sg
+    index = get_space_group_index(name)
+    if index is not None:
+        return construct_space_group(index)
 
     ConsoleOutput.warning("GetSpaceGroup('%s') not found" % (name))
 
     ## return P1
-    return sg1
+    return construct_space_group(0)
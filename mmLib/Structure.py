@@ -13,14 +13,18 @@ import numpy
 
 from . import ConsoleOutput
 from . import Constants
-from . import GeometryDict
 from . import AtomMath
+from . import AtomTable
 from . import Library
 from . import UnitCell
 from . import Sequence
 from . import mmCIFDB
 
 
+## the torsion angles calculated by Chain.calc_torsion_table()
+TORSION_ANGLE_NAMES = ("phi", "psi", "omega", "chi1", "chi2", "chi3", "chi4")
+
+
 class StructureError(Exception):
     """Base class of errors raised by Structure objects.
     """
@@ -83,6 +87,8 @@ class Structure(object):
         self.model_list = []
         self.model_dict = {}
 
+        self.atom_table = None
+
     def __str__(self):
         return "Struct(%s)" % (self.structure_id)
 
@@ -557,6 +563,33 @@ class Structure(object):
         except KeyError:
             return None
 
+    def get_atom_table(self):
+        """Builds a AtomTable holding all Atom objects in the Structure,
+        in iter_all_atoms() order, binds the Atoms to it and returns it.
+        The table is kept in Structure.atom_table.  Call again after Atoms
+        are added or removed.
+        """
+        self.atom_table = AtomTable.AtomTable(self.iter_all_atoms())
+        return self.atom_table
+
+    def get_bond_graph(self):
+        """Returns a BondGraph of all Bonds between the Atoms of the
+        Structure; atom i of the graph is the i-th Atom of iter_all_atoms(),
+        and BondGraph.atom_table holds the Atoms.  The AtomTable kept in
+        Structure.atom_table is used if it still holds the Atoms of the
+        Structure, otherwise a bind=False AtomTable is built; the call never
+        binds Atoms or replaces Structure.atom_table.  Call again after
+        Bonds are added or removed.
+        """
+        atom_list = list(self.iter_all_atoms())
+
+        atom_table = self.atom_table
+        if atom_table is None or len(atom_table) != len(atom_list) or \
+           not all(atm1 is atm2 for atm1, atm2 in zip(atom_table, atom_list)):
+            atom_table = AtomTable.AtomTable(atom_list, bind = False)
+
+        return atom_table.calc_bond_graph()
+
     def iter_bonds(self):
         """Iterates over all Bond objects. The iteration is preformed by
         iterating over all Atom objects in the same order as iter_atoms(),
@@ -652,39 +685,13 @@ class Structure(object):
         """Builds a Structure's bonds by atomic distance distance using
         the covalent radii in element.cif. A bond is built if the the
         distance between them is less than or equal to the sum of their
-        covalent radii + 0.54A.
+        covalent radii + 0.54A.  Use AtomTable.calc_covalent_bonds() to
+        get the bonds as a edge list of atom indexes instead.
         """
         for model in self.iter_models():
-            xyzdict = GeometryDict.XYZDict(2.0)
-
-            for atm in model.iter_all_atoms():
-                if atm.position is not None:
-                    xyzdict.add(atm.position, atm)
-
-            for (p1,atm1),(p2,atm2),dist in xyzdict.iter_contact_distance(2.5):
-
-                if (atm1.alt_loc == "" or atm2.alt_loc == "") or (atm1.alt_loc == atm2.alt_loc):
-
-                    ## calculate the expected bond distance by adding the
-                    ## covalent radii + 0.54A
-                    edesc1 = Library.library_get_element_desc(atm1.element)
-                    edesc2 = Library.library_get_element_desc(atm2.element)
-
-                    ## this will usually occur if an atom name does not match
-                    ## the one found in the associated monomer library
-                    if edesc1 is None or edesc2 is None:
-                        continue
-
-                    bond_dist = edesc1.covalent_radius + edesc2.covalent_radius + 0.54
-
-                    ## this will usually occur if the bond distance between
-                    ## between two atoms does not match the description in
-                    ## in the monomer library
-                    if dist > bond_dist:
-                        continue
-
-                    if atm1.get_bond(atm2) is None:
-                        atm1.create_bond(atom = atm2, standard_res_bond = False)
+            atom_table = AtomTable.AtomTable(model.iter_all_atoms(), bind = False)
+            index1, index2, dist = atom_table.calc_covalent_bonds()
+            atom_table.create_bonds(index1, index2)
 
     def add_bonds_from_library(self):
         """Builds bonds for all Fragments in the Structure from bond tables
@@ -711,6 +718,8 @@ class Model(object):
         self.beta_sheet_list  = []
         self.site_list        = []
 
+        self.atom_table       = None
+
     def __str__(self):
         return "Model(model_id=%d)" % (self.model_id)
 
@@ -875,6 +884,18 @@ class Model(object):
             for frag in chain.iter_amino_acids():
                 yield frag
 
+    def calc_torsion_table(self, torsion_names = TORSION_ANGLE_NAMES):
+        """Returns the Chain.calc_torsion_table() 2-tuple (residue_list,
+        table) of all the Chains of the Model, concatenated in Chain order.
+        """
+        residue_list = []
+        table_list = [numpy.zeros((0, len(torsion_names)), float)]
+        for chain in self.iter_chains():
+            chain_residue_list, table = chain.calc_torsion_table(torsion_names)
+            residue_list.extend(chain_residue_list)
+            table_list.append(table)
+        return residue_list, numpy.concatenate(table_list)
+
     def has_nucleic_acids(self):
         for frag in self.iter_nucleic_acids():
             return True
@@ -1002,6 +1023,15 @@ class Model(object):
         except KeyError:
             return None
 
+    def get_atom_table(self):
+        """Builds a AtomTable holding all Atom objects in the Model, in
+        iter_all_atoms() order, binds the Atoms to it and returns it.
+        The table is kept in Model.atom_table.  Call again after Atoms
+        are added or removed.
+        """
+        self.atom_table = AtomTable.AtomTable(self.iter_all_atoms())
+        return self.atom_table
+
     def add_alpha_helix(self, alpha_helix):
         """Adds an AlphaHelix object to the Model.
         """
@@ -1637,6 +1667,93 @@ class Chain(Segment):
         if self.model is not None:
             self.model.chain_list.sort()
 
+    def calc_torsion_table(self, torsion_names = TORSION_ANGLE_NAMES):
+        """Calculates the torsion angles of all amino acid residues of the
+        Chain at once.  The atom quadruplet of every angle is looked up
+        first, then all angles are computed by one call to
+        AtomMath.calc_torsion_angle_array().  Torsion names are phi, psi
+        and omega, or the names of the monomer library torsion angles
+        (chi1..chi4, pucker), like the AminoAcidResidue.calc_torsion_*
+        methods.  Returns the 2-tuple (residue_list, table): the amino
+        acid residues in Chain order, and the (len(residue_list),
+        len(torsion_names)) array of angles in degrees, NaN where the angle
+        is not defined or atoms are missing.
+        """
+        backbone_dict = {
+            "phi":   ((-1, "C"),  (0, "N"),  (0, "CA"), (0, "C")),
+            "psi":   ((0, "N"),   (0, "CA"), (0, "C"),  (1, "N")),
+            "omega": ((0, "CA"),  (0, "C"),  (1, "N"),  (1, "CA"))}
+
+        ## row -1 of the position array is the NaN position of missing atoms
+        atom_index_dict = {}
+        position_list = []
+        def atom_index(atm):
+            if atm is None or atm.position is None:
+                return -1
+            try:
+                return atom_index_dict[id(atm)]
+            except KeyError:
+                index = atom_index_dict[id(atm)] = len(position_list)
+                position_list.append(atm.position)
+                return index
+
+        torsion_angle_dict_cache = {}
+        def get_torsion_angle_dict(res_name):
+            try:
+                return torsion_angle_dict_cache[res_name]
+            except KeyError:
+                mdesc = Library.library_get_monomer_desc(res_name)
+                tdict = {}
+                if mdesc is not None:
+                    tdict = mdesc.torsion_angle_dict
+                torsion_angle_dict_cache[res_name] = tdict
+                return tdict
+
+        residue_list = []
+        quad_list = []
+        frag_list = self.fragment_list
+        num_frags = len(frag_list)
+
+        for i, frag in enumerate(frag_list):
+            if not frag.is_amino_acid():
+                continue
+            residue_list.append(frag)
+
+            ## neighbors as found by Residue.get_offset_residue()
+            offset_residue = {0: frag, -1: None, 1: None}
+            if i > 0 and type(frag_list[i - 1]) == type(frag):
+                offset_residue[-1] = frag_list[i - 1]
+            if i + 1 < num_frags and type(frag_list[i + 1]) == type(frag):
+                offset_residue[1] = frag_list[i + 1]
+
+            quad_row = []
+            for torsion_name in torsion_names:
+                quad = [-1, -1, -1, -1]
+                if torsion_name in backbone_dict:
+                    definition = backbone_dict[torsion_name]
+                    if all(offset_residue[offset] is not None for offset, name in definition):
+                        quad = [atom_index(offset_residue[offset].get_atom(name))
+                                for offset, name in definition]
+                else:
+                    atom_names = get_torsion_angle_dict(frag.res_name).get(torsion_name)
+                    if atom_names is not None:
+                        quad = [atom_index(frag.get_atom(name)) for name in atom_names]
+                quad_row.append(quad)
+            quad_list.append(quad_row)
+
+        xyz = numpy.zeros((len(position_list) + 1, 3), float)
+        if len(position_list) > 0:
+            xyz[:-1] = position_list
+        xyz[-1] = numpy.nan
+
+        quad = numpy.array(quad_list, int).reshape((len(residue_list), len(torsion_names), 4))
+        table = AtomMath.calc_torsion_angle_array(
+            xyz[quad[:,:,0]], xyz[quad[:,:,1]], xyz[quad[:,:,2]], xyz[quad[:,:,3]])
+
+        ## quadruplets with a missing atom are NaN
+        table[numpy.any(quad == -1, axis = 2)] = numpy.nan
+        return residue_list, table
+
 
 class Fragment(object):
     """Fragment objects are a basic unit for organizing small groups of Atoms.
@@ -2482,6 +2599,10 @@ class Atom(object):
     Atom.label_seq_id -
                        sequence id corresponding to entity_poly_seq_num
                        and struct_conn.ptnr?_label_seq_id
+    Atom.atom_table  - the AtomTable the Atom is bound to, or None; when
+                       bound, position, sig_position, occupancy,
+                       temp_factor, U and sig_U are stored in row
+                       Atom.atom_table_index of the table
     """
     def __init__(
         self,
@@ -2530,6 +2651,10 @@ class Atom(object):
         self.fragment        = None
         self.altloc          = None
 
+        ## AtomTable row this Atom is bound to, see bind_atom_table()
+        self.atom_table       = None
+        self.atom_table_index = None
+
         self.name            = name
         self.alt_loc         = alt_loc
         self.res_name        = res_name
@@ -3031,6 +3156,125 @@ class Atom(object):
         listx.sort()
         return iter(listx)
 
+    def bind_atom_table(self, atom_table, index):
+        """Binds the Atom to row index of the AtomTable atom_table.  The
+        numeric attributes of the Atom are then stored in the table arrays.
+        This is called by the AtomTable constructor, which has already
+        copied the Atom's values into the row.
+        """
+        self.atom_table       = atom_table
+        self.atom_table_index = index
+
+        self._position     = None
+        self._sig_position = None
+        self._occupancy    = None
+        self._temp_factor  = None
+        self._U            = None
+        self._sig_U        = None
+
+    def unbind_atom_table(self):
+        """Copies the numeric attributes out of the bound AtomTable row
+        back into the Atom, and unbinds it.
+        """
+        if self.atom_table is None:
+            return
+
+        position     = copy.copy(self.position)
+        sig_position = copy.copy(self.sig_position)
+        occupancy    = self.occupancy
+        temp_factor  = self.temp_factor
+        U            = copy.copy(self.U)
+        sig_U        = copy.copy(self.sig_U)
+
+        self.atom_table       = None
+        self.atom_table_index = None
+
+        self.position     = position
+        self.sig_position = sig_position
+        self.occupancy    = occupancy
+        self.temp_factor  = temp_factor
+        self.U            = U
+        self.sig_U        = sig_U
+
+    def _get_position(self):
+        if self.atom_table is None:
+            return self._position
+        return self.atom_table.get_position(self.atom_table_index)
+
+    def _set_position(self, position):
+        if self.atom_table is None:
+            self._position = position
+        else:
+            self.atom_table.set_position(self.atom_table_index, position)
+
+    position = property(_get_position, _set_position)
+
+    def _get_sig_position(self):
+        if self.atom_table is None:
+            return self._sig_position
+        return self.atom_table.get_sig_position(self.atom_table_index)
+
+    def _set_sig_position(self, sig_position):
+        if self.atom_table is None:
+            self._sig_position = sig_position
+        else:
+            self.atom_table.set_sig_position(
+                self.atom_table_index, sig_position)
+
+    sig_position = property(_get_sig_position, _set_sig_position)
+
+    def _get_occupancy(self):
+        if self.atom_table is None:
+            return self._occupancy
+        return self.atom_table.get_occupancy(self.atom_table_index)
+
+    def _set_occupancy(self, occupancy):
+        if self.atom_table is None:
+            self._occupancy = occupancy
+        else:
+            self.atom_table.set_occupancy(self.atom_table_index, occupancy)
+
+    occupancy = property(_get_occupancy, _set_occupancy)
+
+    def _get_temp_factor(self):
+        if self.atom_table is None:
+            return self._temp_factor
+        return self.atom_table.get_temp_factor(self.atom_table_index)
+
+    def _set_temp_factor(self, temp_factor):
+        if self.atom_table is None:
+            self._temp_factor = temp_factor
+        else:
+            self.atom_table.set_temp_factor(self.atom_table_index, temp_factor)
+
+    temp_factor = property(_get_temp_factor, _set_temp_factor)
+
+    def _get_U(self):
+        if self.atom_table is None:
+            return self._U
+        return self.atom_table.get_U(self.atom_table_index)
+
+    def _set_U(self, U):
+        if self.atom_table is None:
+            self._U = U
+        else:
+            self.atom_table.set_U(self.atom_table_index, U)
+
+    U = property(_get_U, _set_U)
+
+    def _get_sig_U(self):
+        if self.atom_table is None:
+            return self._sig_U
+        return self.atom_table.get_sig_U(self.atom_table_index)
+
+    def _set_sig_U(self, sig_U):
+        if self.atom_table is None:
+            self._sig_U = sig_U
+        else:
+            self.atom_table.set_sig_U(self.atom_table_index, sig_U)
+
+    sig_U = property(_get_sig_U, _set_sig_U)
+
     def set_model_id(self, model_id):
         """Sets the chain_id of the Atom and all alt_loc Atom
         objects.
@@ -3792,42 +4036,36 @@ class AtomList(list):
     def calc_adv_anisotropy(self):
         """Calculates the average anisotropy for all Atoms in the AtomList.
         """
-        num_atoms = 0
-        adv_aniso = 0.0
-
-        for atm in self:
-            try:
-                adv_aniso += atm.calc_anisotropy()
-            except ZeroDivisionError:
-                pass
-            else:
-                num_atoms += 1
-
-        return adv_aniso / num_atoms
+        return numpy.mean(self.calc_anisotropy_array())
 
     def calc_adv_anisotropy3(self):
         """Calculates the average anisotropy 3-tuple for all Atoms in the 
         AtomList.
         """
-        num_atoms  = 0
-        adv_aniso1 = 0.0
-        adv_aniso2 = 0.0
-        adv_aniso3 = 0.0
-
-        for atm in self:
-            try:
-                a1, a2, a3 = atm.calc_anisotropy3()
-            except ZeroDivisionError:
-                pass
-            else:
-                adv_aniso1 += a1
-                adv_aniso2 += a2
-                adv_aniso3 += a3
-                num_atoms  += 1
-
-        return (adv_aniso1 / num_atoms,
-                adv_aniso2 / num_atoms,
-                adv_aniso3 / num_atoms)
+        a1, a2, a3 = numpy.mean(self.calc_anisotropy3_array(), axis = 0)
+        return (a1, a2, a3)
+
+    def calc_anisotropy_array(self):
+        """Returns a array of the Atom.calc_anisotropy() of each Atom, from
+        one batched eigen decomposition of all the U tensors.
+        """
+        anisotropy = numpy.ones(len(self), float)
+        aniso_index = [i for i, atm in enumerate(self) if atm.U is not None]
+        if len(aniso_index) > 0:
+            U = numpy.array([self[i].U for i in aniso_index], float)
+            anisotropy[aniso_index] = AtomMath.calc_anisotropy_array(U)
+        return anisotropy
+
+    def calc_anisotropy3_array(self):
+        """Returns a (n,3) array of the Atom.calc_anisotropy3() of each
+        Atom, from one batched eigen decomposition of all the U tensors.
+        """
+        anisotropy3 = numpy.ones((len(self), 3), float)
+        aniso_index = [i for i, atm in enumerate(self) if atm.U is not None]
+        if len(aniso_index) > 0:
+            U = numpy.array([self[i].U for i in aniso_index], float)
+            anisotropy3[aniso_index] = AtomMath.calc_anisotropy3_array(U)
+        return anisotropy3
 
 
 ### <testing>
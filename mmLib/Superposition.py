@@ -5,20 +5,25 @@
 """Class for least-squares structural superposition.  Uses a quaternion
 method which avoids improper rotations.
 """
+import concurrent.futures
 import math
 
-try:
-    import numpy
-    try:
-        from numpy.oldnumeric import linear_algebra as linalg
-    except ImportError:
-        from numpy.linalg import old as linalg
-except ImportError:
-    from . import NumericCompat as numpy
-    from .NumericCompat import linalg
-    
+import numpy
+
 from . import AtomMath
 
+## atom matching rules of CalcMatchingPoints(); None matches every atom
+## name the compared structures have in common
+MATCH_CA       = "CA"
+MATCH_BACKBONE = "backbone"
+MATCH_ALL      = "all"
+
+MATCH_ATOM_NAMES = {
+    MATCH_CA:       ("CA",),
+    MATCH_BACKBONE: ("N", "CA", "C", "O"),
+    MATCH_ALL:      None,
+    }
+
 def QuaternionToRotationMatrix(q):
     """Create a rotation matrix from q quaternion rotation.
     Quaternions are typed as Numeric Python arrays of length 4.
@@ -51,6 +56,59 @@ def QuaternionToRotationMatrix(q):
                          [q13-q02, q23+q01, q00+q33] ], float)
 
 
+def QuaternionsToRotationMatrices(Q):
+    """Creates the (k,3,3) array of rotation matrices from the (k,4) array Q
+    of unit quaternions; the batched form of QuaternionToRotationMatrix().
+    """
+    Q = numpy.asarray(Q, float)
+    q0, q1, q2, q3 = Q[:, 0], Q[:, 1], Q[:, 2], Q[:, 3]
+
+    R = numpy.empty((len(Q), 3, 3), float)
+    R[:, 0, 0] = 2.0*(q0*q0 + q1*q1) - 1.0
+    R[:, 0, 1] = 2.0*(q1*q2 - q0*q3)
+    R[:, 0, 2] = 2.0*(q1*q3 + q0*q2)
+    R[:, 1, 0] = 2.0*(q1*q2 + q0*q3)
+    R[:, 1, 1] = 2.0*(q0*q0 + q2*q2) - 1.0
+    R[:, 1, 2] = 2.0*(q2*q3 - q0*q1)
+    R[:, 2, 0] = 2.0*(q1*q3 - q0*q2)
+    R[:, 2, 1] = 2.0*(q2*q3 + q0*q1)
+    R[:, 2, 2] = 2.0*(q0*q0 + q3*q3) - 1.0
+    return R
+
+
+def CalcQuaternionMatrices(C):
+    """Returns the (k,4,4) symmetric quaternion matrices F whose largest
+    eigenvalue and eigenvector give the optimal rotation, for the (k,3,3)
+    array of source/destination correlation matrices C.
+    """
+    Rxx, Rxy, Rxz = C[:, 0, 0], C[:, 0, 1], C[:, 0, 2]
+    Ryx, Ryy, Ryz = C[:, 1, 0], C[:, 1, 1], C[:, 1, 2]
+    Rzx, Rzy, Rzz = C[:, 2, 0], C[:, 2, 1], C[:, 2, 2]
+
+    F = numpy.empty((len(C), 4, 4), float)
+    F[:, 0, 0] = Rxx + Ryy + Rzz
+    F[:, 0, 1] = Ryz - Rzy
+    F[:, 0, 2] = Rzx - Rxz
+    F[:, 0, 3] = Rxy - Ryx
+
+    F[:, 1, 1] = Rxx - Ryy - Rzz
+    F[:, 1, 2] = Rxy + Ryx
+    F[:, 1, 3] = Rxz + Rzx
+
+    F[:, 2, 2] =-Rxx + Ryy - Rzz
+    F[:, 2, 3] = Ryz + Rzy
+
+    F[:, 3, 3] =-Rxx - Ryy + Rzz
+
+    F[:, 1, 0] = F[:, 0, 1]
+    F[:, 2, 0] = F[:, 0, 2]
+    F[:, 3, 0] = F[:, 0, 3]
+    F[:, 2, 1] = F[:, 1, 2]
+    F[:, 3, 1] = F[:, 1, 3]
+    F[:, 3, 2] = F[:, 2, 3]
+    return F
+
+
 class SuperpositionResults(object):
     """Returns the results of a superposition.
     """
@@ -70,141 +128,323 @@ class SuperpositionResults(object):
         position = position + self.dst_origin
         return position
 
+    def transform_array(self, positions):
+        """Transforms a (n,3) array of source positions to their aligned
+        positions.
+        """
+        return numpy.dot(positions - self.src_origin, self.R.T) + self.dst_origin
+
+
+class SuperpositionBatchResults(object):
+    """Returns the results of a batch of k superpositions as stacked arrays:
+    Q(k,4) quaternions, R(k,3,3) rotations, src_origin(k,3),
+    dst_origin(k,3), rmsd(k) and num_atoms(k).
+    """
+    def __init__(self, Q, src_origin, dst_origin, rmsd, num_atoms):
+        self.Q = Q
+        self.R = QuaternionsToRotationMatrices(Q)
+        self.src_origin = src_origin
+        self.dst_origin = dst_origin
+        self.rmsd = rmsd
+        self.num_atoms = num_atoms
+
+    def __len__(self):
+        return len(self.Q)
+
+    def __getitem__(self, i):
+        """Returns superposition i of the batch as a SuperpositionResults.
+        """
+        return SuperpositionResults(
+            self.Q[i], self.src_origin[i], self.dst_origin[i],
+            float(self.rmsd[i]), int(self.num_atoms[i]))
+
+    def calc_translations(self):
+        """Returns the (k,3) translations t so that R[i] x + t[i] is the
+        aligned position of source position x of set i.
+        """
+        return self.dst_origin - numpy.matmul(self.R, self.src_origin[:, :, numpy.newaxis])[:, :, 0]
+
+    def transform_array(self, positions):
+        """Transforms the (k,n,3) array of source position sets, or one
+        (n,3) set by every superposition, to their aligned positions.
+        """
+        positions = numpy.asarray(positions, float)
+        if positions.ndim == 2:
+            positions = positions[numpy.newaxis]
+        shifted = positions - self.src_origin[:, numpy.newaxis, :]
+        return numpy.matmul(shifted, self.R.transpose(0, 2, 1)) + \
+               self.dst_origin[:, numpy.newaxis, :]
+
 
 def SuperimposePoints(src_points, dst_points):
     """Takes two 1:1 set of points and returns a 3x3 rotation matrix and
     translation vector.
     """
-    num_points = src_points.shape[0]
-
-    ## shift both sets of coordinates to their centroids
-    src_org = numpy.add.reduce(src_points) / float(src_points.shape[0])
-    dst_org = numpy.add.reduce(dst_points) / float(dst_points.shape[0])
+    batch = SuperimposePointsBatch(
+        numpy.asarray(src_points, float)[numpy.newaxis],
+        numpy.asarray(dst_points, float)[numpy.newaxis])
+    return batch[0]
+
+
+def SuperimposePointsBatch(src_points, dst_points, weights = None):
+    """Superimposes k sets of 1:1 points in one call.  src_points is a
+    (k,n,3) array, dst_points is a (k,n,3) array or a single (n,3) set
+    which every source set is superimposed onto, such as an NMR ensemble
+    onto a reference model.  The optional (k,n) or (n,) array of weights,
+    typically 0/1 to leave out missing atoms, weights each point pair.
+    Returns a SuperpositionBatchResults.
+    """
+    src_points = numpy.asarray(src_points, float)
+    dst_points = numpy.asarray(dst_points, float)
+    num_sets, num_points = src_points.shape[:2]
+    dst_points = numpy.broadcast_to(dst_points, src_points.shape)
 
-    X = numpy.add(src_points, -src_org)
-    Y = numpy.add(dst_points, -dst_org)
+    if weights is None:
+        weights = numpy.ones((num_sets, num_points), float)
+    else:
+        weights = numpy.broadcast_to(
+            numpy.asarray(weights, float), (num_sets, num_points))
+    wsum = numpy.sum(weights, axis = 1)
 
-    xy2n = 0.0
+    ## shift both sets of coordinates to their centroids
+    src_org = numpy.matmul(weights[:, numpy.newaxis, :], src_points)[:, 0] / wsum[:, numpy.newaxis]
+    dst_org = numpy.matmul(weights[:, numpy.newaxis, :], dst_points)[:, 0] / wsum[:, numpy.newaxis]
 
-    R = numpy.zeros((3,3), float)
+    X = src_points - src_org[:, numpy.newaxis, :]
+    Y = dst_points - dst_org[:, numpy.newaxis, :]
+    WX = X * weights[:, :, numpy.newaxis]
 
-    for k in range(num_points):
-        x = X[k]
-        y = Y[k]
+    xy2n = numpy.einsum("knd,knd->k", WX, X) + \
+           numpy.einsum("kn,knd,knd->k", weights, Y, Y)
+    C = numpy.matmul(WX.transpose(0, 2, 1), Y)
 
-        xy2n += numpy.add.reduce(x*x) + numpy.add.reduce(y*y)
+    ## the optimal rotation is the eigenvector of the largest eigenvalue;
+    ## eigh sorts eigenvalues in ascending order
+    evals, evecs = numpy.linalg.eigh(CalcQuaternionMatrices(C))
+    eval = evals[:, -1]
+    Q = evecs[:, :, -1]
 
-        R[0,0] += x[0]*y[0]
-        R[0,1] += x[0]*y[1]
-        R[0,2] += x[0]*y[2]
-        
-        R[1,0] += x[1]*y[0]
-        R[1,1] += x[1]*y[1]
-        R[1,2] += x[1]*y[2]
-        
-        R[2,0] += x[2]*y[0]
-        R[2,1] += x[2]*y[1]
-        R[2,2] += x[2]*y[2]
-
-    F = numpy.zeros((4,4), float)
-    F[0,0] = R[0,0] + R[1,1] + R[2,2]
-    F[0,1] = R[1,2] - R[2,1]
-    F[0,2] = R[2,0] - R[0,2]
-    F[0,3] = R[0,1] - R[1,0]
-
-    F[1,0] = F[0,1]
-    F[1,1] = R[0,0] - R[1,1] - R[2,2]
-    F[1,2] = R[0,1] + R[1,0]
-    F[1,3] = R[0,2] + R[2,0]
-
-    F[2,0] = F[0,2]
-    F[2,1] = F[1,2]
-    F[2,2] =-R[0,0] + R[1,1] - R[2,2]
-    F[2,3] = R[1,2] + R[2,1]
-
-    F[3,0] = F[0,3]
-    F[3,1] = F[1,3]
-    F[3,2] = F[2,3]
-    F[3,3] =-R[0,0] - R[1,1] + R[2,2]
-
-    evals, evecs = linalg.eigenvectors(F)
-
-    i = numpy.argmax(evals)
-    eval = evals[i]
-    evec = evecs[i]
-    
-    msd = (xy2n - 2.0*eval) / num_points
-    if msd < 0.0:
-        rmsd = 0.0
-    else:
-        rmsd = math.sqrt(msd)
+    msd = (xy2n - 2.0*eval) / wsum
+    rmsd = numpy.sqrt(numpy.maximum(msd, 0.0))
 
-    return SuperpositionResults(evec, src_org, dst_org, rmsd, num_points)
+    ## wsum is only the divisor; count the points actually used
+    num_atoms = numpy.count_nonzero(weights, axis = 1)
+    return SuperpositionBatchResults(Q, src_org, dst_org, rmsd, num_atoms)
 
 
 def SuperimposePositions(position_tuple_list):
     """Superimposes a list of 2-tuple atom pairs.
     """
-    n = len(position_tuple_list)
-    a1 = numpy.zeros((n,3), float)
-    a2 = numpy.zeros((n,3), float)
-    
-    for i in range(n):
-        pos1, pos2 = position_tuple_list[i]
-
-        a1[i] = pos1
-        a2[i] = pos2
-    
+    a1 = numpy.array([pos1 for pos1, pos2 in position_tuple_list], float)
+    a2 = numpy.array([pos2 for pos1, pos2 in position_tuple_list], float)
     return SuperimposePoints(a1, a2)
 
 
 def SuperimposeAtoms(atom_pair_list):
     """Superimposes a list of 2-tuple atom pairs.
     """
-    n = len(atom_pair_list)
-    a1 = numpy.zeros((n,3), float)
-    a2 = numpy.zeros((n,3), float)
-    
-    for i in range(n):
-        atm1, atm2 = atom_pair_list[i]
-
-        a1[i] = atm1.position
-        a2[i] = atm2.position
-    
+    a1 = numpy.array([atm1.position for atm1, atm2 in atom_pair_list], float)
+    a2 = numpy.array([atm2.position for atm1, atm2 in atom_pair_list], float)
     return SuperimposePoints(a1, a2)
 
 
+def CalcMatchingPoints(container_list, match = MATCH_CA):
+    """Extracts the coordinates of the matching atoms of a list of N
+    Segments, Chains, Models (or other containers with iter_atoms()) once.
+    Atoms match by fragment_id and name, and also by chain_id when the
+    containers are Models.  match is one of MATCH_CA, MATCH_BACKBONE or
+    MATCH_ALL, or a function taking an Atom and returning True to use it.
+    Returns the (xyz, mask, key_list) tuple: xyz(N,M,3) holds the positions
+    of the M matching atoms found in any container, mask(N,M) is True where
+    container i has atom j, and key_list holds the M atom keys.
+    """
+    if callable(match):
+        use_atom = match
+    else:
+        names = MATCH_ATOM_NAMES[match]
+        if names is None:
+            use_atom = lambda atm: True
+        else:
+            use_atom = lambda atm: atm.name in names
+
+    key_dict = {}
+    row_list = []
+    for container in container_list:
+        use_chain_id = not hasattr(container, "chain_id")
+        row = {}
+        for atm in container.iter_atoms():
+            if atm.position is None or not use_atom(atm):
+                continue
+            if use_chain_id:
+                key = (atm.chain_id, atm.fragment_id, atm.name)
+            else:
+                key = (atm.fragment_id, atm.name)
+            if key not in row:
+                row[key] = atm.position
+                key_dict.setdefault(key, len(key_dict))
+        row_list.append(row)
+
+    xyz = numpy.zeros((len(row_list), len(key_dict), 3), float)
+    mask = numpy.zeros((len(row_list), len(key_dict)), bool)
+    for i, row in enumerate(row_list):
+        index = [key_dict[key] for key in row]
+        if len(index) > 0:
+            xyz[i, index] = list(row.values())
+            mask[i, index] = True
+
+    key_list = list(key_dict)
+    return xyz, mask, key_list
+
+
+def CalcRMSDRows(xyz, mask, rows, min_atoms = 3):
+    """Computes rows of the upper triangle of the RMSD matrix of
+    CalcRMSDMatrixPoints(): for each row i, the optimal RMSD of point set
+    i against sets i+1..N-1 over their common points, NaN where fewer than
+    min_atoms points are common.  Returns the list of (i, rmsd_row) pairs.
+    """
+    result_list = []
+    for i in rows:
+        weights = mask[i + 1:] & mask[i]
+        count = numpy.sum(weights, axis = 1)
+        use = count >= max(min_atoms, 1)
+
+        rmsd_row = numpy.empty(len(weights), float)
+        rmsd_row[:] = numpy.nan
+        if numpy.any(use):
+            batch = SuperimposePointsBatch(xyz[i + 1:][use], xyz[i], weights[use])
+            rmsd_row[use] = batch.rmsd
+        result_list.append((i, rmsd_row))
+    return result_list
+
+
+def CalcRMSDMatrixPoints(xyz, mask = None, min_atoms = 3, num_procs = 1):
+    """Returns the symmetric (N,N) matrix of optimal superposition RMSDs of
+    every pair of the N point sets in the (N,M,3) array xyz, superimposing
+    each pair on the points both have in the optional (N,M) mask.  Pairs
+    with fewer than min_atoms common points are NaN.  With num_procs > 1
+    the rows are computed by a pool of worker processes.
+    """
+    xyz = numpy.asarray(xyz, float)
+    num_sets = len(xyz)
+    if mask is None:
+        mask = numpy.ones(xyz.shape[:2], bool)
+
+    rmsd = numpy.zeros((num_sets, num_sets), float)
+    rows = list(range(num_sets - 1))
+
+    if num_procs > 1 and len(rows) > 1:
+        ## row i has N-1-i superpositions, so deal rows out in turn to
+        ## balance the work
+        chunks = [rows[p::num_procs] for p in range(num_procs) if rows[p::num_procs]]
+        with concurrent.futures.ProcessPoolExecutor(len(chunks)) as pool:
+            result_lists = list(pool.map(
+                CalcRMSDRows,
+                [xyz] * len(chunks), [mask] * len(chunks), chunks,
+                [min_atoms] * len(chunks)))
+    else:
+        result_lists = [CalcRMSDRows(xyz, mask, rows, min_atoms)]
+
+    for result_list in result_lists:
+        for i, rmsd_row in result_list:
+            rmsd[i, i + 1:] = rmsd_row
+            rmsd[i + 1:, i] = rmsd_row
+
+    return rmsd
+
+
+def CalcRMSDMatrix(container_list, match = MATCH_CA, min_atoms = 3, num_procs = 1):
+    """Returns the symmetric all-vs-all optimal superposition RMSD matrix of
+    a list of Segments, Chains or Models, such as NCS copies or the models
+    of an NMR ensemble.  Atoms are matched with CalcMatchingPoints() and
+    every pair is superimposed on the atoms both have; see
+    CalcRMSDMatrixPoints() for min_atoms and num_procs.
+    """
+    xyz, mask, key_list = CalcMatchingPoints(container_list, match)
+    return CalcRMSDMatrixPoints(xyz, mask, min_atoms, num_procs)
+
+
+class OutlierRejectionResults(object):
+    """Returns the results of SuperimposePointsOutlierRejection():
+
+    sresult      - SuperpositionResults of the last fit, or None if no fit
+                   was possible
+    inlier_mask  - boolean array of the points used in the last fit
+    cycle_list   - one (num_atoms, rmsd, num_rejected) tuple per cycle
+    converged    - True if the last fit has rmsd <= rmsd_cutoff
+    """
+    def __init__(self, sresult, inlier_mask, cycle_list, converged):
+        self.sresult = sresult
+        self.inlier_mask = inlier_mask
+        self.cycle_list = cycle_list
+        self.converged = converged
+
+
+def SuperimposePointsOutlierRejection(src_points, dst_points,
+                                      rmsd_cutoff = 1.0,
+                                      max_cycles = 100,
+                                      max_outliers = None,
+                                      min_atoms = 3):
+    """Superimposes two 1:1 (n,3) point arrays, omitting points with large
+    deviations each cycle until the rmsd of the least squares superposition
+    is less than or equal to rmsd_cutoff, or the number of cycles exceeds
+    max_cycles.  Each cycle drops every remaining point which deviates by
+    rmsd_cutoff or more after the fit, or only the max_outliers worst of
+    them if max_outliers is given.  Returns a OutlierRejectionResults.
+    """
+    src_points = numpy.asarray(src_points, float)
+    dst_points = numpy.asarray(dst_points, float)
+
+    mask = numpy.ones(len(src_points), bool)
+    cycle_list = []
+    sresult = None
+
+    for cycle in range(max_cycles):
+        if numpy.sum(mask) < min_atoms:
+            break
+
+        sresult = SuperimposePoints(src_points[mask], dst_points[mask])
+        if sresult.rmsd <= rmsd_cutoff:
+            cycle_list.append((sresult.num_atoms, sresult.rmsd, 0))
+            return OutlierRejectionResults(sresult, mask, cycle_list, True)
+
+        delta = sresult.transform_array(src_points) - dst_points
+        deviation = numpy.sqrt(numpy.sum(delta * delta, axis = 1))
+        outliers = numpy.nonzero(mask & (deviation >= rmsd_cutoff))[0]
+        if max_outliers is not None and len(outliers) > max_outliers:
+            order = numpy.argsort(deviation[outliers], kind = "stable")
+            outliers = outliers[order[len(order) - max_outliers:]]
+
+        cycle_list.append((sresult.num_atoms, sresult.rmsd, len(outliers)))
+        if len(outliers) == 0:
+            break
+        mask = mask.copy()
+        mask[outliers] = False
+
+    return OutlierRejectionResults(sresult, mask, cycle_list, False)
+
+
 def SuperimposeAtomsOutlierRejection(alist, rmsd_cutoff = 1.0, max_cycles = 100):
     """Superimpose two homologous protein chains. The argument alist is a list of
     2-tuples. The 2-tuples are the 1:1 atoms to superimpose. The alignment
-    procedure incrementally omits atoms with large deviations until the rmsd of
-    the least squares superposition is less than or equal to rmsd_cutoff, or the
-    number of cycles exceeds max_cycles.
+    procedure incrementally omits atoms with large deviations, at most 10
+    per cycle, until the rmsd of the least squares superposition is less
+    than or equal to rmsd_cutoff, or the number of cycles exceeds
+    max_cycles.  The omitted atom pairs are removed from alist.  Returns
+    the SuperpositionResults, or None if the rmsd_cutoff was not reached.
     """
-    for cycle in range(max_cycles):
-        sresult = SuperimposeAtoms(alist)
-        print("Cycle %d NA: %5d RMSD %6.2f" % (cycle, sresult.num_atoms, sresult.rmsd))
-        if sresult.rmsd <= rmsd_cutoff:
-            return sresult
-
-        deviation = []
-        for i in range(len(alist)):
-            satm, datm = alist[i]            
-            spos = sresult.transform(satm.position)
-            deviation.append((AtomMath.length(spos - datm.position), i))
-        deviation.sort()
-
-        outliers = deviation[-10:]
-        outliersr = [(x[1], x[0]) for x in outliers]
-        outliersr.sort()
-        outliersr.reverse()
-        
-        for i, d in outliersr:
-            if d < rmsd_cutoff: continue
-            del alist[i]
+    a1 = numpy.array([atm1.position for atm1, atm2 in alist], float)
+    a2 = numpy.array([atm2.position for atm1, atm2 in alist], float)
+
+    result = SuperimposePointsOutlierRejection(
+        a1, a2, rmsd_cutoff, max_cycles, max_outliers = 10, min_atoms = 1)
+
+    alist[:] = [pair for pair, inlier in zip(alist, result.inlier_mask) if inlier]
+
+    if not result.converged:
+        return None
+    return result.sresult
+
 
-    return None
-        
 ## <testing>
 def test_module():
     import random
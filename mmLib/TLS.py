@@ -5,18 +5,10 @@
 """Utility classes for loading, manipulating, and analyzing TLS parameters.
 """
 import re
-import fpformat
 import math
+import concurrent.futures
 
-try:
-    import numpy
-    try:
-        from numpy.oldnumeric import linear_algebra as linalg
-    except ImportError:
-        from numpy.linalg import old as linalg
-except ImportError:
-    from . import NumericCompat as numpy
-    from .NumericCompat import linalg
+import numpy
 
 from . import Constants
 from . import ConsoleOutput
@@ -1222,33 +1214,64 @@ class TLSFileFormatPHENIX(TLSFileFormat):
 
 def solve_TLS_Ab(A, b):
     """Solve an overdetermined TLS system by singular value decomposition.
+    Singular values smaller than 1E-10 of the largest are treated as zero.
     """
-    ## solve by SVD
-    U, W, Vt = linalg.singular_value_decomposition(A, full_matrices=0)
+    x, residues, rank, W = numpy.linalg.lstsq(A, b, rcond = 1E-10)
+    return x
 
-    V  = numpy.transpose(Vt)
-    Ut = numpy.transpose(U)
+def calc_atom_arrays(atom_list, origin, weight_dict=None):
+    """Returns the (n,3) array of the atom positions relative to origin,
+    the (n,3,3) array of the atom U tensors, and the (n) array of the
+    least-squares weights sqrt(weight_dict[atm]) (all 1.0 without a
+    weight_dict) of the atoms in atom_list.
+    """
+    num_atoms = len(atom_list)
 
-    ## analyze singular values and generate smallness cutoff
-    cutoff = max(W) * 1E-10
+    xyz = numpy.zeros((num_atoms, 3), float)
+    U = numpy.zeros((num_atoms, 3, 3), float)
+    for i, atm in enumerate(atom_list):
+        xyz[i] = atm.position
+        U[i] = atm.get_U()
+    xyz -= origin
 
-    ## make W
-    dim_W = len(W)
-    Wi = numpy.zeros((dim_W, dim_W), float)
+    if weight_dict is None:
+        w = numpy.ones(num_atoms, float)
+    else:
+        w = numpy.sqrt(numpy.array([weight_dict[atm] for atm in atom_list], float))
 
-    for i in range(dim_W):
-        if W[i]>cutoff:
-            Wi[i,i] = 1.0 / W[i]
-        else:
-            #print "SVD: ill conditioned value %d=%f" % (i, W[i])
-            Wi[i,i] = 0.0
+    return xyz, U, w
 
-    ## solve for x
-    Utb  = numpy.dot(Ut, b)
-    WUtb = numpy.dot(Wi, Utb)
-    x    = numpy.dot(V, WUtb)
+def calc_TLS_tensors(X):
+    """Returns the T, L, S tensors of the first 20 parameters of a TLS
+    least-squares solution X, in the column order of calc_TLS_A_array().
+    For a (m,k) stack of solutions (m,3,3) stacks of tensors are returned.
+    """
+    X = numpy.asarray(X, float)
 
-    return x
+    ## use label indexing to avoid confusion!
+    T11, T22, T33, T12, T13, T23, L11, L22, L33, L12, L13, L23, \
+    S1133, S2211, S12, S13, S23, S21, S31, S32 = (
+        0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19)
+
+    T = X[..., [ [ T11, T12, T13 ],
+                 [ T12, T22, T23 ],
+                 [ T13, T23, T33 ] ] ]
+
+    L = X[..., [ [ L11, L12, L13 ],
+                 [ L12, L22, L23 ],
+                 [ L13, L23, L33 ] ] ]
+
+    s11, s22, s33 = calc_s11_s22_s33(X[..., S2211], X[..., S1133])
+
+    ## the diagonal is overwritten below
+    S = X[..., [ [ S1133, S12,   S13   ],
+                 [ S21,   S2211, S23   ],
+                 [ S31,   S32,   S1133 ] ] ]
+    S[..., 0, 0] = s11
+    S[..., 1, 1] = s22
+    S[..., 2, 2] = s33
+
+    return T, L, S
 
 def calc_rmsd(msd):
     """Calculate RMSD from a given MSD.
@@ -1302,6 +1325,60 @@ def set_TLSiso_A(A, i, j, x, y, z, w):
     A[UISO, S2]  = w * (( 2.0 * y) / 3.0)
     A[UISO, S3]  = w * (( 2.0 * x) / 3.0)
 
+def calc_TLSiso_A_array(xyz, w):
+    """Returns the (n,10) isotropic TLS design matrix of the atoms at the
+    (n,3) positions xyz with (n) least-squares weights w; row i is the row
+    set_TLSiso_A() would set for atom i.
+    """
+    x = xyz[:,0]
+    y = xyz[:,1]
+    z = xyz[:,2]
+
+    xx = x*x
+    yy = y*y
+    zz = z*z
+
+    A = numpy.empty((len(xyz), 10), float)
+    A[:,0] = 1.0
+    A[:,1] = (zz + yy) / 3.0
+    A[:,2] = (xx + zz) / 3.0
+    A[:,3] = (xx + yy) / 3.0
+    A[:,4] = (-2.0 * x*y) / 3.0
+    A[:,5] = (-2.0 * x*z) / 3.0
+    A[:,6] = (-2.0 * y*z) / 3.0
+    A[:,7] = ( 2.0 * z) / 3.0
+    A[:,8] = ( 2.0 * y) / 3.0
+    A[:,9] = ( 2.0 * x) / 3.0
+    A *= w[:,numpy.newaxis]
+    return A
+
+def calc_itls_least_squares_fit(atom_list, origin, weight_dict=None):
+    """Perform a LSQ fit of the isotropic TLS model to the temperature
+    factors of the given AtomList.  The tensors are calculated at the
+    given origin, with weights of weight_dict[atm].  Return values are
+    iT, iL[3,3], iS[3], lsq_residual, as used by calc_itls_uiso().
+    """
+    xyz, U, w = calc_atom_arrays(atom_list, origin, weight_dict)
+    uiso = numpy.array([atm.temp_factor for atm in atom_list], float) * Constants.B2U
+
+    A = calc_TLSiso_A_array(xyz, w)
+    B = w * uiso
+
+    ## solve by SVD
+    X = solve_TLS_Ab(A, B)
+
+    iT = X[0]
+    iL = numpy.array([ [ X[1], X[4], X[5] ],
+                       [ X[4], X[2], X[6] ],
+                       [ X[5], X[6], X[3] ] ], float)
+    iS = X[7:10].copy()
+
+    ## calculate the lsq residual
+    D = numpy.dot(A, X) - B
+    lsq_residual = numpy.dot(D, D)
+
+    return iT, iL, iS, lsq_residual
+
 def calc_itls_uiso(T, L, S, position):
     """Calculate the TLS predicted uiso from the isotropic TLS model for the 
     atom at position.
@@ -1319,11 +1396,32 @@ def calc_itls_uiso(T, L, S, position):
         + 2.0*S[0]*z + 2.0*S[1]*y + 2.0*S[2]*x) / 3.0
     return u_tls
 
+def calc_itls_uiso_array(T, L, S, xyz):
+    """Returns the (n) array of the calc_itls_uiso() isotropic TLS model
+    uiso of the atoms at the (n,3) positions xyz (relative to the origin).
+    """
+    xyz = numpy.asarray(xyz, float)
+    x = xyz[:,0]
+    y = xyz[:,1]
+    z = xyz[:,2]
+
+    xx = x*x
+    yy = y*y
+    zz = z*z
+
+    ## note: S1 == S21-S12; S2 == S13-S31; S3 == S32-S23 
+    u_tls = T + (
+        L[0,0]*(zz+yy) + L[1,1]*(xx+zz) + L[2,2]*(xx+yy)
+        - 2.0*L[0,1]*x*y - 2.0*L[0,2]*x*z - 2.0*L[1,2]*y*z
+        + 2.0*S[0]*z + 2.0*S[1]*y + 2.0*S[2]*x) / 3.0
+    return u_tls
+
 def iter_itls_uiso(atom_iter, T, L, S, O):
     """Iterates the pair (atom, u_iso)
     """
-    for atm in atom_iter:
-        yield atm, calc_itls_uiso(T, L, S, atm.position - O)
+    atom_list = list(atom_iter)
+    xyz = numpy.array([atm.position for atm in atom_list], float).reshape((-1, 3))
+    return zip(atom_list, calc_itls_uiso_array(T, L, S, xyz - O))
 
 def calc_itls_center_of_reaction(iT, iL, iS, origin):
     """iT is a single float; iL[3,3]; iS[3]
@@ -1383,7 +1481,9 @@ def calc_itls_center_of_reaction(iT, iL, iS, origin):
     rdict["Tr3_rmsd"] = 0.0
 
     ## set the L tensor eigenvalues and eigenvectors
-    (L_evals, RL) = linalg.eigenvectors(L0)
+    ## eigenvectors of L0 as the rows of RL
+    (L_evals, RL) = numpy.linalg.eig(L0)
+    RL = numpy.transpose(RL).copy()
     L1, L2, L3 = L_evals
 
     good_L_eigens = []
@@ -1405,7 +1505,7 @@ def calc_itls_center_of_reaction(iT, iL, iS, origin):
 
     ## no good L eigenvalues
     if len(good_L_eigens) == 0:
-        Tr1, Tr2, Tr3 = linalg.eigenvalues(T0)
+        Tr1, Tr2, Tr3 = numpy.linalg.eigvals(T0)
 
         if numpy.allclose(Tr1, 0.0) or isinstance(Tr1, complex):
             Tr1 = 0.0
@@ -1469,12 +1569,12 @@ def calc_itls_center_of_reaction(iT, iL, iS, origin):
     ## begin tensor transformations which depend upon
     ## the eigenvectors of L0 being well-determined
     ## make sure RLt is right-handed
-    if numpy.allclose(linalg.determinant(RL), -1.0):
+    if numpy.allclose(numpy.linalg.det(RL), -1.0):
         I = numpy.identity(3, float)
         I[0,0] = -1.0
         RL = numpy.dot(I, RL)
 
-    if not numpy.allclose(linalg.determinant(RL), 1.0):
+    if not numpy.allclose(numpy.linalg.det(RL), 1.0):
         return rdict
 
     RLt = numpy.transpose(RL)
@@ -1624,6 +1724,51 @@ def calc_Utls(T, L, S, position):
                         [u12, u22, u23],
                         [u13, u23, u33]], float)
 
+def calc_Utls_array(T, L, S, xyz):
+    """Returns the (n,3,3) array of the calc_Utls() anisotropic U tensors
+    of the atoms at the (n,3) positions xyz (relative to the TLS origin).
+    """
+    xyz = numpy.asarray(xyz, float)
+    x = xyz[:,0]
+    y = xyz[:,1]
+    z = xyz[:,2]
+
+    xx = x*x
+    yy = y*y
+    zz = z*z
+
+    xy = x*y
+    yz = y*z
+    xz = x*z
+
+    U = numpy.empty((len(xyz), 3, 3), float)
+    U[:,0,0] = T[0,0] + L[1,1]*zz + L[2,2]*yy - 2.0*L[1,2]*yz + 2.0*S[1,0]*z - 2.0*S[2,0]*y
+    U[:,1,1] = T[1,1] + L[0,0]*zz + L[2,2]*xx - 2.0*L[2,0]*xz - 2.0*S[0,1]*z + 2.0*S[2,1]*x
+    U[:,2,2] = T[2,2] + L[0,0]*yy + L[1,1]*xx - 2.0*L[0,1]*xy - 2.0*S[1,2]*x + 2.0*S[0,2]*y
+    U[:,0,1] = T[0,1] - L[2,2]*xy + L[1,2]*xz + L[2,0]*yz - L[0,1]*zz - S[0,0]*z + S[1,1]*z + S[2,0]*x - S[2,1]*y
+    U[:,0,2] = T[0,2] - L[1,1]*xz + L[1,2]*xy - L[2,0]*yy + L[0,1]*yz + S[0,0]*y - S[2,2]*y + S[1,2]*z - S[1,0]*x
+    U[:,1,2] = T[1,2] - L[0,0]*yz - L[1,2]*xx + L[2,0]*xy + L[0,1]*xz - S[1,1]*x + S[2,2]*x + S[0,1]*y - S[0,2]*z
+    U[:,1,0] = U[:,0,1]
+    U[:,2,0] = U[:,0,2]
+    U[:,2,1] = U[:,1,2]
+    return U
+
+def calc_Utls_fit_statistics(U, Utls):
+    """Compares the (n,3,3) observed anisotropic ADP tensors U with the
+    TLS predicted tensors Utls.  Returns a dictionary of (n) arrays:
+    lsq_residual (the sum of the squared differences of the six unique
+    components, as minimized by the TLS fit), CCuij and Suij (see
+    AtomMath.calc_CCuij_array, NaN for tensors which are not positive
+    definite).
+    """
+    D = numpy.asarray(U, float) - numpy.asarray(Utls, float)
+    lsq_residual = D[:,0,0]**2 + D[:,1,1]**2 + D[:,2,2]**2 + \
+                   D[:,0,1]**2 + D[:,0,2]**2 + D[:,1,2]**2
+
+    return {"lsq_residual": lsq_residual,
+            "CCuij":        AtomMath.calc_CCuij_array(U, Utls),
+            "Suij":         AtomMath.calc_Suij_array(U, Utls)}
+
 def calc_LS_displacement(cor, Lval, Lvec, Lrho, Lpitch, position, prob):
     """Returns the amount of rotational displacement from L for an atom at the 
     given position.
@@ -1725,58 +1870,138 @@ def set_TLS_b(b, i, u11, u22, u33, u12, u13, u23, w):
     b[i+4] = w * u13
     b[i+5] = w * u23
 
-def calc_TLS_least_squares_fit(atom_list, origin, weight_dict=None):
-    """Perform a LSQ-TLS fit on the given AtomList.  The TLS tensors
-    are calculated at the given origin, with weights of weight_dict[atm].
-    Return values are T, L, S, lsq_residual. 
-    """    
-    ## calculate the number of parameters in the model
-    num_atoms = len(atom_list)
-    params = 20
+def calc_L_A_array(xyz):
+    """Returns the (n,6,6) L tensor coefficients (columns L11, L22, L33,
+    L12, L13, L23) of the six U rows (U11, U22, U33, U12, U13, U23) of
+    each of the atoms at the (n,3) positions xyz.
+    """
+    x = xyz[:,0]
+    y = xyz[:,1]
+    z = xyz[:,2]
 
-    A = numpy.zeros((num_atoms * 6, params), float)
-    B = numpy.zeros(num_atoms * 6,  float)
+    xx = x*x
+    yy = y*y
+    zz = z*z
 
-    i = -1
-    for atm in atom_list:
-        i += 1
-        iU11 = i * 6
+    xy = x*y
+    xz = x*z
+    yz = y*z
 
-        ## is this fit weighted?
-        if weight_dict is not None:
-            w = math.sqrt(weight_dict[atm])
-        else:
-            w = 1.0
+    U11, U22, U33, U12, U13, U23 = 0, 1, 2, 3, 4, 5
+    L11, L22, L33, L12, L13, L23 = 0, 1, 2, 3, 4, 5
 
-        ## set the b vector
-        U = atm.get_U()
-        set_TLS_b(B, iU11, U[0,0], U[1,1], U[2,2], U[0,1], U[0,2], U[1,2], w)
+    A = numpy.zeros((len(xyz), 6, 6), float)
 
-        ## set the A matrix
-        x, y, z = atm.position - origin
-        set_TLS_A(A, iU11, 0, x, y, z, w)
+    A[:, U11, L22] =        zz
+    A[:, U11, L33] =        yy
+    A[:, U11, L23] = -2.0 * yz
 
-    ## solve by SVD
-    X = solve_TLS_Ab(A, B)
+    A[:, U22, L11] =        zz
+    A[:, U22, L33] =        xx
+    A[:, U22, L13] = -2.0 * xz
+
+    A[:, U33, L11] =        yy
+    A[:, U33, L22] =        xx
+    A[:, U33, L12] = -2.0 * xy
+
+    A[:, U12, L33] = -xy
+    A[:, U12, L23] =  xz
+    A[:, U12, L13] =  yz
+    A[:, U12, L12] = -zz
+
+    A[:, U13, L22] = -xz
+    A[:, U13, L23] =  xy
+    A[:, U13, L13] = -yy
+    A[:, U13, L12] =  yz
+
+    A[:, U23, L11] = -yz
+    A[:, U23, L23] = -xx
+    A[:, U23, L13] =  xy
+    A[:, U23, L12] =  xz
+
+    return A
+
+def calc_TLS_A_array(xyz, w):
+    """Returns the (n,6,20) TLS design matrix blocks of the atoms at the
+    (n,3) positions xyz with (n) least-squares weights w.  Block i holds
+    the six rows set_TLS_A() would set for atom i; reshape it to
+    (6n,20) for the full matrix.
+    """
+    x = xyz[:,0]
+    y = xyz[:,1]
+    z = xyz[:,2]
 
     ## use label indexing to avoid confusion!
     T11, T22, T33, T12, T13, T23, L11, L22, L33, L12, L13, L23, \
     S1133, S2211, S12, S13, S23, S21, S31, S32 = (
         0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19)
+    U11, U22, U33, U12, U13, U23 = 0, 1, 2, 3, 4, 5
+
+    A = numpy.zeros((len(xyz), 6, 20), float)
+
+    A[:, U11, T11] = 1.0
+    A[:, U22, T22] = 1.0
+    A[:, U33, T33] = 1.0
+    A[:, U12, T12] = 1.0
+    A[:, U13, T13] = 1.0
+    A[:, U23, T23] = 1.0
+
+    A[:, :, L11:L23+1] = calc_L_A_array(xyz)
+
+    A[:, U11, S31] = -2.0 * y
+    A[:, U11, S21] =  2.0 * z
+
+    A[:, U22, S12] = -2.0 * z
+    A[:, U22, S32] =  2.0 * x
+
+    A[:, U33, S23] = -2.0 * x
+    A[:, U33, S13] =  2.0 * y
+
+    A[:, U12, S2211] =  z
+    A[:, U12, S31]   =  x
+    A[:, U12, S32]   = -y
 
-    T = numpy.array([ [ X[T11], X[T12], X[T13] ],
-                      [ X[T12], X[T22], X[T23] ],
-                      [ X[T13], X[T23], X[T33] ] ], float)
+    A[:, U13, S1133] =  y
+    A[:, U13, S23]   =  z
+    A[:, U13, S21]   = -x
 
-    L = numpy.array([ [ X[L11], X[L12], X[L13] ],
-                      [ X[L12], X[L22], X[L23] ],
-                      [ X[L13], X[L23], X[L33] ] ], float)
+    A[:, U23, S2211] = -x
+    A[:, U23, S1133] = -x
+    A[:, U23, S12]   =  y
+    A[:, U23, S13]   = -z
 
-    s11, s22, s33 = calc_s11_s22_s33(X[S2211], X[S1133])
+    A *= w[:, numpy.newaxis, numpy.newaxis]
+    return A
+
+def calc_TLS_b_array(U, w):
+    """Returns the (n,6) target vector blocks (U11, U22, U33, U12, U13,
+    U23) of the (n,3,3) anisotropic ADP tensors U with (n) least-squares
+    weights w; reshape it to (6n) for the full vector.
+    """
+    b = numpy.empty((len(U), 6), float)
+    b[:,0] = U[:,0,0]
+    b[:,1] = U[:,1,1]
+    b[:,2] = U[:,2,2]
+    b[:,3] = U[:,0,1]
+    b[:,4] = U[:,0,2]
+    b[:,5] = U[:,1,2]
+    b *= w[:, numpy.newaxis]
+    return b
+
+def calc_TLS_least_squares_fit(atom_list, origin, weight_dict=None):
+    """Perform a LSQ-TLS fit on the given AtomList.  The TLS tensors
+    are calculated at the given origin, with weights of weight_dict[atm].
+    Return values are T, L, S, lsq_residual. 
+    """    
+    xyz, U, w = calc_atom_arrays(atom_list, origin, weight_dict)
+
+    A = calc_TLS_A_array(xyz, w).reshape((-1, 20))
+    B = calc_TLS_b_array(U, w).reshape(-1)
+
+    ## solve by SVD
+    X = solve_TLS_Ab(A, B)
 
-    S = numpy.array([ [    s11, X[S12], X[S13] ],
-                      [ X[S21],    s22, X[S23] ],
-                      [ X[S31], X[S32],    s33 ] ], float)
+    T, L, S = calc_TLS_tensors(X)
 
     ## calculate the lsq residual
     UTLS = numpy.dot(A, X)
@@ -1785,6 +2010,68 @@ def calc_TLS_least_squares_fit(atom_list, origin, weight_dict=None):
 
     return T, L, S, lsq_residual
 
+def calc_TLS_origin_shift_matrix(d):
+    """Returns the (20,20) matrix N which converts the TLS parameter vector
+    X of a fit at some origin into the equivalent parameters N X at the
+    origin moved by the vector d, so that
+    calc_TLS_A_array(xyz + d, w) == calc_TLS_A_array(xyz, w) N.
+    For a (m,3) array of vectors d a (m,20,20) array is returned.
+    """
+    d = numpy.asarray(d, float)
+    dv = d.reshape((-1, 3))
+    a = dv[:,0]
+    b = dv[:,1]
+    c = dv[:,2]
+
+    ## use label indexing to avoid confusion!
+    L11, L22, L33, L12, L13, L23, \
+    S1133, S2211, S12, S13, S23, S21, S31, S32 = (
+        6,7,8,9,10,11,12,13,14,15,16,17,18,19)
+
+    N = numpy.zeros((len(dv), 20, 20), float)
+    N[:] = numpy.identity(20, float)
+
+    ## T picks up the L and S contributions at d
+    N[:, :6, 6:] = calc_TLS_A_array(dv, numpy.ones(len(dv), float))[:, :, 6:]
+
+    ## S picks up the L contributions linear in d; L is unchanged
+    N[:, S1133, L23] =  a
+    N[:, S1133, L13] = -2.0 * b
+    N[:, S1133, L12] =  c
+    N[:, S2211, L23] =  a
+    N[:, S2211, L13] =  b
+    N[:, S2211, L12] = -2.0 * c
+    N[:, S12,   L13] =  a
+    N[:, S12,   L11] = -c
+    N[:, S13,   L11] =  b
+    N[:, S13,   L12] = -a
+    N[:, S23,   L12] =  b
+    N[:, S23,   L22] = -a
+    N[:, S21,   L22] =  c
+    N[:, S21,   L23] = -b
+    N[:, S31,   L23] =  c
+    N[:, S31,   L33] = -b
+    N[:, S32,   L33] =  a
+    N[:, S32,   L13] = -c
+
+    if d.ndim == 1:
+        return N[0]
+    return N
+
+def solve_TLS_normal_equations(ATA, ATb):
+    """Solves the normal equations (A^T A) x = A^T b of a TLS system by
+    eigen decomposition of the symmetric matrix A^T A, treating singular
+    values of A smaller than 1E-10 of the largest as zero like
+    solve_TLS_Ab().  ATA and ATb may also be (m,k,k) and (m,k) stacks of
+    systems, which are solved together.
+    """
+    evals, evecs = numpy.linalg.eigh(ATA)
+    cutoff = numpy.max(evals, axis = -1)[..., numpy.newaxis] * 1E-20
+    inv_evals = numpy.where(evals > cutoff, 1.0 / numpy.where(evals > cutoff, evals, 1.0), 0.0)
+
+    VtATb = numpy.einsum("...ji,...j->...i", evecs, ATb)
+    return numpy.einsum("...ij,...j->...i", evecs, inv_evals * VtATb)
+
 def calc_TLS_center_of_reaction(T0, L0, S0, origin):
     """Calculate new tensors based on the center for reaction.
     This method returns a dictionary of the calculations:
@@ -1841,7 +2128,9 @@ def calc_TLS_center_of_reaction(T0, L0, S0, origin):
     rdict["Tr3_rmsd"] = 0.0
 
     ## set the L tensor eigenvalues and eigenvectors
-    (L_evals, RL) = linalg.eigenvectors(L0)
+    ## eigenvectors of L0 as the rows of RL
+    (L_evals, RL) = numpy.linalg.eig(L0)
+    RL = numpy.transpose(RL).copy()
     L1, L2, L3 = L_evals
 
     good_L_eigens = []
@@ -1911,12 +2200,12 @@ def calc_TLS_center_of_reaction(T0, L0, S0, origin):
     ## begin tensor transformations which depend upon
     ## the eigenvectors of L0 being well-determined
     ## make sure RLt is right-handed
-    if numpy.allclose(linalg.determinant(RL), -1.0):
+    if numpy.allclose(numpy.linalg.det(RL), -1.0):
         I = numpy.identity(3, float)
         I[0,0] = -1.0
         RL = numpy.dot(I, RL)
 
-    if not numpy.allclose(linalg.determinant(RL), 1.0):
+    if not numpy.allclose(numpy.linalg.det(RL), 1.0):
         return rdict
 
     RLt = numpy.transpose(RL)
@@ -2066,7 +2355,7 @@ def calc_TLS_center_of_reaction(T0, L0, S0, origin):
     Tr = numpy.dot(numpy.dot(RLt, cTred), RL)
     rdict["rT'"] = Tr
 
-    Tr1, Tr2, Tr3 = linalg.eigenvalues(Tr)
+    Tr1, Tr2, Tr3 = numpy.linalg.eigvals(Tr)
 
     if numpy.allclose(Tr1, 0.0) or isinstance(Tr1, complex):
         Tr1 = 0.0
@@ -2095,58 +2384,29 @@ def calc_TLS_plus_b_least_squares_fit(atom_list, origin, weight_dict=None):
     about the CA atom.  This model uses 20 TLS parameters and 6
     libration parameters per side chain.
     """
+    xyz, U, w = calc_atom_arrays(atom_list, origin, weight_dict)
+    assert numpy.all(numpy.trace(U, axis1 = 1, axis2 = 2) > 0.0)
+
     ## calculate the number of parameters in the model
     num_atoms = len(atom_list)
     params = 20 + num_atoms
 
-    A = numpy.zeros((num_atoms * 6, params), float)
-    B = numpy.zeros(num_atoms * 6,  float)
-
-    i = -1
-    for atm in atom_list:
-        i += 1
-        iU11 = i * 6
-
-        if weight_dict is None:
-            w = 1.0
-        else:
-            w = math.sqrt(weight_dict[atm])
-
-        ## set the b vector
-        U = atm.get_U()
-        assert numpy.trace(U) > 0.0
-        set_TLS_b(B, iU11, U[0,0], U[1,1], U[2,2], U[0,1], U[0,2], U[1,2], w)
+    A = numpy.zeros((num_atoms, 6, params), float)
+    A[:, :, :20] = calc_TLS_A_array(xyz, w)
 
-        ## set the A matrix
-        x, y, z = atm.position - origin
-        set_TLS_A(A, iU11, 0, x, y, z, w)
+    ## set A for additional Uiso / atom
+    atom_index = numpy.arange(num_atoms)
+    A[atom_index, 0, 20 + atom_index] = 1.0
+    A[atom_index, 1, 20 + atom_index] = 1.0
+    A[atom_index, 2, 20 + atom_index] = 1.0
 
-        ## set A for additional Uiso / atom
-        A[iU11,   20+i] = 1.0
-        A[iU11+1, 20+i] = 1.0
-        A[iU11+2, 20+i] = 1.0
+    A = A.reshape((-1, params))
+    B = calc_TLS_b_array(U, w).reshape(-1)
 
     ## solve by SVD
     X = solve_TLS_Ab(A, B)
 
-    ## use label indexing to avoid confusion!
-    T11, T22, T33, T12, T13, T23, L11, L22, L33, L12, L13, L23, \
-    S1133, S2211, S12, S13, S23, S21, S31, S32 = (
-        0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19)
-
-    T = numpy.array([ [ X[T11], X[T12], X[T13] ],
-                [ X[T12], X[T22], X[T23] ],
-                [ X[T13], X[T23], X[T33] ] ], float)
-
-    L = numpy.array([ [ X[L11], X[L12], X[L13] ],
-                [ X[L12], X[L22], X[L23] ],
-                [ X[L13], X[L23], X[L33] ] ], float)
-
-    s11, s22, s33 = calc_s11_s22_s33(X[S2211], X[S1133])
-
-    S = numpy.array([ [    s11, X[S12], X[S13] ],
-                [ X[S21],    s22, X[S23] ],
-                [ X[S31], X[S32],    s33 ] ], float)
+    T, L, S = calc_TLS_tensors(X)
 
     ## calculate the lsq residual
     UTLS = numpy.dot(A, X)
@@ -2159,12 +2419,7 @@ def calc_TLS_plus_b_least_squares_fit(atom_list, origin, weight_dict=None):
     rdict["S"] = S
     rdict["lsq_residual"] = lsq_residual
 
-    uiso_residual = {}
-    i = 19
-    for atm in atom_list:
-        i += 1
-        uiso_residual[atm] = X[i]
-    rdict["uiso_residual"] = uiso_residual
+    rdict["uiso_residual"] = dict(zip(atom_list, X[20:]))
 
     return rdict
 
@@ -2265,25 +2520,14 @@ def calc_TLSCA_least_squares_fit(segment, origin):
 
     params = (6 * num_pivot_frags) + 20
 
-    A = numpy.zeros((num_atoms * 6, params), float)
-    B = numpy.zeros(num_atoms * 6,  float)
+    atom_list = list(segment.iter_atoms())
+    xyz, U, w = calc_atom_arrays(atom_list, origin)
 
-    i = -1
-    for atm in segment.iter_atoms():
-        i += 1
-        iU11 = i * 6
-
-        ## set the b vector
-        U = atm.get_U()
-        set_TLS_b(B, iU11,
-                  U[0,0], U[1,1], U[2,2], U[0,1], U[0,2], U[1,2],
-                  1.0)
-
-        ## set the A matrix
-        x, y, z = atm.position - origin
-        set_TLS_A(A, iU11, 0, x, y, z, 1.0)
-
-        ## independent side-chain Ls tensor
+    ## side-chain atoms with a independent Ls tensor about a pivot atom
+    pivot_atoms = []
+    pivot_iL11 = []
+    pivot_xyz = []
+    for i, atm in enumerate(atom_list):
         frag = atm.get_fragment()
 
         assert frag.is_amino_acid()
@@ -2298,9 +2542,21 @@ def calc_TLSCA_least_squares_fit(segment, origin):
                 patm = frag.get_atom(patom_name)
                 assert patm is not None
 
-                iL11 = iL11p[frag]
-                xs, ys, zs = atm.position - patm.position
-                set_L_A(A, iU11, iL11, xs, ys, zs, 1.0)
+                pivot_atoms.append(i)
+                pivot_iL11.append(iL11p[frag])
+                pivot_xyz.append(atm.position - patm.position)
+
+    A = numpy.zeros((num_atoms, 6, params), float)
+    A[:, :, :20] = calc_TLS_A_array(xyz, w)
+
+    if len(pivot_atoms) > 0:
+        rows = numpy.array(pivot_atoms, int)[:, numpy.newaxis, numpy.newaxis]
+        urows = numpy.arange(6)[numpy.newaxis, :, numpy.newaxis]
+        cols = (numpy.array(pivot_iL11, int)[:, numpy.newaxis] + numpy.arange(6))[:, numpy.newaxis, :]
+        A[rows, urows, cols] = calc_L_A_array(numpy.array(pivot_xyz, float))
+
+    A = A.reshape((-1, params))
+    B = calc_TLS_b_array(U, w).reshape(-1)
 
     ## solve by SVD
     X = solve_TLS_Ab(A, B)
@@ -2311,25 +2567,7 @@ def calc_TLSCA_least_squares_fit(segment, origin):
     lsq_residual = numpy.dot(D, D)
 
     ## create the T,L,S tensors
-
-    ## use label indexing to avoid confusion!
-    T11, T22, T33, T12, T13, T23, L11, L22, L33, L12, L13, L23, \
-    S1133, S2211, S12, S13, S23, S21, S31, S32 = (
-        0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19)
-
-    T = numpy.array([ [ X[T11], X[T12], X[T13] ],
-                      [ X[T12], X[T22], X[T23] ],
-                      [ X[T13], X[T23], X[T33] ] ], float)
-
-    L = numpy.array([ [ X[L11], X[L12], X[L13] ],
-                      [ X[L12], X[L22], X[L23] ],
-                      [ X[L13], X[L23], X[L33] ] ], float)
-
-    s11, s22, s33 = calc_s11_s22_s33(X[S2211], X[S1133])
-
-    S = numpy.array([ [    s11, X[S12], X[S13] ],
-                      [ X[S21],    s22, X[S23] ],
-                      [ X[S31], X[S32],    s33 ] ], float)
+    T, L, S = calc_TLS_tensors(X)
 
     ## extract the CA-pivot L tensors
     frag_L_dict = {}
@@ -2344,23 +2582,18 @@ def calc_TLSCA_least_squares_fit(segment, origin):
                              [ X[iL11+4], X[iL11+5], X[iL11+2] ] ], float)
 
         frag_L_dict[frag] = CA_L
-        eval = linalg.eigenvalues(CA_L) * Constants.RAD2DEG2
+        eval = numpy.linalg.eigvals(CA_L) * Constants.RAD2DEG2
 
         print("%s %s: %6.2f %6.2f %6.2f" % (
             frag.fragment_id, frag.res_name, eval[0],eval[1],eval[2]))
 
     ## calculate TLSCA-U
     udict = {}
-    i = -1
-    for atm in segment.iter_atoms():
-        i += 1
-        iU11 = i * 6
-
-        U = numpy.array( ((UTLS[iU11],   UTLS[iU11+3], UTLS[iU11+4]),
-                          (UTLS[iU11+3], UTLS[iU11+1], UTLS[iU11+5]),
-                          (UTLS[iU11+4], UTLS[iU11+5], UTLS[iU11+2])), float)
-
-        udict[atm] = U
+    UTLS = UTLS.reshape((num_atoms, 6))
+    for atm, u in zip(atom_list, UTLS):
+        udict[atm] = numpy.array( ((u[0], u[3], u[4]),
+                                   (u[3], u[1], u[5]),
+                                   (u[4], u[5], u[2])), float)
 
     ## calculate the center of reaction for the group and
     rdict = {}
@@ -2382,6 +2615,48 @@ def calc_TLSCA_least_squares_fit(segment, origin):
 ###############################################################################
 ## 
 
+def calc_tls_info_arrays(T, L, S, origin, xyz, temp_factor, anisotropy):
+    """Returns the TLSGroup.calc_tls_info() dictionary of the T, L, S
+    tensors at origin for the atoms at the (n,3) positions xyz, with the
+    (n) arrays of their experimental temp_factor (NaN if unknown) and
+    anisotropy.
+    """
+    tls_info = calc_TLS_center_of_reaction(T, L, S, origin)
+
+    ## EXPERIMENTAL DATA
+
+    ## number of atoms
+    tls_info["num_atoms"] = len(xyz)
+
+    ## mean temp_factor/anisotropy from experimental data (PDB file)
+    tls_info["exp_mean_temp_factor"] = numpy.nanmean(temp_factor)
+    tls_info["exp_mean_anisotropy"]  = numpy.mean(anisotropy)
+
+    ## model temp factors
+    Utls  = calc_Utls_array(T, L, S, xyz - origin)
+    evals = numpy.linalg.eigvalsh(Utls)
+
+    tls_info["tls_mean_max_temp_factor"] = Constants.U2B * numpy.mean(evals[:,2])
+    tls_info["tls_mean_temp_factor"]     = Constants.U2B * numpy.mean(numpy.sum(evals, axis = 1)) / 3.0
+    tls_info["tls_mean_anisotropy"]      = numpy.mean(evals[:,0] / evals[:,2])
+
+    return tls_info
+
+def calc_atom_info_arrays(atom_list):
+    """Returns the (n) arrays of the temp_factor (NaN if unknown) and the
+    Atom.calc_anisotropy() of the atoms in atom_list.
+    """
+    temp_factor = numpy.array(
+        [numpy.nan if atm.temp_factor is None else atm.temp_factor for atm in atom_list], float)
+
+    anisotropy = numpy.ones(len(atom_list), float)
+    aniso_atoms = [i for i, atm in enumerate(atom_list) if atm.U is not None]
+    if len(aniso_atoms) > 0:
+        evals = numpy.linalg.eigvalsh(numpy.array([atom_list[i].U for i in aniso_atoms], float))
+        anisotropy[aniso_atoms] = evals[:,0] / evals[:,2]
+
+    return temp_factor, anisotropy
+
 class TLSGroup(Structure.AtomList):
     """A subclass of AtomList implementing methods for performing TLS
     calculations on the contained Atom instances.
@@ -2487,14 +2762,22 @@ class TLSGroup(Structure.AtomList):
         (atm, U) where U is the calcuated U value from the current values of 
         the TLS object's T,L,S, tensors and origin.
         """
-        T = self.T
-        L = self.L
-        S = self.S
-        o = self.origin
+        return zip(self, self.calc_Utls_array())
 
-        for atm in self:
-            Utls = calc_Utls(T, L, S, atm.position - o)
-            yield atm, Utls
+    def calc_Utls_array(self):
+        """Returns the (n,3,3) array of the TLS predicted U tensors of the
+        atoms, in order, from the current T,L,S tensors and origin.
+        """
+        xyz = numpy.array([atm.position for atm in self], float).reshape((-1, 3))
+        return calc_Utls_array(self.T, self.L, self.S, xyz - self.origin)
+
+    def calc_fit_statistics(self):
+        """Returns the calc_Utls_fit_statistics() dictionary of per-atom
+        arrays comparing the atoms' U tensors (Atom.get_U()) with the TLS
+        predicted U tensors.
+        """
+        U = numpy.array([atm.get_U() for atm in self], float).reshape((-1, 3, 3))
+        return calc_Utls_fit_statistics(U, self.calc_Utls_array())
 
     def calc_COR(self):
         """Returns the calc_COR() return information for this TLS Group.
@@ -2517,39 +2800,308 @@ class TLSGroup(Structure.AtomList):
         goodness of fit, various parameter averages, center of reaction
         tensors, etc...
         """
-        tls_info = self.calc_COR()
-
-        ## EXPERIMENTAL DATA
+        xyz = numpy.array([atm.position for atm in self], float)
+        temp_factor, anisotropy = calc_atom_info_arrays(self)
+        return calc_tls_info_arrays(
+            self.T, self.L, self.S, self.origin, xyz, temp_factor, anisotropy)
+
+
+def calc_tls_groups_fit_statistics(tls_group_list):
+    """Evaluates the TLS models of all the TLSGroups of tls_group_list
+    against their atoms' U tensors in one batch.  Returns a list with one
+    dictionary per group: the calc_Utls_fit_statistics() per-atom arrays
+    plus their means mean_CCuij and mean_Suij (over the atoms where they
+    are defined) and the total lsq_residual as sum_lsq_residual.
+    """
+    xyz_list = []
+    U = []
+    Utls = []
+    for tls_group in tls_group_list:
+        xyz = numpy.array([atm.position for atm in tls_group], float).reshape((-1, 3))
+        U.extend([atm.get_U() for atm in tls_group])
+        Utls.append(calc_Utls_array(tls_group.T, tls_group.L, tls_group.S,
+                                    xyz - tls_group.origin))
+
+    U = numpy.array(U, float).reshape((-1, 3, 3))
+    Utls = numpy.concatenate(Utls) if len(Utls) > 0 else numpy.zeros((0, 3, 3), float)
+    stats = calc_Utls_fit_statistics(U, Utls)
+
+    bounds = numpy.zeros(len(tls_group_list) + 1, int)
+    numpy.cumsum([len(tls_group) for tls_group in tls_group_list], out = bounds[1:])
+
+    stats_list = []
+    for i in range(len(tls_group_list)):
+        group_stats = {}
+        for key, value in stats.items():
+            group_stats[key] = value[bounds[i]:bounds[i + 1]]
+
+        for key in ("CCuij", "Suij"):
+            values = group_stats[key]
+            values = values[numpy.isfinite(values)]
+            group_stats["mean_" + key] = numpy.mean(values) if len(values) > 0 else numpy.nan
+        group_stats["sum_lsq_residual"] = numpy.sum(group_stats["lsq_residual"])
+        stats_list.append(group_stats)
+
+    return stats_list
+
+
+class TLSChainFitter(object):
+    """Fits TLS parameters to contiguous ranges of a list of Fragments,
+    usually the Fragments of a Chain.  The least-squares normal equations
+    (A^T A, A^T b) of each Fragment's atoms are accumulated once about the
+    centroid of all atoms, and kept as prefix sums, so the fit of any
+    range [i,j) of Fragments costs a fixed 20x20 solve independent of the
+    number of atoms.  Each range is fit with its origin at the centroid of
+    its atoms, like TLSGroup.calc_TLS_least_squares_fit() with
+    origin = calc_centroid().
+    """
+    def __init__(self, frag_list, atom_filter=None, weight_dict=None):
+        self.frag_list = list(frag_list)
+
+        ## the atoms of each Fragment used in the fits
+        self.frag_atom_lists = []
+        for frag in self.frag_list:
+            if atom_filter is None:
+                self.frag_atom_lists.append(list(frag.iter_atoms()))
+            else:
+                self.frag_atom_lists.append(
+                    [atm for atm in frag.iter_atoms() if atom_filter(atm)])
+
+        atom_list = [atm for atm_list in self.frag_atom_lists for atm in atm_list]
+        frag_num_atoms = [len(atm_list) for atm_list in self.frag_atom_lists]
+
+        ## frag_bound[i] is the index of the first atom of Fragment i
+        frag_bound = numpy.zeros(len(self.frag_list) + 1, int)
+        numpy.cumsum(frag_num_atoms, out = frag_bound[1:])
+        self.num_atoms_prefix = frag_bound
+
+        self.origin = numpy.zeros(3, float)
+        if len(atom_list) > 0:
+            self.origin = numpy.mean([atm.position for atm in atom_list], axis = 0)
+
+        xyz, U, w = calc_atom_arrays(atom_list, self.origin, weight_dict)
+        A = calc_TLS_A_array(xyz, w)
+
+        ## compact per-atom arrays for the group statistics
+        self.atom_xyz = xyz + self.origin
+        self.atom_temp_factor, self.atom_anisotropy = calc_atom_info_arrays(atom_list)
+        b = calc_TLS_b_array(U, w)
+
+        ## prefix sums over the atoms, sampled at the Fragment bounds
+        def prefix(x):
+            sums = numpy.zeros((len(x) + 1,) + x.shape[1:], float)
+            numpy.cumsum(x, axis = 0, out = sums[1:])
+            return sums[frag_bound]
+
+        self.xyz_prefix = prefix(xyz)
+        At = numpy.transpose(A, (0, 2, 1))
+        self.ATA_prefix = prefix(numpy.matmul(At, A))
+        self.ATb_prefix = prefix(numpy.matmul(At, b[:, :, numpy.newaxis])[:, :, 0])
+        self.btb_prefix = prefix(numpy.sum(b * b, axis = 1))
+
+    def count_fragments(self):
+        """Returns the number of Fragments.
+        """
+        return len(self.num_atoms_prefix) - 1
 
-        ## number of atoms
-        tls_info["num_atoms"] = len(self)
+    def count_atoms(self, i, j):
+        """Returns the number of atoms used for the Fragments [i,j).
+        """
+        return self.num_atoms_prefix[j] - self.num_atoms_prefix[i]
 
-        ## mean temp_factor/anisotropy from experimental data (PDB file)
-        tls_info["exp_mean_temp_factor"] = self.calc_adv_temp_factor()
-        tls_info["exp_mean_anisotropy"]  = self.calc_adv_anisotropy()
+    def iter_atoms(self, i, j):
+        """Iterates the atoms used for the Fragments [i,j).
+        """
+        for atm_list in self.frag_atom_lists[i:j]:
+            for atm in atm_list:
+                yield atm
 
-        ## model temp factors
-        n = 0
-        mean_max_tf = 0.0
-        mean_tf     = 0.0
-        mean_aniso  = 0.0
+    def calc_segment_fits(self, start, end):
+        """Fits the Fragment ranges [start[k], end[k]) given by the integer
+        arrays start and end.  Returns a dictionary of arrays with one
+        entry per range: num_atoms(m), origin(m,3) (the centroid of the
+        range), T(m,3,3), L(m,3,3), S(m,3,3) at that origin, and
+        lsq_residual(m).  Ranges without atoms have a NaN origin and fit.
+        """
+        start = numpy.asarray(start, int)
+        end = numpy.asarray(end, int)
+
+        num_atoms = self.num_atoms_prefix[end] - self.num_atoms_prefix[start]
+        with numpy.errstate(invalid = "ignore", divide = "ignore"):
+            d = (self.xyz_prefix[end] - self.xyz_prefix[start]) / num_atoms[:, numpy.newaxis]
+
+        ATA = self.ATA_prefix[end] - self.ATA_prefix[start]
+        ATb = self.ATb_prefix[end] - self.ATb_prefix[start]
+        btb = self.btb_prefix[end] - self.btb_prefix[start]
+
+        ## move the normal equations to the centroid of each range, which
+        ## is much better conditioned, solve, and evaluate the residual
+        ## |A X - b|^2 = b^T b - 2 X^T A^T b + X^T A^T A X
+        empty = num_atoms == 0
+        N = calc_TLS_origin_shift_matrix(numpy.where(empty[:, numpy.newaxis], 0.0, -d))
+        Nt = numpy.transpose(N, (0, 2, 1))
+        ATA = numpy.matmul(numpy.matmul(Nt, ATA), N)
+        ATb = numpy.matmul(Nt, ATb[:, :, numpy.newaxis])[:, :, 0]
+        ATA[empty] = numpy.identity(20, float)
+
+        X = solve_TLS_normal_equations(ATA, ATb)
+        ATAX = numpy.matmul(ATA, X[:, :, numpy.newaxis])[:, :, 0]
+        lsq_residual = btb + numpy.sum(X * (ATAX - 2.0 * ATb), axis = 1)
+        lsq_residual = numpy.maximum(lsq_residual, 0.0)
+
+        T, L, S = calc_TLS_tensors(X)
+        T[empty] = numpy.nan
+        L[empty] = numpy.nan
+        S[empty] = numpy.nan
+        lsq_residual[empty] = numpy.nan
+
+        return {"num_atoms":    num_atoms,
+                "origin":       self.origin + d,
+                "T":            T,
+                "L":            L,
+                "S":            S,
+                "lsq_residual": lsq_residual}
+
+    def calc_segment_fit(self, i, j):
+        """Fits the Fragments [i,j).  Returns a dictionary with the
+        num_atoms, origin, T, L, S and lsq_residual of the fit.
+        """
+        fits = self.calc_segment_fits([i], [j])
+        rdict = {}
+        for key, value in fits.items():
+            rdict[key] = value[0]
+        return rdict
 
-        for atm, Utls in self.iter_atm_Utls():
-            n += 1
+    def calc_width_fits(self, width):
+        """Fits every range of width consecutive Fragments, starting at
+        each Fragment in turn; see calc_segment_fits().
+        """
+        start = numpy.arange(max(self.count_fragments() - width + 1, 0))
+        return self.calc_segment_fits(start, start + width)
+
+    def calc_segment_residual_matrix(self, min_width = 1, max_width = None, min_atoms = 20):
+        """Returns the (n+1,n+1) matrix R of the lsq_residual of the fit of
+        every Fragment range [i,j), R[i,j], for the n Fragments.  Ranges
+        narrower than min_width or wider than max_width Fragments, or with
+        fewer than min_atoms atoms, are infinite.
+        """
+        num_frags = self.count_fragments()
+        if max_width is None:
+            max_width = num_frags
+
+        start, end = numpy.nonzero(numpy.ones((num_frags + 1, num_frags + 1), bool))
+        width = end - start
+        use = (width >= max(min_width, 1)) & (width <= max_width)
+        start = start[use]
+        end = end[use]
+        use = self.count_atoms(start, end) >= min_atoms
+        start = start[use]
+        end = end[use]
+
+        R = numpy.empty((num_frags + 1, num_frags + 1), float)
+        R[:] = numpy.inf
+
+        ## solve the ranges in blocks to bound the memory of the stacks
+        block = 4096
+        for k in range(0, len(start), block):
+            fits = self.calc_segment_fits(start[k:k + block], end[k:k + block])
+            R[start[k:k + block], end[k:k + block]] = fits["lsq_residual"]
+
+        return R
+
+    def __getstate__(self):
+        """Pickles only the prefix sums, not the Fragments and Atoms, so a
+        fitter is cheap to send to a worker process.
+        """
+        state = self.__dict__.copy()
+        state["frag_list"] = None
+        state["frag_atom_lists"] = None
+        return state
+
+
+def calc_optimal_partitions(R, max_groups):
+    """Partitions n Fragments into 1..max_groups contiguous groups with the
+    smallest total residual by dynamic programming over the (n+1,n+1)
+    segment residual matrix R of TLSChainFitter.calc_segment_residual_matrix().
+    Returns (residuals, partitions): residuals[k-1] is the smallest total
+    residual of a partition into k groups (infinite if there is none),
+    and partitions[k-1] the list of its (i,j) Fragment ranges, or None.
+    """
+    num_frags = len(R) - 1
+
+    ## cost[j] is the best residual of partitioning Fragments [0,j) into
+    ## k groups; split[k-1][j] is where its last group starts
+    cost = R[0].copy()
+    split = [numpy.zeros(num_frags + 1, int)]
+    residuals = [cost[num_frags]]
+
+    for k in range(2, max_groups + 1):
+        total = cost[:, numpy.newaxis] + R
+        best_i = numpy.argmin(total, axis = 0)
+        cost = total[best_i, numpy.arange(num_frags + 1)]
+        split.append(best_i)
+        residuals.append(cost[num_frags])
+
+    partitions = []
+    for k in range(1, max_groups + 1):
+        if not numpy.isfinite(residuals[k - 1]):
+            partitions.append(None)
+            continue
+        range_list = []
+        j = num_frags
+        for m in range(k, 0, -1):
+            i = int(split[m - 1][j])
+            range_list.append((i, j))
+            j = i
+        range_list.reverse()
+        partitions.append(range_list)
+
+    return numpy.array(residuals, float), partitions
+
+def calc_chain_partitions(fitter, max_groups, min_width, max_width, min_atoms):
+    """Returns calc_optimal_partitions() of the segment residual matrix of
+    the TLSChainFitter; the unit of work of one chain for
+    TLSStructureAnalysis.fit_TLS_partitions().
+    """
+    R = fitter.calc_segment_residual_matrix(min_width, max_width, min_atoms)
+    return calc_optimal_partitions(R, max_groups)
+
+
+def calc_segment_tls_infos(fitter, width, min_atoms = 20):
+    """Fits every range of width consecutive Fragments of the
+    TLSChainFitter, and returns the list of their numeric
+    calc_tls_info_arrays() dictionaries, computed after shifting each
+    group to its center of reaction, with the lsq_residual and the
+    Fragment range (frag_index1, frag_index2) added.  Ranges with fewer
+    than min_atoms atoms only have num_atoms and an error.  This uses
+    only the arrays of the fitter, so it runs in worker processes.
+    """
+    fits = fitter.calc_width_fits(width)
 
-            evals  = linalg.eigenvalues(Utls)
-            max_ev = max(evals)
-            min_ev = min(evals)
+    tls_info_list = []
+    for i in range(len(fits["num_atoms"])):
+        a1 = fitter.num_atoms_prefix[i]
+        a2 = fitter.num_atoms_prefix[i + width]
 
-            mean_max_tf += Constants.U2B * max_ev
-            mean_tf     += Constants.U2B * numpy.trace(Utls) / 3.0
-            mean_aniso  += AtomMath.calc_anisotropy(Utls)
+        if a2 - a1 < min_atoms:
+            tls_info = {
+                "num_atoms": a2 - a1,
+                "error":     "Not Enough Atoms"}
+        else:
+            cor = calc_TLS_center_of_reaction(
+                fits["T"][i], fits["L"][i], fits["S"][i], fits["origin"][i])
+            tls_info = calc_tls_info_arrays(
+                cor["T'"], cor["L'"], cor["S'"], cor["COR"],
+                fitter.atom_xyz[a1:a2],
+                fitter.atom_temp_factor[a1:a2],
+                fitter.atom_anisotropy[a1:a2])
+            tls_info["lsq_residual"] = fits["lsq_residual"][i]
 
-        tls_info["tls_mean_max_temp_factor"] = mean_max_tf / n
-        tls_info["tls_mean_temp_factor"]     = mean_tf     / n
-        tls_info["tls_mean_anisotropy"]      = mean_aniso  / n  
+        tls_info["frag_index1"] = i
+        tls_info["frag_index2"] = i + width
+        tls_info_list.append(tls_info)
 
-        return tls_info
+    return tls_info_list
 
 
 class TLSStructureAnalysis(object):
@@ -2604,7 +3156,10 @@ class TLSStructureAnalysis(object):
         structure.  This method has many options, which are outlined in
         the source code for the method.  This returns a list of dictionaries
         containing statistics on each of the fit TLS groups, the residues
-        involved, and the TLS object itself.
+        involved, and the TLS object itself.  Segments of several widths
+        are scanned with residue_widths, and with num_procs > 1 the
+        chains and widths are fit by a pool of worker processes; the
+        results are yielded in the same order either way.
         """
         import copy
 
@@ -2612,13 +3167,16 @@ class TLSStructureAnalysis(object):
         chain_ids               = args.get("chain_ids", None)
         origin                  = args.get("origin_of_calc")
         residue_width           = args.get("residue_width", 6)
+        residue_widths          = args.get("residue_widths", [residue_width])
         use_side_chains         = args.get("use_side_chains", True)
         include_hydrogens       = args.get("include_hydrogens", False)
         include_frac_occupancy  = args.get("include_frac_occupancy", False)
         include_single_bond     = args.get("include_single_bond", True)
         calc_pivot_model        = args.get("calc_pivot_model", False)
+        num_procs               = args.get("num_procs", 1)
 
-
+        ## one job for each chain and segment width
+        job_list = []
         for chain in self.struct.iter_chains():
 
             ## skip some chains
@@ -2626,68 +3184,86 @@ class TLSStructureAnalysis(object):
                 continue
 
             ## don't bother with non-biopolymers and small chains
-            if chain.count_amino_acids() < residue_width:
+            if chain.count_amino_acids() < min(residue_widths):
                 continue
 
-            for segment in self.iter_segments(chain, residue_width):
-                frag_id1     = segment[0].fragment_id
-                frag_id2     = segment[-1].fragment_id
-                name         = "%s-%s" % (frag_id1, frag_id2)
-                frag_id_cntr = segment[len(segment)/2].fragment_id
-
-                ## create the TLSGroup
-                pv_struct = Structure.Structure()
-                pv_seg    = Structure.Chain(chain_id=segment.chain_id,
-                                  model_id=segment.model_id)
-                pv_struct.add_chain(pv_seg)
-
-                tls_group = TLSGroup()
-
-                ## add atoms into the TLSGroup
-                ## filter the atoms going into the TLS group                
-                for atm in segment.iter_atoms():
-                    if self.atom_filter(atm, **args):
-                        tls_group.append(atm)
-
-                        atm_cp = copy.deepcopy(atm)
-                        pv_seg.add_atom(atm_cp)
-
-                ## check for enough atoms(parameters) after atom filtering
-                if len(tls_group) < 20:
-                    tls_info = {
-                        "name":         name,
-                        "chain_id":     chain.chain_id,
-                        "frag_id1":     frag_id1,
-                        "frag_id2":     frag_id2,
-                        "frag_id_cntr": frag_id_cntr,
-                        "num_atoms":    len(tls_group),
-                        "error":        "Not Enough Atoms"}
-                    yield tls_info
-                    continue
+            fitter = TLSChainFitter(
+                chain.iter_fragments(),
+                atom_filter = lambda atm: self.atom_filter(atm, **args))
+
+            for width in residue_widths:
+                if chain.count_amino_acids() >= width:
+                    job_list.append((chain, fitter, width))
 
-                tls_group.origin = tls_group.calc_centroid()
-                lsq_residual     = tls_group.calc_TLS_least_squares_fit()
-                tls_group.shift_COR()
-                tls_info = tls_group.calc_tls_info()
-                tls_info["lsq_residual"] = lsq_residual
-
-                ## calculate using CA-pivot TLS model for side chains
-                if calc_pivot_model == True:
-                    rdict = calc_CB_pivot_TLS_least_squares_fit(pv_seg)
-                    tls_info["ca_pivot"] = rdict
-
-                ## add additional information
-                tls_info["name"]      = name
-                tls_info["chain_id"]  = chain.chain_id
-                tls_info["frag_id1"]  = frag_id1
-                tls_info["frag_id2"]  = frag_id2
-                tls_info["frag_id_cntr"] = frag_id_cntr
-                tls_info["tls_group"] = tls_group
-                tls_info["residues"]  = segment
-                tls_info["segment"]   = segment
-
-                ## this TLS group passes all our tests -- yield it
-                yield tls_info
+        ## the workers get the fitter arrays, not the Structure
+        fitters = [fitter for chain, fitter, width in job_list]
+        widths  = [width for chain, fitter, width in job_list]
+
+        if num_procs > 1 and len(job_list) > 1:
+            pool = concurrent.futures.ProcessPoolExecutor(min(num_procs, len(job_list)))
+            futures = [pool.submit(calc_segment_tls_infos, fitter, width)
+                       for fitter, width in zip(fitters, widths)]
+            results = (future.result() for future in futures)
+        else:
+            pool = None
+            results = map(calc_segment_tls_infos, fitters, widths)
+
+        try:
+            for (chain, fitter, width), tls_info_list in zip(job_list, results):
+                for tls_info in tls_info_list:
+                    i = tls_info["frag_index1"]
+                    j = tls_info["frag_index2"]
+
+                    segment      = chain[i:j]
+                    frag_id1     = segment[0].fragment_id
+                    frag_id2     = segment[-1].fragment_id
+                    name         = "%s-%s" % (frag_id1, frag_id2)
+                    frag_id_cntr = segment[len(segment) // 2].fragment_id
+
+                    tls_info["name"]         = name
+                    tls_info["chain_id"]     = chain.chain_id
+                    tls_info["frag_id1"]     = frag_id1
+                    tls_info["frag_id2"]     = frag_id2
+                    tls_info["frag_id_cntr"] = frag_id_cntr
+
+                    ## check for enough atoms(parameters) after atom filtering
+                    if "error" in tls_info:
+                        yield tls_info
+                        continue
+
+                    ## create the TLSGroup, shifted to the center of reaction
+                    tls_group = TLSGroup(fitter.iter_atoms(i, j))
+                    tls_group.T      = tls_info["T'"].copy()
+                    tls_group.L      = tls_info["L'"].copy()
+                    tls_group.S      = tls_info["S'"].copy()
+                    tls_group.origin = tls_info["COR"].copy()
+
+                    ## calculate using CA-pivot TLS model for side chains
+                    ## on copies of the atoms
+                    if calc_pivot_model == True:
+                        pv_struct = Structure.Structure()
+                        pv_seg    = Structure.Chain(chain_id=segment.chain_id,
+                                          model_id=segment.model_id)
+                        pv_struct.add_chain(pv_seg)
+                        for atm in tls_group:
+                            pv_seg.add_atom(copy.deepcopy(atm))
+
+                        rdict = calc_TLSCA_least_squares_fit(pv_seg, tls_group.origin)
+                        tls_info["ca_pivot"] = rdict
+
+                    ## add additional information
+                    tls_info["tls_group"] = tls_group
+                    tls_info["residues"]  = segment
+                    tls_info["segment"]   = segment
+
+                    ## this TLS group passes all our tests -- yield it
+                    yield tls_info
+        finally:
+            ## cancel the jobs not yet started if the caller stops early
+            if pool is not None:
+                for future in futures:
+                    future.cancel()
+                pool.shutdown(wait = True)
 
     def fit_TLS_segments(self, **args):
         """Returns the list iterated by iter_fit_TLS_segments.
@@ -2697,6 +3273,104 @@ class TLSStructureAnalysis(object):
             tls_info_list.append(tls_info)
         return tls_info_list
 
+    def fit_TLS_partitions(self, **args):
+        """Finds the partitions of the amino acids of each chain into
+        1..max_groups contiguous TLS groups with the smallest total
+        least-squares residual.  Every candidate segment is fit once
+        from the prefix sums of a TLSChainFitter, and the optimal
+        partitions follow by dynamic programming.  With num_procs > 1 the
+        chains are solved by a pool of worker processes.  Takes the atom_filter() options and
+        chain_ids of iter_fit_TLS_segments(), plus max_groups, min_width
+        and max_width (in residues) and min_atoms per group.  Returns a
+        list with one dictionary per chain:
+
+        chain_id     - the chain
+        residuals    - array(max_groups) of the total residual of the best
+                       partition into 1..max_groups groups (inf if none)
+        partitions   - for each number of groups, the list of
+                       (frag_id1, frag_id2) of the groups, or None
+        tls_groups   - for each number of groups, the list of fit
+                       TLSGroup objects with origin at their centroid,
+                       or None
+        """
+        chain_ids  = args.get("chain_ids", None)
+        max_groups = args.get("max_groups", 10)
+        min_width  = args.get("min_width", 6)
+        max_width  = args.get("max_width", None)
+        min_atoms  = args.get("min_atoms", 20)
+        num_procs  = args.get("num_procs", 1)
+
+        chain_list = []
+        fitter_list = []
+        for chain in self.struct.iter_chains():
+
+            ## skip some chains
+            if chain_ids is not None and chain.chain_id not in chain_ids:
+                continue
+
+            ## don't bother with non-biopolymers and small chains
+            if chain.count_amino_acids() < min_width:
+                continue
+
+            chain_list.append(chain)
+            ## partition the amino acids only, so widths and groups count
+            ## residues and waters/ligands never form a group
+            fitter_list.append(TLSChainFitter(
+                chain.iter_amino_acids(),
+                atom_filter = lambda atm: self.atom_filter(atm, **args)))
+
+        num_chains = len(chain_list)
+        if num_procs > 1 and num_chains > 1:
+            with concurrent.futures.ProcessPoolExecutor(min(num_procs, num_chains)) as pool:
+                results = list(pool.map(
+                    calc_chain_partitions, fitter_list,
+                    [max_groups] * num_chains, [min_width] * num_chains,
+                    [max_width] * num_chains, [min_atoms] * num_chains))
+        else:
+            results = [calc_chain_partitions(fitter, max_groups, min_width, max_width, min_atoms)
+                       for fitter in fitter_list]
+
+        partition_list = []
+        for chain, fitter, (residuals, partitions) in zip(chain_list, fitter_list, results):
+            frag_list = fitter.frag_list
+
+            frag_id_partitions = []
+            tls_group_partitions = []
+            for range_list in partitions:
+                if range_list is None:
+                    frag_id_partitions.append(None)
+                    tls_group_partitions.append(None)
+                    continue
+
+                fits = fitter.calc_segment_fits(
+                    [i for i, j in range_list], [j for i, j in range_list])
+
+                frag_ids = []
+                tls_groups = []
+                for k, (i, j) in enumerate(range_list):
+                    frag_id1 = frag_list[i].fragment_id
+                    frag_id2 = frag_list[j - 1].fragment_id
+                    frag_ids.append((frag_id1, frag_id2))
+
+                    tls_group = TLSGroup(fitter.iter_atoms(i, j))
+                    tls_group.name   = "%s:%s-%s" % (chain.chain_id, frag_id1, frag_id2)
+                    tls_group.origin = fits["origin"][k]
+                    tls_group.T      = fits["T"][k]
+                    tls_group.L      = fits["L"][k]
+                    tls_group.S      = fits["S"][k]
+                    tls_groups.append(tls_group)
+
+                frag_id_partitions.append(frag_ids)
+                tls_group_partitions.append(tls_groups)
+
+            partition_list.append({
+                "chain_id":   chain.chain_id,
+                "residuals":  residuals,
+                "partitions": frag_id_partitions,
+                "tls_groups": tls_group_partitions})
+
+        return partition_list
+
 
 ###############################################################################
 ### GLViewer Rendering components for TLS Groups
@@ -4473,9 +5147,9 @@ def test_module():
     print(tls)
 
     print("eigenvalues(T)")
-    print(linalg.eigenvalues(tls.T))
+    print(numpy.linalg.eigvals(tls.T))
     print("eigenvalues(L)")
-    print(linalg.eigenvalues(tls.L))
+    print(numpy.linalg.eigvals(tls.L))
 
     print("===============================================")
 
@@ -4,11 +4,13 @@
 ## included as part of this package.
 """Classes for handling unit cell transformation.
 """
+import itertools
 import math
 
 import numpy
 
 from . import AtomMath
+from . import GeometryDict
 from . import SpaceGroups
 
 
@@ -181,6 +183,18 @@ class UnitCell(object):
         """
         return numpy.dot(self.frac_to_orth, v)
 
+    def calc_orth_to_frac_array(self, xyz):
+        """Returns the fractional coordinates of the (n,3) array xyz of
+        orthogonal coordinates.
+        """
+        return numpy.dot(numpy.asarray(xyz, float), self.orth_to_frac.T)
+
+    def calc_frac_to_orth_array(self, frac):
+        """Returns the orthogonal coordinates of the (n,3) array frac of
+        fractional coordinates.
+        """
+        return numpy.dot(numpy.asarray(frac, float), self.frac_to_orth.T)
+
     def calc_orth_symop(self, symop):
         """Calculates the orthogonal space symmetry operation (return SymOp)
         given a fractional space symmetry operation (argument SymOp).
@@ -233,42 +247,198 @@ class UnitCell(object):
                 for k in cube:
                     yield i, j, k
 
+    def calc_packing_symops(self, centroid, radius, distance = 5.0):
+        """Finds all space group operations combined with a lattice
+        translation which place a copy of a molecule, bounded by the sphere
+        of the given radius around its orthogonal centroid, so the two
+        spheres come within distance of each other.  Returns the
+        (symop_index, cell_t) arrays: the index of the SymOp in
+        space_group.symop_list, and the integer lattice translation added
+        to it.  The identity operation with no translation, the molecule
+        itself, is included.
+        """
+        reach = 2.0 * radius + distance
+
+        cfrac = self.calc_orth_to_frac(numpy.asarray(centroid, float))
+        R = self.space_group.R_array
+        t = self.space_group.t_array
+        base = numpy.dot(R, cfrac) + t
+
+        ## a sphere of radius reach spans at most this many cells along
+        ## each fractional axis; this bounds the lattice translations of
+        ## each operation
+        frac_reach = reach * numpy.sqrt(numpy.sum(self.orth_to_frac ** 2, axis = 1))
+        lo = numpy.ceil(cfrac - base - frac_reach).astype(int)
+        hi = numpy.floor(cfrac - base + frac_reach).astype(int)
+        size = numpy.maximum(hi - lo + 1, 0)
+        count = numpy.prod(size, axis = 1)
+
+        ## enumerate every (operation, translation) candidate of the boxes
+        symop_index = numpy.repeat(numpy.arange(len(R)), count)
+        local = numpy.arange(count.sum()) - numpy.repeat(numpy.cumsum(count) - count, count)
+        size = size[symop_index]
+        cell_t = numpy.column_stack((
+            local // (size[:, 1] * size[:, 2]),
+            (local // size[:, 2]) % size[:, 1],
+            local % size[:, 2])) + lo[symop_index]
+
+        ## keep the candidates whose centroid lands within reach
+        frac = numpy.dot(R[symop_index], cfrac) + (t[symop_index] + cell_t)
+        dist = numpy.sqrt(numpy.sum(
+            (self.calc_frac_to_orth_array(frac) - centroid) ** 2, axis = 1))
+        mask = dist <= reach
+
+        return symop_index[mask], cell_t[mask]
+
+    def calc_orth_symop_arrays(self, symop_index, cell_t):
+        """Returns the orthogonal space symmetry operations for the arrays
+        returned by calc_packing_symops() as stacked (m,3,3) rotation and
+        (m,3) translation arrays.
+        """
+        R = numpy.matmul(numpy.matmul(self.frac_to_orth,
+                                      self.space_group.R_array),
+                         self.orth_to_frac)
+        t = self.space_group.t_array[symop_index] + cell_t
+        return R[symop_index], self.calc_frac_to_orth_array(t)
+
+    def calc_symmetry_mates(self, xyz, distance = 5.0):
+        """Returns the symmetry mates of the molecule with the (n,3) array
+        of orthogonal coordinates xyz, which may come within distance of
+        it, as the (symop_index, cell_t, mate_xyz) arrays; mate_xyz has
+        shape (m,n,3).  The molecule itself is not included.
+        """
+        xyz = numpy.asarray(xyz, float)
+        centroid = numpy.mean(xyz, axis = 0)
+        radius = numpy.sqrt(numpy.max(numpy.sum((xyz - centroid) ** 2, axis = 1)))
+
+        symop_index, cell_t = self.calc_packing_symops(centroid, radius, distance)
+        R, t = self.calc_orth_symop_arrays(symop_index, cell_t)
+
+        ## drop the identity with no lattice translation
+        mask = numpy.logical_not(
+            numpy.all(numpy.isclose(R, numpy.identity(3)), axis = (1, 2)) &
+            numpy.all(numpy.isclose(t, 0.0), axis = 1))
+        R = R[mask]
+        t = t[mask]
+
+        mate_xyz = numpy.matmul(xyz, R.transpose(0, 2, 1)) + t[:, numpy.newaxis, :]
+        return symop_index[mask], cell_t[mask], mate_xyz
+
+    def calc_unit_cell_xyz(self, xyz):
+        """Returns the (n_ops,n,3) array of orthogonal coordinates of the
+        molecule xyz placed by every space group operation, each copy
+        translated by whole cells so its centroid falls inside the unit
+        cell, which fills one unit cell.
+        """
+        frac = self.space_group.calc_equivalent_positions(
+            self.calc_orth_to_frac_array(xyz))
+        frac -= numpy.floor(numpy.mean(frac, axis = 1))[:, numpy.newaxis, :]
+        return self.calc_frac_to_orth_array(frac)
+
+    def calc_supercell_xyz(self, xyz, na = 1, nb = 1, nc = 1):
+        """Returns the (na*nb*nc*n_ops,n,3) array of orthogonal coordinates
+        of a na x nb x nc block of unit cells built as by
+        calc_unit_cell_xyz().
+        """
+        cell_xyz = self.calc_unit_cell_xyz(xyz)
+        cell_t = numpy.array([(i, j, k)
+                              for i in range(na)
+                              for j in range(nb)
+                              for k in range(nc)], float)
+        orth_t = self.calc_frac_to_orth_array(cell_t)
+        supercell_xyz = cell_xyz[numpy.newaxis] + orth_t[:, numpy.newaxis, numpy.newaxis, :]
+        return supercell_xyz.reshape((-1,) + cell_xyz.shape[1:])
+
+    def calc_symmetry_contacts(self, xyz, distance = 4.0, resolution = None):
+        """Finds all pairs of an atom of the asymmetric unit, given by the
+        (n,3) array of orthogonal coordinates xyz, and an atom of one of its
+        symmetry or lattice copies, which are within distance of each other.
+        Returns the arrays (atom_i, atom_j, symop_index, cell_t, dist):
+        atom j moved by SymOp symop_index of space_group.symop_list plus the
+        integer lattice translation cell_t(m,3) is dist from atom i.  The
+        asymmetric unit itself (identity operation, no translation) is left
+        out, and a contact between two copies is reported from both sides.
+        The search uses a GeometryDict.XYZCellList of the asymmetric unit
+        with cells of size resolution, by default distance.
+        """
+        xyz = numpy.asarray(xyz, float).reshape(-1, 3)
+        frac = self.calc_orth_to_frac_array(xyz)
+
+        ## fractional bounding box of the asymmetric unit, grown by distance;
+        ## only copied atoms inside it can be in contact
+        frac_reach = distance * numpy.sqrt(numpy.sum(self.orth_to_frac ** 2, axis = 1))
+        box_lo = numpy.min(frac, axis = 0) - frac_reach
+        box_hi = numpy.max(frac, axis = 0) + frac_reach
+
+        identity = numpy.identity(3, float)
+        no_cell = (0, 0, 0)
+
+        center_frac = []
+        center_atom = []
+        center_symop = []
+        center_cell = []
+
+        for k, symop in enumerate(self.space_group.iter_symops()):
+            image = numpy.dot(frac, symop.R.T) + symop.t
+            cell_lo = numpy.ceil(box_lo - numpy.max(image, axis = 0)).astype(int)
+            cell_hi = numpy.floor(box_hi - numpy.min(image, axis = 0)).astype(int)
+            is_identity = numpy.allclose(symop.R, identity) and numpy.allclose(symop.t, 0.0)
+
+            for cell in itertools.product(*[range(lo, hi + 1) for lo, hi in zip(cell_lo, cell_hi)]):
+                if is_identity and cell == no_cell:
+                    continue
+                shifted = image + cell
+                atoms = numpy.nonzero(numpy.all(
+                    (shifted >= box_lo) & (shifted <= box_hi), axis = 1))[0]
+                if len(atoms) == 0:
+                    continue
+                center_frac.append(shifted[atoms])
+                center_atom.append(atoms)
+                center_symop.append(numpy.zeros(len(atoms), int) + k)
+                center_cell.append(numpy.tile(cell, (len(atoms), 1)))
+
+        if len(center_frac) == 0:
+            return (numpy.zeros(0, int), numpy.zeros(0, int), numpy.zeros(0, int),
+                    numpy.zeros((0, 3), int), numpy.zeros(0, float))
+
+        center_xyz = self.calc_frac_to_orth_array(numpy.concatenate(center_frac))
+        center_atom = numpy.concatenate(center_atom)
+        center_symop = numpy.concatenate(center_symop)
+        center_cell = numpy.concatenate(center_cell)
+
+        cell_list = GeometryDict.XYZCellList(xyz, resolution or distance)
+        center_index, atom_i, dist = cell_list.calc_radius_neighbors(center_xyz, distance)
+
+        atom_j = center_atom[center_index]
+        symop_index = center_symop[center_index]
+        cell_t = center_cell[center_index]
+
+        order = numpy.lexsort((cell_t[:, 2], cell_t[:, 1], cell_t[:, 0],
+                               symop_index, atom_j, atom_i))
+        return atom_i[order], atom_j[order], symop_index[order], cell_t[order], dist[order]
+
     def iter_struct_orth_symops(self, struct):
         """Iterate over the orthogonal-space symmetry operations which will
         place a symmetry related structure near the argument struct.
         """
         ## compute the centroid of the structure
-        n = 0
-        cent = numpy.zeros(3, float)
-        for atm in struct.iter_all_atoms():
-            n    += 1
-            cent += atm.position
-        centroid = cent / n
-
-        ccell = self.calc_cell(self.calc_orth_to_frac(centroid))
-        centroid_cell = numpy.array(ccell, float)
+        xyz = AtomMath.calc_atom_position_array(struct.iter_all_atoms())
+        centroid = AtomMath.calc_centroid_array(xyz)
 
         ## compute the distance from the centroid to the farthest point from 
         ## it in the structure.
-        max_dist = 0.0
-        for frag in struct.iter_amino_acids():
-            for atm in frag.iter_atoms():
-                dist = AtomMath.length(atm.position - centroid)
-                max_dist = max(max_dist, dist)
-        max_dist2 = 2.0 * max_dist + 5.0
-
-        for symop in self.space_group.iter_symops():
-            for i, j, k in self.cell_search_iter():
-
-                 cell_t  = numpy.array([i, j, k], float)
-                 symop_t = SpaceGroups.SymOp(symop.R, symop.t+cell_t)
+        aa_xyz = AtomMath.calc_atom_position_array(
+            atm for frag in struct.iter_amino_acids() for atm in frag.iter_atoms())
+        if len(aa_xyz) > 0:
+            max_dist = numpy.max(AtomMath.calc_distance_array(aa_xyz, centroid))
+        else:
+            max_dist = 0.0
 
-                 xyz       = self.calc_orth_to_frac(centroid)
-                 xyz_symm  = symop_t(xyz)
-                 centroid2 = self.calc_frac_to_orth(xyz_symm)
+        symop_index, cell_t = self.calc_packing_symops(centroid, max_dist)
+        R, t = self.calc_orth_symop_arrays(symop_index, cell_t)
 
-                 if AtomMath.length(centroid - centroid2) <= max_dist2:
-                     yield self.calc_orth_symop(symop_t)
+        for i in range(len(R)):
+            yield SpaceGroups.SymOp(R[i], t[i])
 
 
 def strRT(R, T):
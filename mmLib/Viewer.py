@@ -9,15 +9,7 @@
 import copy
 import math
 
-try:
-    import numpy
-    try:
-        from numpy.oldnumeric import linear_algebra as linalg
-    except ImportError:
-        from numpy.linalg import old as linalg
-except ImportError:
-    from . import NumericCompat as numpy
-    from .NumericCompat import linalg
+import numpy
 
 from . import Library
 from . import GeometryDict
@@ -2540,41 +2532,20 @@ class GLViewer(GLObject):
                 for atm in structx.iter_atoms():
                     yield atm
                     
-        try:
-            centroid = AtomMath.calc_atom_centroid(aa_atom_iter(struct))
-        except OverflowError:
+        ## gather the positions once for the centroid, tensor and box
+        xyz = AtomMath.calc_atom_position_array(aa_atom_iter(struct))
+        if len(xyz) == 0:
             return None
 
-        R = AtomMath.calc_inertia_tensor(aa_atom_iter(struct), centroid)
+        centroid = AtomMath.calc_centroid_array(xyz)
+        R = AtomMath.calc_inertia_tensor_array(xyz, centroid)
 
         ori = {}
 
         ## now calculate a rectangular box
-        first_atm = True
-
-        min_x = 0.0
-        max_x = 0.0
-        min_y = 0.0
-        max_y = 0.0
-        min_z = 0.0
-        max_z = 0.0
-
-        for atm in aa_atom_iter(struct):
-            x  = numpy.dot(R, atm.position - centroid)
-
-            if first_atm is True:
-                first_atm = False
-
-                min_x = max_x = x[0]
-                min_y = max_y = x[1]
-                min_z = max_z = x[2]
-            else:
-                min_x = min(min_x, x[0])
-                max_x = max(max_x, x[0])
-                min_y = min(min_y, x[1])
-                max_y = max(max_y, x[1])
-                min_z = min(min_z, x[2])
-                max_z = max(max_z, x[2])
+        x = numpy.dot(xyz - centroid, R.T)
+        min_x, min_y, min_z = numpy.min(x, axis = 0)
+        max_x, max_y, max_z = numpy.max(x, axis = 0)
 
         ## add slop
         min_x -= slop
@@ -2831,7 +2802,7 @@ class GLViewer(GLObject):
             gl_fog             = self.properties["GL_FOG"])
 
         R = self.properties["R"]
-        assert numpy.allclose(linalg.determinant(R), 1.0)
+        assert numpy.allclose(numpy.linalg.det(R), 1.0)
 
         driver.glr_mult_matrix_R(R)
         driver.glr_translate(-self.properties["cor"])
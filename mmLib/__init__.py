@@ -4,6 +4,8 @@
 ## included as part of this package.
 __all__ = [
     "AtomMath",
+    "AtomTable",
+    "BondGraph",
     "CIFBuilder",
     "CIF",
     "Colors",
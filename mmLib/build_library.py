@@ -1,9 +1,12 @@
 import argparse
+import json
 import os
+import sqlite3
 import subprocess
 import tempfile
 import urllib.request, urllib.parse, urllib.error
 import mmLib.mmCIF
+import mmLib.Library
 
 def build_library_bash(cif_file, zip=False):
     SITE_PACKAGES = os.path.dirname(os.path.dirname(__file__))
@@ -95,11 +98,97 @@ def build_library(cif_file, zip=False):
         zf.close()
 
 
+def iter_monomer_cif_data(cif_file=None):
+    """Iterates over the mmCIFData blocks of all monomers, read from the
+    components.cif file cif_file if given, otherwise from the installed
+    Monomers directory or Monomers.zip.
+    """
+    if cif_file:
+        cif = mmLib.mmCIF.mmCIFFile()
+        cif.load_file(cif_file, columnar=True)
+        for cif_data in cif:
+            yield cif_data
+        return
+
+    def load_monomer_file(fil):
+        cif = mmLib.mmCIF.mmCIFFile()
+        cif.load_file(fil, columnar=True)
+        return cif
+
+    if os.path.isdir(mmLib.Library.RCSB_MONOMER_DATA_PATH):
+        for dir_path, dir_names, file_names in os.walk(mmLib.Library.RCSB_MONOMER_DATA_PATH):
+            dir_names.sort()
+            for file_name in sorted(file_names):
+                for cif_data in load_monomer_file(os.path.join(dir_path, file_name)):
+                    yield cif_data
+
+    if mmLib.Library.library_use_monomer_zipfile():
+        import io
+        zf = mmLib.Library.RCSB_ZIP
+        for name in zf.namelist():
+            for cif_data in load_monomer_file(io.StringIO(zf.read(name).decode('utf-8'))):
+                yield cif_data
+
+
+def build_library_index(cif_file=None, index_path=None):
+    """Compiles the element, monomer, and supplemental mmLib monomer
+    descriptions into the SQLite library index read by mmLib.Library, so
+    descriptions are looked up by name instead of parsing mmCIF files.
+    Monomers are read as described for iter_monomer_cif_data().
+    """
+    index_path = index_path or mmLib.Library.LIBRARY_INDEX_PATH
+    tmp_path = index_path + ".tmp"
+    print('Will create mmLib library index at: {}'.format(index_path))
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    db = sqlite3.connect(tmp_path)
+    db.execute("CREATE TABLE info (name TEXT PRIMARY KEY, value TEXT)")
+    for table in ("element", "monomer", "mmlib_monomer"):
+        db.execute("CREATE TABLE %s (name TEXT PRIMARY KEY, record TEXT) WITHOUT ROWID" % (table))
+    db.execute("INSERT INTO info VALUES ('version', ?)", (mmLib.Library.LIBRARY_INDEX_VERSION,))
+
+    ## the first data block of a name wins, as with mmCIFFile.get_data()
+    def insert_record(table, name, record):
+        db.execute("INSERT OR IGNORE INTO %s VALUES (?, ?)" % (table),
+                   (name, json.dumps(record, separators=(",", ":"))))
+
+    element_cif = mmLib.mmCIF.mmCIFFile()
+    element_cif.load_file(mmLib.Library.ELEMENT_DATA_PATH)
+    for cif_data in element_cif:
+        insert_record("element", cif_data.name.lower(),
+                      mmLib.Library.library_cif_element_record(cif_data))
+
+    mmlib_cif = mmLib.mmCIF.mmCIFFile()
+    mmlib_cif.load_file(mmLib.Library.MMLIB_MONOMER_DATA_PATH)
+    for cif_data in mmlib_cif:
+        insert_record("mmlib_monomer", cif_data.name.lower(),
+                      mmLib.Library.library_cif_mmlib_monomer_record(cif_data))
+
+    num_monomers = 0
+    for cif_data in iter_monomer_cif_data(cif_file):
+        if cif_data.get_table("chem_comp") is None:
+            continue
+        insert_record("monomer", cif_data.name.upper(),
+                      mmLib.Library.library_cif_monomer_record(cif_data, cif_data.name))
+        num_monomers += 1
+
+    db.commit()
+    db.close()
+    os.replace(tmp_path, index_path)
+    print("[BUILDLIB] indexed %d elements, %d monomers" % (len(element_cif), num_monomers))
+
+
 def run():
     parser = argparse.ArgumentParser(prog="build_library", formatter_class=argparse.RawDescriptionHelpFormatter,
                                          description="build_library agent")
     parser.add_argument('--cif-file', nargs='?', default=None, help="Path to components.cif file. If not given it will be downloaded from PDBe")
     parser.add_argument('--zip', nargs='?', default=False, type=bool, help="Should the monomer library be zipped? Default: NO")
+    parser.add_argument('--index-only', action='store_true', help="Only rebuild the precompiled library index (Library.db) from the --cif-file or the installed monomer library")
     args = vars(parser.parse_args())
-    build_library_bash(args['cif_file'], args['zip'])
+    if not args['index_only']:
+        build_library_bash(args['cif_file'], args['zip'])
+        build_library_index()
+    else:
+        build_library_index(args['cif_file'])
 
@@ -12,8 +12,11 @@ included as a specialized version of the mmCIF parser.
 import re
 import copy
 import itertools
+import collections
 from curses import has_key
 
+import numpy
+
 ##
 ## DATA STRUCTURES FOR HOLDING CIF INFORMATION
 ##
@@ -173,9 +176,9 @@ class mmCIFTable(list):
         self.remove(self[i])
 
     def get(self, x, default = None):
-        if x in self.keys():
+        try:
             return self[x]
-        else:
+        except KeyError:
             return default
 
     def append(self, row):
@@ -310,6 +313,406 @@ class mmCIFTable(list):
                 pass
         return dictx
 
+    def get_column(self, column):
+        """Returns a list of the values of column in row order, with None
+        for the rows without a value.
+        """
+        clower = column.lower()
+        return [row.get_lower(clower) for row in self]
+
+    def get_column_array(self, column):
+        """Returns the values of column as a float array.  Rows without a
+        value, and values which are not numbers such as "?", are NaN.
+        """
+        values = self.get_column(column)
+        try:
+            return numpy.array(values, float)
+        except (TypeError, ValueError):
+            pass
+
+        array = numpy.zeros(len(values), float)
+        for i, value in enumerate(values):
+            try:
+                array[i] = float(value)
+            except (TypeError, ValueError):
+                array[i] = numpy.nan
+        return array
+
+
+class mmCIFColumnRow(object):
+    """Lightweight view of one row of a mmCIFColumnTable, with the same
+    interface as mmCIFRow.  The values are read from and written to the
+    table columns; the view only stores the table and the row index.
+    """
+    __slots__ = ["table", "index"]
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    def __eq__(self, other):
+        return isinstance(other, mmCIFColumnRow) and \
+               self.table is other.table and self.index == other.index
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __deepcopy__(self, memo):
+        cif_row = mmCIFRow()
+        for key, val in self.items():
+            cif_row[key] = val
+        return cif_row
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __contains__(self, column):
+        return self.get_lower(column.lower()) is not None
+
+    def __setitem__(self, column, value):
+        assert value is not None
+        self.table.set_value(self.index, column.lower(), value)
+
+    def __getattr__(self, name):
+        if name in self:
+            return self[name]
+        else:
+            raise AttributeError(name)
+
+    def __getitem__(self, column):
+        return self.get_lower(column.lower())
+
+    def getitem_lower(self, clower):
+        return self.get_lower(clower)
+
+    def __delitem__(self, column):
+        clower = column.lower()
+        if self.get_lower(clower) is None:
+            raise KeyError(column)
+        self.table.column_data[clower][self.index] = None
+
+    def get(self, column, default = None):
+        return self.get_lower(column.lower(), default)
+
+    def get_lower(self, clower, default = None):
+        try:
+            value = self.table.column_data[clower][self.index]
+        except KeyError:
+            return default
+        if value is None:
+            return default
+        return value
+
+    def has_key(self, column):
+        return self.get_lower(column.lower()) is not None
+
+    def has_key_lower(self, clower):
+        return self.get_lower(clower) is not None
+
+    def keys(self):
+        index = self.index
+        return [clower for clower, column in self.table.column_data.items()
+                if column[index] is not None]
+
+    def values(self):
+        index = self.index
+        return [column[index] for column in self.table.column_data.values()
+                if column[index] is not None]
+
+    def items(self):
+        index = self.index
+        return [(clower, column[index])
+                for clower, column in self.table.column_data.items()
+                if column[index] is not None]
+
+
+class mmCIFColumnTable(mmCIFTable):
+    """mmCIFTable which stores its data as one list per column instead of
+    one mmCIFRow dictionary per row, which uses a fraction of the memory
+    for large loop_ tables and makes get_column() free.  Rows without a
+    value in a column hold None.
+
+    Rows are returned as mmCIFColumnRow views which address their row by
+    index, so a view refers to a different row after rows are inserted,
+    removed or reordered before it.  Rows added with append(), insert() or
+    extend() are copied into the columns, so later writes to the added
+    mmCIFRow are not seen by the table; use new_row() to add a row and keep
+    writing to it.  The other list methods (index, count, pop, remove,
+    sort, reverse, clear) act on the rows held in the columns.
+    """
+    __slots__ = ["column_data", "num_rows"]
+
+    def __init__(self, name, columns = None):
+        self.column_data = dict()
+        self.num_rows = 0
+        mmCIFTable.__init__(self, name, columns)
+
+    def __deepcopy__(self, memo):
+        table = mmCIFColumnTable(self.name, self.columns[:])
+        for clower, column in self.column_data.items():
+            table.column_data[clower] = column[:]
+        table.num_rows = self.num_rows
+        return table
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __len__(self):
+        return self.num_rows
+
+    def __bool__(self):
+        return self.num_rows > 0
+
+    ## list operators which would act on the (empty) list base class
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __mul__(self, n):
+        return list(self) * n
+
+    __rmul__ = __mul__
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __imul__(self, n):
+        raise TypeError("mmCIFColumnTable does not support *=")
+
+    def __lt__(self, other):
+        return NotImplemented
+
+    __le__ = __gt__ = __ge__ = __lt__
+
+    def __iter__(self):
+        for index in range(self.num_rows):
+            yield mmCIFColumnRow(self, index)
+
+    def __reversed__(self):
+        for index in range(self.num_rows - 1, -1, -1):
+            yield mmCIFColumnRow(self, index)
+
+    def __contains__(self, row):
+        return isinstance(row, mmCIFColumnRow) and row.table is self and \
+               0 <= row.index < self.num_rows
+
+    def __getitem__(self, x):
+        if isinstance(x, int):
+            if x < 0:
+                x += self.num_rows
+            if x < 0 or x >= self.num_rows:
+                raise IndexError("mmCIFColumnTable index out of range")
+            return mmCIFColumnRow(self, x)
+
+        return mmCIFTable.__getitem__(self, x)
+
+    def __setitem__(self, x, value):
+        assert value is not None
+
+        if isinstance(x, int):
+            row = self[x]
+            values = dict(value.items())
+            for clower, column in self.column_data.items():
+                column[row.index] = values.pop(clower, None)
+            for clower, val in values.items():
+                self.set_value(row.index, clower, val)
+
+        else:
+            mmCIFTable.__setitem__(self, x, value)
+
+    def __delitem__(self, i):
+        row = self[i]
+        for column in self.column_data.values():
+            del column[row.index]
+        self.num_rows -= 1
+
+    def append(self, row):
+        self.insert(self.num_rows, row)
+
+    def insert(self, i, row):
+        """Inserts a new row before index i, and copies the values of row,
+        a mmCIFRow or mmCIFColumnRow, into it.
+        """
+        if i < 0:
+            i = max(0, i + self.num_rows)
+        i = min(i, self.num_rows)
+
+        for column in self.column_data.values():
+            column.insert(i, None)
+        self.num_rows += 1
+
+        for key, val in row.items():
+            self.set_value(i, key.lower(), val)
+
+    def extend(self, rows):
+        ## copy the rows first, they may be views of this table
+        for row in [dict(row.items()) for row in rows]:
+            self.insert(self.num_rows, row)
+
+    def remove(self, row):
+        assert row in self
+        del self[row.index]
+
+    def index(self, row, start = 0, stop = None):
+        """Returns the index of the mmCIFColumnRow view row.
+        """
+        start, stop, step = slice(start, stop).indices(self.num_rows)
+        if row in self and start <= row.index < stop:
+            return row.index
+        raise ValueError("row is not in mmCIFColumnTable")
+
+    def count(self, row):
+        if row in self:
+            return 1
+        return 0
+
+    def pop(self, i = -1):
+        """Removes the row at index i and returns it as a mmCIFRow.
+        """
+        if self.num_rows == 0:
+            raise IndexError("pop from empty mmCIFColumnTable")
+        try:
+            row = self[i]
+        except IndexError:
+            raise IndexError("pop index out of range")
+        cif_row = copy.deepcopy(row)
+        del self[row.index]
+        return cif_row
+
+    def clear(self):
+        for column in self.column_data.values():
+            del column[:]
+        self.num_rows = 0
+
+    def copy(self):
+        """Returns a list of the row views, like list.copy().
+        """
+        return list(self)
+
+    def reverse(self):
+        for column in self.column_data.values():
+            column.reverse()
+
+    def sort(self, key = None, reverse = False):
+        """Sorts the rows in place.  The key function is called with the
+        mmCIFColumnRow views of the rows before they are moved.
+        """
+        row_list = list(self)
+        if key is None:
+            row_list.sort(reverse = reverse)
+        else:
+            row_list.sort(key = key, reverse = reverse)
+
+        order = [row.index for row in row_list]
+        for clower, column in self.column_data.items():
+            self.column_data[clower] = [column[i] for i in order]
+
+    def new_row(self):
+        """Adds a new empty row to the table and returns a view of it.
+        """
+        for column in self.column_data.values():
+            column.append(None)
+        self.num_rows += 1
+        return mmCIFColumnRow(self, self.num_rows - 1)
+
+    def set_value(self, index, clower, value):
+        """Sets the value of column clower in row index.
+        """
+        try:
+            column = self.column_data[clower]
+        except KeyError:
+            column = self.column_data[clower] = [None] * self.num_rows
+        column[index] = value
+
+    def extend_columns(self, column_values):
+        """Appends rows to the table from a dictionary mapping the lower
+        case column names to equal length lists of values, with None for
+        the rows without a value.
+        """
+        num_new = 0
+        for values in column_values.values():
+            num_new = len(values)
+            break
+
+        for clower, values in column_values.items():
+            assert len(values) == num_new
+            try:
+                column = self.column_data[clower]
+            except KeyError:
+                column = self.column_data[clower] = [None] * self.num_rows
+            column.extend(values)
+
+        for clower, column in self.column_data.items():
+            if clower not in column_values:
+                column.extend([None] * num_new)
+
+        self.num_rows += num_new
+
+    def autoset_columns(self):
+        clower_used = {}
+        for clower, column in self.column_data.items():
+            if column.count(None) < len(column):
+                clower_used[clower] = True
+                if clower not in self.columns_lower:
+                    self.append_column(clower)
+        for clower in list(self.columns_lower.keys()):
+            if clower not in clower_used:
+                self.remove_column(clower)
+
+    def iter_row_indices(self, *args):
+        """Iterates over the indices of the rows matching all the
+        (<lower-case-column-name>, <column-value>) arguments.
+        """
+        if len(args) == 0:
+            return iter(range(self.num_rows))
+
+        if len(args) == 1:
+            clower, value = args[0]
+            column = self.get_column(clower)
+            return (i for i, x in enumerate(column) if x == value)
+
+        column_list = [self.get_column(clower) for clower, value in args]
+        match = tuple(value for clower, value in args)
+        return (i for i, x in enumerate(zip(*column_list)) if x == match)
+
+    def get_row1(self, clower, value):
+        return self.get_row((clower, value))
+
+    def get_row(self, *args):
+        for index in self.iter_row_indices(*args):
+            return mmCIFColumnRow(self, index)
+        return None
+
+    def iter_rows(self, *args):
+        for index in self.iter_row_indices(*args):
+            yield mmCIFColumnRow(self, index)
+
+    def row_index_dict(self, clower):
+        dictx = dict()
+        for index, value in enumerate(self.get_column(clower)):
+            dictx[value] = mmCIFColumnRow(self, index)
+        return dictx
+
+    def get_column(self, column):
+        """Returns the list of values of column.  This is the list stored
+        by the table, not a copy.
+        """
+        try:
+            return self.column_data[column.lower()]
+        except KeyError:
+            return [None] * self.num_rows
+
 
 class mmCIFData(list):
     """Contains all information found under a data_ block in a mmCIF file.
@@ -546,15 +949,17 @@ class mmCIFFile(list):
         else:
             return default
         
-    def load_file(self, fil):
+    def load_file(self, fil, columnar = False):
         """Load and append the mmCIF data from file object fil into self.
         The fil argument must be a file object or implement its iterface.
+        If columnar is True, loop_ tables are stored as mmCIFColumnTable
+        objects.
         """
         if isinstance(fil, str):
             fileobj = open(fil, "r")
         else:
             fileobj = fil
-        mmCIFFileParser().parse_file(fileobj, self)
+        mmCIFFileParser(columnar).parse_file(fileobj, self)
 
     def save_file(self, fil):
         if isinstance(fil, str):
@@ -601,8 +1006,20 @@ class mmCIFFileParser(object):
     a mmCIF file and convert it into the mmCIFData/mmCIFTable/mmCIFRow
     data hierarchy.
     """
+    ## lines of loop_ data which can be split with str.split() because
+    ## they contain no quoted strings, comments, tags or reserved words
+    ## (tags and all reserved words contain a underscore), and do not
+    ## start a semicolon string
+    re_bulk_special = re.compile(r"[\'\"#_]|^;")
+
+    def __init__(self, columnar = False):
+        self.columnar = columnar
+
     def parse_file(self, fileobj, cif_file):
         self.line_number = 0
+        self.file_iter = iter(fileobj)
+        self.unread_ln = None
+        self.line_tokens = collections.deque()
         token_iter = self.gen_token_iter(fileobj)
 
         try:
@@ -761,7 +1178,10 @@ class mmCIFFileParser(object):
                     self.syntax_error("_loop section duplication")
                     return
 
-                cif_table = mmCIFTable(tblx)
+                if self.columnar:
+                    cif_table = mmCIFColumnTable(tblx)
+                else:
+                    cif_table = mmCIFTable(tblx)
 
                 try:
                     cif_data.append(cif_table)
@@ -795,37 +1215,9 @@ class mmCIFFileParser(object):
                             self.syntax_error(
                                 "unexpected reserved word: %s" % (rword))
                     
-                ## now read all the data 
-                while True:
-                    cif_row = mmCIFRow()
-                    cif_table.append(cif_row)
-
-                    for col in cif_table.columns:
-                        if tokx is not None:
-                            if tokx != ".":
-                                cif_row[col] = tokx
-                        elif strx is not None:
-                            cif_row[col] = strx
-
-#                        try:
-#                            if tokx=='9.653999':
-#                                print('error')
-                        tblx, colx, strx, tokx = next(token_iter)
-#                        except RuntimeError as e:
-#                            continue
-
-
-                    ## the loop ends when one of these conditions is met:
-                    ## condition #1: a new table is encountered
-                    if tblx is not None:
-                        break
-
-                    ## condition #2: a reserved word is encountered
-                    if tokx is not None:
-                        rword, name = self.split_token(tokx)
-                        if rword is not None:
-                            break
-
+                ## now read all the data
+                tblx, colx, strx, tokx = self.read_loop_data(
+                    cif_table, token_iter, (tblx, colx, strx, tokx))
                 continue
 
             elif state == "RD_DATA":
@@ -845,6 +1237,134 @@ class mmCIFFileParser(object):
                 tblx,colx,strx,tokx = next(token_iter)
                 
 
+    def read_loop_data(self, cif_table, token_iter, token):
+        """Reads the values of a loop_ table, starting with token, and
+        adds them to cif_table as mmCIFRow objects.  Returns the token
+        ending the loop: a table tag or a reserved word.
+
+        Whenever the tokenizer is at the start of a line, all following
+        lines without quotes, comments, tags or semicolon strings are split
+        with str.split() in bulk; other lines are read token by token.
+        The rows are then built by stride from the flat list of values.
+        """
+        values = []
+        quoted_dot_index = []
+        line_tokens = self.line_tokens
+
+        tblx, colx, strx, tokx = token
+        while True:
+            ## the loop ends with a new table or a reserved word
+            if tblx is not None:
+                break
+
+            if tokx is not None:
+                rword, name = self.split_token(tokx)
+                if rword is not None:
+                    break
+                values.append(tokx)
+
+            elif strx is not None:
+                ## a quoted "." is a value, not a null
+                if strx == ".":
+                    quoted_dot_index.append(len(values))
+                values.append(strx)
+
+            if not line_tokens:
+                self.read_bulk_lines(values)
+
+            try:
+                tblx, colx, strx, tokx = next(token_iter)
+            except RuntimeError:
+                ## end of file
+                self.load_loop_values(cif_table, values, quoted_dot_index)
+                raise
+
+        self.load_loop_values(cif_table, values, quoted_dot_index)
+        return tblx, colx, strx, tokx
+
+    def read_bulk_lines(self, values):
+        """Adds the values of the following loop_ data lines to values for
+        as long as they can be split with str.split().  The first line
+        which cannot is left for the tokenizer.
+        """
+        re_bulk_special = self.re_bulk_special
+
+        while True:
+            try:
+                ln = self.next_line()
+            except StopIteration:
+                return
+
+            if re_bulk_special.search(ln) is not None:
+                self.unread_ln = ln
+                return
+
+            values.extend(ln.split())
+
+    def load_loop_values(self, cif_table, values, quoted_dot_index):
+        """Adds the flat list of loop_ values to cif_table, one mmCIFRow
+        per len(cif_table.columns) values.  Unquoted "." values are
+        left out of the rows.
+        """
+        columns_lower = [column.lower() for column in cif_table.columns]
+        num_columns = len(columns_lower)
+        first_row = len(cif_table)
+
+        if isinstance(cif_table, mmCIFColumnTable):
+            self.load_loop_columns(cif_table, values, quoted_dot_index)
+            return
+
+        for i in range(0, len(values), num_columns):
+            row_values = values[i:i + num_columns]
+            cif_row = mmCIFRow(zip(columns_lower, row_values))
+            if "." in row_values:
+                for clower, value in zip(columns_lower, row_values):
+                    if value == ".":
+                        dict.__delitem__(cif_row, clower)
+            cif_table.append(cif_row)
+
+        for i in quoted_dot_index:
+            cif_row = cif_table[first_row + i // num_columns]
+            dict.__setitem__(cif_row, columns_lower[i % num_columns], ".")
+
+    def load_loop_columns(self, cif_table, values, quoted_dot_index):
+        """Like load_loop_values, for a mmCIFColumnTable.  Equal values in
+        a column share one string object, and unquoted "." values are
+        stored as None.
+        """
+        columns_lower = [column.lower() for column in cif_table.columns]
+        num_columns = len(columns_lower)
+        num_rows = (len(values) + num_columns - 1) // num_columns
+        first_row = len(cif_table)
+
+        column_values = {}
+        for i, clower in enumerate(columns_lower):
+            column = values[i::num_columns]
+            value_dict = {".": None}
+            column = list(map(value_dict.setdefault, column, column))
+            if len(column) < num_rows:
+                column.append(None)
+            column_values[clower] = column
+
+        cif_table.extend_columns(column_values)
+
+        for i in quoted_dot_index:
+            cif_table.set_value(
+                first_row + i // num_columns, columns_lower[i % num_columns], ".")
+
+    def next_line(self):
+        """Returns the next line of the file, raising StopIteration at the
+        end of the file.
+        """
+        ln = self.unread_ln
+        if ln is not None:
+            self.unread_ln = None
+            return ln
+
+        ln = next(self.file_iter)
+        self.line_number += 1
+        return ln
+
     def gen_token_iter(self, fileobj):
         re_tok = re.compile(
             r"(?:"
@@ -866,12 +1386,19 @@ class mmCIFFileParser(object):
         #              r"(?:\"(.*?)(?:\"\s|\"$))"          "|"  # double quoted strings
         #
         #              r"(?:'(.*?)(?:'\s|'$))"             "|"  # single quoted strings
-        file_iter = iter(fileobj)
+
+        ## the lines are read with self.next_line(), and the tokens of the
+        ## current line are queued in self.line_tokens, so read_loop_data
+        ## can take over reading at the start of any line
+        next_line = self.next_line
+        line_tokens = self.line_tokens
 
         ## parse file, yielding tokens for self.parser()
         while True:
-            ln = next(file_iter)
-            self.line_number += 1
+            while line_tokens:
+                yield line_tokens.popleft()
+
+            ln = next_line()
 
             ## skip comments
             if ln.startswith("#"):
@@ -881,8 +1408,7 @@ class mmCIFFileParser(object):
             if ln.startswith(";"):
                 lmerge = [ln[1:]]
                 while True:
-                    ln = next(file_iter)
-                    self.line_number += 1
+                    ln = next_line()
                     if ln.startswith(";"):
                         break
                     lmerge.append(ln)
@@ -899,7 +1425,7 @@ class mmCIFFileParser(object):
                 groups = (groups_all[0], groups_all[1], groups_all[2] or groups_all[3], groups_all[4])
                 #groups = groups_all
                 if groups != (None, None, None, None):
-                    yield groups
+                    line_tokens.append(groups)
 
 
 class mmCIFFileWriter(object):
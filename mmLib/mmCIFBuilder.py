@@ -57,13 +57,18 @@ def setmapf_cif(smap, skey, dmap, dkey):
 
 
 class mmCIFStructureBuilder(StructureBuilder.StructureBuilder):
-    """Builds a new Structure object by loading an mmCIF file.
+    """Builds a new Structure object by loading an mmCIF file.  With
+    columnar set, the loop_ tables of the mmCIF file (kept in
+    Structure.cifdb) are stored as mmCIF.mmCIFColumnTable.
     """
+    def __init__(self, columnar = False, **args):
+        self.columnar = columnar
+        StructureBuilder.StructureBuilder.__init__(self, **args)
 
     def read_start(self, filobj):
         ## parse the mmCIF file
         self.cif_file = mmCIF.mmCIFFile()
-        self.cif_file.load_file(filobj)
+        self.cif_file.load_file(filobj, columnar = self.columnar)
 
         ## for an mmCIF file for a structure, assume the first data item
         ## contains the structure; if there is no data in the mmCIF
@@ -76,8 +76,7 @@ class mmCIFDB(mmCIF.mmCIFData):
         if len(table):
             table[0][col_name] = val
         else:
-            row = mmCIF.mmCIFRow()
-            table.append(row)
+            row = table.new_row()
             row[col_name] = val
 
     def get_entry_id(self):
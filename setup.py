@@ -193,6 +193,11 @@ def library_data(opts):
                 for fil in os.listdir(dir2):
                     file_list.append(os.path.join(dir2, fil))
 
+        ## precompiled library index from mmlib-build-library
+        index_path = os.path.join(os.curdir, "mmLib", "Data", "Library.db")
+        if os.path.isfile(index_path):
+            inst_list.append((os.path.join("mmLib", "Data"), [index_path]))
+
     return inst_list
 
 
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+## Copyright 2002-2010 by PyMMLib Development Group (see AUTHORS file)
+## This code is part of the PyMMLib distribution and governed by
+## its license.  Please see the LICENSE file that should have been
+## included as part of this package.
+"""Checks the batched geometry and ADP comparison functions of
+mmLib.AtomMath against their scalar versions.
+"""
+import numpy
+
+## pymmlib
+from mmLib import AtomMath, Structure
+
+
+def random_U(rng, num):
+    """Returns a (num,3,3) stack of random positive definite tensors.
+    """
+    A = rng.normal(0.0, 0.2, (num, 3, 3))
+    return numpy.matmul(A, A.transpose((0, 2, 1))) + 0.01 * numpy.identity(3)
+
+def test_adp_comparisons():
+    rng = numpy.random.RandomState(22)
+    U = random_U(rng, 50)
+    V = random_U(rng, 50)
+
+    CC = AtomMath.calc_CCuij_array(U, V)
+    S = AtomMath.calc_Suij_array(U, V)
+    DP2 = AtomMath.calc_DP2uij_array(U, V)
+    for i in range(len(U)):
+        assert numpy.allclose(CC[i], AtomMath.calc_CCuij(U[i], V[i]))
+        assert numpy.allclose(S[i], AtomMath.calc_Suij(U[i], V[i]))
+        assert numpy.allclose(DP2[i], AtomMath.calc_DP2uij(U[i], V[i]))
+
+def test_not_positive_definite():
+    rng = numpy.random.RandomState(23)
+    V = random_U(rng, 4)
+
+    ## two negative eigenvalues give a positive determinant
+    U = numpy.array([numpy.diag((-0.02, -0.03, 0.2)),
+                     numpy.diag((-0.02, 0.03, 0.2)),
+                     numpy.diag((0.0, 0.03, 0.2)),
+                     numpy.diag((0.02, 0.03, 0.2))])
+    assert numpy.linalg.det(U[0]) > 0.0
+
+    positive = numpy.array([False, False, False, True])
+    assert numpy.array_equal(AtomMath.calc_positive_definite_array(U), positive)
+
+    for func in (AtomMath.calc_CCuij_array,
+                 AtomMath.calc_Suij_array,
+                 AtomMath.calc_DP2uij_array):
+        for values in (func(U, V), func(V, U)):
+            assert numpy.array_equal(numpy.isnan(values), ~positive)
+
+
+def random_atoms(rng, num):
+    xyz = rng.uniform(-10.0, 10.0, (num, 3))
+    atom_list = [Structure.Atom(x = x, y = y, z = z) for x, y, z in xyz]
+    return xyz, atom_list
+
+def test_geometry_arrays():
+    rng = numpy.random.RandomState(25)
+    xyz, atom_list = random_atoms(rng, 40)
+    a1, a2, a3, a4 = atom_list[0:10], atom_list[10:20], atom_list[20:30], atom_list[30:40]
+    x1, x2, x3, x4 = xyz[0:10], xyz[10:20], xyz[20:30], xyz[30:40]
+
+    distance = AtomMath.calc_distance_array(x1, x2)
+    angle = AtomMath.calc_angle_array(x1, x2, x3)
+    torsion = AtomMath.calc_torsion_angle_array(x1, x2, x3, x4)
+    for i in range(10):
+        assert numpy.allclose(distance[i], AtomMath.calc_distance(a1[i], a2[i]),
+                              rtol = 1e-13, atol = 0.0)
+        assert numpy.allclose(angle[i], AtomMath.calc_angle(a1[i], a2[i], a3[i]),
+                              rtol = 1e-13, atol = 1e-13)
+        assert numpy.allclose(torsion[i], AtomMath.calc_torsion_angle(a1[i], a2[i], a3[i], a4[i]),
+                              rtol = 1e-13, atol = 1e-13)
+
+    ## one position against many
+    assert numpy.allclose(AtomMath.calc_distance_array(x1[0], x2),
+                          [AtomMath.calc_distance(a1[0], atm) for atm in a2])
+
+    ## the index versions
+    pairs = numpy.array([(0, 10), (5, 39), (22, 3)])
+    triples = numpy.array([(0, 10, 20), (39, 5, 12)])
+    quads = numpy.array([(0, 10, 20, 30), (39, 5, 12, 7)])
+    assert numpy.allclose(AtomMath.calc_index_distance_array(xyz, pairs),
+                          [AtomMath.calc_distance(atom_list[i], atom_list[j]) for i, j in pairs])
+    assert numpy.allclose(AtomMath.calc_index_angle_array(xyz, triples),
+                          [AtomMath.calc_angle(*[atom_list[i] for i in t]) for t in triples])
+    assert numpy.allclose(AtomMath.calc_index_torsion_angle_array(xyz, quads),
+                          [AtomMath.calc_torsion_angle(*[atom_list[i] for i in q]) for q in quads])
+
+    ## missing positions are NaN
+    x4 = x4.copy()
+    x4[3] = numpy.nan
+    torsion = AtomMath.calc_torsion_angle_array(x1, x2, x3, x4)
+    assert numpy.array_equal(numpy.isnan(torsion), numpy.arange(10) == 3)
+
+def test_centroid_arrays():
+    rng = numpy.random.RandomState(251)
+    xyz, atom_list = random_atoms(rng, 30)
+    for i, atm in enumerate(atom_list):
+        atm.temp_factor = 10.0 + i
+
+    centroid = numpy.sum(xyz, axis = 0) / len(xyz)
+    assert numpy.allclose(AtomMath.calc_centroid_array(xyz), centroid)
+    assert numpy.allclose(AtomMath.calc_atom_centroid(atom_list), centroid)
+    assert numpy.allclose(AtomMath.calc_atom_mean_temp_factor(atom_list), 24.5)
+
+    ## a boolean mask, an index mask, and Atoms without a position
+    mask = rng.uniform(size = 30) > 0.5
+    centroid = AtomMath.calc_atom_centroid(
+        [atm for atm, use in zip(atom_list, mask) if use])
+    assert numpy.allclose(AtomMath.calc_centroid_array(xyz, mask), centroid)
+    assert numpy.allclose(AtomMath.calc_centroid_array(xyz, numpy.nonzero(mask)[0]), centroid)
+
+    for atm, use in zip(atom_list, mask):
+        if not use:
+            atm.position = None
+    assert numpy.allclose(AtomMath.calc_atom_centroid(atom_list), centroid)
+    assert numpy.array_equal(AtomMath.calc_atom_position_array(atom_list), xyz[mask])
+
+def test_inertia_tensor():
+    rng = numpy.random.RandomState(252)
+
+    ## a flattened blob: longest along u, shortest along w
+    u, v, w = AtomMath.rmatrixu(rng.normal(size = 3), 1.0)
+    s = rng.normal(size = (200, 3)) * [8.0, 4.0, 1.0]
+    xyz = 5.0 + s[:,0:1] * u + s[:,1:2] * v + s[:,2:3] * w
+    atom_list = [Structure.Atom(x = x, y = y, z = z) for x, y, z in xyz]
+    origin = AtomMath.calc_centroid_array(xyz)
+
+    I = numpy.zeros((3, 3), float)
+    for x in xyz - origin:
+        I += numpy.dot(x, x) * numpy.identity(3) - numpy.outer(x, x)
+    assert numpy.allclose(AtomMath.calc_inertia_matrix_array(xyz, origin), I)
+
+    ## rows are the principal axes, smallest moment first (the longest
+    ## axis of the molecule), and the largest moment along z
+    R = AtomMath.calc_inertia_tensor_array(xyz, origin)
+    assert numpy.allclose(numpy.linalg.det(R), 1.0)
+    assert numpy.allclose(numpy.dot(R, R.T), numpy.identity(3))
+    moments = numpy.dot(numpy.dot(R, I), R.T)
+    assert numpy.allclose(moments, numpy.diag(numpy.diag(moments)), atol = 1e-8 * numpy.trace(I))
+    assert numpy.all(numpy.diff(numpy.diag(moments)) > 0.0)
+    for row, axis in zip(R, (u, v, w)):
+        assert abs(numpy.dot(row, axis)) > 0.99
+
+    assert numpy.allclose(AtomMath.calc_inertia_tensor(atom_list, origin), R)
+
+    ## a mask selects the positions used
+    mask = rng.uniform(size = len(xyz)) > 0.3
+    assert numpy.allclose(AtomMath.calc_inertia_tensor_array(xyz, origin, mask),
+                          AtomMath.calc_inertia_tensor_array(xyz[mask], origin))
+
+
+if __name__ == "__main__":
+    for name, func in sorted(globals().items()):
+        if name.startswith("test_"):
+            func()
+            print("%s: OK" % (name))
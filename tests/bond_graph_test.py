@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+## Copyright 2002-2010 by PyMMLib Development Group (see AUTHORS file)
+## This code is part of the PyMMLib distribution and governed by
+## its license.  Please see the LICENSE file that should have been
+## included as part of this package.
+"""Checks that Structure.get_bond_graph() leaves the AtomTable binding of
+the Atoms alone.
+"""
+## Python
+import os
+
+import numpy
+
+## pymmlib
+from mmLib import FileIO
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+def load_bonded_struct():
+    struct = FileIO.LoadStructure(fil = os.path.join(DATA_PATH, "1eas.cif"))
+    struct.add_bonds_from_covalent_distance()
+    return struct
+
+def bond_set(struct, bond_graph):
+    """Returns the bonds of the graph as a set of (id(atm1), id(atm2)).
+    """
+    atom_list = list(struct.iter_all_atoms())
+    return set((id(atom_list[i]), id(atom_list[j]))
+               for i, j in zip(bond_graph.index1.tolist(), bond_graph.index2.tolist()))
+
+def test_bond_graph_keeps_table():
+    struct = load_bonded_struct()
+    atm = next(struct.iter_all_atoms())
+
+    table = struct.get_atom_table()
+    bond_graph = struct.get_bond_graph()
+    assert struct.atom_table is table
+    assert bond_graph.atom_table is table
+    assert atm.atom_table is table
+
+    ## writes through the Atom still reach the table the caller holds
+    atm.position = numpy.array([1.0, 2.0, 3.0])
+    assert numpy.array_equal(table.position[0], [1.0, 2.0, 3.0])
+
+def test_bond_graph_unbound():
+    struct = load_bonded_struct()
+    bond_graph = struct.get_bond_graph()
+
+    assert struct.atom_table is None
+    assert all(atm.atom_table is None for atm in struct.iter_all_atoms())
+    assert bond_graph.num_atoms == struct.count_all_atoms()
+    assert len(bond_graph.index1) > 0
+
+    ## the same bonds as the graph of a bound table
+    table_graph = struct.get_atom_table().calc_bond_graph()
+    assert bond_set(struct, bond_graph) == bond_set(struct, table_graph)
+
+
+if __name__ == "__main__":
+    for name, func in sorted(globals().items()):
+        if name.startswith("test_"):
+            func()
+            print("%s: OK" % (name))
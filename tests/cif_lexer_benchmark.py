@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+## Copyright 2002-2010 by PyMMLib Development Group (see AUTHORS file)
+## This code is part of the PyMMLib distribution and governed by
+## its license.  Please see the LICENSE file that should have been
+## included as part of this package.
+"""Benchmarks the buffered CIF.Lexer against the character at a time
+CIF.CharLexer, and checks that both produce the same Token stream.
+"""
+
+## Python
+import sys
+import time
+
+## pymmlib
+import test_util
+from mmLib import CIF
+
+
+def read_tokens(lexer_class, path):
+    fil = open(path)
+    lexer = lexer_class(fil, path)
+    token_list = []
+    while True:
+        token = lexer.next_token()
+        token_list.append((token.type, token.value, token.line))
+        if token.type is CIF.L_EOF:
+            break
+    fil.close()
+    return token_list
+
+def time_tokens(lexer_class, path, repeat):
+    best = None
+    for i in range(repeat):
+        begin = time.time()
+        token_list = read_tokens(lexer_class, path)
+        secs = time.time() - begin
+        if best is None or secs < best:
+            best = secs
+    return token_list, best
+
+def main(path, repeat):
+    char_tokens, char_secs = time_tokens(CIF.CharLexer, path, repeat)
+    tokens, secs = time_tokens(CIF.Lexer, path, repeat)
+
+    if tokens != char_tokens:
+        print("%s: ERROR: Token streams differ" % (path))
+        return False
+
+    print("%s: %d tokens  CharLexer %.3fs  Lexer %.3fs  speedup %.1fx" % (
+        path, len(tokens), char_secs, secs, char_secs / max(secs, 1e-9)))
+    return True
+
+if __name__ == "__main__":
+    try:
+        path = sys.argv[1]
+    except IndexError:
+        print("usage: cif_lexer_benchmark.py <CIF file or directory of files> [repeat]")
+        sys.exit(1)
+
+    try:
+        repeat = int(sys.argv[2])
+    except IndexError:
+        repeat = 3
+
+    ok = True
+    for pathx in test_util.walk_cif(path):
+        ok = main(pathx, repeat) and ok
+
+    if not ok:
+        sys.exit(1)
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+## Copyright 2002-2010 by PyMMLib Development Group (see AUTHORS file)
+## This code is part of the PyMMLib distribution and governed by
+## its license.  Please see the LICENSE file that should have been
+## included as part of this package.
+"""Checks that the list interface of mmCIF.mmCIFColumnTable behaves like
+the one of mmCIF.mmCIFTable.
+"""
+## Python
+import os
+
+## pymmlib
+from mmLib import mmCIF, mmCIFDB
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+def load_tables(table_name, path = os.path.join(DATA_PATH, "1eas.cif")):
+    """Returns the (mmCIFTable, mmCIFColumnTable) pair of table_name.
+    """
+    tables = []
+    for columnar in (False, True):
+        cif_file = mmCIF.mmCIFFile()
+        cif_file.load_file(path, columnar = columnar)
+        tables.append(cif_file[0][table_name])
+    assert isinstance(tables[0], mmCIF.mmCIFTable)
+    assert isinstance(tables[1], mmCIF.mmCIFColumnTable)
+    return tables
+
+def rows(table):
+    return [dict(row.items()) for row in table]
+
+def test_index_count_contains():
+    for table in load_tables("entity_poly_seq"):
+        for i in (0, 5, len(table) - 1):
+            row = table[i]
+            assert row in table
+            assert table.index(row) == i
+            assert table.count(row) == 1
+        try:
+            table.index(table[5], 6)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("index() found a row before start")
+
+def test_sort_reverse():
+    key = lambda row: (row["mon_id"], int(row["num"]))
+    table, column_table = load_tables("entity_poly_seq")
+
+    table.sort(key = key)
+    column_table.sort(key = key)
+    assert rows(table) == rows(column_table)
+
+    table.sort(key = key, reverse = True)
+    column_table.sort(key = key, reverse = True)
+    assert rows(table) == rows(column_table)
+
+    table.reverse()
+    column_table.reverse()
+    assert rows(table) == rows(column_table)
+    assert rows(reversed(table)) == rows(reversed(column_table))
+
+def test_pop_remove_clear():
+    table, column_table = load_tables("entity_poly_seq")
+
+    for i in (-1, 0, 3):
+        assert dict(table.pop(i).items()) == dict(column_table.pop(i).items())
+        assert rows(table) == rows(column_table)
+
+    table.remove(table[2])
+    column_table.remove(column_table[2])
+    del table[4]
+    del column_table[4]
+    assert rows(table) == rows(column_table)
+
+    table.clear()
+    column_table.clear()
+    assert len(table) == len(column_table) == 0
+    for tablex in (table, column_table):
+        try:
+            tablex.pop()
+        except IndexError:
+            pass
+        else:
+            raise AssertionError("pop() from empty table")
+
+def test_insert_extend_add():
+    table, column_table = load_tables("entity_poly_seq")
+    new_row = {"entity_id": "9", "num": "1", "mon_id": "GLY", "hetero": "n"}
+
+    for tablex in (table, column_table):
+        cif_row = mmCIF.mmCIFRow()
+        cif_row.update(new_row)
+        tablex.insert(1, cif_row)
+    assert rows(table) == rows(column_table)
+
+    table.extend([copy_row(row) for row in list(table)[:3]])
+    column_table.extend(list(column_table)[:3])
+    assert rows(table) == rows(column_table)
+
+    assert rows(table + []) == rows(column_table + [])
+    assert rows(table * 2) == rows(column_table * 2)
+
+def copy_row(row):
+    cif_row = mmCIF.mmCIFRow()
+    cif_row.update(row)
+    return cif_row
+
+def test_set_single():
+    for columnar in (False, True):
+        cif_db = mmCIFDB.mmCIFDB("XXXX")
+        if columnar:
+            cif_db.append(mmCIF.mmCIFColumnTable("entry"))
+        cif_db.set_single("entry", "id", "1EAS")
+        assert cif_db.get_single("entry", "id") == "1EAS"
+
+
+if __name__ == "__main__":
+    for name, func in sorted(globals().items()):
+        if name.startswith("test_"):
+            func()
+            print("%s: OK" % (name))
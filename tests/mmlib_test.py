@@ -476,10 +476,56 @@ def struct_test(struct, stats):
     stats["testing"] = None
 
 
+def atom_table_test(struct, stats):
+    """Tests the mmLib.AtomTable columnar view of the Structure.
+    """
+    stats["testing"] = struct
+
+    atom_list = list(struct.iter_all_atoms())
+    pos_list  = [copy.copy(atm.position) for atm in atom_list]
+
+    table = struct.get_atom_table()
+    assert struct.atom_table is table
+    assert len(table) == len(atom_list)
+
+    for i, atm in enumerate(atom_list):
+        assert table[i] is atm
+        assert table.index(atm) == i
+        assert table.element_names[table.element_code[i]] == atm.element
+        assert table.name_names[table.name_code[i]] == atm.name
+        assert table.fragment_list[table.fragment_index[i]] is atm.fragment
+
+        if pos_list[i] is None:
+            assert atm.position is None
+            assert not table.has_position[i]
+        else:
+            assert numpy.allclose(table.position[i], pos_list[i])
+
+    ## writes through either the Atom or the table are seen by both
+    if len(atom_list) > 0 and atom_list[0].position is not None:
+        atm = atom_list[0]
+        pos = atm.position.copy()
+
+        atm.position = pos + 1.0
+        assert numpy.allclose(table.position[0], pos + 1.0)
+
+        table.position[0] = pos
+        assert numpy.allclose(atm.position, pos)
+
+    table.detach()
+    for i, atm in enumerate(atom_list):
+        assert atm.atom_table is None
+        if pos_list[i] is not None:
+            assert numpy.allclose(atm.position, pos_list[i])
+
+    stats["testing"] = None
+
+
 def run_structure_tests(struct, stats):
     """Run basic API tests on the mmLib.Structure object and print statistics.
     """
     struct_test(struct, stats)
+    atom_table_test(struct, stats)
 
     for model in struct.iter_models():
         model_test(model, stats)
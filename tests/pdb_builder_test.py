@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+## Copyright 2002-2010 by PyMMLib Development Group (see AUTHORS file)
+## This code is part of the PyMMLib distribution and governed by
+## its license.  Please see the LICENSE file that should have been
+## included as part of this package.
+"""Checks that PDBStructureBuilder loads the same structure from a file
+name as from an open file.
+"""
+## Python
+import os
+import shutil
+import tempfile
+
+## pymmlib
+from mmLib import FileIO
+from mmLib.PDBBuilder import PDBStructureBuilder
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+def atom_keys(struct):
+    return [(atm.chain_id, atm.fragment_id, atm.name, atm.alt_loc)
+            for atm in struct.iter_all_atoms()]
+
+def test_load_pdb_path():
+    struct = FileIO.LoadStructure(fil = os.path.join(DATA_PATH, "1eas.cif"))
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp_dir, "1eas.pdb")
+        FileIO.SaveStructure(fil = path, struct = struct, format = "PDB")
+
+        path_struct = PDBStructureBuilder(fil = path).struct
+        with open(path) as fil:
+            file_struct = PDBStructureBuilder(fil = fil).struct
+    finally:
+        shutil.rmtree(tmp_dir)
+
+    assert path_struct.count_all_atoms() == struct.count_all_atoms() > 0
+    assert atom_keys(path_struct) == atom_keys(file_struct)
+
+
+if __name__ == "__main__":
+    test_load_pdb_path()
+    print("test_load_pdb_path: OK")
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+## Copyright 2002-2010 by PyMMLib Development Group (see AUTHORS file)
+## This code is part of the PyMMLib distribution and governed by
+## its license.  Please see the LICENSE file that should have been
+## included as part of this package.
+"""Measures the wall time of a fresh interpreter running
+python -c "import mmLib.FileIO", and fails if the median time exceeds
+an optional limit in seconds.
+"""
+
+## Python
+import os
+import subprocess
+import sys
+import time
+
+STATEMENT = "import mmLib.FileIO"
+
+
+def time_startup(statement):
+    ## run from the source tree this script belongs to
+    env = dict(os.environ)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(
+        [root] + [x for x in [env.get("PYTHONPATH")] if x])
+
+    begin = time.time()
+    subprocess.check_call([sys.executable, "-c", statement], env = env,
+                          stdout = subprocess.DEVNULL)
+    return time.time() - begin
+
+def main(repeat, max_secs):
+    ## the baseline interpreter start, so the mmLib share can be reported
+    python_secs = sorted(time_startup("pass") for i in range(repeat))
+    secs = sorted(time_startup(STATEMENT) for i in range(repeat))
+
+    median = secs[len(secs) // 2]
+    python_median = python_secs[len(python_secs) // 2]
+    print("%s: best %.3fs  median %.3fs  (interpreter alone %.3fs)" % (
+        STATEMENT, secs[0], median, python_median))
+
+    if max_secs is not None and median > max_secs:
+        print("ERROR: median startup time %.3fs exceeds %.3fs" % (median, max_secs))
+        return False
+    return True
+
+if __name__ == "__main__":
+    try:
+        repeat = int(sys.argv[1])
+    except IndexError:
+        repeat = 10
+
+    try:
+        max_secs = float(sys.argv[2])
+    except IndexError:
+        max_secs = None
+
+    if not main(repeat, max_secs):
+        sys.exit(1)
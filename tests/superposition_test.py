@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+## Copyright 2002-2010 by PyMMLib Development Group (see AUTHORS file)
+## This code is part of the PyMMLib distribution and governed by
+## its license.  Please see the LICENSE file that should have been
+## included as part of this package.
+"""Checks the batched superposition functions and the outlier rejection
+of mmLib.Superposition against pairwise SuperimposePoints.
+"""
+import numpy
+
+## pymmlib
+from mmLib import AtomMath, Superposition
+
+
+def random_ensemble(rng, num_sets, num_points, noise = 0.3):
+    """Returns (num_sets,num_points,3) randomly rotated, shifted and
+    perturbed copies of one random point set.
+    """
+    xyz = rng.uniform(-10.0, 10.0, (num_points, 3))
+    ensemble = []
+    for k in range(num_sets):
+        R = AtomMath.rmatrixu(rng.normal(size = 3), rng.uniform(0.0, numpy.pi))
+        t = rng.uniform(-5.0, 5.0, 3)
+        ensemble.append(numpy.dot(xyz, R.T) + t + rng.normal(0.0, noise, xyz.shape))
+    return numpy.array(ensemble)
+
+def test_batch_num_atoms():
+    rng = numpy.random.RandomState(15)
+    src = random_ensemble(rng, 4, 30)
+    dst = random_ensemble(rng, 1, 30)[0]
+
+    ## uniform real weights do not change the fit
+    batch = Superposition.SuperimposePointsBatch(src, dst, numpy.ones(30) * 0.5)
+    assert list(batch.num_atoms) == [30] * 4
+    for k in range(4):
+        sresult = Superposition.SuperimposePoints(src[k], dst)
+        assert numpy.allclose(batch.rmsd[k], sresult.rmsd)
+
+    ## 0/1 weights leave out points
+    weights = numpy.ones((4, 30))
+    weights[1, :5] = 0.0
+    weights[3, ::2] = 0.0
+    batch = Superposition.SuperimposePointsBatch(src, dst, weights)
+    assert list(batch.num_atoms) == [30, 25, 30, 15]
+    for k in range(4):
+        use = weights[k] > 0.0
+        sresult = Superposition.SuperimposePoints(src[k][use], dst[use])
+        assert numpy.allclose(batch.rmsd[k], sresult.rmsd)
+
+def test_rmsd_matrix():
+    rng = numpy.random.RandomState(16)
+    num_sets, num_points = 7, 25
+    xyz = random_ensemble(rng, num_sets, num_points)
+
+    ## each set misses some points; sets 5 and 6 share only 2 points
+    mask = rng.uniform(size = (num_sets, num_points)) > 0.2
+    mask[5] = False
+    mask[5, :8] = True
+    mask[6] = False
+    mask[6, 6:14] = True
+
+    rmsd = Superposition.CalcRMSDMatrixPoints(xyz, mask, min_atoms = 3)
+    assert numpy.array_equal(rmsd, rmsd.T, equal_nan = True)
+    assert numpy.all(numpy.diag(rmsd) == 0.0)
+
+    for i in range(num_sets):
+        for j in range(i + 1, num_sets):
+            use = mask[i] & mask[j]
+            if numpy.sum(use) < 3:
+                assert numpy.isnan(rmsd[i, j])
+                continue
+            sresult = Superposition.SuperimposePoints(xyz[j][use], xyz[i][use])
+            assert numpy.allclose(rmsd[i, j], sresult.rmsd)
+    assert numpy.isnan(rmsd[5, 6])
+
+    for num_procs in (2, 3):
+        rmsd_procs = Superposition.CalcRMSDMatrixPoints(
+            xyz, mask, min_atoms = 3, num_procs = num_procs)
+        assert numpy.array_equal(rmsd, rmsd_procs, equal_nan = True)
+
+
+class Atom(object):
+    def __init__(self, fragment_id, name, position):
+        self.fragment_id = fragment_id
+        self.name = name
+        self.position = position
+
+
+class Segment(object):
+    """The parts of a Segment used by CalcMatchingPoints().
+    """
+    def __init__(self, atom_list):
+        self.chain_id = "A"
+        self.atom_list = atom_list
+
+    def iter_atoms(self):
+        return iter(self.atom_list)
+
+
+def test_rmsd_matrix_containers():
+    rng = numpy.random.RandomState(161)
+    xyz = random_ensemble(rng, 4, 20)
+
+    ## the copies miss different residues
+    segment_list = []
+    for k in range(4):
+        segment_list.append(Segment([
+            Atom(str(i // 2), ("CA", "CB")[i % 2], xyz[k, i])
+            for i in range(20) if (i // 2) % 4 != k]))
+
+    rmsd = Superposition.CalcRMSDMatrix(segment_list, Superposition.MATCH_CA)
+    for i in range(4):
+        for j in range(4):
+            use = [n for n in range(0, 20, 2) if (n // 2) % 4 not in (i, j)]
+            sresult = Superposition.SuperimposePoints(xyz[j, use], xyz[i, use])
+            assert numpy.allclose(rmsd[i, j], sresult.rmsd, atol = 1e-6)
+
+
+def planted_outliers(rng, num_points = 60, noise = 0.02):
+    """Returns (src, dst, outliers): a random point set, a rotated, shifted
+    and slightly perturbed copy of it, and the indexes of the points of
+    the copy moved 3, 4, 5 and 6A away.
+    """
+    src, dst = random_ensemble(rng, 2, num_points, noise)
+    outliers = numpy.array([7, 19, 33, 48])
+    for k, i in enumerate(outliers):
+        direction = rng.normal(size = 3)
+        dst[i] += (3.0 + k) * direction / AtomMath.length(direction)
+    return src, dst, outliers
+
+def test_outlier_rejection():
+    rng = numpy.random.RandomState(17)
+    src, dst, outliers = planted_outliers(rng)
+    inliers = numpy.ones(len(src), bool)
+    inliers[outliers] = False
+    sresult = Superposition.SuperimposePoints(src[inliers], dst[inliers])
+
+    ## all outliers dropped in one cycle
+    result = Superposition.SuperimposePointsOutlierRejection(src, dst, rmsd_cutoff = 0.3)
+    assert result.converged
+    assert numpy.array_equal(result.inlier_mask, inliers)
+    assert [(n, k) for n, rmsd, k in result.cycle_list] == [(60, 4), (56, 0)]
+    assert result.cycle_list[0][1] > 0.3
+    assert numpy.allclose(result.cycle_list[1][1], sresult.rmsd)
+    assert numpy.allclose(result.sresult.rmsd, sresult.rmsd)
+    assert numpy.allclose(result.sresult.R, sresult.R)
+
+    ## one outlier a cycle, the worst first
+    result = Superposition.SuperimposePointsOutlierRejection(
+        src, dst, rmsd_cutoff = 0.3, max_outliers = 1)
+    assert result.converged
+    assert numpy.array_equal(result.inlier_mask, inliers)
+    assert [(n, k) for n, rmsd, k in result.cycle_list] == \
+        [(60, 1), (59, 1), (58, 1), (57, 1), (56, 0)]
+    rmsd_list = [rmsd for n, rmsd, k in result.cycle_list]
+    assert rmsd_list == sorted(rmsd_list, reverse = True)
+    for num_cycles in range(1, 5):
+        result = Superposition.SuperimposePointsOutlierRejection(
+            src, dst, rmsd_cutoff = 0.3, max_cycles = num_cycles, max_outliers = 1)
+        assert list(numpy.nonzero(~result.inlier_mask)[0]) == sorted(outliers[-num_cycles:])
+
+    ## stops when no point may be dropped
+    result = Superposition.SuperimposePointsOutlierRejection(
+        src, dst, rmsd_cutoff = 0.3, max_outliers = 0)
+    assert not result.converged
+    assert numpy.all(result.inlier_mask)
+    assert [(n, k) for n, rmsd, k in result.cycle_list] == [(60, 0)]
+    assert result.sresult.num_atoms == 60
+
+    ## stops when fewer than min_atoms points are left; the result is the
+    ## last fit done
+    result = Superposition.SuperimposePointsOutlierRejection(
+        src, dst, rmsd_cutoff = 0.001, max_outliers = 10, min_atoms = 40)
+    assert not result.converged
+    assert [(n, k) for n, rmsd, k in result.cycle_list] == [(60, 10), (50, 10), (40, 10)]
+    assert numpy.sum(result.inlier_mask) == 30
+    assert result.sresult.num_atoms == 40
+
+    ## stops after max_cycles
+    result = Superposition.SuperimposePointsOutlierRejection(
+        src, dst, rmsd_cutoff = 0.3, max_cycles = 1)
+    assert not result.converged
+    assert len(result.cycle_list) == 1
+    assert numpy.array_equal(result.inlier_mask, inliers)
+
+
+class AtomPosition(object):
+    def __init__(self, position):
+        self.position = position
+
+
+def test_atoms_outlier_rejection():
+    rng = numpy.random.RandomState(171)
+    src, dst, outliers = planted_outliers(rng)
+    inliers = numpy.ones(len(src), bool)
+    inliers[outliers] = False
+
+    alist = [(AtomPosition(x1), AtomPosition(x2)) for x1, x2 in zip(src, dst)]
+    inlier_pairs = [pair for pair, inlier in zip(alist, inliers) if inlier]
+
+    sresult = Superposition.SuperimposeAtomsOutlierRejection(alist, rmsd_cutoff = 1.0)
+    assert alist == inlier_pairs
+    fit = Superposition.SuperimposePoints(src[inliers], dst[inliers])
+    assert sresult.num_atoms == len(inlier_pairs)
+    assert numpy.allclose(sresult.rmsd, fit.rmsd)
+    assert numpy.allclose(sresult.R, fit.R)
+
+    ## the pairs dropped are removed from alist even without convergence
+    alist = [(AtomPosition(x1), AtomPosition(x2)) for x1, x2 in zip(src, dst)]
+    inlier_pairs = [pair for pair, inlier in zip(alist, inliers) if inlier]
+    sresult = Superposition.SuperimposeAtomsOutlierRejection(
+        alist, rmsd_cutoff = 1.0, max_cycles = 1)
+    assert sresult is None
+    assert alist == inlier_pairs
+
+
+if __name__ == "__main__":
+    for name, func in sorted(globals().items()):
+        if name.startswith("test_"):
+            func()
+            print("%s: OK" % (name))
@@ -0,0 +1,263 @@
+#!/usr/bin/env python
+## Copyright 2002-2010 by PyMMLib Development Group (see AUTHORS file)
+## This code is part of the PyMMLib distribution and governed by
+## its license.  Please see the LICENSE file that should have been
+## included as part of this package.
+"""Checks the batched TLS fitting code of mmLib.TLS against the scalar
+reference implementations.
+"""
+## Python
+import os
+import copy
+import itertools
+
+import numpy
+
+## pymmlib
+from mmLib import Constants, FileIO, Structure, TLS
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+_STRUCT_CACHE = {}
+
+def load_struct(name = "8j5a.cif"):
+    """Returns the structure of the test data file name, loaded once.
+    """
+    try:
+        return _STRUCT_CACHE[name]
+    except KeyError:
+        struct = _STRUCT_CACHE[name] = FileIO.LoadStructure(
+            fil = os.path.join(DATA_PATH, name))
+        return struct
+
+def chain_fragments(chain_id = "A"):
+    """Returns the list of the Fragments with anisotropic atoms of a chain
+    of the test structure.
+    """
+    chain = load_struct().get_chain(chain_id)
+    return [frag for frag in chain.iter_fragments()
+            if all(atm.U is not None for atm in frag.iter_atoms())]
+
+def amino_acid_struct(chain_id = "A"):
+    """Returns a Structure with a copy of a Chain of the test structure in
+    which all Fragments with a CA atom are AminoAcidResidues, so the
+    result does not depend on the monomer library.
+    """
+    struct = Structure.Structure()
+    chain = Structure.Chain(chain_id = chain_id)
+    for frag in load_struct().get_chain(chain_id).iter_fragments():
+        if frag.get_atom("CA") is not None:
+            frag_class = Structure.AminoAcidResidue
+        else:
+            frag_class = Structure.Fragment
+        new_frag = frag_class(chain_id = chain_id,
+                              fragment_id = frag.fragment_id,
+                              res_name = frag.res_name)
+        for atm in frag.iter_all_atoms():
+            new_frag.add_atom(copy.deepcopy(atm))
+        chain.add_fragment(new_frag, True)
+    chain.sort()
+    struct.add_chain(chain)
+    return struct
+
+def tls_info_key(tls_info):
+    """Returns the parts of a fit_TLS_segments() result which can be
+    compared with ==.
+    """
+    key = []
+    for name, value in sorted(tls_info.items()):
+        if isinstance(value, numpy.ndarray):
+            value = value.tolist()
+        elif isinstance(value, TLS.TLSGroup):
+            value = (value.T.tolist(), value.L.tolist(), value.S.tolist(),
+                     value.origin.tolist(), len(value))
+        elif isinstance(value, Structure.Segment):
+            value = [frag.fragment_id for frag in value.iter_fragments()]
+        key.append((name, value))
+    return key
+
+
+def brute_force_partitions(R, num_groups):
+    """Returns the (residual, range_list) of the best partition of the
+    Fragments of the segment residual matrix R into num_groups groups by
+    trying every set of cut points.
+    """
+    num_frags = len(R) - 1
+    best = (numpy.inf, None)
+    for cuts in itertools.combinations(range(1, num_frags), num_groups - 1):
+        bounds = (0,) + cuts + (num_frags,)
+        range_list = list(zip(bounds[:-1], bounds[1:]))
+        residual = sum(R[i, j] for i, j in range_list)
+        if residual < best[0]:
+            best = (residual, range_list)
+    return best
+
+def test_optimal_partitions():
+    rng = numpy.random.RandomState(20)
+    for num_frags, min_width in ((8, 1), (10, 2), (11, 3)):
+        R = numpy.empty((num_frags + 1, num_frags + 1), float)
+        R[:] = numpy.inf
+        for i in range(num_frags + 1):
+            for j in range(i + min_width, num_frags + 1):
+                R[i, j] = rng.uniform(0.0, 10.0) * (j - i)
+
+        ## some ranges without a fit
+        R[rng.randint(0, num_frags, 4), rng.randint(1, num_frags + 1, 4)] = numpy.inf
+
+        max_groups = num_frags // min_width + 1
+        residuals, partitions = TLS.calc_optimal_partitions(R, max_groups)
+        assert len(residuals) == len(partitions) == max_groups
+
+        for k in range(1, max_groups + 1):
+            residual, range_list = brute_force_partitions(R, k)
+            if range_list is None:
+                assert not numpy.isfinite(residuals[k - 1])
+                assert partitions[k - 1] is None
+                continue
+            assert numpy.allclose(residuals[k - 1], residual)
+            assert numpy.allclose(sum(R[i, j] for i, j in partitions[k - 1]), residual)
+            assert partitions[k - 1][0][0] == 0
+            assert partitions[k - 1][-1][1] == num_frags
+
+def test_chain_fitter():
+    frag_list = chain_fragments()
+    num_frags = len(frag_list)
+    atom_list = [atm for frag in frag_list for atm in frag.iter_atoms()]
+
+    rng = numpy.random.RandomState(19)
+    weight_dict = dict((atm, rng.uniform(0.5, 2.0)) for atm in atom_list)
+
+    range_list = [(0, 6), (3, 15), (40, 41), (num_frags // 2, num_frags), (0, num_frags)]
+
+    for weights in (None, weight_dict):
+        fitter = TLS.TLSChainFitter(frag_list, weight_dict = weights)
+        assert fitter.count_fragments() == num_frags
+
+        for i, j in range_list:
+            fit = fitter.calc_segment_fit(i, j)
+
+            tls_group = TLS.TLSGroup(fitter.iter_atoms(i, j))
+            tls_group.origin = tls_group.calc_centroid()
+            lsq_residual = tls_group.calc_TLS_least_squares_fit(weights)
+
+            assert fit["num_atoms"] == len(tls_group)
+            assert numpy.allclose(fit["origin"], tls_group.origin)
+            for tensor in ("T", "L", "S"):
+                assert numpy.allclose(fit[tensor], getattr(tls_group, tensor),
+                                      rtol = 1e-6, atol = 1e-8)
+            assert numpy.allclose(fit["lsq_residual"], lsq_residual, rtol = 1e-6)
+
+def test_fit_segments_num_procs():
+    analysis = TLS.TLSStructureAnalysis(amino_acid_struct())
+
+    tls_info_list = analysis.fit_TLS_segments(residue_widths = [6, 10])
+    assert len(tls_info_list) == 614
+    assert [tls_info["chain_id"] for tls_info in tls_info_list] == ["A"] * len(tls_info_list)
+    keys = [tls_info_key(tls_info) for tls_info in tls_info_list]
+
+    for num_procs in (2, 3):
+        tls_info_list = analysis.fit_TLS_segments(
+            residue_widths = [6, 10], num_procs = num_procs)
+        assert [tls_info_key(tls_info) for tls_info in tls_info_list] == keys
+
+    ## closing the generator early cancels the pending jobs and returns
+    for num_items in (0, 1, 5):
+        iter_fit = analysis.iter_fit_TLS_segments(residue_widths = [6, 10], num_procs = 2)
+        for tls_info, key in zip(iter_fit, keys[:num_items]):
+            assert tls_info_key(tls_info) == key
+        iter_fit.close()
+
+def test_origin_shift_matrix():
+    rng = numpy.random.RandomState(191)
+    xyz = rng.uniform(-10.0, 10.0, (30, 3))
+    w = rng.uniform(0.5, 2.0, 30)
+    d = rng.uniform(-5.0, 5.0, (4, 3))
+
+    N = TLS.calc_TLS_origin_shift_matrix(d)
+    A = TLS.calc_TLS_A_array(xyz, w)
+    for k in range(len(d)):
+        assert numpy.allclose(TLS.calc_TLS_A_array(xyz + d[k], w),
+                              numpy.matmul(A, N[k]))
+        assert numpy.allclose(TLS.calc_TLS_origin_shift_matrix(d[k]), N[k])
+
+def test_design_matrices():
+    rng = numpy.random.RandomState(18)
+    num_atoms = 25
+    xyz = rng.uniform(-10.0, 10.0, (num_atoms, 3))
+    w = rng.uniform(0.5, 2.0, num_atoms)
+    U = rng.normal(0.0, 0.1, (num_atoms, 3, 3))
+    U = U + U.transpose((0, 2, 1))
+
+    A_TLS = numpy.zeros((6 * num_atoms, 20), float)
+    A_L = numpy.zeros((6 * num_atoms, 6), float)
+    A_iso = numpy.zeros((num_atoms, 10), float)
+    b_TLS = numpy.zeros(6 * num_atoms, float)
+    b_iso = numpy.zeros(num_atoms, float)
+    for i, ((x, y, z), wi, Ui) in enumerate(zip(xyz, w, U)):
+        TLS.set_TLS_A(A_TLS, 6 * i, 0, x, y, z, wi)
+        TLS.set_L_A(A_L, 6 * i, 0, x, y, z, wi)
+        TLS.set_TLSiso_A(A_iso, i, 0, x, y, z, wi)
+        TLS.set_TLS_b(b_TLS, 6 * i, Ui[0,0], Ui[1,1], Ui[2,2],
+                      Ui[0,1], Ui[0,2], Ui[1,2], wi)
+        TLS.set_TLSiso_b(b_iso, i, Ui[0,0], wi)
+
+    assert numpy.array_equal(TLS.calc_TLS_A_array(xyz, w).reshape((-1, 20)), A_TLS)
+    assert numpy.allclose(
+        (TLS.calc_L_A_array(xyz) * w[:, numpy.newaxis, numpy.newaxis]).reshape((-1, 6)), A_L)
+    assert numpy.allclose(TLS.calc_TLSiso_A_array(xyz, w), A_iso)
+    assert numpy.array_equal(TLS.calc_TLS_b_array(U, w).reshape(-1), b_TLS)
+    assert numpy.allclose(w * U[:,0,0], b_iso)
+
+def test_itls_least_squares_fit():
+    rng = numpy.random.RandomState(181)
+    origin = numpy.array([3.0, -2.0, 5.0])
+    xyz = rng.uniform(-10.0, 10.0, (40, 3))
+
+    ## temperature factors of a known isotropic TLS model plus noise
+    iT = 0.2
+    iL = numpy.array([[0.003, 0.001, 0.0],
+                      [0.001, 0.002, 0.0005],
+                      [0.0, 0.0005, 0.004]])
+    iS = numpy.array([0.01, -0.02, 0.005])
+    uiso = TLS.calc_itls_uiso_array(iT, iL, iS, xyz) + rng.normal(0.0, 0.01, 40)
+
+    atom_list = []
+    for (x, y, z), u in zip(xyz + origin, uiso):
+        atom_list.append(Structure.Atom(
+            x = x, y = y, z = z, temp_factor = u * Constants.U2B))
+    weight_dict = dict((atm, rng.uniform(0.5, 2.0)) for atm in atom_list)
+
+    for weights in (None, weight_dict):
+        fit_iT, fit_iL, fit_iS, lsq_residual = TLS.calc_itls_least_squares_fit(
+            atom_list, origin, weights)
+
+        ## the same fit from the scalar design matrix
+        if weights is None:
+            w = numpy.ones(len(atom_list))
+        else:
+            w = numpy.sqrt([weights[atm] for atm in atom_list])
+        A = numpy.zeros((len(atom_list), 10), float)
+        b = numpy.zeros(len(atom_list), float)
+        for i, ((x, y, z), u) in enumerate(zip(xyz, uiso)):
+            TLS.set_TLSiso_A(A, i, 0, x, y, z, w[i])
+            TLS.set_TLSiso_b(b, i, u, w[i])
+        X = numpy.linalg.lstsq(A, b, rcond = None)[0]
+        D = numpy.dot(A, X) - b
+
+        assert numpy.allclose(fit_iT, X[0])
+        assert numpy.allclose(fit_iL[[0, 1, 2, 0, 0, 1], [0, 1, 2, 1, 2, 2]], X[1:7])
+        assert numpy.allclose(fit_iL, fit_iL.T)
+        assert numpy.allclose(fit_iS, X[7:10])
+        assert numpy.allclose(lsq_residual, numpy.dot(D, D))
+
+        ## and it recovers the model
+        assert abs(fit_iT - iT) < 0.05
+        assert numpy.allclose(TLS.calc_itls_uiso_array(fit_iT, fit_iL, fit_iS, xyz),
+                              uiso, atol = 0.05)
+
+
+if __name__ == "__main__":
+    for name, func in sorted(globals().items()):
+        if name.startswith("test_"):
+            func()
+            print("%s: OK" % (name))
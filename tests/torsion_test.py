@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+## Copyright 2002-2010 by PyMMLib Development Group (see AUTHORS file)
+## This code is part of the PyMMLib distribution and governed by
+## its license.  Please see the LICENSE file that should have been
+## included as part of this package.
+"""Checks Chain.calc_torsion_table() and Model.calc_torsion_table()
+against the AminoAcidResidue.calc_torsion_* methods.
+"""
+## Python
+import os
+import copy
+
+import numpy
+
+## pymmlib
+from mmLib import FileIO, Library, Structure
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+BACKBONE_TORSIONS = ("phi", "psi", "omega")
+
+
+def build_chain(chain_id = "A", fragment_index = 40):
+    """Returns a copy of a Chain of the test structure in which all
+    Fragments with a CA atom are AminoAcidResidues, so the result does not
+    depend on the monomer library.  Fragment fragment_index stays a plain
+    Fragment, like a modified residue, and breaks the chain.
+    """
+    struct = FileIO.LoadStructure(fil = os.path.join(DATA_PATH, "8j5a.cif"))
+
+    chain = Structure.Chain(chain_id = chain_id)
+    for i, frag in enumerate(struct.get_chain("A").iter_fragments()):
+        if frag.get_atom("CA") is not None and i != fragment_index:
+            frag_class = Structure.AminoAcidResidue
+        else:
+            frag_class = Structure.Fragment
+        new_frag = frag_class(chain_id = chain_id,
+                              fragment_id = frag.fragment_id,
+                              res_name = frag.res_name)
+        for atm in frag.iter_all_atoms():
+            new_atm = copy.deepcopy(atm)
+            new_atm.chain_id = chain_id
+            new_frag.add_atom(new_atm)
+        chain.add_fragment(new_frag, True)
+    chain.sort()
+    return chain
+
+def calc_torsion_row(res):
+    row = []
+    for torsion_name in BACKBONE_TORSIONS:
+        angle = getattr(res, "calc_torsion_" + torsion_name)()
+        if angle is None:
+            angle = numpy.nan
+        row.append(angle)
+    return row
+
+def check_torsion_table(chain):
+    residue_list, table = chain.calc_torsion_table(BACKBONE_TORSIONS)
+    assert residue_list == list(chain.iter_amino_acids())
+    assert table.shape == (len(residue_list), len(BACKBONE_TORSIONS))
+
+    expected = numpy.array([calc_torsion_row(res) for res in residue_list])
+    assert numpy.allclose(table, expected, equal_nan = True)
+    return residue_list, table
+
+def test_chain_torsion_table():
+    chain = build_chain()
+    residue_list, table = check_torsion_table(chain)
+    assert len(residue_list) > 100
+    assert numpy.all(numpy.isnan(table[0, 0]))
+    assert numpy.all(numpy.isnan(table[-1, 1:]))
+    assert numpy.sum(numpy.isnan(table)) < 10
+
+    ## the residues next to the plain Fragment have no angles through it
+    assert not chain.fragment_list[40].is_amino_acid()
+    k = residue_list.index(chain.fragment_list[41])
+    assert residue_list[k - 1] is chain.fragment_list[39]
+    assert numpy.isnan(table[k, 0])
+    assert numpy.all(numpy.isnan(table[k - 1, 1:]))
+
+    ## a deleted CA makes every angle of the residue and its neighbors
+    ## which uses it NaN
+    k = len(residue_list) // 2
+    res = residue_list[k]
+    res.remove_atom(res.get_atom("CA"))
+    residue_list, table = check_torsion_table(chain)
+    assert numpy.all(numpy.isnan(table[k]))
+    assert numpy.isnan(table[k - 1, 2])
+    assert not numpy.isnan(table[k - 1, 1])
+    assert not numpy.any(numpy.isnan(table[k + 1]))
+
+def test_model_torsion_table():
+    model = Structure.Model()
+    model.add_chain(build_chain("A"))
+    model.add_chain(build_chain("B"))
+
+    residue_list, table = model.calc_torsion_table(BACKBONE_TORSIONS)
+    chain_residue_list, chain_table = model.get_chain("A").calc_torsion_table(BACKBONE_TORSIONS)
+    num_res = len(chain_residue_list)
+
+    assert residue_list == list(model.iter_amino_acids())
+    assert len(residue_list) == 2 * num_res
+    assert numpy.array_equal(table[:num_res], chain_table, equal_nan = True)
+    assert numpy.array_equal(table[num_res:], chain_table, equal_nan = True)
+
+def test_library_torsion_table():
+    chain = build_chain()
+    torsion_names = ("chi1", "chi2", "pucker")
+    residue_list, table = chain.calc_torsion_table(torsion_names)
+
+    ## angles without a monomer library definition are NaN
+    for res, row in zip(residue_list, table):
+        if Library.library_get_monomer_desc(res.res_name) is None:
+            assert numpy.all(numpy.isnan(row))
+            continue
+        for torsion_name, angle in zip(torsion_names, row):
+            expected = res.calc_torsion(torsion_name)
+            if expected is None:
+                assert numpy.isnan(angle)
+            else:
+                assert numpy.allclose(angle, expected)
+
+
+if __name__ == "__main__":
+    for name, func in sorted(globals().items()):
+        if name.startswith("test_"):
+            func()
+            print("%s: OK" % (name))
@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+## Copyright 2002-2010 by PyMMLib Development Group (see AUTHORS file)
+## This code is part of the PyMMLib distribution and governed by
+## its license.  Please see the LICENSE file that should have been
+## included as part of this package.
+"""Checks the crystal packing searches of mmLib.UnitCell against brute
+force searches over the space group operations and nearby unit cells.
+"""
+## Python
+import itertools
+
+import numpy
+
+## pymmlib
+from mmLib import AtomMath, SpaceGroups, UnitCell
+
+## (space group, a, b, c, alpha, beta, gamma)
+CELL_LIST = [
+    ("P 21 21 21", 30.0, 40.0, 50.0, 90.0, 90.0, 90.0),
+    ("C 1 2 1", 60.0, 30.0, 40.0, 90.0, 105.0, 90.0),
+    ("P 61", 40.0, 40.0, 70.0, 90.0, 90.0, 120.0),
+    ("H 3", 60.0, 60.0, 40.0, 90.0, 90.0, 120.0)]
+
+
+def iter_unit_cells():
+    for space_group, a, b, c, alpha, beta, gamma in CELL_LIST:
+        yield UnitCell.UnitCell(a, b, c, alpha, beta, gamma, space_group)
+
+def random_molecule(rng, unit_cell, num_atoms = 40, radius = 8.0):
+    """Returns the (num_atoms,3) orthogonal coordinates of a random blob
+    of atoms somewhere in the unit cell.
+    """
+    center = unit_cell.calc_frac_to_orth(rng.uniform(-0.5, 1.5, 3))
+    return center + rng.uniform(-radius, radius, (num_atoms, 3))
+
+def brute_force_cells(num_cells):
+    cube = range(-num_cells, num_cells + 1)
+    return numpy.array(list(itertools.product(cube, cube, cube)), int)
+
+def test_packing_symops():
+    rng = numpy.random.RandomState(13)
+    for unit_cell in iter_unit_cells():
+        for trial in range(3):
+            centroid = random_molecule(rng, unit_cell, 1)[0]
+            radius = rng.uniform(5.0, 25.0)
+            reach = 2.0 * radius + 5.0
+
+            symop_index, cell_t = unit_cell.calc_packing_symops(centroid, radius)
+            found = set(zip(symop_index.tolist(), map(tuple, cell_t.tolist())))
+            assert len(found) == len(symop_index)
+
+            expected = set()
+            cfrac = unit_cell.calc_orth_to_frac(centroid)
+            for k, symop in enumerate(unit_cell.space_group.iter_symops()):
+                for cell in brute_force_cells(6):
+                    xyz = unit_cell.calc_frac_to_orth(symop(cfrac) + cell)
+                    if AtomMath.length(xyz - centroid) <= reach:
+                        expected.add((k, tuple(cell.tolist())))
+
+            assert found == expected
+
+def test_symmetry_contacts():
+    rng = numpy.random.RandomState(14)
+    distance = 4.0
+    for unit_cell in iter_unit_cells():
+        xyz = random_molecule(rng, unit_cell, 60, 15.0)
+        atom_i, atom_j, symop_index, cell_t, dist = \
+            unit_cell.calc_symmetry_contacts(xyz, distance)
+
+        found = dict(((i, j, k, tuple(t)), d) for i, j, k, t, d in zip(
+            atom_i.tolist(), atom_j.tolist(), symop_index.tolist(),
+            cell_t.tolist(), dist.tolist()))
+        assert len(found) == len(atom_i)
+
+        expected = {}
+        frac = unit_cell.calc_orth_to_frac_array(xyz)
+        for k, symop in enumerate(unit_cell.space_group.iter_symops()):
+            image = numpy.dot(frac, symop.R.T) + symop.t
+            is_identity = numpy.allclose(symop.R, numpy.identity(3)) and \
+                          numpy.allclose(symop.t, 0.0)
+            cells = brute_force_cells(3)
+            if is_identity:
+                cells = cells[numpy.any(cells != 0, axis = 1)]
+
+            ## d[c,i,j] is the distance of atom i to atom j moved to cell c
+            mate = unit_cell.calc_frac_to_orth_array(
+                image[numpy.newaxis, :, :] + cells[:, numpy.newaxis, :])
+            d = numpy.sqrt(numpy.sum(
+                (xyz[numpy.newaxis, :, numpy.newaxis, :] - mate[:, numpy.newaxis, :, :]) ** 2,
+                axis = 3))
+            for c, i, j in zip(*numpy.nonzero(d <= distance)):
+                expected[(int(i), int(j), k, tuple(cells[c].tolist()))] = d[c, i, j]
+
+        assert len(expected) > 0
+        assert set(found) == set(expected)
+        for key, d in expected.items():
+            assert numpy.allclose(found[key], d)
+
+
+class Atom(object):
+    def __init__(self, position):
+        self.position = position
+
+    def iter_atoms(self):
+        yield self
+
+
+class Molecule(object):
+    """The parts of a Structure used by UnitCell.iter_struct_orth_symops():
+    all atoms are in one amino acid residue.
+    """
+    def __init__(self, xyz):
+        self.atom_list = [Atom(position) for position in xyz]
+
+    def iter_all_atoms(self):
+        return iter(self.atom_list)
+
+    def iter_amino_acids(self):
+        yield self
+
+    def iter_atoms(self):
+        return iter(self.atom_list)
+
+
+def iter_struct_orth_symops_cube(unit_cell, struct):
+    """The original iter_struct_orth_symops(), which searches the
+    lattice translations of the 7x7x7 cube of cell_search_iter().
+    """
+    n = 0
+    cent = numpy.zeros(3, float)
+    for atm in struct.iter_all_atoms():
+        n += 1
+        cent += atm.position
+    centroid = cent / n
+
+    max_dist = 0.0
+    for frag in struct.iter_amino_acids():
+        for atm in frag.iter_atoms():
+            max_dist = max(max_dist, AtomMath.length(atm.position - centroid))
+    max_dist2 = 2.0 * max_dist + 5.0
+
+    for symop in unit_cell.space_group.iter_symops():
+        for i, j, k in unit_cell.cell_search_iter():
+            cell_t = numpy.array([i, j, k], float)
+            symop_t = SpaceGroups.SymOp(symop.R, symop.t + cell_t)
+
+            xyz = unit_cell.calc_orth_to_frac(centroid)
+            centroid2 = unit_cell.calc_frac_to_orth(symop_t(xyz))
+
+            if AtomMath.length(centroid - centroid2) <= max_dist2:
+                yield unit_cell.calc_orth_symop(symop_t)
+
+def calc_symop_key(unit_cell, orth_symop):
+    """Returns the (symop_index, cell_t) of the orthogonal space SymOp.
+    """
+    R = numpy.dot(unit_cell.orth_to_frac, numpy.dot(orth_symop.R, unit_cell.frac_to_orth))
+    t = numpy.dot(unit_cell.orth_to_frac, orth_symop.t)
+    for k, symop in enumerate(unit_cell.space_group.iter_symops()):
+        cell_t = t - symop.t
+        if numpy.allclose(R, symop.R) and numpy.allclose(cell_t, numpy.round(cell_t)):
+            return k, tuple(int(x) for x in numpy.round(cell_t))
+    raise AssertionError("not a space group operation")
+
+def test_struct_orth_symops():
+    rng = numpy.random.RandomState(131)
+    for unit_cell in iter_unit_cells():
+        for radius in (4.0, 10.0, 30.0):
+            struct = Molecule(random_molecule(rng, unit_cell, radius = radius))
+
+            keys = [calc_symop_key(unit_cell, symop)
+                    for symop in unit_cell.iter_struct_orth_symops(struct)]
+            cube_keys = [calc_symop_key(unit_cell, symop)
+                         for symop in iter_struct_orth_symops_cube(unit_cell, struct)]
+
+            ## the search is not limited to the cube any more, but yields
+            ## the operations of the cube in the same order
+            assert len(set(keys)) == len(keys)
+            assert [key for key in keys if max(map(abs, key[1])) <= 3] == cube_keys
+            assert len(cube_keys) > 0
+
+
+if __name__ == "__main__":
+    for name, func in sorted(globals().items()):
+        if name.startswith("test_"):
+            func()
+            print("%s: OK" % (name))